@@ -141,6 +141,34 @@ Examples
 >>> _config.STORE_RECV_CHUNKED_DATASET = True
 """
 
+STORE_RECV_STREAMING: bool = False
+"""Pass the dataset to the C-STORE handler while it's still being received.
+
+.. versionadded:: 3.1
+
+If ``True``, then when receiving C-STORE requests as an SCP the
+``evt.EVT_C_STORE`` handler is called as soon as the request's command set
+has been received, rather than once the entire dataset has arrived. The
+encoded dataset (without the File Meta Information) can then be read as it
+arrives using the read-only file-like :attr:`Event.dataset_stream
+<pynetdicom.events.Event.dataset_stream>` attribute, which blocks until more
+data is available. This allows writing the dataset to storage to overlap with
+receiving it, and the amount of memory used by the stream is limited to
+:attr:`DatasetStream.max_memory
+<pynetdicom.dimse_messages.DatasetStream.max_memory>`, with any excess
+spooled to a temporary file until read.
+
+If used then :attr:`STORE_RECV_CHUNKED_DATASET` is ignored.
+
+Default: ``False``
+
+Examples
+--------
+
+>>> from pynetdicom import _config
+>>> _config.STORE_RECV_STREAMING = True
+"""
+
 PASS_CONTEXTVARS: bool = False
 """Pass context-local state to concurrent pynetdicom code.
 
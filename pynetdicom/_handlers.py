@@ -972,7 +972,7 @@ def _send_c_store_rq(event: "Event") -> list[str]:
     dataset = "None"
     if msg.data_set and msg.data_set.getvalue() != b"":
         dataset = "Present"
-    elif msg._data_set_path is not None:
+    elif msg._data_set_path is not None or msg._data_set_stream is not None:
         dataset = "Present"
 
     sop_class = cast(UID, cs.AffectedSOPClassUID)
@@ -4097,11 +4097,16 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
     :dcm:`Asynchronous Operations Window Negotiation<part07/sect_D.3.3.3.html>`
     item will be sent in reply to the association requestor.
 
-    Because *pynetdicom* doesn't support asynchronous operations if the
-    handler is implemented then the response to the asynchronous
-    operations window negotiation request will always return the default
-    number of operations invoked/performed, (1, 1), regardless of what
-    values are returned by the handler.
+    .. versionchanged:: 3.1
+
+        The values returned by the handler are now used in the response,
+        previously the response was always (1, 1).
+
+    If the handler is implemented then the response to the asynchronous
+    operations window negotiation request will contain the number of
+    operations invoked/performed returned by the handler, limited to the
+    values that were requested. If the handler raises an exception or
+    returns invalid values then the default of (1, 1) will be used.
 
     **Event**
 
@@ -4119,11 +4124,11 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
           that received the Asynchronous Operations Window Negotiation request.
         * :attr:`~pynetdicom.events.Event.event`: the event that occurred as
           :class:`~pynetdicom.events.InterventionEvent`.
-        * ``invoked``: the *Maximum Number Operations Invoked* parameter
+        * ``nr_invoked``: the *Maximum Number Operations Invoked* parameter
           value of the Asynchronous Operations Window Negotiation item as
           an :class:`int`. If the value is ``0`` then an unlimited number of
           invocations are requested.
-        * ``performed``: the *Maximum Number Operations Performed*
+        * ``nr_performed``: the *Maximum Number Operations Performed*
           parameter value of the Asynchronous Operations Window Negotiation
           item as an :class:`int`. If the value is ``0`` then an unlimited
           number of performances are requested.
@@ -4142,9 +4147,7 @@ def doc_handle_async(event: "Event", *args: Sequence[Any]) -> tuple[int, int]:
     int, int
         The (maximum number operations invoked, maximum number operations
         performed). A value of ``0`` indicates that an unlimited number of
-        operations is supported. As asynchronous operations are not
-        supported the returned values will be ignored and (1, 1) sent in
-        response.
+        operations is supported.
 
     References
     ----------
@@ -19,19 +19,28 @@ from pynetdicom.pdu_primitives import (
 )
 from pynetdicom.presentation import (
     negotiate_as_requestor,
-    negotiate_as_acceptor,
     negotiate_unrestricted,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.association import Association, ServiceUser
-    from pynetdicom.dul import DULServiceProvider
+    from pynetdicom.dul import DULServiceProvider, _UserQueuePrimitives
     from pynetdicom.transport import AssociationSocket
 
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _narrow_window(offered: int, requested: int) -> int:
+    """Return the number of asynchronous operations to accept given the
+    `offered` and `requested` numbers, where ``0`` is unlimited.
+    """
+    if not requested or not offered:
+        return offered or requested
+
+    return min(offered, requested)
+
+
 class ACSE:
     """The Association Control Service Element (ACSE) service provider.
 
@@ -69,36 +78,44 @@ class ACSE:
 
         .. currentmodule:: pynetdicom.pdu_primitives
 
+        .. versionchanged:: 3.1
+
+            The number of operations returned by the handler are now used
+            in the response, provided they don't exceed the requested numbers.
+
         Returns
         -------
         pdu_primitives.AsynchronousOperationsWindowNegotiation or None
             If the ``evt.EVT_ASYNC_OPS`` handler hasn't been implemented
             then returns ``None``, otherwise returns an
             :class:`AsynchronousOperationsWindowNegotiation` item with the
-            default values for the number of operations invoked/performed
-            (1, 1).
+            number of operations invoked/performed returned by the handler,
+            or the default values (1, 1) if the handler raised an exception.
         """
         setattr(self.assoc, "abort", self.assoc._abort_nonblocking)  # noqa: B010
 
+        item = AsynchronousOperationsWindowNegotiation()
         try:
-            # Response is always ignored as async ops is not supported
             inv, perf = self.requestor.asynchronous_operations
-            _ = evt.trigger(
+            rsp = evt.trigger(
                 self.assoc, evt.EVT_ASYNC_OPS, {"nr_invoked": inv, "nr_performed": perf}
             )
+            # The acceptor may offer fewer operations than were requested but
+            #   not more, a value of 0 means unlimited
+            rsp_inv, rsp_perf = cast(tuple[int, int], rsp)
+            item.maximum_number_operations_invoked = _narrow_window(rsp_inv, inv)
+            item.maximum_number_operations_performed = _narrow_window(rsp_perf, perf)
         except NotImplementedError:
             setattr(self.assoc, "abort", self.assoc._abort_blocking)
             return None
         except Exception as exc:
             LOGGER.error("Exception raised in handler bound to 'evt.EVT_ASYNC_OPS'")
             LOGGER.exception(exc)
+            item.maximum_number_operations_invoked = 1
+            item.maximum_number_operations_performed = 1
 
         setattr(self.assoc, "abort", self.assoc._abort_blocking)
 
-        item = AsynchronousOperationsWindowNegotiation()
-        item.maximum_number_operations_invoked = 1
-        item.maximum_number_operations_performed = 1
-
         return item
 
     def _check_sop_class_common_extended(
@@ -318,6 +335,9 @@ class ACSE:
         assoc_rq = cast(A_ASSOCIATE, self.requestor.primitive)
         # Set the Requestor's AE Title
         self.requestor.ae_title = assoc_rq.calling_ae_title
+        self.assoc.ae._registry.update(self.assoc)
+        if self.assoc._server:
+            self.assoc._server._registry.update(self.assoc)
 
         # If we reject association -> [result, source, diagnostic]
         reject_assoc_rsd: tuple[int, ...] = ()
@@ -369,16 +389,21 @@ class ACSE:
 
         # DUL Presentation Related Rejections
         # Maximum number of associations reached (local-limit-exceeded)
-        active_acceptors = [
-            tt for tt in self.assoc.ae.active_associations if tt.is_acceptor
-        ]
-        if len(active_acceptors) > self.assoc.ae.maximum_associations:
+        if self.assoc._server:
+            nr_acceptors = self.assoc._server._count_acceptors()
+        else:
+            nr_acceptors = self.assoc.ae._registry.nr_acceptors
+
+        if nr_acceptors > self.assoc.ae.maximum_associations:
             reject_assoc_rsd = (0x02, 0x03, 0x02)
 
         if reject_assoc_rsd:
             LOGGER.info("Rejecting Association")
-            self.send_reject(*reject_assoc_rsd)
-            evt.trigger(self.assoc, evt.EVT_REJECTED, {})
+            # Let the handlers run before the peer sees the rejection
+            with self.dul._hold_primitives():
+                self.send_reject(*reject_assoc_rsd)
+                evt.trigger(self.assoc, evt.EVT_REJECTED, {})
+
             self.assoc.kill()
             return
 
@@ -397,7 +422,7 @@ class ACSE:
                 rq_roles,
             )
         else:
-            result, ac_roles = negotiate_as_acceptor(
+            result, ac_roles = self.assoc.ae._negotiate_as_acceptor(
                 assoc_rq.presentation_context_definition_list,
                 self.acceptor.supported_contexts,
                 rq_roles,
@@ -413,15 +438,19 @@ class ACSE:
         for role_item in ac_roles:
             self.acceptor.add_negotiation_item(role_item)
 
-        # Send the A-ASSOCIATE (accept) primitive
-        LOGGER.info("Accepting Association")
-        self.send_accept()
+        # Finish accepting before the peer sees the acceptance so it can't
+        #   use the association before we can
+        with self.dul._hold_primitives():
+            # Send the A-ASSOCIATE (accept) primitive
+            LOGGER.info("Accepting Association")
+            self.send_accept()
 
-        # Callbacks/Logging
-        evt.trigger(self.assoc, evt.EVT_ACCEPTED, {})
+            # Callbacks/Logging
+            evt.trigger(self.assoc, evt.EVT_ACCEPTED, {})
+
+            # Association established OK
+            self.assoc.is_established = True
 
-        # Association established OK
-        self.assoc.is_established = True
         evt.trigger(self.assoc, evt.EVT_ESTABLISHED, {})
 
     def _negotiate_as_requestor(self) -> None:
@@ -442,14 +471,29 @@ class ACSE:
         socket = cast("AssociationSocket", self.socket)
         socket._ready.wait()
 
-        if not socket._is_connected:
+        # The peer may have already responded and closed the connection
+        if not socket._is_connected and not isinstance(
+            self.dul.peek_next_pdu(), A_ASSOCIATE
+        ):
             # Failed to connect
             self.assoc.abort()
             return
 
         # Wait for response
         rsp = self.dul.receive_pdu(wait=True, timeout=self.acse_timeout)
+        self._handle_association_response(rsp)
+
+    def _handle_association_response(self, rsp: "_UserQueuePrimitives | None") -> None:
+        """Handle the peer's response to an association request.
 
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        rsp : A-ASSOCIATE, A-ABORT, A-P-ABORT or None
+            The primitive received from the peer in response to the
+            A-ASSOCIATE request, or ``None`` if the ACSE timeout was reached.
+        """
         # Association accepted or rejected
         if isinstance(rsp, A_ASSOCIATE):
             self.acceptor.primitive = rsp
@@ -587,6 +631,7 @@ class ACSE:
                 self.assoc.is_aborted = True
                 self.assoc.is_established = False
                 evt.trigger(self.assoc, evt.EVT_ABORTED, {})
+                self.assoc._set_abort_handled()
                 self.assoc.kill()
                 return
 
@@ -810,6 +855,24 @@ class ACSE:
         #   Calling Presentation Address
         #   Called Presentation Address
         #   Presentation Context Definition List*
+        primitive = self._request_primitive()
+        # The TCP/IP address info of the source
+        primitive.calling_presentation_address = self.requestor.address_info
+        # The TCP/IP address info of the destination
+        primitive.called_presentation_address = self.acceptor.address_info
+
+        # Save the request primitive
+        self.requestor.primitive = primitive
+
+        # Send the A-ASSOCIATE request primitive to the peer
+        self.dul.send_pdu(primitive)
+
+    def _request_primitive(self) -> A_ASSOCIATE:
+        """Return an A-ASSOCIATE (request) primitive with the parameters that
+        are sent in the A-ASSOCIATE-RQ PDU.
+
+        .. versionadded:: 3.1
+        """
         primitive = A_ASSOCIATE()
         # DICOM Application Context Name, see PS3.7 Annex A.2.1
         primitive.application_context_name = UID(APPLICATION_CONTEXT_NAME)
@@ -817,10 +880,6 @@ class ACSE:
         primitive.calling_ae_title = self.requestor.ae_title
         # Called AE Title is the destination DICOM AE title
         primitive.called_ae_title = self.acceptor.ae_title
-        # The TCP/IP address info of the source
-        primitive.calling_presentation_address = self.requestor.address_info
-        # The TCP/IP address info of the destination
-        primitive.called_presentation_address = self.acceptor.address_info
         # Proposed presentation contexts
         primitive.presentation_context_definition_list = (
             self.requestor.requested_contexts
@@ -840,11 +899,7 @@ class ACSE:
         #   User Identity Negotiation (0 or 1)
         primitive.user_information = self.requestor.user_information
 
-        # Save the request primitive
-        self.requestor.primitive = primitive
-
-        # Send the A-ASSOCIATE request primitive to the peer
-        self.dul.send_pdu(primitive)
+        return primitive
 
     @property
     def socket(self) -> "AssociationSocket | None":
@@ -2,9 +2,14 @@
 The main user class, represents a DICOM Application Entity
 """
 
-from copy import deepcopy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy, deepcopy
 from datetime import datetime
 import logging
+import os
+from pathlib import Path
+import queue
 import socket
 from ssl import SSLContext
 import threading
@@ -13,16 +18,25 @@ from typing import (
     TypeVar,
     Any,
 )
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import warnings
 
+from pydicom.dataset import Dataset
 from pydicom.uid import UID
 
 from pynetdicom import _config
-from pynetdicom.association import Association
+from pynetdicom.association import Association, _AssociationRegistry
 from pynetdicom.events import EventHandlerType
-from pynetdicom.presentation import PresentationContext
-from pynetdicom.pdu_primitives import _UI
+from pynetdicom.pdu import A_ASSOCIATE_RQ
+from pynetdicom.presentation import (
+    PresentationContext,
+    CXNegotiationReturn,
+    RoleType,
+    negotiate_as_acceptor,
+    _copy_contexts,
+)
+from pynetdicom.pdu_primitives import _UI, UserIdentityNegotiation
+from pynetdicom.pool import AssociationPool
 from pynetdicom.transport import (
     AssociationSocket,
     AssociationServer,
@@ -42,6 +56,16 @@ LOGGER = logging.getLogger(__name__)
 _T = TypeVar("_T")
 ListCXType = list[PresentationContext]
 TSyntaxType = None | str | UID | Sequence[str] | Sequence[UID]
+_RequestKeyType = tuple[str, tuple[tuple[Any, ...], ...], bytes]
+_NegotiationKeyType = tuple[tuple[tuple[Any, ...], ...], ...]
+# (dataset to send, number of times it's been tried)
+_SendItemType = tuple[str | Path | Dataset, int]
+
+# The maximum number of prebuilt A-ASSOCIATE-RQ PDUs kept by each AE
+_MAX_REQUEST_TEMPLATES = 64
+# The maximum number of presentation context negotiation results kept by
+#   each AE
+_MAX_NEGOTIATION_RESULTS = 64
 
 
 class ApplicationEntity:
@@ -84,6 +108,11 @@ class ApplicationEntity:
         # Default maximum simultaneous associations
         self._maximum_associations = 10
 
+        # Limits on the received DIMSE messages an association buffers
+        #   while waiting for them to be handled, None for no limit
+        self._maximum_buffered_bytes: int | None = None
+        self._maximum_buffered_messages: int | None = None
+
         # Default maximum PDU receive size (in bytes)
         self._maximum_pdu_size = DEFAULT_MAX_LENGTH
 
@@ -93,13 +122,28 @@ class ApplicationEntity:
         self._dimse_timeout: float | None = 30
         self._network_timeout: float | None = 60
 
+        # Spooling of received C-STORE datasets to file
+        self._store_recv_spool_threshold: int | None = None
+        self._store_recv_spool_dir: Path | None = None
+
         # Require Calling/Called AE titles to match if value is non-empty str
         self._require_calling_aet: list[str] = []
         self._require_called_aet = False
 
-        self._servers: list[ThreadedAssociationServer] = []
+        self._servers: list[AssociationServer] = []
+        # The pool of associations used for C-MOVE sub-operations
+        self._association_pool: AssociationPool | None = None
+        # The live associations, maintained by the associations themselves
+        self._registry = _AssociationRegistry()
         self._lock: threading.Lock = threading.Lock()
 
+        # Contexts and A-ASSOCIATE-RQ PDUs prebuilt for previous requests
+        self._request_templates: dict[
+            _RequestKeyType, tuple[ListCXType, A_ASSOCIATE_RQ]
+        ] = {}
+        # Results of previous presentation context negotiations as acceptor
+        self._negotiation_results: dict[_NegotiationKeyType, CXNegotiationReturn] = {}
+
     @property
     def acse_timeout(self) -> None | float:
         """Get or set the ACSE timeout value (in seconds).
@@ -130,18 +174,14 @@ class ApplicationEntity:
     @property
     def active_associations(self) -> list[Association]:
         """Return a list of the AE's active
-        :class:`~pynetdicom.association.Association` threads.
+        :class:`~pynetdicom.association.Association` instances.
 
         Returns
         -------
         list of Association
-            A list of all active association threads, both requestors and
-            acceptors.
+            A list of all active associations, both requestors and acceptors.
         """
-        threads = threading.enumerate()
-        t_assocs = [tt for tt in threads if isinstance(tt, Association)]
-
-        return [tt for tt in t_assocs if tt.ae == self]
+        return self._registry.associations()
 
     def add_requested_context(
         self,
@@ -401,6 +441,9 @@ class ApplicationEntity:
 
         transfer_syntax = [UID(ts) for ts in transfer_syntax]
 
+        # Any cached negotiation results may no longer apply
+        self._negotiation_results.clear()
+
         # If the abstract syntax is already supported then update the transfer
         #   syntaxes
         if abstract_syntax in self._supported_contexts:
@@ -565,6 +608,67 @@ class ApplicationEntity:
             :attr:`~pynetdicom.ae.ApplicationEntity.requested_contexts` is
             empty).
         """
+        assoc = self._create_requestor(
+            addr, port, contexts, ae_title, max_pdu, ext_neg, bind_address, evt_handlers
+        )
+
+        # Setup the association's communication socket
+        local_address = cast(AddressInformation, assoc.requestor.address_info)
+        sock = self._create_socket(assoc, local_address, tls_args)
+        assoc.set_socket(sock)
+
+        # Send an A-ASSOCIATE request to the peer and start negotiation
+        assoc.request()
+
+        # If the result of the negotiation was acceptance then start up
+        #   the Association thread
+        if assoc.is_established:
+            assoc.start()
+
+        return assoc
+
+    @property
+    def association_pool(self) -> AssociationPool | None:
+        """Get or set the pool of associations to use for the C-STORE
+        sub-operations of C-MOVE requests.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        value : pool.AssociationPool | None
+            The pool to acquire the associations with the *Move Destination*
+            from, or ``None`` to request a new association for each C-MOVE
+            request (default).
+        """
+        return self._association_pool
+
+    @association_pool.setter
+    def association_pool(self, value: AssociationPool | None) -> None:
+        """Set the association pool."""
+        if value is not None and not isinstance(value, AssociationPool):
+            raise TypeError("'association_pool' must be an AssociationPool or None")
+
+        self._association_pool = value
+
+    def _create_requestor(
+        self,
+        addr: str | tuple[str, int, int],
+        port: int,
+        contexts: ListCXType | None,
+        ae_title: str,
+        max_pdu: int,
+        ext_neg: list[_UI] | None,
+        bind_address: tuple[str, int] | tuple[str, int, int, int] | None,
+        evt_handlers: list[EventHandlerType] | None,
+    ) -> Association:
+        """Return a new requestor :class:`~pynetdicom.association.Association`
+        configured ready for association negotiation.
+
+        .. versionadded:: 3.1
+
+        See :meth:`associate` for the parameters.
+        """
         if not isinstance(addr, (str, tuple)):
             raise TypeError("'addr' must be str or tuple[str, int, int]")
 
@@ -615,10 +719,6 @@ class ApplicationEntity:
         timestamp = datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
         assoc.name = f"RequestorThread@{timestamp}"
 
-        # Setup the association's communication socket
-        sock = self._create_socket(assoc, local_address, tls_args)
-        assoc.set_socket(sock)
-
         # Association Acceptor object -> remote AE
         # `ae_title` validation is performed by the ServiceUser
         assoc.acceptor.ae_title = ae_title
@@ -646,29 +746,142 @@ class ApplicationEntity:
                 "before associating with a peer"
             )
 
-        # Set using a copy of the original to play nicely
-        contexts = deepcopy(contexts)
+        # Reuse the contexts and A-ASSOCIATE-RQ PDU prebuilt for a previous
+        #   request that differed by at most the Called AE Title
+        key = self._request_key(assoc, contexts)
+        with self._lock:
+            template = self._request_templates.get(key) if key else None
+
+        if template is None:
+            # Set using a copy of the original to play nicely
+            contexts = deepcopy(contexts)
+
+            # Add the context IDs
+            for ii, context in enumerate(contexts):
+                context.context_id = 2 * ii + 1
+
+            assoc.requestor.requested_contexts = contexts
+            if key:
+                template = (contexts, A_ASSOCIATE_RQ(assoc.acse._request_primitive()))
+                with self._lock:
+                    if len(self._request_templates) >= _MAX_REQUEST_TEMPLATES:
+                        del self._request_templates[next(iter(self._request_templates))]
 
-        # Add the context IDs
-        for ii, context in enumerate(contexts):
-            context.context_id = 2 * ii + 1
+                    self._request_templates[key] = template
 
-        assoc.requestor.requested_contexts = contexts
+        if template is not None:
+            assoc.requestor.requested_contexts = _copy_contexts(template[0])
+            assoc._request_pdu = template[1]._from_template(assoc.acceptor.ae_title)
 
         # Bind events to the handlers
         evt_handlers = evt_handlers or []
         for evt_hh_args in evt_handlers:
             assoc.bind(*evt_hh_args)
 
-        # Send an A-ASSOCIATE request to the peer and start negotiation
-        assoc.request()
+        return assoc
 
-        # If the result of the negotiation was acceptance then start up
-        #   the Association thread
-        if assoc.is_established:
-            assoc.start()
+    def _negotiate_as_acceptor(
+        self, rq_contexts: ListCXType, ac_contexts: ListCXType, roles: RoleType = None
+    ) -> CXNegotiationReturn:
+        """Return the result of negotiating presentation contexts as the
+        association acceptor.
 
-        return assoc
+        .. versionadded:: 3.1
+
+        Equivalent to :func:`~pynetdicom.presentation.negotiate_as_acceptor`,
+        except that the results are cached and copies of them returned for
+        any later negotiation with the same proposed contexts, roles and
+        supported contexts.
+
+        Parameters
+        ----------
+        rq_contexts : list of presentation.PresentationContext
+            The presentation contexts proposed by the peer.
+        ac_contexts : list of presentation.PresentationContext
+            The presentation contexts supported by the local AE.
+        roles : dict or None, optional
+            The requestor's SCP/SCU Role Selection Negotiation items as
+            ``{'SOP Class UID' : (SCU role, SCP role)}``, if any.
+
+        Returns
+        -------
+        list of presentation.PresentationContext
+            The negotiated presentation contexts.
+        list of pdu_primitives.SCP_SCU_RoleSelectionNegotiation
+            Any SCP/SCU Role Selection Negotiation items to send back to the
+            requestor.
+        """
+        key = (
+            tuple(
+                (cx.context_id, cx.abstract_syntax, tuple(cx.transfer_syntax))
+                for cx in rq_contexts
+            ),
+            tuple(sorted((roles or {}).items())),
+            tuple(
+                (
+                    cx.abstract_syntax,
+                    tuple(cx.transfer_syntax),
+                    cx.scu_role,
+                    cx.scp_role,
+                )
+                for cx in ac_contexts
+            ),
+        )
+        with self._lock:
+            result = self._negotiation_results.get(key)
+
+        if result is None:
+            result = negotiate_as_acceptor(rq_contexts, ac_contexts, roles)
+            with self._lock:
+                if len(self._negotiation_results) >= _MAX_NEGOTIATION_RESULTS:
+                    del self._negotiation_results[next(iter(self._negotiation_results))]
+
+                self._negotiation_results[key] = result
+
+        contexts, ac_roles = result
+
+        return _copy_contexts(contexts), [copy(item) for item in ac_roles]
+
+    @staticmethod
+    def _request_key(
+        assoc: Association, contexts: ListCXType
+    ) -> _RequestKeyType | None:
+        """Return the key used to cache the A-ASSOCIATE-RQ PDU for `assoc`.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The requestor association, with everything other than its requested
+            presentation contexts configured.
+        contexts : list of presentation.PresentationContext
+            The presentation contexts to be requested.
+
+        Returns
+        -------
+        tuple | None
+            The key, or ``None`` if the request shouldn't be cached because it
+            contains user identity negotiation.
+        """
+        user_information = assoc.requestor.user_information
+        # Don't keep hold of anyone's credentials
+        if any(isinstance(ii, UserIdentityNegotiation) for ii in user_information):
+            return None
+
+        return (
+            assoc.requestor.ae_title,
+            tuple(
+                (
+                    cx.abstract_syntax,
+                    tuple(cx.transfer_syntax),
+                    cx.scu_role,
+                    cx.scp_role,
+                )
+                for cx in contexts
+            ),
+            b"".join(item.from_primitive().encode() for item in user_information),
+        )
 
     def _create_socket(
         self,
@@ -906,6 +1119,66 @@ class ApplicationEntity:
             LOGGER.warning("maximum_associations set to 1")
             self._maximum_associations = 1
 
+    @property
+    def maximum_buffered_bytes(self) -> int | None:
+        """Get or set the maximum total size (in bytes) of the received DIMSE
+        messages an association will buffer while they wait to be handled.
+
+        .. versionadded:: 3.1
+
+        Once the limit is reached the association stops reading from the
+        connection until enough of the buffered messages have been handled,
+        so that TCP flow control pushes back on the peer. Requests being
+        handled in a worker thread, as allowed by an Asynchronous Operations
+        Window, count towards the limit until their handler returns. The
+        number of times this has happened is available from the association's
+        :attr:`DIMSEServiceProvider.throttle_count
+        <pynetdicom.dimse.DIMSEServiceProvider.throttle_count>`.
+
+        Parameters
+        ----------
+        value : int or None
+            The maximum number of bytes, or ``None`` for no limit (default).
+        """
+        return self._maximum_buffered_bytes
+
+    @maximum_buffered_bytes.setter
+    def maximum_buffered_bytes(self, value: int | None) -> None:
+        """Set the maximum number of buffered bytes."""
+        if value is None or (isinstance(value, int) and value >= 1):
+            self._maximum_buffered_bytes = value
+        else:
+            LOGGER.warning("maximum_buffered_bytes set to None")
+            self._maximum_buffered_bytes = None
+
+    @property
+    def maximum_buffered_messages(self) -> int | None:
+        """Get or set the maximum number of received DIMSE messages an
+        association will buffer while they wait to be handled.
+
+        .. versionadded:: 3.1
+
+        Once the limit is reached the association stops reading from the
+        connection until one of the buffered messages has been handled, see
+        :attr:`maximum_buffered_bytes`.
+
+        Parameters
+        ----------
+        value : int or None
+            The maximum number of messages, or ``None`` for no limit
+            (default).
+        """
+        return self._maximum_buffered_messages
+
+    @maximum_buffered_messages.setter
+    def maximum_buffered_messages(self, value: int | None) -> None:
+        """Set the maximum number of buffered messages."""
+        if value is None or (isinstance(value, int) and value >= 1):
+            self._maximum_buffered_messages = value
+        else:
+            LOGGER.warning("maximum_buffered_messages set to None")
+            self._maximum_buffered_messages = None
+
     @property
     def maximum_pdu_size(self) -> int:
         """Get or set the maximum PDU size accepted by the AE as :class:`int`.
@@ -1192,6 +1465,9 @@ class ApplicationEntity:
         if isinstance(transfer_syntax, str):
             transfer_syntax = [transfer_syntax]
 
+        # Any cached negotiation results may no longer apply
+        self._negotiation_results.clear()
+
         # Check abstract syntax is actually present
         #   we don't warn if not present because by not being present its not
         #   supported and hence the user's intent has been satisfied
@@ -1341,6 +1617,307 @@ class ApplicationEntity:
 
         self._require_calling_aet = values
 
+    def send_many(
+        self,
+        datasets: Iterable[str | Path | Dataset],
+        addr: str | tuple[str, int, int],
+        port: int,
+        n_associations: int = 4,
+        contexts: ListCXType | None = None,
+        ae_title: str = "ANY-SCP",
+        retries: int = 1,
+        **kwargs: Any,
+    ) -> Iterator[tuple[str | Path | Dataset, Dataset]]:
+        """Send C-STORE requests for `datasets` to a peer using several
+        associations at once.
+
+        .. versionadded:: 3.1
+
+        Up to `n_associations` associations are requested with the peer and
+        the datasets are shared between them, with each association taking
+        the next dataset from `datasets` as soon as it's able to send another
+        request. Requests are sent using
+        :meth:`Association.send_c_store_many()
+        <pynetdicom.association.Association.send_c_store_many>` so each
+        association may also have several requests outstanding if an
+        asynchronous operations window was negotiated.
+
+        If an association fails before a response is received for a dataset
+        then the dataset is sent again using a new association, up to
+        `retries` times. Datasets that can't be sent, such as when there's no
+        accepted presentation context for one or its file can't be read,
+        aren't retried and the association continues to be used for the
+        others.
+
+        Parameters
+        ----------
+        datasets : iterable of pydicom.dataset.Dataset, str or pathlib.Path
+            The DICOM datasets to send to the peer or the file paths to the
+            datasets, see :meth:`Association.send_c_store()
+            <pynetdicom.association.Association.send_c_store>`. Datasets are
+            only read from `datasets` when an association is ready to send
+            them.
+        addr : str | tuple[str, int, int]
+            The peer AE's TCP/IP address, see :meth:`associate`.
+        port : int
+            The peer AE's listen port number.
+        n_associations : int, optional
+            The maximum number of associations to use (default ``4``).
+        contexts : list of presentation.PresentationContext, optional
+            The presentation contexts to request, if not used then the
+            contexts in :attr:`requested_contexts` will be requested instead.
+        ae_title : str, optional
+            The peer's AE title (default ``'ANY-SCP'``).
+        retries : int, optional
+            The number of times a dataset will be sent again after the
+            association it was sent on fails (default ``1``).
+        **kwargs
+            Other keyword parameters to pass to :meth:`associate` when
+            requesting each association.
+
+        Yields
+        ------
+        dataset : pydicom.dataset.Dataset, str or pathlib.Path
+            The item from `datasets` that the result is for.
+        status : pydicom.dataset.Dataset
+            The status of the C-STORE operation, see
+            :meth:`Association.send_c_store()
+            <pynetdicom.association.Association.send_c_store>`. Results are
+            yielded in the order they're received and may not be in the same
+            order as `datasets`. If the dataset couldn't be sent, or no valid
+            response was received after all the retries, then an empty
+            :class:`~pydicom.dataset.Dataset` is yielded.
+
+        Raises
+        ------
+        ValueError
+            If `n_associations` is less than 1 or `retries` is negative.
+        RuntimeError
+            If called with no requested presentation contexts (i.e. `contexts`
+            has not been supplied and :attr:`requested_contexts` is empty).
+        """
+        if n_associations < 1:
+            raise ValueError("'n_associations' must be at least 1")
+
+        if retries < 0:
+            raise ValueError("'retries' must not be negative")
+
+        if not (contexts or self.requested_contexts):
+            raise RuntimeError(
+                "At least one requested presentation context is required "
+                "before associating with a peer"
+            )
+
+        return self._send_many(
+            iter(datasets),
+            n_associations,
+            retries,
+            (addr, port, contexts, ae_title),
+            kwargs,
+        )
+
+    def _send_many(
+        self,
+        datasets: Iterator[str | Path | Dataset],
+        n_associations: int,
+        retries: int,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Iterator[tuple[str | Path | Dataset, Dataset]]:
+        """Generator for :meth:`send_many`.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        datasets : iterator of pydicom.dataset.Dataset, str or pathlib.Path
+            The datasets to send.
+        n_associations : int
+            The maximum number of associations to use.
+        retries : int
+            The number of times to retry sending a dataset.
+        args : tuple
+            The positional arguments for :meth:`associate`.
+        kwargs : dict
+            The keyword arguments for :meth:`associate`.
+
+        Yields
+        ------
+        See ``send_many()``.
+        """
+        lock = threading.Lock()
+        stop = threading.Event()
+        # Exceptions raised by `datasets`
+        errors: list[Exception] = []
+
+        def take() -> _SendItemType | None:
+            """Return the next dataset to send and the number of times it's
+            been tried, or ``None`` if there are no more datasets.
+            """
+            with lock:
+                if stop.is_set():
+                    return None
+
+                try:
+                    return next(datasets), 0
+                except StopIteration:
+                    return None
+                except Exception as exc:
+                    # Stop all the workers and re-raise once they're done
+                    errors.append(exc)
+                    stop.set()
+                    return None
+
+        # (dataset, status) results, or None when a worker is finished
+        results: "queue.SimpleQueue[tuple[str | Path | Dataset, Dataset] | None]"
+        results = queue.SimpleQueue()
+
+        executor = ThreadPoolExecutor(
+            max_workers=n_associations, thread_name_prefix="SendMany"
+        )
+        futures = [
+            executor.submit(
+                self._send_many_worker, take, results, retries, args, kwargs
+            )
+            for _ in range(n_associations)
+        ]
+
+        nr_finished = 0
+        try:
+            while nr_finished < n_associations:
+                result = results.get()
+                if result is None:
+                    nr_finished += 1
+                    continue
+
+                yield result
+        finally:
+            # Stop sending if the caller stopped early, then wait for the
+            #   outstanding requests to finish
+            stop.set()
+            while nr_finished < n_associations:
+                if results.get() is None:
+                    nr_finished += 1
+
+            executor.shutdown()
+
+        if errors:
+            raise errors[0]
+
+        for future in futures:
+            future.result()
+
+    def _send_many_worker(
+        self,
+        take: Callable[[], _SendItemType | None],
+        results: "queue.SimpleQueue[tuple[str | Path | Dataset, Dataset] | None]",
+        retries: int,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Send datasets using one association at a time for
+        :meth:`send_many`.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        take : Callable[[], tuple[Dataset | str | Path, int] | None]
+            Returns the next dataset to send and the number of times it's been
+            tried, or ``None`` if there are no more.
+        results : queue.SimpleQueue
+            The queue to put the (dataset, status) results on, followed by
+            ``None`` when finished.
+        retries : int
+            The number of times to retry sending a dataset.
+        args : tuple
+            The positional arguments for :meth:`associate`.
+        kwargs : dict
+            The keyword arguments for :meth:`associate`.
+        """
+        # Datasets to be sent again using a new association
+        retry: deque[_SendItemType] = deque()
+        # The datasets that have been taken for sending with the current
+        #   association but have no result yet
+        sending: list[_SendItemType] = []
+        assoc: Association | None = None
+
+        def failed(item: _SendItemType) -> None:
+            if item[1] < retries:
+                retry.append((item[0], item[1] + 1))
+            else:
+                results.put((item[0], Dataset()))
+
+        def requests(item: _SendItemType) -> Iterator[str | Path | Dataset]:
+            while True:
+                sending.append(item)
+                yield item[0]
+
+                # Datasets to be retried are left for the next association
+                next_item = take()
+                if next_item is None:
+                    return
+
+                item = next_item
+
+        try:
+            while True:
+                # Datasets are only retried using a new association
+                is_new = assoc is None or not assoc.is_established
+                item = retry.popleft() if retry and is_new else take()
+                if item is None:
+                    break
+
+                if assoc is None or not assoc.is_established:
+                    assoc = self.associate(*args, **kwargs)
+                    if not assoc.is_established:
+                        failed(item)
+                        continue
+
+                is_failed = False
+                try:
+                    for dataset, status in assoc.send_c_store_many(requests(item)):
+                        idx = next(
+                            ii for ii, sent in enumerate(sending) if sent[0] is dataset
+                        )
+                        sent = sending.pop(idx)
+                        if status:
+                            results.put((dataset, status))
+                        else:
+                            failed(sent)
+                            is_failed = True
+                except Exception as exc:
+                    # The most recent dataset couldn't be sent, the responses
+                    #   to any others have already been received
+                    LOGGER.error("Unable to send the dataset")
+                    LOGGER.exception(exc)
+                    sent = sending.pop() if sending else item
+                    if assoc.is_established:
+                        # A problem with the dataset itself, such as no
+                        #   accepted context or it can't be read or encoded
+                        results.put((sent[0], Dataset()))
+                    else:
+                        failed(sent)
+                        is_failed = True
+
+                for sent in sending:
+                    failed(sent)
+                    is_failed = True
+
+                sending.clear()
+
+                # Always use a new association after a failure
+                if is_failed:
+                    if assoc.is_established:
+                        assoc.abort()
+
+                    assoc = None
+        finally:
+            if assoc is not None and assoc.is_established:
+                assoc.release()
+
+            results.put(None)
+
     def shutdown(self) -> None:
         """Stop any active association servers and threads."""
         for assoc in self.active_associations:
@@ -1361,7 +1938,9 @@ class ApplicationEntity:
         evt_handlers: list[EventHandlerType] | None = None,
         ae_title: str | None = None,
         contexts: ListCXType | None = None,
-    ) -> ThreadedAssociationServer | None:
+        server_class: type[AssociationServer] | None = None,
+        **kwargs: Any,
+    ) -> AssociationServer | None:
         """Start the AE as an association *acceptor*.
 
         If set to non-blocking then a running
@@ -1416,10 +1995,24 @@ class ApplicationEntity:
             The presentation contexts that will be supported by the SCP. If
             not used then the presentation contexts in the
             :attr:`supported_contexts` property will be used instead (default).
+        server_class : type, optional
+            The :class:`~pynetdicom.transport.AssociationServer` subclass to
+            use for the server, such as
+            :class:`~pynetdicom.transport.MultiplexedAssociationServer`. If not
+            used then an :class:`~pynetdicom.transport.AssociationServer` will
+            be used when `block` is ``True``, otherwise a
+            :class:`~pynetdicom.transport.ThreadedAssociationServer` (default).
+
+            .. versionadded:: 3.1
+        **kwargs
+            Additional keyword parameters to pass to the constructor of
+            `server_class`.
+
+            .. versionadded:: 3.1
 
         Returns
         -------
-        transport.ThreadedAssociationServer or None
+        transport.AssociationServer or None
             If `block` is ``False`` then returns the server instance, otherwise
             returns ``None``.
         """
@@ -1431,6 +2024,8 @@ class ApplicationEntity:
                 contexts=contexts,
                 ssl_context=ssl_context,
                 evt_handlers=evt_handlers,
+                server_class=server_class,
+                **kwargs,
             )
             self._servers.append(server)
 
@@ -1450,7 +2045,8 @@ class ApplicationEntity:
             contexts=contexts,
             ssl_context=ssl_context,
             evt_handlers=evt_handlers,
-            server_class=ThreadedAssociationServer,
+            server_class=server_class or ThreadedAssociationServer,
+            **kwargs,
         )
 
         thread = threading.Thread(
@@ -1463,6 +2059,57 @@ class ApplicationEntity:
 
         return server
 
+    @property
+    def store_recv_spool_dir(self) -> Path | None:
+        """Get or set the directory that received C-STORE datasets are spooled
+        to.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        value : str, os.PathLike or None
+            The directory to write spooled datasets to, or ``None`` to use the
+            system's default temporary directory (default).
+        """
+        return self._store_recv_spool_dir
+
+    @store_recv_spool_dir.setter
+    def store_recv_spool_dir(self, value: str | os.PathLike | None) -> None:
+        """Set the spool directory."""
+        self._store_recv_spool_dir = Path(value) if value is not None else None
+
+    @property
+    def store_recv_spool_threshold(self) -> int | None:
+        """Get or set the size (in bytes) a received C-STORE dataset can reach
+        before it's spooled to file.
+
+        .. versionadded:: 3.1
+
+        Datasets no larger than the threshold are kept in memory, while larger
+        ones are written to a temporary file in :attr:`store_recv_spool_dir`
+        and made available to the ``evt.EVT_C_STORE`` handler via
+        :attr:`Event.dataset_path<pynetdicom.events.Event.dataset_path>`.
+        When set this is used instead of
+        :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET`.
+
+        Parameters
+        ----------
+        value : int or None
+            The spool threshold in bytes, or ``None`` to use
+            :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` (default).
+        """
+        return self._store_recv_spool_threshold
+
+    @store_recv_spool_threshold.setter
+    def store_recv_spool_threshold(self, value: int | None) -> None:
+        """Set the spool threshold."""
+        if value is None or (isinstance(value, int) and value >= 0):
+            self._store_recv_spool_threshold = value
+        else:
+            LOGGER.warning("store_recv_spool_threshold set to None")
+            self._store_recv_spool_threshold = None
+
     def __str__(self) -> str:
         """Prints out the attribute values and status for the AE"""
         s = [""]
@@ -1566,6 +2213,7 @@ class ApplicationEntity:
         """Set the supported presentation contexts using a list."""
         if not contexts:
             self._supported_contexts = {}
+            self._negotiation_results.clear()
 
         for item in contexts:
             if not isinstance(item, PresentationContext):
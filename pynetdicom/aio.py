@@ -0,0 +1,1610 @@
+"""Native :mod:`asyncio` interface for association requestors and acceptors.
+
+.. versionadded:: 3.1
+
+The classes in this module run an association over an :mod:`asyncio` stream
+rather than a dedicated pair of reactor threads. The DICOM Upper Layer state
+machine, association negotiation and release, the encoding and decoding of PDUs
+and DIMSE messages and the service class implementations are shared with
+:class:`~pynetdicom.association.Association`, so the same presentation
+contexts, extended negotiation items and event handlers may be used with both.
+
+Event handlers for notification events are called from the event loop's
+thread and must not block. Service requests received from the peer, such as
+C-STORE or C-FIND, are passed to the corresponding service class in a worker
+thread using :meth:`loop.run_in_executor()<asyncio.loop.run_in_executor>`,
+so their intervention event handlers may block as usual.
+
+Examples
+--------
+
+Send a C-ECHO request to a peer::
+
+    import asyncio
+
+    from pynetdicom.aio import AsyncAE
+    from pynetdicom.sop_class import Verification
+
+    async def main():
+        ae = AsyncAE()
+        ae.add_requested_context(Verification)
+        async with await ae.associate_async("127.0.0.1", 11112) as assoc:
+            if assoc.is_established:
+                status = await assoc.send_c_echo()
+
+    asyncio.run(main())
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+from io import BytesIO
+import logging
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from pydicom.dataset import Dataset
+from pydicom.uid import UID
+
+from pynetdicom import _config, evt, transport
+from pynetdicom._globals import (
+    DEFAULT_MAX_LENGTH,
+    MODE_ACCEPTOR,
+    STATUS_CANCEL,
+    STATUS_FAILURE,
+    STATUS_PENDING,
+    STATUS_WARNING,
+)
+from pynetdicom._handlers import (
+    standard_dimse_recv_handler,
+    standard_dimse_sent_handler,
+    standard_pdu_recv_handler,
+    standard_pdu_sent_handler,
+)
+from pynetdicom.ae import ApplicationEntity
+from pynetdicom.association import Association
+from pynetdicom.dimse_primitives import C_ECHO, C_FIND, C_GET, C_MOVE, C_STORE
+from pynetdicom.dsutils import decode, pretty_dataset
+from pynetdicom.dul import _PDU_TYPES, _UNPACK_PDU_HEADER, DULServiceProvider
+from pynetdicom.pdu_primitives import A_ASSOCIATE
+from pynetdicom.sop_class import RepositoryQuery, Verification  # type: ignore
+from pynetdicom.status import code_to_category
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from ssl import SSLContext
+
+    from pynetdicom.association import ServiceUser
+    from pynetdicom.dimse_primitives import DimseServiceType
+    from pynetdicom.dul import _PDUPrimitiveType, _UserQueuePrimitives
+    from pynetdicom.events import EventHandlerType
+    from pynetdicom.transport import AssociationSocket
+    from pynetdicom.pdu_primitives import _UI
+    from pynetdicom.presentation import PresentationContext
+
+    ListCXType = list[PresentationContext]
+
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class _StreamSocket:
+    """The parts of the :class:`~pynetdicom.transport.AssociationSocket`
+    interface used by the DUL and its state machine, for an :mod:`asyncio`
+    stream.
+
+    Must only be used from the event loop's thread, except for
+    :meth:`_shutdown_socket`.
+    """
+
+    # Stream writers can't send directly from file, so datasets stored in
+    #   one are read by the worker sending them
+    _can_sendfile = False
+
+    def __init__(self, dul: "_AsyncDUL", writer: asyncio.StreamWriter) -> None:
+        self._dul = dul
+        self._writer = writer
+        self._is_connected = True
+        # There's no underlying socket to be monitored by a reactor
+        self.socket = None
+
+    @property
+    def assoc(self) -> Association:
+        """Return the parent :class:`~pynetdicom.association.Association`."""
+        return self._dul.assoc
+
+    def close(self) -> None:
+        """Close the connection to the peer.
+
+        **Events Emitted**
+
+        - Evt17: Transport connection closed
+        """
+        self._shutdown_socket()
+        if not self._is_connected:
+            return
+
+        self._is_connected = False
+        # Evt17: Transport connection closed
+        self._dul.event_queue.put("Evt17")
+
+    def connect(self, primitive: transport.T_CONNECT) -> None:
+        """Confirm the connection with the peer.
+
+        The connection is opened by :class:`AsyncAssociation` before the
+        association is requested, so this only issues the confirmation.
+
+        **Events Emitted**
+
+        - Evt2: Transport connection confirmation
+        """
+        primitive.result = "Evt2"
+        self._dul.to_provider_queue.put(primitive)
+
+    def send(self, bytestream: bytes) -> None:
+        """Write the data in `bytestream` to the stream."""
+        self.sendmsg([bytestream])
+
+    def sendmsg(self, buffers: "Iterable[bytes | bytearray | memoryview]") -> None:
+        """Write the data in `buffers` to the stream."""
+        if self._writer.is_closing():
+            LOGGER.warning("Attempted to send data over closed connection")
+            return
+
+        buffers = list(buffers)
+        self._writer.writelines(buffers)
+
+        # Only join the buffers if there's a handler to pass the data to
+        if self.assoc.get_handlers(evt.EVT_DATA_SENT):
+            evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": b"".join(buffers)})
+
+    def _shutdown_socket(self) -> None:
+        """Close the stream."""
+        dul = self._dul
+        if threading.get_ident() != dul._loop_thread:
+            try:
+                dul._loop.call_soon_threadsafe(self._shutdown_socket)
+            except RuntimeError:
+                # Event loop is closed
+                pass
+
+            return
+
+        if not self._writer.is_closing():
+            self._writer.close()
+
+
+class _AsyncDUL(DULServiceProvider):
+    """A DUL service provider driven by an :mod:`asyncio` event loop.
+
+    PDUs received by :meth:`AsyncAssociation._read_loop` and primitives from
+    the local user are processed by the same state machine as the
+    :class:`~pynetdicom.dul.DULServiceProvider`, but from the event loop's
+    thread rather than from a reactor thread. The DUL is never started as a
+    :class:`threading.Thread`.
+
+    Primitives may be sent from either the event loop's thread or from a
+    worker thread, in which case the call blocks until the resulting PDU has
+    been written.
+    """
+
+    def __init__(
+        self,
+        assoc: Association,
+        loop: asyncio.AbstractEventLoop,
+        callback: Callable[[], None],
+    ) -> None:
+        """Create a new DUL service provider for `assoc`.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The DUL's parent association.
+        loop : asyncio.AbstractEventLoop
+            The event loop to run the state machine in.
+        callback : Callable[[], None]
+            Called from the event loop's thread after the state machine has
+            processed one or more events, after the DUL has stopped or when
+            the service user has been woken.
+        """
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._callback = callback
+        # Cleared while reading from the peer is paused
+        self._reading = asyncio.Event()
+        self._reading.set()
+        # Set when the service user has been woken
+        self._user_woken = asyncio.Event()
+
+        super().__init__(assoc)
+
+    def _call_soon(self, func: Callable[[], None]) -> None:
+        """Schedule `func` to be called from the event loop's thread."""
+        try:
+            self._loop.call_soon_threadsafe(func)
+        except RuntimeError:
+            # Event loop is closed
+            pass
+
+    async def drain(self) -> None:
+        """Wait until the outgoing data has been flushed to the transport."""
+        sock = cast("_StreamSocket | None", self.socket)
+        if sock and not sock._writer.is_closing():
+            try:
+                await sock._writer.drain()
+            except ConnectionError:
+                pass
+
+    def is_alive(self) -> bool:
+        """Return ``True`` until the DUL has stopped."""
+        return not self._stopped.is_set()
+
+    def _is_transport_event(self) -> bool:
+        """Close the connection if the peer hasn't closed it after waiting in
+        Sta13.
+
+        Received PDUs are placed in the event queue by the read loop rather
+        than being read here.
+
+        Returns
+        -------
+        bool
+            ``True`` if the connection was closed, ``False`` otherwise.
+        """
+        sock = cast("_StreamSocket", self.socket)
+        if self.state_machine.current_state != "Sta13" or not sock._is_connected:
+            return False
+
+        if self._is_waiting_for_close():
+            return False
+
+        sock.close()
+        return True
+
+    def _notify(self) -> None:
+        """Wake the service user."""
+        self._user_woken.set()
+        self._callback()
+
+    def _run(self) -> None:
+        """Run the state machine until it has nothing left to process.
+
+        Must be called from the event loop's thread. The equivalent of
+        :meth:`SharedReactor._run()<pynetdicom.dul.SharedReactor._run>`.
+        """
+        if self._stopped.is_set():
+            return
+
+        processed = False
+        try:
+            while not self._kill_thread and self._step():
+                processed = True
+        except Exception as exc:
+            LOGGER.error("Exception in the DUL, stopping the DUL")
+            LOGGER.exception(exc)
+            self._kill_thread = True
+
+        if not self._is_reading_paused():
+            self._reading.set()
+
+        # The connection is closed and idle so there's nothing more to do
+        sock = cast("_StreamSocket | None", self.socket)
+        finished = self.state_machine.current_state == "Sta1" and (
+            sock is not None and not sock._is_connected
+        )
+        if self._kill_thread or finished:
+            self._set_stopped()
+        elif not processed:
+            return
+
+        self._notify()
+
+    def send_pdu(self, primitive: "_PDUPrimitiveType") -> None:
+        """Place a primitive in the provider queue to be sent to the peer.
+
+        Parameters
+        ----------
+        primitive : pdu_primitives.PDU sub-class
+            A service primitive, one of:
+
+            .. currentmodule:: pynetdicom.pdu_primitives
+
+            * :class:`A_ASSOCIATE`
+            * :class:`A_RELEASE`
+            * :class:`A_ABORT`
+            * :class:`A_P_ABORT`
+            * :class:`P_DATA`
+        """
+        super().send_pdu(primitive)
+        if threading.get_ident() == self._loop_thread:
+            return
+
+        # Called from a worker thread: block until the data has been flushed
+        #   so that large messages are subject to the transport's flow control
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.drain(), self._loop)
+        except RuntimeError:
+            # Event loop is closed
+            return
+
+        future.result()
+
+    def _set_stopped(self) -> None:
+        """Signal that the DUL has stopped and close the connection."""
+        for timer in (self.artim_timer, self._idle_timer, self._close_timer):
+            timer.stop()
+
+        if self.socket is not None:
+            self.socket._shutdown_socket()
+
+        super()._set_stopped()
+
+    def _start(self, writer: asyncio.StreamWriter) -> None:
+        """Start the DUL using the connection with the peer.
+
+        Parameters
+        ----------
+        writer : asyncio.StreamWriter
+            The writer for the connection with the peer.
+        """
+        self.socket = cast("AssociationSocket", _StreamSocket(self, writer))
+        self._idle_timer.start()
+
+    def stop_dul(self) -> bool:
+        """Stop the DUL and return ``True``.
+
+        Unlike :meth:`DULServiceProvider.stop_dul()
+        <pynetdicom.dul.DULServiceProvider.stop_dul>` this doesn't wait for
+        the state machine to return to Sta1 as it may be called from the
+        event loop. Instead the connection is closed, unless the state machine
+        is already waiting for it to close.
+        """
+        self._call_soon(self._stop)
+        return True
+
+    def _stop(self) -> None:
+        """Close the connection unless the state machine is waiting for it to
+        close, then run the state machine.
+        """
+        # Send anything the local user has already issued
+        self._run()
+
+        sock = cast("_StreamSocket | None", self.socket)
+        state = self.state_machine.current_state
+        if sock is None or state == "Sta13":
+            return
+
+        if state == "Sta1":
+            # Not yet started or already finished
+            sock._is_connected = False
+            sock._shutdown_socket()
+        else:
+            sock.close()
+
+        self._run()
+
+    def _wakeup(self) -> None:
+        """Schedule the state machine to be run."""
+        self._call_soon(self._run)
+
+    def _wakeup_user(self) -> None:
+        """Schedule the service user to be woken."""
+        self._call_soon(self._notify)
+
+
+class AsyncAssociation:
+    """An association with a peer AE that uses :mod:`asyncio`.
+
+    .. versionadded:: 3.1
+
+    Instances should be created using :meth:`AsyncAE.associate_async` when
+    acting as the association requestor, or will be created by
+    :class:`AsyncAssociationServer` when acting as the association acceptor.
+
+    May be used as an asynchronous context manager, in which case the
+    association will be released on exit (if still established).
+    """
+
+    def __init__(self, assoc: Association) -> None:
+        """Create a new :class:`AsyncAssociation`.
+
+        Must be called from within a running event loop.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The configured, but not started, association to use for
+            negotiation and for encoding and decoding messages.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._assoc = assoc
+        self.dul = _AsyncDUL(assoc, self._loop, self._reactor_step)
+        assoc.dul = self.dul
+
+        self._reader: asyncio.StreamReader | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._closed = asyncio.Event()
+
+        # Service requests from the peer, (None, None) for an A-RELEASE request
+        self._requests: "asyncio.Queue[tuple[int | None, DimseServiceType | None]]" = (
+            asyncio.Queue()
+        )
+        # Service responses from the peer, (None, None) if the connection closed
+        self._responses: "asyncio.Queue[tuple[int | None, DimseServiceType | None]]" = (
+            asyncio.Queue()
+        )
+        # True while a C-GET or C-MOVE request is awaiting responses
+        self._retrieving = False
+        self._releasing = False
+
+    async def __aenter__(self) -> "AsyncAssociation":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self.is_established:
+            await self.release()
+
+        await self.wait_closed()
+
+    async def abort(self) -> None:
+        """Abort the association by sending an A-ABORT to the peer and wait
+        for the connection to close.
+        """
+        self._abort()
+        await self.wait_closed()
+
+    def _abort(self) -> None:
+        """Send an A-ABORT to the peer and close the connection."""
+        if self._assoc._sent_abort or self._assoc.is_released:
+            return
+
+        self._assoc._abort_blocking(block=False)
+        self._assoc.kill()
+
+    @property
+    def accepted_contexts(self) -> list["PresentationContext"]:
+        """Return a :class:`list` of accepted
+        :class:`~pynetdicom.presentation.PresentationContext`.
+        """
+        return self._assoc.accepted_contexts
+
+    @property
+    def acceptor(self) -> "ServiceUser":
+        """Return the association *acceptor*
+        :class:`~pynetdicom.association.ServiceUser`.
+        """
+        return self._assoc.acceptor
+
+    async def _accept(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Negotiate an association as the association *acceptor*."""
+        assoc = self._assoc
+        self._start(reader, writer)
+
+        remote = cast(transport.AddressInformation, self.requestor.address_info)
+        evt.trigger(assoc, evt.EVT_CONN_OPEN, {"address": remote.as_tuple})
+        # Evt5: Transport connection indication
+        self.dul.event_queue.put("Evt5")
+
+        primitive = await self._receive_acse(assoc.acse_timeout)
+        if not isinstance(primitive, A_ASSOCIATE):
+            # Timed out waiting for A-ASSOCIATE request or connection closed
+            assoc.kill()
+            return
+
+        self.requestor.primitive = primitive
+        evt.trigger(assoc, evt.EVT_REQUESTED, {})
+
+        # User used EVT_REQUESTED to send an A-ABORT or A-ASSOCIATE-RJ
+        if not assoc.is_aborted and not assoc.is_rejected:
+            await self._run(assoc.acse.negotiate_association)
+
+        self._established()
+
+    @property
+    def acse_timeout(self) -> float | None:
+        """Get or set the ACSE timeout value (in seconds)."""
+        return self._assoc.acse_timeout
+
+    @acse_timeout.setter
+    def acse_timeout(self, value: float | None) -> None:
+        """Set the ACSE timeout (in seconds)."""
+        self._assoc.acse_timeout = value
+
+    @property
+    def ae(self) -> ApplicationEntity:
+        """Return the parent AE."""
+        return self._assoc.ae
+
+    @property
+    def assoc(self) -> Association:
+        """Return the underlying :class:`~pynetdicom.association.Association`.
+
+        This is the association passed to event handlers as ``event.assoc``.
+        """
+        return self._assoc
+
+    def bind(
+        self, event: evt.EventType, handler: Callable, args: None | list[Any] = None
+    ) -> None:
+        """Bind a callable `handler` to an `event`.
+
+        Parameters
+        ----------
+        event : collections.namedtuple
+            The event to bind the function to.
+        handler : callable
+            The function that will be called if the event occurs.
+        args : list, optional
+            Optional extra arguments to be passed to the handler (default:
+            no extra arguments passed to the handler).
+        """
+        self._assoc.bind(event, handler, args)
+
+    def _check_received_status(self, rsp: "DimseServiceType") -> Dataset:
+        """Return a :class:`~pydicom.dataset.Dataset` containing status
+        related elements, aborting the association if `rsp` is invalid.
+        """
+        if not rsp.is_valid_response:
+            LOGGER.error(f"Received an invalid {rsp.msg_type} response from the peer")
+            self._abort()
+            return Dataset()
+
+        return self._assoc._check_received_status(rsp)
+
+    def _connection_closed(self) -> None:
+        """Clean up once the DUL has stopped and the connection with the peer
+        has closed.
+        """
+        if self._closed.is_set():
+            return
+
+        # Unblock anything waiting on a DIMSE message
+        self._assoc.dimse.msg_queue.put((None, None))
+        self._responses.put_nowait((None, None))
+
+        for task in self._tasks:
+            if task is not asyncio.current_task():
+                task.cancel()
+
+        self._closed.set()
+        # Unblock anything waiting on an ACSE primitive
+        self.dul._user_woken.set()
+
+    def _decode_identifier(
+        self, bytestream: BytesIO | None, transfer_syntax: UID
+    ) -> Dataset | None:
+        """Return the decoded Identifier dataset from a response."""
+        try:
+            identifier = decode(
+                cast(BytesIO, bytestream),
+                transfer_syntax.is_implicit_VR,
+                transfer_syntax.is_little_endian,
+                transfer_syntax.is_deflated,
+            )
+        except Exception as exc:
+            LOGGER.error("Failed to decode the received Identifier dataset")
+            LOGGER.exception(exc)
+            return None
+
+        if identifier and _config.LOG_RESPONSE_IDENTIFIERS:
+            LOGGER.info("")
+            LOGGER.info("# Response Identifier")
+            for line in pretty_dataset(identifier):
+                LOGGER.info(line)
+
+            LOGGER.info("")
+
+        return identifier
+
+    @property
+    def dimse_timeout(self) -> float | None:
+        """Get or set the DIMSE timeout (in seconds)."""
+        return self._assoc.dimse_timeout
+
+    @dimse_timeout.setter
+    def dimse_timeout(self, value: float | None) -> None:
+        """Set the DIMSE timeout (in seconds)."""
+        self._assoc.dimse_timeout = value
+
+    def _dispatch(self) -> None:
+        """Route received DIMSE messages to the request or response queues.
+
+        Messages are left in the DIMSE provider's queue while a service class
+        is running in a worker thread as it may be waiting on them.
+        """
+        assoc = self._assoc
+        if not assoc.is_established or assoc._is_paused:
+            return
+
+        while True:
+            # Requests count towards the buffer limits until they're handled
+            context_id, msg = assoc.dimse.get_msg(block=False, hold=True)
+            if msg is None:
+                return
+
+            if msg.is_valid_request and not (
+                self._retrieving and isinstance(msg, C_STORE)
+            ):
+                self._requests.put_nowait((context_id, msg))
+            else:
+                assoc.dimse.release_msg(msg)
+                self._responses.put_nowait((context_id, msg))
+
+    def _established(self) -> None:
+        """Start serving requests once association negotiation is complete."""
+        if not self.is_established:
+            self._assoc.kill()
+            return
+
+        self._tasks.append(asyncio.ensure_future(self._serve()))
+
+        # Handle anything received while negotiation was completing
+        self._reactor_step()
+
+    async def _find_responses(
+        self, transfer_syntax: UID, query_model: UID
+    ) -> AsyncIterator[tuple[Dataset, Dataset | None]]:
+        """Yield the C-FIND responses from the peer."""
+        operation_no = 1
+        while True:
+            _, rsp = await self._receive_response()
+            if rsp is None:
+                self._handle_no_response()
+                yield Dataset(), None
+                return
+
+            if not isinstance(rsp, C_FIND):
+                LOGGER.error(
+                    f"Received an unexpected {rsp.msg_type} message from the peer"
+                )
+                self._abort()
+                yield Dataset(), None
+                return
+
+            if not rsp.is_valid_response:
+                LOGGER.error("Received an invalid C-FIND response from the peer")
+                self._abort()
+                yield Dataset(), None
+                return
+
+            status = self._assoc._check_received_status(rsp)
+            category = code_to_category(cast(int, status.Status))
+
+            LOGGER.debug("")
+            if query_model == RepositoryQuery and status.Status == 0xB001:
+                # PS3.4, Annex C.6.4.4
+                # 0xB001 conveys end of Pending responses
+                LOGGER.info(
+                    f"Find SCP Response: {operation_no} - "
+                    "0xB001 (Warning - Matching reached response limit, "
+                    "subsequent request may return additional matches)"
+                )
+                yield status, None
+                continue
+
+            if category != STATUS_PENDING:
+                LOGGER.info(f"Find SCP Result: 0x{status.Status:04X} ({category})")
+                yield status, None
+                return
+
+            LOGGER.info(
+                f"Find SCP Response: {operation_no} - 0x{status.Status:04X} (Pending)"
+            )
+            operation_no += 1
+            identifier = self._decode_identifier(rsp.Identifier, transfer_syntax)
+            yield status, identifier
+
+    async def _get_move_responses(
+        self, transfer_syntax: UID
+    ) -> AsyncIterator[tuple[Dataset, Dataset | None]]:
+        """Yield the C-GET or C-MOVE responses from the peer."""
+        operation_no = 1
+        try:
+            while True:
+                # Should be either a C-GET or C-MOVE response or a
+                #   C-STORE request
+                _, rsp = await self._receive_response()
+                if rsp is None:
+                    self._handle_no_response()
+                    yield Dataset(), None
+                    return
+
+                if not isinstance(rsp, (C_STORE, C_GET, C_MOVE)):
+                    LOGGER.error(
+                        f"Received an unexpected {rsp.msg_type} message from the peer"
+                    )
+                    self._abort()
+                    yield Dataset(), None
+                    return
+
+                if isinstance(rsp, C_STORE):
+                    # Received a C-STORE request from the peer
+                    # Should occur during C-GET and may occur during C-MOVE
+                    await self._run(self._assoc._c_store_scp, rsp)
+                    continue
+
+                if not rsp.is_valid_response:
+                    LOGGER.error(
+                        f"Received an invalid {rsp.msg_type} response from the peer"
+                    )
+                    self._abort()
+                    yield Dataset(), None
+                    return
+
+                status = self._assoc._check_received_status(rsp)
+                category = code_to_category(cast(int, status.Status))
+                name = "Get" if isinstance(rsp, C_GET) else "Move"
+
+                LOGGER.debug("")
+                if category == STATUS_PENDING:
+                    LOGGER.info(
+                        f"{name} SCP Response: {operation_no} - "
+                        f"0x{status.Status:04X} (Pending)"
+                    )
+                else:
+                    LOGGER.info(
+                        f"{name} SCP Result: 0x{status.Status:04X} ({category})"
+                    )
+
+                LOGGER.info(
+                    "Sub-Operations Remaining: %s, Completed: %s, "
+                    "Failed: %s, Warning: %s",
+                    rsp.NumberOfRemainingSuboperations or "0",
+                    rsp.NumberOfCompletedSuboperations or "0",
+                    rsp.NumberOfFailedSuboperations or "0",
+                    rsp.NumberOfWarningSuboperations or "0",
+                )
+
+                if category == STATUS_PENDING:
+                    operation_no += 1
+                    yield status, None
+                    continue
+
+                # From Part 4, Annex C.4.3, responses with these statuses
+                #   should contain an Identifier dataset with a (0008,0058)
+                #   Failed SOP Instance UID List element
+                identifier = None
+                if rsp.Identifier and category in (
+                    STATUS_CANCEL,
+                    STATUS_WARNING,
+                    STATUS_FAILURE,
+                ):
+                    identifier = self._decode_identifier(
+                        rsp.Identifier, transfer_syntax
+                    )
+
+                yield status, identifier
+                return
+        finally:
+            self._retrieving = False
+
+    def get_events(self) -> list[evt.EventType]:
+        """Return a :class:`list` of currently bound events."""
+        return self._assoc.get_events()
+
+    def get_handlers(self, event: evt.EventType) -> evt.HandlerArgType:
+        """Return the handlers bound to a specific `event`.
+
+        See :meth:`Association.get_handlers()
+        <pynetdicom.association.Association.get_handlers>` for details.
+        """
+        return self._assoc.get_handlers(event)
+
+    def _handle_no_response(self) -> None:
+        """Common reaction when DIMSE timeout hit or no response message."""
+        acse = self._assoc.acse
+        if acse.is_aborted("a-p-abort"):
+            LOGGER.error("Connection closed while waiting for DIMSE message")
+        elif self.is_established:
+            LOGGER.error("DIMSE timeout reached while waiting for message response")
+            self._abort()
+
+    @property
+    def is_aborted(self) -> bool:
+        """Return ``True`` if the association was aborted."""
+        return self._assoc.is_aborted
+
+    @property
+    def is_acceptor(self) -> bool:
+        """Return ``True`` if the local AE is the association *acceptor*."""
+        return self._assoc.is_acceptor
+
+    @property
+    def is_established(self) -> bool:
+        """Return ``True`` if the association is established."""
+        return self._assoc.is_established
+
+    @property
+    def is_rejected(self) -> bool:
+        """Return ``True`` if the association was rejected."""
+        return self._assoc.is_rejected
+
+    @property
+    def is_released(self) -> bool:
+        """Return ``True`` if the association was released."""
+        return self._assoc.is_released
+
+    @property
+    def is_requestor(self) -> bool:
+        """Return ``True`` if the local AE is the association *requestor*."""
+        return self._assoc.is_requestor
+
+    @property
+    def mode(self) -> str:
+        """Return the association's mode, ``'requestor'`` or ``'acceptor'``."""
+        return self._assoc.mode
+
+    @property
+    def network_timeout(self) -> float | None:
+        """Get or set the network timeout (in seconds)."""
+        return self._assoc.network_timeout
+
+    @network_timeout.setter
+    def network_timeout(self, value: float | None) -> None:
+        """Set the network timeout (in seconds)."""
+        self._assoc.network_timeout = value
+
+    async def _read_loop(self) -> None:
+        """Read PDUs from the peer and pass them to the DUL until the
+        connection closes.
+        """
+        dul = self.dul
+        reader = cast(asyncio.StreamReader, self._reader)
+        try:
+            while True:
+                # Too many received DIMSE messages are waiting to be handled
+                while dul._is_reading_paused():
+                    dul._reading.clear()
+                    await dul._reading.wait()
+
+                header = await reader.readexactly(6)
+                pdu_type, _, pdu_length = _UNPACK_PDU_HEADER(header)
+                if pdu_type not in _PDU_TYPES:
+                    LOGGER.error(f"Unknown PDU type received '0x{pdu_type:02X}'")
+                    # Evt19: Unrecognised or invalid PDU received
+                    dul.event_queue.put("Evt19")
+                    dul._run()
+                    continue
+
+                data = header + await reader.readexactly(pdu_length)
+                dul._idle_timer.restart()
+                dul._process_pdu(data)
+                # Process each PDU as it's received so that reading can be
+                #   paused as soon as too many messages are waiting
+                dul._run()
+        except (asyncio.IncompleteReadError, OSError):
+            pass
+        finally:
+            if dul.socket is not None:
+                dul.socket.close()
+
+    def _reactor_step(self) -> None:
+        """React to the DUL having processed events or the service user being
+        woken.
+
+        Equivalent to :meth:`Association._reactor_step()
+        <pynetdicom.association.Association._reactor_step>`. During
+        negotiation and release the ACSE primitives are left on the queue for
+        the ACSE provider.
+        """
+        assoc = self._assoc
+        acse = assoc.acse
+        self._dispatch()
+        if assoc.is_established and not self._releasing:
+            if acse.is_release_requested():
+                # Released after any outstanding service requests are complete
+                self._requests.put_nowait((None, None))
+            elif acse.is_aborted():
+                log_msg = "Association Aborted"
+                if acse.is_aborted("a-p-abort"):
+                    log_msg += " (A-P-ABORT)"
+
+                LOGGER.info(log_msg)
+                # Ensure that EVT_ACSE_RECV fires for subscribers
+                self.dul.receive_pdu(wait=False)
+                assoc.is_aborted = True
+                assoc.is_established = False
+                evt.trigger(assoc, evt.EVT_ABORTED, {})
+                assoc._set_abort_handled()
+                assoc.kill()
+            elif self.dul.idle_timer_expired():
+                LOGGER.error("Network timeout reached")
+                if assoc.network_timeout_response == "A-RELEASE":
+                    self._tasks.append(asyncio.ensure_future(self.release()))
+                else:
+                    self._abort()
+
+        if not self.dul.is_alive():
+            self._connection_closed()
+
+    async def _receive_response(
+        self,
+    ) -> tuple[int | None, "DimseServiceType | None"]:
+        """Return the next DIMSE response from the peer or ``(None, None)``
+        if none was received within the DIMSE timeout.
+        """
+        try:
+            return await asyncio.wait_for(self._responses.get(), self.dimse_timeout)
+        except asyncio.TimeoutError:
+            return None, None
+
+    async def _receive_acse(
+        self, timeout: float | None
+    ) -> "_UserQueuePrimitives | None":
+        """Return the next A-ASSOCIATE, A-RELEASE, A-ABORT or A-P-ABORT
+        received from the peer.
+
+        Unlike :meth:`_AsyncDUL.receive_pdu` this waits on the event loop
+        rather than blocking a worker thread.
+
+        Parameters
+        ----------
+        timeout : float or None
+            The maximum number of seconds to wait for.
+
+        Returns
+        -------
+        A_ASSOCIATE | A_RELEASE | A_ABORT | A_P_ABORT | None
+            The received primitive, or ``None`` if none was received within
+            `timeout` or the connection was closed.
+        """
+        dul = self.dul
+
+        async def _wait() -> None:
+            while dul.to_user_queue.empty() and not self._closed.is_set():
+                dul._user_woken.clear()
+                await dul._user_woken.wait()
+
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        return dul.receive_pdu(wait=False)
+
+    @property
+    def rejected_contexts(self) -> list["PresentationContext"]:
+        """Return a :class:`list` of rejected
+        :class:`~pynetdicom.presentation.PresentationContext`.
+        """
+        return self._assoc.rejected_contexts
+
+    async def release(self) -> None:
+        """Release the association by sending an A-RELEASE request and wait
+        for the connection to close.
+        """
+        if not self.is_established or self._releasing:
+            return
+
+        self._releasing = True
+        LOGGER.info("Releasing Association")
+        await self._run(self._assoc.acse.negotiate_release)
+        await self.wait_closed()
+
+    async def _request(self, tls_args: "tuple[SSLContext, str] | None") -> None:
+        """Connect to the peer and negotiate an association as the
+        association *requestor*.
+        """
+        assoc = self._assoc
+        remote = cast(transport.AddressInformation, self.acceptor.address_info)
+        local = cast(transport.AddressInformation, self.requestor.address_info)
+
+        kwargs: dict[str, Any] = {}
+        if tls_args:
+            kwargs["ssl"], kwargs["server_hostname"] = tls_args
+
+        LOGGER.info("Requesting Association")
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    remote.address,
+                    remote.port,
+                    family=remote.address_family,
+                    local_addr=local.as_tuple,
+                    **kwargs,
+                ),
+                assoc.connection_timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as exc:
+            LOGGER.error("Association request failed: unable to connect to remote")
+            LOGGER.error(f"TCP Initialisation Error: {exc}")
+            assoc.is_aborted = True
+            evt.trigger(assoc, evt.EVT_ABORTED, {})
+            self.dul._set_stopped()
+            self._closed.set()
+            return
+
+        self.requestor.address_info = transport.AddressInformation.from_tuple(
+            writer.get_extra_info("sockname")
+        )
+        self._start(reader, writer)
+        evt.trigger(assoc, evt.EVT_CONN_OPEN, {"address": remote.as_tuple})
+
+        # Build and send an A-ASSOCIATE (request) PDU to the peer
+        assoc.acse.send_request()
+        evt.trigger(assoc, evt.EVT_REQUESTED, {})
+
+        # Wait for the response and handle it
+        rsp = await self._receive_acse(assoc.acse_timeout)
+        await self._run(assoc.acse._handle_association_response, rsp)
+
+        self._established()
+
+    @property
+    def requestor(self) -> "ServiceUser":
+        """Return the association *requestor*
+        :class:`~pynetdicom.association.ServiceUser`.
+        """
+        return self._assoc.requestor
+
+    def _run(self, func: Callable[..., _T], *args: Any) -> "asyncio.Future[_T]":
+        """Run `func` in a worker thread."""
+        return self._loop.run_in_executor(None, func, *args)
+
+    def send_c_cancel(
+        self,
+        msg_id: int,
+        context_id: int | None = None,
+        query_model: str | UID | None = None,
+    ) -> None:
+        """Send a C-CANCEL request to the peer AE.
+
+        See :meth:`Association.send_c_cancel()
+        <pynetdicom.association.Association.send_c_cancel>` for details.
+        """
+        self._assoc.send_c_cancel(msg_id, context_id, query_model)
+
+    async def send_c_echo(self, msg_id: int = 1) -> Dataset:
+        """Send a C-ECHO request to the peer AE and return the status.
+
+        See :meth:`Association.send_c_echo()
+        <pynetdicom.association.Association.send_c_echo>` for details.
+        """
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-ECHO request"
+            )
+
+        context = self._assoc._get_valid_context(Verification, "", "scu")
+
+        primitive = C_ECHO()
+        primitive.MessageID = msg_id
+        primitive.AffectedSOPClassUID = Verification
+
+        self._assoc.dimse.send_msg(primitive, cast(int, context.context_id))
+        await self.dul.drain()
+
+        _, rsp = await self._receive_response()
+        if rsp is None:
+            self._handle_no_response()
+            return Dataset()
+
+        return self._check_received_status(rsp)
+
+    def send_c_find(
+        self,
+        dataset: Dataset,
+        query_model: str | UID,
+        msg_id: int = 1,
+        priority: int = 2,
+    ) -> AsyncIterator[tuple[Dataset, Dataset | None]]:
+        """Send a C-FIND request to the peer AE.
+
+        The request is sent immediately and an asynchronous iterator returned
+        that yields the responses from the peer::
+
+            async for status, identifier in assoc.send_c_find(ds, model):
+                ...
+
+        See :meth:`Association.send_c_find()
+        <pynetdicom.association.Association.send_c_find>` for details.
+        """
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-FIND request"
+            )
+
+        req, context = self._assoc._c_find_request(
+            dataset, query_model, msg_id, priority
+        )
+        self._assoc.dimse.send_msg(req, cast(int, context.context_id))
+
+        return self._find_responses(context.transfer_syntax[0], UID(query_model))
+
+    def send_c_get(
+        self,
+        dataset: Dataset,
+        query_model: str | UID,
+        msg_id: int = 1,
+        priority: int = 2,
+    ) -> AsyncIterator[tuple[Dataset, Dataset | None]]:
+        """Send a C-GET request to the peer AE.
+
+        The request is sent immediately and an asynchronous iterator returned
+        that yields the responses from the peer. Any C-STORE sub-operations
+        are handled by the ``evt.EVT_C_STORE`` handler in a worker thread.
+
+        See :meth:`Association.send_c_get()
+        <pynetdicom.association.Association.send_c_get>` for details.
+        """
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-GET request"
+            )
+
+        req, context = self._assoc._c_get_request(
+            dataset, query_model, msg_id, priority
+        )
+        self._retrieving = True
+        self._assoc.dimse.send_msg(req, cast(int, context.context_id))
+
+        return self._get_move_responses(context.transfer_syntax[0])
+
+    def send_c_move(
+        self,
+        dataset: Dataset,
+        move_aet: str,
+        query_model: str | UID,
+        msg_id: int = 1,
+        priority: int = 2,
+    ) -> AsyncIterator[tuple[Dataset, Dataset | None]]:
+        """Send a C-MOVE request to the peer AE.
+
+        The request is sent immediately and an asynchronous iterator returned
+        that yields the responses from the peer.
+
+        See :meth:`Association.send_c_move()
+        <pynetdicom.association.Association.send_c_move>` for details.
+        """
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-MOVE request"
+            )
+
+        req, context = self._assoc._c_move_request(
+            dataset, move_aet, query_model, msg_id, priority
+        )
+        self._retrieving = True
+        self._assoc.dimse.send_msg(req, cast(int, context.context_id))
+
+        return self._get_move_responses(context.transfer_syntax[0])
+
+    async def send_c_store(
+        self,
+        dataset: "str | Path | Dataset",
+        msg_id: int = 1,
+        priority: int = 2,
+        originator_aet: str | None = None,
+        originator_id: int | None = None,
+    ) -> Dataset:
+        """Send a C-STORE request to the peer AE and return the status.
+
+        The dataset is read, encoded and sent from a worker thread.
+
+        See :meth:`Association.send_c_store()
+        <pynetdicom.association.Association.send_c_store>` for details.
+        """
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-STORE request"
+            )
+
+        req, context = await self._run(
+            self._assoc._c_store_request,
+            dataset,
+            msg_id,
+            priority,
+            originator_aet,
+            originator_id,
+        )
+        await self._run(self._assoc.dimse.send_msg, req, cast(int, context.context_id))
+
+        _, rsp = await self._receive_response()
+        if rsp is None:
+            self._handle_no_response()
+            return Dataset()
+
+        return self._check_received_status(rsp)
+
+    async def _serve(self) -> None:
+        """Handle service requests from the peer in a worker thread, one at a
+        time, in the order they were received.
+        """
+        assoc = self._assoc
+        while True:
+            context_id, msg = await self._requests.get()
+            if msg is None:
+                # A-RELEASE request received from the peer, respond once the
+                #   requests being performed have been responded to
+                await self._wait_for_workers(lambda: assoc._in_flight > 0)
+                if assoc.is_established:
+                    # Let the handlers run before the peer sees the release
+                    with self.dul._hold_primitives():
+                        # Send A-RELEASE response
+                        assoc.acse.send_release(is_response=True)
+                        LOGGER.info("Association Released")
+                        assoc.is_released = True
+                        assoc.is_established = False
+                        evt.trigger(assoc, evt.EVT_RELEASED, {})
+
+                    assoc.kill()
+                    return
+
+                continue
+
+            await self._wait_for_workers(assoc._is_saturated)
+            await self._run(assoc._serve_request, msg, cast(int, context_id))
+            self._dispatch()
+
+    async def _wait_for_workers(self, is_busy: Callable[[], bool]) -> None:
+        """Wait until the service requests being performed by the
+        association's workers are no longer `is_busy`.
+        """
+        woken = self.dul._user_woken
+        while is_busy():
+            woken.clear()
+            await woken.wait()
+
+    def _start(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Start reading from the connection with the peer."""
+        self._reader = reader
+        self.dul._start(writer)
+        self._tasks.append(asyncio.ensure_future(self._read_loop()))
+
+    def unbind(self, event: evt.EventType, handler: Callable) -> None:
+        """Unbind a callable `handler` from an `event`.
+
+        Parameters
+        ----------
+        event : namedtuple
+            The event to unbind the function from.
+        handler : callable
+            The function that will no longer be called if the event occurs.
+        """
+        self._assoc.unbind(event, handler)
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection with the peer has closed."""
+        await self._closed.wait()
+
+
+class AsyncAssociationServer:
+    """An :mod:`asyncio` association server.
+
+    .. versionadded:: 3.1
+
+    Servers should be created and started using
+    :meth:`AsyncAE.start_server_async`. Each accepted connection is handled
+    by an :class:`AsyncAssociation` acceptor.
+
+    Attributes
+    ----------
+    ae : ae.ApplicationEntity
+        The parent AE that is running the server.
+    ae_title : str
+        The AE title of the server.
+    contexts : list of presentation.PresentationContext
+        The presentation contexts supported by the server.
+    ssl_context : ssl.SSLContext or None
+        The TLS context used to wrap accepted connections, or ``None`` if
+        not using TLS.
+    """
+
+    def __init__(
+        self,
+        ae: ApplicationEntity,
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str,
+        contexts: "ListCXType",
+        ssl_context: "SSLContext | None" = None,
+        evt_handlers: "list[EventHandlerType] | None" = None,
+    ) -> None:
+        """Create a new :class:`AsyncAssociationServer`.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The parent AE that's running the server.
+        address : tuple[str, int] | tuple[str, int, int, int]
+            The ``(host: str, port: int)`` or ``(host: str, port: int,
+            flowinfo: int, scope_id: int)`` that the server should run on.
+        ae_title : str
+            The AE title of the SCP.
+        contexts : list of presentation.PresentationContext
+            The SCPs supported presentation contexts.
+        ssl_context : ssl.SSLContext, optional
+            If TLS is to be used then this should be the
+            :class:`ssl.SSLContext` used to wrap the client sockets, otherwise
+            if ``None`` then no TLS will be used (default).
+        evt_handlers : list of 2- or 3-tuple, optional
+            A list of ``(event, callable)`` or ``(event, callable, args)``,
+            the *callable* function to run when *event* occurs and the
+            optional extra *args* to pass to the callable.
+        """
+        self.ae = ae
+        self.ae_title = ae_title
+        self.contexts = contexts
+        self.ssl_context = ssl_context
+        self.address_info = transport.AddressInformation.from_tuple(address)
+        self.server_address: tuple[str, int] | tuple[str, int, int, int] = address
+
+        self._server: asyncio.AbstractServer | None = None
+        self._associations: set[AsyncAssociation] = set()
+
+        # Stores all currently bound event handlers so future
+        #   Associations can be bound
+        self._handlers: dict[
+            evt.EventType,
+            list[tuple[Callable, list[Any] | None]] | tuple[Callable, list[Any] | None],
+        ] = {}
+        self._bind_defaults()
+
+        # Bind the functions to their events
+        for evt_hh_args in evt_handlers or ():
+            self.bind(*evt_hh_args)
+
+    async def __aenter__(self) -> "AsyncAssociationServer":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.shutdown()
+
+    @property
+    def active_associations(self) -> list[AsyncAssociation]:
+        """Return the server's established :class:`AsyncAssociation`
+        acceptors.
+        """
+        return [assoc for assoc in self._associations if assoc.is_established]
+
+    def bind(
+        self, event: evt.EventType, handler: Callable, args: list[Any] | None = None
+    ) -> None:
+        """Bind a callable `handler` to an `event`.
+
+        Parameters
+        ----------
+        event : namedtuple
+            The event to bind the function to.
+        handler : callable
+            The function that will be called if the event occurs.
+        args : list, optional
+            Optional extra arguments to be passed to the handler (default:
+            no extra arguments passed to the handler).
+        """
+        evt._add_handler(event, self._handlers, (handler, args))
+
+        # Bind our child Association events
+        for assoc in self.active_associations:
+            assoc.bind(event, handler, args)
+
+    def _bind_defaults(self) -> None:
+        """Bind the default event handlers."""
+        # Intervention event handlers
+        for event in evt._INTERVENTION_EVENTS:
+            handler = evt.get_default_handler(event)
+            self.bind(event, handler)
+
+        # Notification event handlers
+        if _config.LOG_HANDLER_LEVEL == "standard":
+            self.bind(evt.EVT_DIMSE_RECV, standard_dimse_recv_handler)
+            self.bind(evt.EVT_DIMSE_SENT, standard_dimse_sent_handler)
+            self.bind(evt.EVT_PDU_RECV, standard_pdu_recv_handler)
+            self.bind(evt.EVT_PDU_SENT, standard_pdu_sent_handler)
+
+    def get_events(self) -> list[evt.EventType]:
+        """Return a list of currently bound events."""
+        return sorted(self._handlers.keys(), key=lambda x: x.name)
+
+    def get_handlers(self, event: evt.EventType) -> evt.HandlerArgType:
+        """Return handlers bound to a specific `event`.
+
+        See :meth:`AssociationServer.get_handlers()
+        <pynetdicom.transport.AssociationServer.get_handlers>` for details.
+        """
+        if event not in self._handlers:
+            return []
+
+        return self._handlers[event]
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a new connection from an association requestor."""
+        assoc = Association(self.ae, MODE_ACCEPTOR)
+        transport._configure_acceptor(
+            assoc,
+            self,
+            transport.AddressInformation.from_tuple(writer.get_extra_info("sockname")),
+            transport.AddressInformation.from_tuple(writer.get_extra_info("peername")),
+        )
+
+        async_assoc = AsyncAssociation(assoc)
+        self._associations.add(async_assoc)
+        try:
+            await async_assoc._accept(reader, writer)
+            await async_assoc.wait_closed()
+        finally:
+            self._associations.discard(async_assoc)
+
+    async def serve_forever(self) -> None:
+        """Accept connections until cancelled or :meth:`shutdown` is called."""
+        server = cast(asyncio.Server, self._server)
+        try:
+            await server.serve_forever()
+        except asyncio.CancelledError:
+            # Raised on shutdown
+            pass
+
+    async def shutdown(self) -> None:
+        """Stop accepting connections and abort any active associations."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        for assoc in list(self._associations):
+            await assoc.abort()
+
+        servers = getattr(self.ae, "_async_servers", [])
+        if self in servers:
+            servers.remove(self)
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._handle_connection,
+            self.address_info.address,
+            self.address_info.port,
+            family=self.address_info.address_family,
+            ssl=self.ssl_context,
+            reuse_address=True,
+        )
+        # Update with the actual address, such as when using port 0
+        sockname = self._server.sockets[0].getsockname()
+        self.address_info = transport.AddressInformation.from_tuple(sockname)
+        self.server_address = self.address_info.as_tuple
+
+    def unbind(self, event: evt.EventType, handler: Callable) -> None:
+        """Unbind a callable `handler` from an `event`.
+
+        Parameters
+        ----------
+        event : 3-tuple
+            The event to unbind the function from.
+        handler : callable
+            The function that will no longer be called if the event occurs.
+        """
+        evt._remove_handler(event, self._handlers, handler)
+
+        # Unbind from our child Association events
+        for assoc in self.active_associations:
+            assoc.unbind(event, handler)
+
+
+class AsyncAE(ApplicationEntity):
+    """An :class:`~pynetdicom.ae.ApplicationEntity` with an :mod:`asyncio`
+    interface.
+
+    .. versionadded:: 3.1
+
+    In addition to the methods of
+    :class:`~pynetdicom.ae.ApplicationEntity`, which remain available and
+    continue to use threads, :meth:`associate_async` and
+    :meth:`start_server_async` return associations and servers that run on the
+    current event loop.
+    """
+
+    def __init__(self, ae_title: str = "PYNETDICOM") -> None:
+        """Create a new Application Entity.
+
+        Parameters
+        ----------
+        ae_title : str, optional
+            The AE title of the Application Entity as an ASCII string
+            (default: ``'PYNETDICOM'``).
+        """
+        super().__init__(ae_title)
+        self._async_servers: list[AsyncAssociationServer] = []
+
+    async def associate_async(
+        self,
+        addr: str | tuple[str, int, int],
+        port: int,
+        contexts: "ListCXType | None" = None,
+        ae_title: str = "ANY-SCP",
+        max_pdu: int = DEFAULT_MAX_LENGTH,
+        ext_neg: "list[_UI] | None" = None,
+        bind_address: tuple[str, int] | tuple[str, int, int, int] | None = None,
+        tls_args: "tuple[SSLContext, str] | None" = None,
+        evt_handlers: "list[EventHandlerType] | None" = None,
+    ) -> AsyncAssociation:
+        """Request an association with a remote AE.
+
+        Accepts the same parameters as
+        :meth:`~pynetdicom.ae.ApplicationEntity.associate`.
+
+        Returns
+        -------
+        AsyncAssociation
+            The association, which should be checked using
+            :attr:`AsyncAssociation.is_established` before sending any
+            messages.
+
+        Raises
+        ------
+        RuntimeError
+            If called with no requested presentation contexts.
+        """
+        assoc = self._create_requestor(
+            addr, port, contexts, ae_title, max_pdu, ext_neg, bind_address, evt_handlers
+        )
+        async_assoc = AsyncAssociation(assoc)
+        await async_assoc._request(tls_args)
+
+        return async_assoc
+
+    async def shutdown_async(self) -> None:
+        """Stop any running association servers, both threaded and
+        :mod:`asyncio`.
+        """
+        for server in self._async_servers[:]:
+            await server.shutdown()
+
+        self.shutdown()
+
+    async def start_server_async(
+        self,
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str | None = None,
+        contexts: "ListCXType | None" = None,
+        ssl_context: "SSLContext | None" = None,
+        evt_handlers: "list[EventHandlerType] | None" = None,
+    ) -> AsyncAssociationServer:
+        """Start an :mod:`asyncio` association server listening on `address`.
+
+        Accepts the same parameters as
+        :meth:`~pynetdicom.ae.ApplicationEntity.start_server`. Use
+        :meth:`AsyncAssociationServer.serve_forever` to wait on the server or
+        :meth:`AsyncAssociationServer.shutdown` to stop it.
+
+        Returns
+        -------
+        AsyncAssociationServer
+            The running server.
+        """
+        server = cast(
+            AsyncAssociationServer,
+            self.make_server(
+                address,
+                ae_title,
+                contexts,
+                ssl_context,
+                evt_handlers,
+                server_class=AsyncAssociationServer,
+            ),
+        )
+        await server.start()
+        self._async_servers.append(server)
+
+        return server
@@ -1,5 +1,7 @@
 """Defines the Association class which handles associating with peers."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 import logging
 import os
@@ -11,7 +13,7 @@ from typing import (
     TYPE_CHECKING,
     cast,
 )
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 import warnings
 
 from pydicom import dcmread
@@ -80,11 +82,14 @@ from pynetdicom.sop_class import (  # type: ignore
     Verification,
 )
 from pynetdicom.status import code_to_category, STORAGE_SERVICE_CLASS_STATUS
+from pynetdicom.timer import Timer
 from pynetdicom.transport import AddressInformation
 from pynetdicom.utils import make_target, set_timer_resolution, set_ae, decode_bytes
 
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.ae import ApplicationEntity
+    from pynetdicom.pdu import A_ASSOCIATE_RQ
+    from pynetdicom.service_class import ServiceClass
     from pynetdicom.transport import AssociationServer, AssociationSocket
 
 
@@ -95,6 +100,202 @@ HandlerType = dict[
 ]
 
 
+class _AssociationRegistry:
+    """A record of the live :class:`Association` instances belonging to an AE
+    or association server.
+
+    .. versionadded:: 3.1
+
+    Associations are added when they start running and removed when they end,
+    so the live associations can be found without having to search through
+    all the running threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # The live associations, as an insertion ordered set
+        self._associations: dict["Association", None] = {}
+        # The number of live acceptors
+        self._nr_acceptors = 0
+        # {calling AE title: {association: None}}
+        self._calling: dict[str, dict["Association", None]] = {}
+        # {association: calling AE title}
+        self._titles: dict["Association", str] = {}
+
+    def __contains__(self, assoc: "Association") -> bool:
+        """Return ``True`` if `assoc` is in the registry."""
+        return assoc in self._associations
+
+    def __len__(self) -> int:
+        """Return the number of live associations."""
+        return len(self._associations)
+
+    def add(self, assoc: "Association") -> None:
+        """Add `assoc` to the registry, if it's not already present."""
+        with self._lock:
+            if assoc in self._associations:
+                return
+
+            self._associations[assoc] = None
+            if assoc.is_acceptor:
+                self._nr_acceptors += 1
+
+            self._index(assoc)
+
+    def associations(self, calling_ae_title: str | None = None) -> list["Association"]:
+        """Return a list of the live associations.
+
+        Parameters
+        ----------
+        calling_ae_title : str, optional
+            If used then only return the associations with this *Calling AE
+            Title*. An acceptor's *Calling AE Title* isn't known until its
+            A-ASSOCIATE request has been received.
+
+        Returns
+        -------
+        list of Association
+            The live associations, in the order they were added.
+        """
+        with self._lock:
+            if calling_ae_title is None:
+                return list(self._associations)
+
+            return list(self._calling.get(calling_ae_title, ()))
+
+    def discard(self, assoc: "Association") -> None:
+        """Remove `assoc` from the registry, if it's present."""
+        with self._lock:
+            if assoc not in self._associations:
+                return
+
+            del self._associations[assoc]
+            if assoc.is_acceptor:
+                self._nr_acceptors -= 1
+
+            self._unindex(assoc)
+
+    def _index(self, assoc: "Association") -> None:
+        """Index `assoc` by its *Calling AE Title*."""
+        title = assoc.requestor.ae_title
+        if title:
+            self._calling.setdefault(title, {})[assoc] = None
+            self._titles[assoc] = title
+
+    @property
+    def nr_acceptors(self) -> int:
+        """Return the number of live acceptors."""
+        return self._nr_acceptors
+
+    def _unindex(self, assoc: "Association") -> None:
+        """Remove `assoc` from the *Calling AE Title* index."""
+        title = self._titles.pop(assoc, None)
+        if title is not None:
+            associations = self._calling[title]
+            del associations[assoc]
+            if not associations:
+                del self._calling[title]
+
+    def update(self, assoc: "Association") -> None:
+        """Update the *Calling AE Title* that `assoc` is indexed by, if it's
+        in the registry.
+        """
+        with self._lock:
+            if assoc in self._associations:
+                self._unindex(assoc)
+                self._index(assoc)
+
+
+class _ContextMatches:
+    """The accepted presentation contexts that may be used for a given
+    abstract syntax and role, indexed by their transfer syntax.
+
+    .. versionadded:: 3.1
+    """
+
+    def __init__(self) -> None:
+        self.contexts: list[PresentationContext] = []
+        # {transfer syntax: first context with that transfer syntax}
+        self.exact: dict[UID, PresentationContext] = {}
+        # {is little endian: first context with an uncompressed transfer syntax}
+        self.convertible: dict[bool, PresentationContext] = {}
+
+    def add(self, cx: PresentationContext) -> None:
+        """Add the accepted context `cx`."""
+        self.contexts.append(cx)
+        tsyntax = cx.transfer_syntax[0]
+        self.exact.setdefault(tsyntax, cx)
+        try:
+            if not tsyntax.is_compressed:
+                self.convertible.setdefault(tsyntax.is_little_endian, cx)
+        except ValueError:
+            # Not a transfer syntax pydicom knows about, exact matches only
+            pass
+
+    def match(
+        self, tr_syntax: UID, allow_conversion: bool
+    ) -> PresentationContext | None:
+        """Return the context to use for `tr_syntax`, or ``None`` if there's
+        no suitable context.
+        """
+        if not tr_syntax:
+            return self.contexts[0] if allow_conversion else None
+
+        cx = self.exact.get(tr_syntax)
+        if cx is not None or not allow_conversion:
+            return cx
+
+        # Compressed transfer syntaxes are not convertible
+        #   Allowable matches:
+        #       explicit VR <-> implicit VR
+        #       deflated <-> inflated
+        if tr_syntax.is_compressed:
+            return None
+
+        return self.convertible.get(tr_syntax.is_little_endian)
+
+
+class _ContextIndex:
+    """An index of an association's accepted presentation contexts.
+
+    .. versionadded:: 3.1
+
+    The contexts are indexed by (abstract syntax, role) and by (context ID,
+    role), where the role is one of ``'scu'``, ``'scp'`` or ``None`` for any
+    role.
+    """
+
+    def __init__(self, contexts: dict[int, PresentationContext]) -> None:
+        self.by_syntax: dict[tuple[UID, str | None], _ContextMatches] = {}
+        self.by_id: dict[tuple[int, str | None], _ContextMatches] = {}
+        # The contexts that may be used in place of UPS Push, by role
+        self.ups: dict[str | None, _ContextMatches] = {}
+
+        ups = (
+            UnifiedProcedureStepPull,
+            UnifiedProcedureStepWatch,
+            UnifiedProcedureStepEvent,
+            UnifiedProcedureStepQuery,
+        )
+        for cx_id, cx in sorted(
+            contexts.items(), key=lambda x: cast(int, x[1].context_id)
+        ):
+            roles: list[str | None] = [None]
+            if cx.as_scu is True:
+                roles.append("scu")
+            if cx.as_scp is True:
+                roles.append("scp")
+
+            ab_syntax = cast(UID, cx.abstract_syntax)
+            for role in roles:
+                key = (ab_syntax, role)
+                self.by_syntax.setdefault(key, _ContextMatches()).add(cx)
+                self.by_id[(cx_id, role)] = matches = _ContextMatches()
+                matches.add(cx)
+                if ab_syntax in ups:
+                    self.ups.setdefault(role, _ContextMatches()).add(cx)
+
+
 class Association(threading.Thread):
     """Manage an Association with a peer AE.
 
@@ -163,6 +364,14 @@ class Association(threading.Thread):
         # Accepted and rejected presentation contexts
         self._accepted_cx: dict[int, PresentationContext] = {}
         self._rejected_cx: list[PresentationContext] = []
+        # The index of the accepted contexts used by _get_valid_context() and
+        #   the (accepted contexts, number of contexts) it was built from
+        self._cx_index: (
+            tuple[dict[int, PresentationContext], int, _ContextIndex] | None
+        ) = None
+
+        # The A-ASSOCIATE-RQ PDU prebuilt by the AE, if any
+        self._request_pdu: "A_ASSOCIATE_RQ | None" = None
 
         # Service providers
         self.acse: ACSE = ACSE(self)
@@ -193,6 +402,36 @@ class Association(threading.Thread):
         self._reactor_checkpoint.set()
         # Used to ensure the reactor is paused before DIMSE messaging
         self._is_paused: bool = False
+        # Used to wake the reactor when there's an incoming DIMSE message or
+        #   A-RELEASE/A-ABORT primitive, or the association is killed
+        self._reactor_wakeup: threading.Event = threading.Event()
+        # The maximum time the reactor will block waiting to be woken, in
+        #   seconds. The DUL's idle timer wakes the reactor when the network
+        #   timeout expires
+        self._reactor_max_wait: float = 0.5
+        # Called once the association has ended, see _teardown()
+        self._teardown_hooks: dict[Callable[[], None], None] = {}
+        self._teardown_lock = threading.Lock()
+        self._is_torn_down: bool = False
+        # Set once an A-ABORT or A-P-ABORT from the peer has been handled, the
+        #   DUL leaves the connection open until then, see fsm.AA_3()
+        self._abort_handled: bool = False
+        self._abort_lock = threading.Lock()
+        self._abort_socket: "AssociationSocket | None" = None
+        # When the DUL is driven by a shared reactor, used to run the
+        #   association again once the A-ASSOCIATE request has timed out and
+        #   while it's paused by a service in use, see _run_shared()
+        self._acse_timer = Timer(None, self.dul._wakeup_user)
+        self._paused_timer = Timer(self._reactor_max_wait, self.dul._wakeup_user)
+        # Runs service requests concurrently when an asynchronous operations
+        #   window has been negotiated, see _serve_request()
+        self._executor: ThreadPoolExecutor | None = None
+        self._nr_performed: int | None = None
+        # The number of requests being run by the executor, no more requests
+        #   are taken off the DIMSE message queue while it's at the maximum
+        self._in_flight: int = 0
+        self._max_in_flight: int = 1
+        self._in_flight_lock = threading.Lock()
 
         # Windows timer resolution
         self._timer_resolution: float | None = _config.WINDOWS_TIMER_RESOLUTION
@@ -253,8 +492,9 @@ class Association(threading.Thread):
         except Exception:
             pass
 
-        # Add short delay to ensure everything shuts down
-        time.sleep(0.1)
+        # Give the reactor a short time to exit
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=0.1)
 
     def _abort_nonblocking(self, block: bool = False) -> None:
         """Non-blocking implementation of Association.abort()"""
@@ -404,6 +644,11 @@ class Association(threading.Thread):
 
             Added `allow_conversion` keyword parameter.
 
+        .. versionchanged:: 3.1
+
+            Matching contexts are found using an index of the accepted
+            contexts rather than by searching through them.
+
         Parameters
         ----------
         ab_syntax : str or pydicom.uid.UID
@@ -434,64 +679,29 @@ class Association(threading.Thread):
         ab_syntax = UID(ab_syntax)
         tr_syntax = UID(tr_syntax)
 
-        try:
-            possible_contexts = [self._accepted_cx[context_id]]  # type: ignore
-        except KeyError:
-            possible_contexts = self.accepted_contexts
-
-        # Filter by abstract syntax
-        possible_contexts = [
-            cx for cx in possible_contexts if ab_syntax == cx.abstract_syntax
-        ]
+        index = self._context_index()
+        role_key = role if role in ("scu", "scp") else None
+        if context_id in self._accepted_cx:
+            accepted_syntax = self._accepted_cx[context_id].abstract_syntax
+            has_syntax = accepted_syntax == ab_syntax
+            matches = index.by_id.get((context_id, role_key)) if has_syntax else None
+        else:
+            has_syntax = (ab_syntax, None) in index.by_syntax
+            matches = index.by_syntax.get((ab_syntax, role_key))
 
         # For UPS we can also match UPS Push to Pull/Watch/Event/Query
-        if ab_syntax == UnifiedProcedureStepPush and not possible_contexts:
+        if ab_syntax == UnifiedProcedureStepPush and not has_syntax:
             LOGGER.info(
                 "No exact matching context found for 'Unified Procedure Step "
                 "- Push SOP Class', checking accepted contexts for other UPS "
                 "SOP classes"
             )
-            ups = [
-                UnifiedProcedureStepPull,
-                UnifiedProcedureStepWatch,
-                UnifiedProcedureStepEvent,
-                UnifiedProcedureStepQuery,
-            ]
-            possible_contexts.extend(
-                [cx for cx in self._accepted_cx.values() if cx.abstract_syntax in ups]
-            )
+            matches = index.ups.get(role_key)
 
-        # Filter by role
-        if role == "scu":
-            possible_contexts = [cx for cx in possible_contexts if cx.as_scu is True]
-        if role == "scp":
-            possible_contexts = [cx for cx in possible_contexts if cx.as_scp is True]
-
-        matches = []
-        for cx in possible_contexts:
-            cx_syntax = cx.transfer_syntax[0]
-            if tr_syntax:
-                if tr_syntax == cx_syntax:
-                    # Exact match to transfer syntax
-                    return cx
-
-                # Compressed transfer syntaxes are not convertible
-                #   This excludes deflated transfer syntaxes
-                if tr_syntax.is_compressed or cx_syntax.is_compressed:
-                    continue
-
-                # Filter out contexts where the endianness doesn't match
-                if tr_syntax.is_little_endian != cx_syntax.is_little_endian:
-                    continue
-
-            # Match to convertible transfer syntaxes
-            #   Allowable matches:
-            #       explicit VR <-> implicit VR
-            #       deflated <-> inflated
-            matches.append(cx)
-
-        if allow_conversion and matches:
-            return matches[0]
+        if matches is not None:
+            context = matches.match(tr_syntax, allow_conversion)
+            if context is not None:
+                return context
 
         role = role or "scu"
         msg = (
@@ -505,6 +715,22 @@ class Association(threading.Thread):
         LOGGER.error(msg)
         raise ValueError(msg)
 
+    def _context_index(self) -> _ContextIndex:
+        """Return the index of the accepted presentation contexts.
+
+        .. versionadded:: 3.1
+
+        The index is built on first use and rebuilt whenever the accepted
+        contexts are replaced or added to.
+        """
+        accepted = self._accepted_cx
+        cached = self._cx_index
+        if cached is None or cached[0] is not accepted or cached[1] != len(accepted):
+            cached = (accepted, len(accepted), _ContextIndex(accepted))
+            self._cx_index = cached
+
+        return cached[2]
+
     def _handle_no_response(self) -> None:
         """Common reaction when DIMSE timeout hit or no response message."""
         # Avoids writing the same unit test for each send_ method
@@ -528,15 +754,68 @@ class Association(threading.Thread):
         """Return ``True`` if the local AE is the association *requestor*."""
         return self.mode == MODE_REQUESTOR
 
+    def _bind_teardown(self, hook: Callable[[], None]) -> None:
+        """Call `hook` once the association has ended.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        hook : Callable[[], None]
+            A callable that takes no parameters, called immediately if the
+            association has already ended.
+        """
+        with self._teardown_lock:
+            if not self._is_torn_down:
+                self._teardown_hooks[hook] = None
+                return
+
+        hook()
+
+    def _close_after_abort(self, sock: "AssociationSocket") -> None:
+        """Close `sock` once the association has handled the peer's abort.
+
+        Parameters
+        ----------
+        sock : transport.AssociationSocket
+            The socket to close after the A-ABORT or A-P-ABORT has been
+            handled.
+        """
+        with self._abort_lock:
+            if not self._abort_handled:
+                self._abort_socket = sock
+                return
+
+        sock.close()
+
     def kill(self) -> None:
         """Kill the :class:`Association` thread."""
         # Ensure the reactor is running so it can be exited
         self._reactor_checkpoint.set()
         self._kill = True
+        self._reactor_wakeup.set()
         self.is_established = False
         self._is_paused = True
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+        self._teardown()
+
+        # Wait for the state machine to return to Sta1 then stop the DUL
         while self.dul.is_alive() and not self.dul.stop_dul():
-            time.sleep(0.01)
+            self.dul._wait_for_idle(self.dul._max_wait)
+
+        # Close any connection left open by an abort that wasn't handled
+        self._set_abort_handled()
+
+    def _set_abort_handled(self) -> None:
+        """Flag the peer's abort as handled and close any pending connection."""
+        with self._abort_lock:
+            self._abort_handled = True
+            sock, self._abort_socket = self._abort_socket, None
+
+        if sock:
+            sock.close()
 
     @property
     def local(self) -> dict[str, Any]:
@@ -598,6 +877,14 @@ class Association(threading.Thread):
         """
         return self._rejected_cx
 
+    def _register(self) -> None:
+        """Add the association to the registries of live associations kept by
+        its AE and server.
+        """
+        self.ae._registry.add(self)
+        if self._server:
+            self._server._registry.add(self)
+
     def release(self) -> None:
         """Initiate association release by sending an A-RELEASE request."""
         if self.is_established:
@@ -636,6 +923,18 @@ class Association(threading.Thread):
         LOGGER.info("Requesting Association")
         self.acse.negotiate_association()
 
+    def run(self) -> None:
+        """Run the association's reactor.
+
+        The association is a live association of its AE (and server) while
+        the reactor is running.
+        """
+        self._register()
+        try:
+            super().run()
+        finally:
+            self._unregister()
+
     def run_reactor(self) -> None:
         """The main :class:`Association` reactor."""
         # Start the DUL thread if not already started
@@ -670,6 +969,11 @@ class Association(threading.Thread):
                 with set_timer_resolution(self._timer_resolution):
                     self._run_reactor()
 
+            # If killed by another thread the DUL may still be waiting for the
+            #   peer to close the connection
+            if self._kill:
+                self.kill()
+
             # Ensure the connection is shutdown properly
             sock = cast("AssociationSocket", self.dul.socket)
             if self._server and sock.socket:
@@ -704,10 +1008,21 @@ class Association(threading.Thread):
             If not then kill thread
         5. Checks DUL idle timeout
             If timed out then kill thread
+
+        .. versionchanged:: 3.1
+
+            Blocks until woken by an incoming DIMSE message, an A-RELEASE or
+            A-ABORT primitive or the network timeout instead of polling.
         """
         self._is_paused = False
         while not self._kill:
-            time.sleep(0.001)
+            if self.dimse.msg_queue.empty() or self._is_saturated():
+                # Nothing to do until we're woken, treat as paused while
+                #   blocked so the send_*() methods don't have to wait
+                self._is_paused = True
+                self._reactor_wakeup.wait(self._reactor_max_wait)
+
+            self._reactor_wakeup.clear()
 
             # A race condition may occur if the Acceptor uses the send_*()
             #   methods as the received DIMSE message may be taken off the
@@ -720,56 +1035,151 @@ class Association(threading.Thread):
             self._reactor_checkpoint.wait()
             self._is_paused = False
 
-            # Check with the DIMSE provider to see if a completely decoded
-            #   message is available
-            context_id, msg = self.dimse.get_msg(block=False)
+            if self._reactor_step():
+                return
+
+    def _reactor_step(self) -> bool:
+        """Run a single iteration of the reactor loop.
+
+        .. versionadded:: 3.1
+
+        Returns
+        -------
+        bool
+            ``True`` if the association has ended and the reactor should
+            exit, ``False`` otherwise.
+        """
+        # Check with the DIMSE provider to see if a completely decoded
+        #   message is available, unless we're already performing as many
+        #   requests as we can
+        if not self._is_saturated():
+            context_id, msg = self.dimse.get_msg(block=False, hold=True)
             if msg:
                 self._serve_request(msg, cast(int, context_id))
 
-            # Check for release request from the peer
-            if self.is_established and self.acse.is_release_requested():
+        # Check for release request from the peer, once the responses to any
+        #   requests being performed have been sent
+        if (
+            self.is_established
+            and not self._in_flight
+            and self.acse.is_release_requested()
+        ):
+            # Let the handlers run before the peer sees the release
+            with self.dul._hold_primitives():
                 # Send A-RELEASE response
                 self.acse.send_release(is_response=True)
                 LOGGER.info("Association Released")
                 self.is_released = True
                 self.is_established = False
                 evt.trigger(self, evt.EVT_RELEASED, {})
-                self.kill()
-                return
 
-            # Check for abort from either locally or the peer
-            if self.acse.is_aborted():
-                log_msg = "Association Aborted"
-                if self.acse.is_aborted("a-p-abort"):
-                    log_msg += " (A-P-ABORT)"
-                LOGGER.info(log_msg)
-                # Ensure that EVT_ASCE_RECV fires for subscribers
-                self.dul.receive_pdu(wait=False)
-                self.is_aborted = True
-                self.is_established = False
-                evt.trigger(self, evt.EVT_ABORTED, {})
-                self.kill()
-                return
+            self.kill()
+            return True
+
+        # Check for abort from either locally or the peer
+        if self.acse.is_aborted():
+            log_msg = "Association Aborted"
+            if self.acse.is_aborted("a-p-abort"):
+                log_msg += " (A-P-ABORT)"
+            LOGGER.info(log_msg)
+            # Ensure that EVT_ASCE_RECV fires for subscribers
+            self.dul.receive_pdu(wait=False)
+            self.is_aborted = True
+            self.is_established = False
+            evt.trigger(self, evt.EVT_ABORTED, {})
+            self._set_abort_handled()
+            self.kill()
+            return True
+
+        # Check if the DULServiceProvider thread is still running
+        #   DUL.is_alive() is inherited from threading.thread
+        if not self.dul.is_alive():
+            self.kill()
+            return True
+
+        # Check if network_timeout has expired
+        if self.dul.idle_timer_expired():
+            LOGGER.error("Network timeout reached")
+            if self.network_timeout_response == "A-RELEASE":
+                self._is_paused = True
+                self._reactor_checkpoint.wait()
+                self.release()
+                self._is_paused = False
+            else:
+                self.abort()
 
-            # Check if the DULServiceProvider thread is still running
-            #   DUL.is_alive() is inherited from threading.thread
-            if not self.dul.is_alive():
-                self.kill()
-                return
+            self.kill()
+            return True
 
-            # Check if network_timeout has expired
-            if self.dul.idle_timer_expired():
-                LOGGER.error("Network timeout reached")
-                if self.network_timeout_response == "A-RELEASE":
-                    self._is_paused = True
-                    self._reactor_checkpoint.wait()
-                    self.release()
-                    self._is_paused = False
-                else:
-                    self.abort()
+        return False
+
+    def _run_shared(self) -> bool:
+        """Run the acceptor until it has nothing left to do, without waiting
+        for the peer.
+
+        .. versionadded:: 3.1
+
+        Used instead of :meth:`run_reactor` when the association's DUL is
+        driven by a :class:`~pynetdicom.dul.SharedReactor` and the association
+        has no thread of its own. Each call picks up where the previous one
+        left off, so it should be called again whenever the DUL has processed
+        new events or the service user has been woken by one of its timers.
+
+        Returns
+        -------
+        bool
+            ``True`` if the association has ended, ``False`` otherwise.
+        """
+        if not self._kill and self.requestor.primitive is None:
+            primitive = self.dul.receive_pdu(wait=False)
+            if primitive is None:
+                if not self._acse_timer.is_running:
+                    self._acse_timer.timeout = self.acse_timeout
+                    self._acse_timer.start()
+
+                # Timed out waiting for A-ASSOCIATE request
+                if not self._acse_timer.expired and self.dul.is_alive():
+                    return False
 
                 self.kill()
-                return
+                return self._shutdown_request()
+
+            self._acse_timer.stop()
+            self.requestor.primitive = cast(A_ASSOCIATE, primitive)
+            evt.trigger(self, evt.EVT_REQUESTED, {})
+
+            # User used EVT_REQUESTED to send an A-ABORT or A-ASSOCIATE-RJ
+            if not self.is_aborted and not self.is_rejected:
+                self.acse.negotiate_association()
+
+            if not self.is_established:
+                return self._shutdown_request()
+
+        while not self._kill:
+            # Don't steal messages from any send_*() methods in use
+            self._is_paused = False
+            if not self._reactor_checkpoint.is_set():
+                self._is_paused = True
+                # Check again once the service has finished
+                self._paused_timer.start()
+                return False
+
+            if self._reactor_step():
+                break
+
+            if self.dimse.msg_queue.empty() or self._is_saturated():
+                self._is_paused = True
+                return False
+
+        return self._shutdown_request()
+
+    def _shutdown_request(self) -> bool:
+        """Ensure the connection is shutdown properly, returns ``True``."""
+        sock = cast("AssociationSocket", self.dul.socket)
+        if self._server and sock.socket:
+            self._server.shutdown_request(sock.socket)
+
+        return True
 
     def set_socket(self, socket: "AssociationSocket") -> None:
         """Set the `socket` to use for communicating with the peer.
@@ -789,6 +1199,32 @@ class Association(threading.Thread):
 
         self.dul.socket = socket
 
+    def start(self) -> None:
+        """Start the association's thread."""
+        # Register first so the association is live as soon as we return
+        self._register()
+        try:
+            super().start()
+        except Exception:
+            self._unregister()
+            raise
+
+    def _teardown(self) -> None:
+        """Call the hooks waiting for the association to end.
+
+        .. versionadded:: 3.1
+
+        Called once the association has been killed or its DUL has stopped,
+        after which no more data will be received from the peer.
+        """
+        with self._teardown_lock:
+            self._is_torn_down = True
+            hooks = list(self._teardown_hooks)
+            self._teardown_hooks.clear()
+
+        for hook in hooks:
+            hook()
+
     def unbind(self, event: evt.EventType, handler: Callable) -> None:
         """Unbind a callable `handler` from an `event`.
 
@@ -803,6 +1239,22 @@ class Association(threading.Thread):
         with self.lock:
             evt._remove_handler(event, self._handlers, handler)
 
+    def _unbind_teardown(self, hook: Callable[[], None]) -> None:
+        """Stop `hook` from being called once the association has ended.
+
+        .. versionadded:: 3.1
+        """
+        with self._teardown_lock:
+            self._teardown_hooks.pop(hook, None)
+
+    def _unregister(self) -> None:
+        """Remove the association from the registries of live associations
+        kept by its AE and server.
+        """
+        self.ae._registry.discard(self)
+        if self._server:
+            self._server._registry.discard(self)
+
     # DIMSE-C services provided by the Association
     def _c_store_scp(self, req: C_STORE) -> None:
         """A C-STORE SCP implementation.
@@ -849,6 +1301,9 @@ class Association(threading.Thread):
                 context_id=req._context_id,
             )
         except ValueError:
+            if req._dataset_stream is not None:
+                req._dataset_stream.close()
+
             # SOP Class not supported, no context ID?
             rsp.Status = 0x0122
             self.dimse.send_msg(rsp, 1)
@@ -865,6 +1320,10 @@ class Association(threading.Thread):
             rsp.Status = 0xC211
             self.dimse.send_msg(rsp, cast(int, context.context_id))
             return
+        finally:
+            # Discard any of a streamed dataset the handler didn't read
+            if req._dataset_stream is not None:
+                req._dataset_stream.close()
 
         # Check the callback's returned status
         if isinstance(status, Dataset):
@@ -1223,52 +1682,8 @@ class Association(threading.Thread):
                 "sending a C-FIND request"
             )
 
-        # Determine the Presentation Context we are operating under
-        #   and hence the transfer syntax to use for encoding `dataset`
-        context = self._get_valid_context(query_model, "", "scu")
-        if context.abstract_syntax != query_model:
-            LOGGER.info("Using Presentation Context:")
-            LOGGER.info(f"  Context ID:        {context.context_id}")
-            LOGGER.info(
-                f"  Abstract Syntax:   ={cast(UID, context.abstract_syntax).name}"
-            )
-
-        query_model = UID(query_model)
-
-        # Build C-FIND request primitive
-        #   (M) Message ID
-        #   (M) Affected SOP Class UID
-        #   (M) Priority
-        #   (M) Identifier
-        req = C_FIND()
-        req.MessageID = msg_id
-        req.AffectedSOPClassUID = query_model
-        req.Priority = priority
-
-        # Encode the Identifier `dataset` using the agreed transfer syntax
-        #   Will return None if failed to encode
+        req, context = self._c_find_request(dataset, query_model, msg_id, priority)
         transfer_syntax = context.transfer_syntax[0]
-        bytestream = encode(
-            dataset,
-            transfer_syntax.is_implicit_VR,
-            transfer_syntax.is_little_endian,
-            transfer_syntax.is_deflated,
-        )
-
-        if bytestream is not None:
-            req.Identifier = BytesIO(bytestream)
-        else:
-            LOGGER.error("Failed to encode the supplied Dataset")
-            raise ValueError("Failed to encode the supplied Dataset")
-
-        LOGGER.info(f"Sending Find Request: MsgID {msg_id}")
-        LOGGER.info("")
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            LOGGER.info("# Request Identifier")
-            for line in pretty_dataset(dataset):
-                LOGGER.info(line)
-
-            LOGGER.info("")
 
         # Pause the reactor to prevent a race condition
         self._reactor_checkpoint.clear()
@@ -1282,7 +1697,7 @@ class Association(threading.Thread):
         # Wrap the generator so the C-FIND-RQ is sent immediately on
         #   executing this function, otherwise sending C-CANCEL requests
         #   may end up being sent first unless next() is called
-        return self._wrap_find_responses(transfer_syntax, query_model)
+        return self._wrap_find_responses(transfer_syntax, UID(query_model))
 
     def send_c_get(
         self,
@@ -1435,44 +1850,8 @@ class Association(threading.Thread):
                 "sending a C-GET request"
             )
 
-        # Determine the Presentation Context we are operating under
-        #   and hence the transfer syntax to use for encoding `dataset`
-        context = self._get_valid_context(query_model, "", "scu")
-
-        # Build C-GET request primitive
-        #   (M) Message ID
-        #   (M) Affected SOP Class UID
-        #   (M) Priority
-        #   (M) Identifier
-        req = C_GET()
-        req.MessageID = msg_id
-        req.AffectedSOPClassUID = UID(query_model)
-        req.Priority = priority
-
-        # Encode the Identifier `dataset` using the agreed transfer syntax
-        #   Will return None if failed to encode
+        req, context = self._c_get_request(dataset, query_model, msg_id, priority)
         transfer_syntax = context.transfer_syntax[0]
-        bytestream = encode(
-            dataset,
-            transfer_syntax.is_implicit_VR,
-            transfer_syntax.is_little_endian,
-            transfer_syntax.is_deflated,
-        )
-
-        if bytestream is not None:
-            req.Identifier = BytesIO(bytestream)
-        else:
-            LOGGER.error("Failed to encode the supplied Identifier dataset")
-            raise ValueError("Failed to encode the supplied Identifier dataset")
-
-        LOGGER.info(f"Sending Get Request: MsgID {msg_id}")
-        LOGGER.info("")
-        if _config.LOG_REQUEST_IDENTIFIERS:
-            LOGGER.info("# Request Identifier")
-            for line in pretty_dataset(dataset):
-                LOGGER.info(line)
-
-            LOGGER.info("")
 
         # Pause the reactor to prevent a race condition
         self._reactor_checkpoint.clear()
@@ -1607,40 +1986,528 @@ class Association(threading.Thread):
             If no accepted Presentation Context for `query_model` exists or if
             unable to encode the `dataset`.
 
-        See Also
-        --------
+        See Also
+        --------
+
+        :class:`~pynetdicom.dimse_primitives.C_MOVE`
+        :class:`~pynetdicom.service_class.QueryRetrieveServiceClass`
+        :class:`~pynetdicom.service_class.HangingProtocolQueryRetrieveServiceClass`
+        :class:`~pynetdicom.service_class.ColorPaletteQueryRetrieveServiceClass`
+        :class:`~pynetdicom.service_class.ImplantTemplateQueryRetrieveServiceClass`
+        :class:`~pynetdicom.service_class.InventoryQueryRetrieveServiceClass`
+        :class:`~pynetdicom.service_class.ProtocolApprovalQueryRetrieveServiceClass`
+
+        References
+        ----------
+
+        * DICOM Standard, Part 4, :dcm:`Annex C<part04/chapter_C.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex U<part04/chapter_U.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex X<part04/chapter_X.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex Y<part04/chapter_Y.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex BB<part04/chapter_BB.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex HH<part04/chapter_HH.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex II<part04/chapter_II.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex JJ<part04/chapter_JJ.html>`
+        * DICOM Standard, Part 7, Sections
+          :dcm:`9.1.4<part07/chapter_9.html#sect_9.1.4>`,
+          :dcm:`9.3.4<part07/sect_9.3.4.html>` and
+          :dcm:`Annex C<part07/chapter_C.html>`
+        """
+        # Can't send a C-MOVE without an Association
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-MOVE request"
+            )
+
+        req, context = self._c_move_request(
+            dataset, move_aet, query_model, msg_id, priority
+        )
+        transfer_syntax = context.transfer_syntax[0]
+
+        # Pause the reactor to prevent a race condition
+        self._reactor_checkpoint.clear()
+        while not self._is_paused:
+            time.sleep(0.0001)
+
+        # Send C-MOVE request to the peer via DIMSE and wait for the response
+        self.dimse.send_msg(req, cast(int, context.context_id))
+
+        # Get the responses from the peer
+        # Wrap the generator so the C-MOVE-RQ is sent immediately on
+        #   executing this function, otherwise sending C-CANCEL requests
+        #   may end up being sent first unless next() is called
+        return self._wrap_get_move_responses(transfer_syntax)
+
+    def send_c_store(
+        self,
+        dataset: str | Path | Dataset,
+        msg_id: int = 1,
+        priority: int = 2,
+        originator_aet: str | None = None,
+        originator_id: int | None = None,
+    ) -> Dataset:
+        """Send a C-STORE request to the peer AE.
+
+        .. versionchanged:: 2.0
+
+            * Changed `dataset` parameter to either be a dataset or the path to
+              a dataset.
+            * `originator_aet` should now be :class:`str`
+
+        Parameters
+        ----------
+        dataset : pydicom.dataset.Dataset, str or pathlib.Path
+            The DICOM dataset to send to the peer or the file path to the
+            dataset to be sent. If a file path then the dataset will be read
+            and decoded using :func:`~pydicom.filereader.dcmread`.
+        msg_id : int, optional
+            The C-STORE request's *Message ID*, must be between 0 and 65535,
+            inclusive, (default ``1``).
+        priority : int, optional
+            The value of the C-STORE request's *Priority* parameter (may not be
+            supported by the peer), one of:
+
+            - ``0`` - Medium
+            - ``1`` - High
+            - ``2`` - Low (default)
+        originator_aet : str, optional
+            The value of the *Move Originator Application Entity Title*
+            parameter for the C-STORE request. This is the AE title of the
+            peer that invoked the C-MOVE operation for which this C-STORE
+            sub-operation is being performed (default ``None``).
+        originator_id : int, optional
+            The value of the *Move Originator Message ID* parameter for the
+            C-STORE request. This is the original *Message ID* parameter value
+            for the C-MOVE request primitive for which the C-STORE
+            sub-operation is being performed (default ``None``).
+
+        Returns
+        -------
+        status : pydicom.dataset.Dataset
+            If the peer timed out, aborted or sent an invalid response then
+            returns an empty :class:`~pydicom.dataset.Dataset`. If a valid
+            response was received from the peer then returns a
+            :class:`~pydicom.dataset.Dataset` containing at least a
+            (0000,0900) *Status* element, and, depending on the returned
+            value, may optionally contain additional elements (see DICOM
+            Standard, Part 7, :dcm:`Annex C<part07/chapter_C.html>`).
+
+            The status for the requested C-STORE operation should be one of the
+            following, but as the value depends on the peer SCP this can't be
+            assumed:
+
+            *General C-STORE* (DICOM Standard, Part 7, 9.1.1.1.9 and Annex C):
+
+            Success
+              | ``0x0000`` - Success
+
+            Failure
+              | ``0x0117`` - Invalid SOP instance
+              | ``0x0122`` - SOP class not supported
+              | ``0x0124`` - Not authorised
+              | ``0x0210`` - Duplicate invocation
+              | ``0x0211`` - Unrecognised operation
+              | ``0x0212`` - Mistyped argument
+
+            *Storage Service* and *Non-Patient Object Storage Service* specific
+            (DICOM Standard, Part 4, Annexes B.2.3 and GG):
+
+            Failure
+              | ``0xA700`` to ``0xA7FF`` - Out of resources
+              | ``0xA900`` to ``0xA9FF`` - Data set does not match SOP class
+              | ``0xC000`` to ``0xCFFF`` - Cannot understand
+
+            Warning
+              | ``0xB000`` - Coercion of data elements
+              | ``0xB006`` - Element discarded
+              | ``0xB007`` - Data set does not match SOP class
+
+            *Non-Patient Object Service Class* specific (DICOM Standard, Part
+            4, Annex GG.4.2)
+
+            Failure
+              | ``0xA700`` - Out of resources
+              | ``0xA900`` - Data set does not match SOP class
+              | ``0xC000`` - Cannot understand
+
+        Raises
+        ------
+        RuntimeError
+            If :meth:`send_c_store` is called with no established association.
+        AttributeError
+            If `dataset` is missing (0008,0016) *SOP Class UID*,
+            (0008,0018) *SOP Instance UID* elements or the (0002,0010)
+            *Transfer Syntax UID* file meta information element.
+        ValueError
+            If no accepted Presentation Context for `dataset` exists or if
+            unable to encode the `dataset`.
+
+        See Also
+        --------
+
+        :class:`~pynetdicom.dimse_primitives.C_STORE`
+        :class:`~pynetdicom.service_class.StorageServiceClass`
+        :class:`~pynetdicom.service_class.NonPatientObjectStorageServiceClass`
+        :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET`
+
+        References
+        ----------
+
+        * DICOM Standard, Part 4, :dcm:`Annex B<part04/chapter_B.html>`
+        * DICOM Standard, Part 4, :dcm:`Annex GG<part04/chapter_GG.html>`
+        * DICOM Standard, Part 7, Sections
+          :dcm:`9.1.1<part07/chapter_9.html#sect_9.1.1>`,
+          :dcm:`9.3.1<part07/sect_9.3.html#sect_9.3.1>` and
+          :dcm:`Annex C<part07/chapter_C.html>`
+        """
+        # Can't send a C-STORE without an Association
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-STORE request"
+            )
+
+        req, context = self._c_store_request(
+            dataset, msg_id, priority, originator_aet, originator_id
+        )
+
+        # Pause the reactor to prevent a race condition
+        self._reactor_checkpoint.clear()
+        while not self._is_paused:
+            time.sleep(0.0001)
+
+        # Send C-STORE request to the peer via DIMSE and wait for the response
+        self.dimse.send_msg(req, cast(int, context.context_id))
+        cx_id, rsp = self.dimse.get_msg(block=True)
+
+        # Unpause the reactor
+        self._reactor_checkpoint.set()
+
+        # If `rsp` is None then the DIMSE timeout expired so abort
+        if rsp is None:
+            self._handle_no_response()
+            return Dataset()
+
+        # Determine validity of the response and get the status
+        status = self._check_received_status(rsp)
+
+        return status
+
+    def send_c_store_many(
+        self,
+        datasets: Iterable[str | Path | Dataset],
+        msg_id: int = 1,
+        priority: int = 2,
+    ) -> Iterator[tuple[str | Path | Dataset, Dataset]]:
+        """Send C-STORE requests for `datasets` to the peer AE without waiting
+        for the response to each request before sending the next.
+
+        .. versionadded:: 3.1
+
+        Up to the number of operations negotiated using :dcm:`Asynchronous
+        Operations Window Negotiation<part07/sect_D.3.3.3.html>` will be
+        outstanding at any one time, and responses are matched to their
+        requests using their *Message ID Being Responded To*. If no
+        asynchronous operations window was negotiated then each request
+        waits for the response to the previous one, the same as
+        :meth:`send_c_store`.
+
+        The reactor is paused until the last response has been received, so
+        the returned iterator should be consumed completely.
+
+        Parameters
+        ----------
+        datasets : iterable of pydicom.dataset.Dataset, str or pathlib.Path
+            The DICOM datasets to send to the peer or the file paths to the
+            datasets, see :meth:`send_c_store`. Datasets are only read from
+            `datasets` when there's room in the window for another request.
+        msg_id : int, optional
+            The *Message ID* to use for the first C-STORE request, each
+            subsequent request uses the next value, wrapping around after
+            65535 (default ``1``).
+        priority : int, optional
+            The value of the C-STORE requests' *Priority* parameter (may not
+            be supported by the peer), one of:
+
+            - ``0`` - Medium
+            - ``1`` - High
+            - ``2`` - Low (default)
+
+        Yields
+        ------
+        dataset : pydicom.dataset.Dataset, str or pathlib.Path
+            The item from `datasets` that the response is for.
+        status : pydicom.dataset.Dataset
+            The status of the C-STORE operation, see :meth:`send_c_store`.
+            Responses are yielded in the order they're received and may not
+            be in the same order as `datasets`. If the peer timed out,
+            aborted or sent an invalid response then an empty
+            :class:`~pydicom.dataset.Dataset` is yielded for each of the
+            outstanding requests and no further requests are sent.
+
+        Raises
+        ------
+        RuntimeError
+            If :meth:`send_c_store_many` is called with no established
+            association.
+        AttributeError
+            If a dataset is missing any of the elements required by
+            :meth:`send_c_store`.
+        ValueError
+            If no accepted Presentation Context for a dataset exists or if
+            unable to encode a dataset. No further requests are sent and the
+            responses to the outstanding requests are yielded before the
+            exception is raised.
+
+        See Also
+        --------
+
+        :meth:`send_c_store`
+        :class:`~pynetdicom.pdu_primitives.AsynchronousOperationsWindowNegotiation`
+        """
+        # Can't send a C-STORE without an Association
+        if not self.is_established:
+            raise RuntimeError(
+                "The association with a peer SCP must be established before "
+                "sending a C-STORE request"
+            )
+
+        return self._wrap_store_requests(iter(datasets), msg_id, priority)
+
+    def _wrap_store_requests(
+        self,
+        datasets: Iterator[str | Path | Dataset],
+        msg_id: int,
+        priority: int,
+    ) -> Iterator[tuple[str | Path | Dataset, Dataset]]:
+        """Generator for :meth:`send_c_store_many`.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        datasets : iterator of pydicom.dataset.Dataset, str or pathlib.Path
+            The datasets to send.
+        msg_id : int
+            The *Message ID* of the first C-STORE request.
+        priority : int
+            The *Priority* of the C-STORE requests.
+
+        Yields
+        ------
+        See ``send_c_store_many()``.
+        """
+        # The acceptor's response contains the number of operations the
+        #   requestor may invoke and the number the acceptor may invoke
+        invoked, performed = self.acceptor.asynchronous_operations
+        window = invoked if self.is_requestor else performed
+        # 0 is unlimited, but Message IDs must be unique among the
+        #   outstanding requests
+        window = window or 65535
+
+        # Requests that haven't been responded to as {Message ID: dataset}
+        outstanding: dict[int, str | Path | Dataset] = {}
+        is_exhausted = False
+        # Raised once the responses to the outstanding requests are received
+        error: Exception | None = None
+
+        # Pause the reactor to prevent a race condition
+        self._reactor_checkpoint.clear()
+        while not self._is_paused:
+            time.sleep(0.0001)
+
+        try:
+            while self.is_established and (not is_exhausted or outstanding):
+                # Only wait for a response once the window is full or there
+                #   are no more requests to send
+                block = is_exhausted or len(outstanding) >= window
+                if not block:
+                    try:
+                        dataset = next(datasets)
+                    except StopIteration:
+                        is_exhausted = True
+                        continue
+
+                    try:
+                        req, context = self._c_store_request(
+                            dataset, msg_id, priority, None, None
+                        )
+                    except Exception as exc:
+                        # Nothing has been sent for the dataset, so stop
+                        #   sending and wait for the responses to the
+                        #   requests already sent so they can't be taken as
+                        #   the responses to any later requests
+                        error = exc
+                        is_exhausted = True
+                        continue
+
+                    try:
+                        self.dimse.send_msg(req, cast(int, context.context_id))
+                    except Exception:
+                        # Part of the request may have been sent
+                        self.abort()
+                        raise
+
+                    outstanding[msg_id] = dataset
+                    msg_id = (msg_id + 1) % 65536
+
+                cx_id, rsp = self.dimse.get_msg(block=block)
+                if rsp is None:
+                    if not block:
+                        continue
+
+                    # DIMSE timeout expired, so abort
+                    self._handle_no_response()
+                    break
+
+                rsp_id = getattr(rsp, "MessageIDBeingRespondedTo", None)
+                if not isinstance(rsp, C_STORE) or rsp_id not in outstanding:
+                    LOGGER.error(
+                        f"Received an unexpected {rsp.msg_type} message from "
+                        "the peer"
+                    )
+                    self.abort()
+                    break
+
+                dataset = outstanding.pop(rsp_id)
+                yield dataset, self._check_received_status(rsp)
+        finally:
+            # Unpause the reactor
+            self._reactor_checkpoint.set()
+
+        # Any remaining requests will never receive a response
+        for dataset in outstanding.values():
+            yield dataset, Dataset()
+
+        if error is not None:
+            raise error
+
+    def _c_find_request(
+        self, dataset: Dataset, query_model: str | UID, msg_id: int, priority: int
+    ) -> tuple[C_FIND, PresentationContext]:
+        """Return a C-FIND request for the Identifier `dataset` and the
+        presentation context to send it with.
+
+        .. versionadded:: 3.1
+
+        See :meth:`send_c_find` for the parameters and the exceptions raised.
+        """
+        # Determine the Presentation Context we are operating under
+        #   and hence the transfer syntax to use for encoding `dataset`
+        context = self._get_valid_context(query_model, "", "scu")
+        if context.abstract_syntax != query_model:
+            LOGGER.info("Using Presentation Context:")
+            LOGGER.info(f"  Context ID:        {context.context_id}")
+            LOGGER.info(
+                f"  Abstract Syntax:   ={cast(UID, context.abstract_syntax).name}"
+            )
+
+        query_model = UID(query_model)
+
+        # Build C-FIND request primitive
+        #   (M) Message ID
+        #   (M) Affected SOP Class UID
+        #   (M) Priority
+        #   (M) Identifier
+        req = C_FIND()
+        req.MessageID = msg_id
+        req.AffectedSOPClassUID = query_model
+        req.Priority = priority
+
+        # Encode the Identifier `dataset` using the agreed transfer syntax
+        #   Will return None if failed to encode
+        transfer_syntax = context.transfer_syntax[0]
+        bytestream = encode(
+            dataset,
+            transfer_syntax.is_implicit_VR,
+            transfer_syntax.is_little_endian,
+            transfer_syntax.is_deflated,
+        )
+
+        if bytestream is not None:
+            req.Identifier = BytesIO(bytestream)
+        else:
+            LOGGER.error("Failed to encode the supplied Dataset")
+            raise ValueError("Failed to encode the supplied Dataset")
+
+        LOGGER.info(f"Sending Find Request: MsgID {msg_id}")
+        LOGGER.info("")
+        if _config.LOG_REQUEST_IDENTIFIERS:
+            LOGGER.info("# Request Identifier")
+            for line in pretty_dataset(dataset):
+                LOGGER.info(line)
+
+            LOGGER.info("")
+
+        return req, context
+
+    def _c_get_request(
+        self, dataset: Dataset, query_model: str | UID, msg_id: int, priority: int
+    ) -> tuple[C_GET, PresentationContext]:
+        """Return a C-GET request for the Identifier `dataset` and the
+        presentation context to send it with.
+
+        .. versionadded:: 3.1
+
+        See :meth:`send_c_get` for the parameters and the exceptions raised.
+        """
+        # Determine the Presentation Context we are operating under
+        #   and hence the transfer syntax to use for encoding `dataset`
+        context = self._get_valid_context(query_model, "", "scu")
+
+        # Build C-GET request primitive
+        #   (M) Message ID
+        #   (M) Affected SOP Class UID
+        #   (M) Priority
+        #   (M) Identifier
+        req = C_GET()
+        req.MessageID = msg_id
+        req.AffectedSOPClassUID = UID(query_model)
+        req.Priority = priority
+
+        # Encode the Identifier `dataset` using the agreed transfer syntax
+        #   Will return None if failed to encode
+        transfer_syntax = context.transfer_syntax[0]
+        bytestream = encode(
+            dataset,
+            transfer_syntax.is_implicit_VR,
+            transfer_syntax.is_little_endian,
+            transfer_syntax.is_deflated,
+        )
+
+        if bytestream is not None:
+            req.Identifier = BytesIO(bytestream)
+        else:
+            LOGGER.error("Failed to encode the supplied Identifier dataset")
+            raise ValueError("Failed to encode the supplied Identifier dataset")
+
+        LOGGER.info(f"Sending Get Request: MsgID {msg_id}")
+        LOGGER.info("")
+        if _config.LOG_REQUEST_IDENTIFIERS:
+            LOGGER.info("# Request Identifier")
+            for line in pretty_dataset(dataset):
+                LOGGER.info(line)
+
+            LOGGER.info("")
 
-        :class:`~pynetdicom.dimse_primitives.C_MOVE`
-        :class:`~pynetdicom.service_class.QueryRetrieveServiceClass`
-        :class:`~pynetdicom.service_class.HangingProtocolQueryRetrieveServiceClass`
-        :class:`~pynetdicom.service_class.ColorPaletteQueryRetrieveServiceClass`
-        :class:`~pynetdicom.service_class.ImplantTemplateQueryRetrieveServiceClass`
-        :class:`~pynetdicom.service_class.InventoryQueryRetrieveServiceClass`
-        :class:`~pynetdicom.service_class.ProtocolApprovalQueryRetrieveServiceClass`
+        return req, context
 
-        References
-        ----------
+    def _c_move_request(
+        self,
+        dataset: Dataset,
+        move_aet: str,
+        query_model: str | UID,
+        msg_id: int,
+        priority: int,
+    ) -> tuple[C_MOVE, PresentationContext]:
+        """Return a C-MOVE request for the Identifier `dataset` and the
+        presentation context to send it with.
 
-        * DICOM Standard, Part 4, :dcm:`Annex C<part04/chapter_C.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex U<part04/chapter_U.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex X<part04/chapter_X.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex Y<part04/chapter_Y.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex BB<part04/chapter_BB.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex HH<part04/chapter_HH.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex II<part04/chapter_II.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex JJ<part04/chapter_JJ.html>`
-        * DICOM Standard, Part 7, Sections
-          :dcm:`9.1.4<part07/chapter_9.html#sect_9.1.4>`,
-          :dcm:`9.3.4<part07/sect_9.3.4.html>` and
-          :dcm:`Annex C<part07/chapter_C.html>`
-        """
-        # Can't send a C-MOVE without an Association
-        if not self.is_established:
-            raise RuntimeError(
-                "The association with a peer SCP must be established before "
-                "sending a C-MOVE request"
-            )
+        .. versionadded:: 3.1
 
+        See :meth:`send_c_move` for the parameters and the exceptions raised.
+        """
         # Determine the Presentation Context we are operating under
         #   and hence the transfer syntax to use for encoding `dataset`
         context = self._get_valid_context(query_model, "", "scu")
@@ -1682,149 +2549,23 @@ class Association(threading.Thread):
 
             LOGGER.info("")
 
-        # Pause the reactor to prevent a race condition
-        self._reactor_checkpoint.clear()
-        while not self._is_paused:
-            time.sleep(0.0001)
-
-        # Send C-MOVE request to the peer via DIMSE and wait for the response
-        self.dimse.send_msg(req, cast(int, context.context_id))
-
-        # Get the responses from the peer
-        # Wrap the generator so the C-MOVE-RQ is sent immediately on
-        #   executing this function, otherwise sending C-CANCEL requests
-        #   may end up being sent first unless next() is called
-        return self._wrap_get_move_responses(transfer_syntax)
+        return req, context
 
-    def send_c_store(
+    def _c_store_request(
         self,
         dataset: str | Path | Dataset,
-        msg_id: int = 1,
-        priority: int = 2,
-        originator_aet: str | None = None,
-        originator_id: int | None = None,
-    ) -> Dataset:
-        """Send a C-STORE request to the peer AE.
-
-        .. versionchanged:: 2.0
-
-            * Changed `dataset` parameter to either be a dataset or the path to
-              a dataset.
-            * `originator_aet` should now be :class:`str`
-
-        Parameters
-        ----------
-        dataset : pydicom.dataset.Dataset, str or pathlib.Path
-            The DICOM dataset to send to the peer or the file path to the
-            dataset to be sent. If a file path then the dataset will be read
-            and decoded using :func:`~pydicom.filereader.dcmread`.
-        msg_id : int, optional
-            The C-STORE request's *Message ID*, must be between 0 and 65535,
-            inclusive, (default ``1``).
-        priority : int, optional
-            The value of the C-STORE request's *Priority* parameter (may not be
-            supported by the peer), one of:
-
-            - ``0`` - Medium
-            - ``1`` - High
-            - ``2`` - Low (default)
-        originator_aet : str, optional
-            The value of the *Move Originator Application Entity Title*
-            parameter for the C-STORE request. This is the AE title of the
-            peer that invoked the C-MOVE operation for which this C-STORE
-            sub-operation is being performed (default ``None``).
-        originator_id : int, optional
-            The value of the *Move Originator Message ID* parameter for the
-            C-STORE request. This is the original *Message ID* parameter value
-            for the C-MOVE request primitive for which the C-STORE
-            sub-operation is being performed (default ``None``).
-
-        Returns
-        -------
-        status : pydicom.dataset.Dataset
-            If the peer timed out, aborted or sent an invalid response then
-            returns an empty :class:`~pydicom.dataset.Dataset`. If a valid
-            response was received from the peer then returns a
-            :class:`~pydicom.dataset.Dataset` containing at least a
-            (0000,0900) *Status* element, and, depending on the returned
-            value, may optionally contain additional elements (see DICOM
-            Standard, Part 7, :dcm:`Annex C<part07/chapter_C.html>`).
-
-            The status for the requested C-STORE operation should be one of the
-            following, but as the value depends on the peer SCP this can't be
-            assumed:
-
-            *General C-STORE* (DICOM Standard, Part 7, 9.1.1.1.9 and Annex C):
-
-            Success
-              | ``0x0000`` - Success
-
-            Failure
-              | ``0x0117`` - Invalid SOP instance
-              | ``0x0122`` - SOP class not supported
-              | ``0x0124`` - Not authorised
-              | ``0x0210`` - Duplicate invocation
-              | ``0x0211`` - Unrecognised operation
-              | ``0x0212`` - Mistyped argument
-
-            *Storage Service* and *Non-Patient Object Storage Service* specific
-            (DICOM Standard, Part 4, Annexes B.2.3 and GG):
-
-            Failure
-              | ``0xA700`` to ``0xA7FF`` - Out of resources
-              | ``0xA900`` to ``0xA9FF`` - Data set does not match SOP class
-              | ``0xC000`` to ``0xCFFF`` - Cannot understand
-
-            Warning
-              | ``0xB000`` - Coercion of data elements
-              | ``0xB006`` - Element discarded
-              | ``0xB007`` - Data set does not match SOP class
-
-            *Non-Patient Object Service Class* specific (DICOM Standard, Part
-            4, Annex GG.4.2)
-
-            Failure
-              | ``0xA700`` - Out of resources
-              | ``0xA900`` - Data set does not match SOP class
-              | ``0xC000`` - Cannot understand
-
-        Raises
-        ------
-        RuntimeError
-            If :meth:`send_c_store` is called with no established association.
-        AttributeError
-            If `dataset` is missing (0008,0016) *SOP Class UID*,
-            (0008,0018) *SOP Instance UID* elements or the (0002,0010)
-            *Transfer Syntax UID* file meta information element.
-        ValueError
-            If no accepted Presentation Context for `dataset` exists or if
-            unable to encode the `dataset`.
-
-        See Also
-        --------
-
-        :class:`~pynetdicom.dimse_primitives.C_STORE`
-        :class:`~pynetdicom.service_class.StorageServiceClass`
-        :class:`~pynetdicom.service_class.NonPatientObjectStorageServiceClass`
-        :attr:`~pynetdicom._config.STORE_SEND_CHUNKED_DATASET`
+        msg_id: int,
+        priority: int,
+        originator_aet: str | None,
+        originator_id: int | None,
+    ) -> tuple[C_STORE, PresentationContext]:
+        """Return a C-STORE request for `dataset` and the presentation
+        context to send it with.
 
-        References
-        ----------
+        .. versionadded:: 3.1
 
-        * DICOM Standard, Part 4, :dcm:`Annex B<part04/chapter_B.html>`
-        * DICOM Standard, Part 4, :dcm:`Annex GG<part04/chapter_GG.html>`
-        * DICOM Standard, Part 7, Sections
-          :dcm:`9.1.1<part07/chapter_9.html#sect_9.1.1>`,
-          :dcm:`9.3.1<part07/sect_9.3.html#sect_9.3.1>` and
-          :dcm:`Annex C<part07/chapter_C.html>`
+        See :meth:`send_c_store` for the parameters and the exceptions raised.
         """
-        # Can't send a C-STORE without an Association
-        if not self.is_established:
-            raise RuntimeError(
-                "The association with a peer SCP must be established before "
-                "sending a C-STORE request"
-            )
-
         # Build C-STORE request primitive
         #   (M) Message ID
         #   (M) Affected SOP Class UID
@@ -1950,27 +2691,7 @@ class Association(threading.Thread):
                 LOGGER.error("Failed to encode the supplied dataset")
                 raise ValueError("Failed to encode the supplied dataset")
 
-        # Pause the reactor to prevent a race condition
-        self._reactor_checkpoint.clear()
-        while not self._is_paused:
-            time.sleep(0.0001)
-
-        # Send C-STORE request to the peer via DIMSE and wait for the response
-        self.dimse.send_msg(req, cast(int, context.context_id))
-        cx_id, rsp = self.dimse.get_msg(block=True)
-
-        # Unpause the reactor
-        self._reactor_checkpoint.set()
-
-        # If `rsp` is None then the DIMSE timeout expired so abort
-        if rsp is None:
-            self._handle_no_response()
-            return Dataset()
-
-        # Determine validity of the response and get the status
-        status = self._check_received_status(rsp)
-
-        return status
+        return req, context
 
     def _wrap_find_responses(
         self,
@@ -3477,9 +4198,39 @@ class Association(threading.Thread):
 
         return status, attribute_list
 
+    def _is_saturated(self) -> bool:
+        """Return ``True`` if the executor is running as many service requests
+        as it may perform at once.
+
+        .. versionadded:: 3.1
+        """
+        return self._executor is not None and self._in_flight >= self._max_in_flight
+
     def _serve_request(self, msg: DimseServiceType, context_id: int) -> None:
         """Handle a DIMSE service request.
 
+        .. versionchanged:: 3.1
+
+            If `msg` is being held by the DIMSE provider then it's released
+            once the request has been handled.
+
+        Parameters
+        ----------
+        msg : dimse_primitives.DIMSEPrimitive subclass
+            The DIMSE service request primitive.
+        context_id : int
+            The ID of the presentation context that the request is being
+            made under.
+        """
+        # Only service requests are held
+        if not self._perform_request(msg, context_id) and msg.is_valid_request:
+            self.dimse.release_msg(msg)
+
+    def _perform_request(self, msg: DimseServiceType, context_id: int) -> bool:
+        """Perform a DIMSE service request.
+
+        .. versionadded:: 3.1
+
         Parameters
         ----------
         msg : dimse_primitives.DIMSEPrimitive subclass
@@ -3487,17 +4238,23 @@ class Association(threading.Thread):
         context_id : int
             The ID of the presentation context that the request is being
             made under.
+
+        Returns
+        -------
+        bool
+            ``True`` if the request was passed to a worker, which will release
+            `msg` once the request has been handled, ``False`` otherwise.
         """
         if self._sent_release:
             LOGGER.warning(
                 f"{msg.msg_type} message received during association release, ignoring"
             )
-            return
+            return False
 
         # No message or not a service request
         if not msg.is_valid_request:
             LOGGER.warning(f"Received unexpected {msg.msg_type} service message")
-            return
+            return False
 
         # Use the Message's Affected SOP Class UID or Requested SOP
         #   Class UID to determine which service to use
@@ -3532,18 +4289,105 @@ class Association(threading.Thread):
             )
             LOGGER.debug(str(msg))
             self.abort()
-            return
+            return False
+
+        # Run the service class in a worker if the peer may have more than one
+        #   request outstanding, except for C-GET as its SCP receives the
+        #   C-STORE sub-operation responses from the DIMSE message queue
+        if self._nr_performed is None:
+            invoked, performed = self.acceptor.asynchronous_operations
+            self._nr_performed = invoked if self.is_acceptor else performed
+
+        if self._nr_performed != 1 and not isinstance(msg, C_GET):
+            if self._executor is None:
+                # An unlimited window uses the executor's default
+                self._max_in_flight = self._nr_performed or min(
+                    32, (os.cpu_count() or 1) + 4
+                )
+                self._executor = ThreadPoolExecutor(
+                    self._max_in_flight,
+                    thread_name_prefix=f"{self.name}-Worker",
+                )
 
-        # Run corresponding Service Class in SCP mode
-        try:
-            # Clear out any C-CANCEL requests received beforehand
-            self.dimse.cancel_req = {}
-            # In case the SCP calls one of the send_* methods
-            self._is_paused = True
-            service_class.SCP(msg, context)
+            with self._in_flight_lock:
+                self._in_flight += 1
+
+            try:
+                self._executor.submit(
+                    self._run_scp,
+                    service_class,
+                    msg,
+                    context,
+                    class_uid,
+                    partial(self._release_slot, msg),
+                )
+            except RuntimeError:
+                # The association has been killed
+                self._release_slot(msg)
+
+            return True
+
+        # Handled in this thread so the request no longer counts towards the
+        #   buffer limits, as the SCP may need to receive further messages
+        self.dimse.release_msg(msg)
+        # Clear out any C-CANCEL requests received beforehand
+        self.dimse.cancel_req = {}
+        # In case the SCP calls one of the send_* methods
+        self._is_paused = True
+        if self._run_scp(service_class, msg, context, class_uid):
             self._is_paused = False
             # Clear out any unacted upon requests received during
             self.dimse.cancel_req = {}
+
+        return False
+
+    def _release_slot(self, msg: DimseServiceType) -> None:
+        """Free the executor slot and buffer space used by the service request
+        `msg` and wake the reactor so it can take the next request.
+
+        .. versionadded:: 3.1
+        """
+        self.dimse.release_msg(msg)
+        with self._in_flight_lock:
+            self._in_flight -= 1
+
+        self.dul._wakeup_user()
+
+    def _run_scp(
+        self,
+        service_class: "ServiceClass",
+        msg: DimseServiceType,
+        context: PresentationContext,
+        class_uid: str,
+        on_complete: Callable[[], None] | None = None,
+    ) -> bool:
+        """Run the corresponding service class in SCP mode for a DIMSE service
+        request.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        service_class : service_class.ServiceClass
+            The service class to use.
+        msg : dimse_primitives.DIMSEPrimitive subclass
+            The DIMSE service request primitive.
+        context : presentation.PresentationContext
+            The presentation context that the request is being made under.
+        class_uid : str
+            The UID used to determine the service class.
+        on_complete : Callable[[], None], optional
+            If used then a callable that takes no parameters which will be
+            called once the request has been handled.
+
+        Returns
+        -------
+        bool
+            ``True`` if the service class ran successfully, ``False`` if it
+            raised an exception and the association was aborted.
+        """
+        try:
+            service_class.SCP(msg, context)
         except NotImplementedError:
             # SCP isn't implemented
             LOGGER.error(
@@ -3553,11 +4397,20 @@ class Association(threading.Thread):
                 "support for a private, retired or otherwise unknown SOP Class UID"
             )
             self.abort()
-            return
+            return False
         except Exception as exc:
             LOGGER.exception(exc)
             self.abort()
-            return
+            return False
+        finally:
+            if self._executor:
+                # Clear out any unacted upon C-CANCEL for the request
+                self.dimse.cancel_req.pop(cast(int, msg.MessageID), None)
+
+            if on_complete:
+                on_complete()
+
+        return True
 
 
 class ServiceUser:
@@ -0,0 +1,33 @@
+"""Performance tests for association setup and teardown."""
+
+from pynetdicom import AE
+from pynetdicom.sop_class import Verification
+
+
+class TimeAssociationTeardown:
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        self.scp = ae.start_server(("localhost", 11113), block=False)
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        self.scp.shutdown()
+
+    def time_release(self):
+        """Test associating, sending a C-ECHO and releasing 20 times."""
+        for ii in range(20):
+            assoc = self.ae.associate("localhost", 11113)
+            assert assoc.send_c_echo().Status == 0x0000
+            assoc.release()
+            assert assoc.is_released
+
+    def time_abort(self):
+        """Test associating, sending a C-ECHO and aborting 20 times."""
+        for ii in range(20):
+            assoc = self.ae.associate("localhost", 11113)
+            assert assoc.send_c_echo().Status == 0x0000
+            assoc.abort()
+            assert assoc.is_aborted
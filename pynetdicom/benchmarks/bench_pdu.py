@@ -2,7 +2,16 @@
 
 from io import BytesIO
 
-from pynetdicom.pdu import PDU, PDU_TYPES
+from pynetdicom.pdu import (
+    A_ASSOCIATE_RQ,
+    A_ASSOCIATE_AC,
+    A_ASSOCIATE_RJ,
+    P_DATA_TF,
+    A_RELEASE_RQ,
+    A_RELEASE_RP,
+    A_ABORT_RQ,
+)
+from pynetdicom.pdu_items import PresentationContextItemRQ
 from pynetdicom.tests.encoded_pdu_items import (
     presentation_context_rq,
     a_associate_rq,
@@ -23,43 +32,43 @@ class TimePDUDecode:
 
     def time_decode_assoc_rq_pdu(self):
         """Time decoding an A-ASSOCIATE-RQ PDU."""
-        pdu = PDU_TYPES[0x01]()
+        pdu = A_ASSOCIATE_RQ()
         for ii in range(1000):
             pdu.decode(a_associate_rq_user_id_ext_neg)
 
     def time_decode_assoc_ac_pdu(self):
         """Time decoding an A-ASSOCIATE-AC PDU."""
-        pdu = PDU_TYPES[0x02]()
+        pdu = A_ASSOCIATE_AC()
         for ii in range(1000):
             pdu.decode(a_associate_ac)
 
     def time_decode_assoc_rj_pdu(self):
         """Time decoding an A-ASSOCIATE-RJ PDU."""
-        pdu = PDU_TYPES[0x03]()
+        pdu = A_ASSOCIATE_RJ()
         for ii in range(1000):
             pdu.decode(a_associate_rj)
 
     def time_decode_data_tf_pdu(self):
         """Time decoding a P-DATA-TF PDU."""
-        pdu = PDU_TYPES[0x04]()
+        pdu = P_DATA_TF()
         for ii in range(1000):
             pdu.decode(p_data_tf)
 
     def time_decode_release_rq_pdu(self):
         """Time decoding an A-RELEASE-RQ PDU."""
-        pdu = PDU_TYPES[0x05]()
+        pdu = A_RELEASE_RQ()
         for ii in range(1000):
             pdu.decode(a_release_rq)
 
     def time_decode_release_rp_pdu(self):
         """Time decoding an A-RELEASE-RP PDU."""
-        pdu = PDU_TYPES[0x06]()
+        pdu = A_RELEASE_RP()
         for ii in range(1000):
             pdu.decode(a_release_rp)
 
     def time_decode_abort_rq_pdu(self):
         """Time decoding an A-ABORT-RQ PDU."""
-        pdu = PDU_TYPES[0x07]()
+        pdu = A_ABORT_RQ()
         for ii in range(1000):
             pdu.decode(a_abort)
 
@@ -67,25 +76,38 @@ class TimePDUDecode:
 class TimePDUEncode:
     def setup_method(self):
         """Setup the test"""
-        self.assoc_rq = PDU_TYPES[0x01]()
+        self.assoc_rq = A_ASSOCIATE_RQ()
         self.assoc_rq.decode(a_associate_rq_user_id_ext_neg)
 
-        self.assoc_ac = PDU_TYPES[0x02]()
+        # An A-ASSOCIATE-RQ with the maximum 128 presentation contexts
+        self.assoc_rq_large = A_ASSOCIATE_RQ()
+        self.assoc_rq_large.decode(a_associate_rq_user_id_ext_neg)
+        app_context, *_, user_info = self.assoc_rq_large.variable_items
+        contexts = []
+        for context_id in range(1, 256, 2):
+            item = PresentationContextItemRQ()
+            item.decode(presentation_context_rq)
+            item.presentation_context_id = context_id
+            contexts.append(item)
+
+        self.assoc_rq_large.variable_items = [app_context, *contexts, user_info]
+
+        self.assoc_ac = A_ASSOCIATE_AC()
         self.assoc_ac.decode(a_associate_ac)
 
-        self.assoc_rj = PDU_TYPES[0x03]()
+        self.assoc_rj = A_ASSOCIATE_RJ()
         self.assoc_rj.decode(a_associate_rj)
 
-        self.pdata_tf = PDU_TYPES[0x04]()
+        self.pdata_tf = P_DATA_TF()
         self.pdata_tf.decode(p_data_tf)
 
-        self.release_rq = PDU_TYPES[0x05]()
+        self.release_rq = A_RELEASE_RQ()
         self.release_rq.decode(a_release_rq)
 
-        self.release_rp = PDU_TYPES[0x06]()
+        self.release_rp = A_RELEASE_RP()
         self.release_rp.decode(a_release_rp)
 
-        self.abort_rq = PDU_TYPES[0x07]()
+        self.abort_rq = A_ABORT_RQ()
         self.abort_rq.decode(a_abort)
 
     def time_encode_assoc_rq_pdu(self):
@@ -93,6 +115,11 @@ class TimePDUEncode:
         for ii in range(1000):
             self.assoc_rq.encode()
 
+    def time_encode_assoc_rq_pdu_large(self):
+        """Time encoding an A-ASSOCIATE-RQ PDU with 128 presentation contexts."""
+        for ii in range(100):
+            self.assoc_rq_large.encode()
+
     def time_encode_assoc_ac_pdu(self):
         """Time encoding an A-ASSOCIATE-AC PDU."""
         for ii in range(1000):
@@ -122,3 +149,22 @@ class TimePDUEncode:
         """Time encoding an A-ABORT-RQ PDU."""
         for ii in range(1000):
             self.abort_rq.encode()
+
+
+class TimePDUItemEncode:
+    def setup_method(self):
+        """Setup the test"""
+        pdu = A_ASSOCIATE_RQ()
+        pdu.decode(a_associate_rq_user_id_ext_neg)
+        self.context_rq = pdu.presentation_context[0]
+        self.user_info = pdu.user_information
+
+    def time_encode_context_rq_item(self):
+        """Time encoding a Presentation Context (RQ) item."""
+        for ii in range(1000):
+            self.context_rq.encode()
+
+    def time_encode_user_information_item(self):
+        """Time encoding a User Information item."""
+        for ii in range(1000):
+            self.user_info.encode()
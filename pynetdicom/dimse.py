@@ -2,6 +2,7 @@
 Implementation of the DIMSE service provider.
 """
 
+from collections import deque
 from io import BytesIO
 import logging
 import queue
@@ -53,6 +54,7 @@ from pynetdicom.dimse_primitives import (
     DimsePrimitiveType,
     DimseServiceType,
 )
+from pynetdicom.dul import _WakeupQueue
 from pynetdicom.utils import make_target
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -151,6 +153,11 @@ class DIMSEServiceProvider:
 
     Attributes
     ----------
+    buffered_bytes : int
+        The total size (in bytes) of the messages in :attr:`msg_queue`, as
+        received from the peer.
+
+        .. versionadded:: 3.1
     cancel_rq : dict
         A dict of ``{MessageIDBeingRespondedTo : C_CANCEL}`` messages received.
         The dict is cleared out at the start and end of Service Class
@@ -160,6 +167,16 @@ class DIMSEServiceProvider:
     msg_queue: queue.queue of dimse_messages.DIMSEMessage
         A queue holding decoded DIMSE Message primitives received from the
         peer, except for C-CANCEL requests.
+    throttle_count : int
+        The number of times reading from the peer has been paused because
+        the messages in :attr:`msg_queue` and those still being handled
+        reached the limits set by
+        :attr:`AE.maximum_buffered_bytes
+        <pynetdicom.ae.ApplicationEntity.maximum_buffered_bytes>` or
+        :attr:`AE.maximum_buffered_messages
+        <pynetdicom.ae.ApplicationEntity.maximum_buffered_messages>`.
+
+        .. versionadded:: 3.1
 
     References
     ----------
@@ -179,7 +196,28 @@ class DIMSEServiceProvider:
 
         self.cancel_req: dict[int, C_CANCEL] = {}
         self.message: DIMSEMessage | None = None
-        self.msg_queue: "queue.Queue[_QueueItem]" = queue.Queue()
+        # The association reactor is woken whenever a message is added
+        self.msg_queue: "queue.Queue[_QueueItem]" = _WakeupQueue(self._wakeup)
+        # Prevents the P-DATA of messages sent from different threads from
+        #   being interleaved
+        self._send_lock = threading.Lock()
+        # True while the dataset of a C-STORE request that's already been
+        #   passed on is being streamed
+        self._is_streaming = False
+
+        # The sizes of the messages in the queue, used to apply the AE's
+        #   maximum_buffered_bytes and maximum_buffered_messages limits
+        self._buffered: deque[int] = deque()
+        # The sizes of the messages taken off the queue that are still being
+        #   handled, as {id(message): size}
+        self._held: dict[int, int] = {}
+        self._buffer_lock = threading.Lock()
+        self.buffered_bytes = 0
+        # The size of the message currently being received
+        self._message_size = 0
+        # True while reading from the peer is paused
+        self._is_throttled = False
+        self.throttle_count = 0
 
     @property
     def assoc(self) -> "Association":
@@ -196,15 +234,73 @@ class DIMSEServiceProvider:
         """Return the :class:`~pynetdicom.dul.DULServiceProvider`."""
         return self.assoc.dul
 
-    def get_msg(self, block: bool = False) -> _QueueItem:
+    def _wakeup(self) -> None:
+        """Wake the association reactor.
+
+        .. versionadded:: 3.1
+        """
+        self.assoc._reactor_wakeup.set()
+
+    def _buffer(self, item: _QueueItem) -> None:
+        """Add a received message to the queue, pausing reading from the
+        peer if the buffer limits have been reached.
+
+        .. versionadded:: 3.1
+        """
+        with self._buffer_lock:
+            self._buffered.append(self._message_size)
+            self.buffered_bytes += self._message_size
+            if not self._is_throttled and self._is_buffer_full():
+                self._is_throttled = True
+                self.throttle_count += 1
+                LOGGER.debug(
+                    f"Pausing reading from the peer with {self.buffered_messages} "
+                    f"message(s) and {self.buffered_bytes} bytes buffered"
+                )
+                self.dul._set_throttled(True)
+
+            self.msg_queue.put(item)
+
+    @property
+    def buffered_messages(self) -> int:
+        """Return the number of messages in :attr:`msg_queue` plus the number
+        being held until they've been handled.
+
+        .. versionadded:: 3.1
+        """
+        return len(self._buffered) + len(self._held)
+
+    def _is_buffer_full(self) -> bool:
+        """Return ``True`` if the buffered messages have reached either of the
+        AE's limits.
+
+        .. versionadded:: 3.1
+        """
+        ae = self.assoc.ae
+        max_messages = ae.maximum_buffered_messages
+        if max_messages is not None and self.buffered_messages >= max_messages:
+            return True
+
+        max_bytes = ae.maximum_buffered_bytes
+        return max_bytes is not None and self.buffered_bytes >= max_bytes
+
+    def get_msg(self, block: bool = False, hold: bool = False) -> _QueueItem:
         """Get the next available DIMSE message.
 
+        .. versionchanged:: 3.1
+
+            Added the `hold` keyword parameter.
+
         Parameters
         ----------
         block : bool
             If ``True`` then the function will block until either a message is
             available or :attr:`~DIMSEServiceProvider.dimse_timeout` expires,
             otherwise non-blocking.
+        hold : bool, optional
+            If ``True`` and the message is a service request then it continues
+            to count towards the AE's buffer limits until it's been passed to
+            :meth:`release_msg`, default ``False``.
 
         Returns
         -------
@@ -216,10 +312,54 @@ class DIMSEServiceProvider:
             period.
         """
         try:
-            return self.msg_queue.get(block=block, timeout=self.dimse_timeout)
+            item = self.msg_queue.get(block=block, timeout=self.dimse_timeout)
         except queue.Empty:
             return None, None
 
+        # Messages put directly on the queue aren't counted
+        if item[1] is None or not self._buffered:
+            return item
+
+        with self._buffer_lock:
+            size = self._buffered.popleft()
+            if hold and item[1].is_valid_request:
+                self._held[id(item[1])] = size
+            else:
+                self._unbuffer(size)
+
+        return item
+
+    def release_msg(self, msg: DimseServiceType) -> None:
+        """Stop a message taken from the queue using ``get_msg(hold=True)``
+        from counting towards the AE's buffer limits.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        msg : dimse_primitives.DIMSEPrimitive subclass
+            The message that has been handled. Messages that aren't being held
+            are ignored.
+        """
+        with self._buffer_lock:
+            size = self._held.pop(id(msg), None)
+            if size is not None:
+                self._unbuffer(size)
+
+    def _unbuffer(self, size: int) -> None:
+        """Remove a message of `size` bytes from the buffer, resuming reading
+        from the peer if the buffer is no longer full.
+
+        Must be called with the buffer lock held.
+
+        .. versionadded:: 3.1
+        """
+        self.buffered_bytes -= size
+        if self._is_throttled and not self._is_buffer_full():
+            self._is_throttled = False
+            LOGGER.debug("Resuming reading from the peer")
+            self.dul._set_throttled(False)
+
     @property
     def maximum_pdu_size(self) -> int:
         """Return the peer's maximum PDU length as :class:`int`."""
@@ -264,7 +404,18 @@ class DIMSEServiceProvider:
         if self.message is None:
             self.message = DIMSEMessage()
 
-        if self.message.decode_msg(primitive, self.assoc):
+        self._message_size += sum(
+            len(pdv) for _, pdv in primitive.presentation_data_value_list
+        )
+
+        if not self.message.decode_msg(primitive, self.assoc):
+            return
+
+        # A C-STORE request with a streamed dataset is passed on once its
+        #   command set has been decoded, then the rest of the P-DATA
+        #   primitives are written to the stream until it's complete
+        stream = self.message._data_set_stream
+        if not self._is_streaming:
             # Trigger event
             evt.trigger(self.assoc, evt.EVT_DIMSE_RECV, {"message": self.message})
 
@@ -295,15 +446,23 @@ class DIMSEServiceProvider:
                 )
                 t.start()
             else:
-                self.msg_queue.put((context_id, cast(DimseServiceType, d_primitive)))
+                self._buffer((context_id, cast(DimseServiceType, d_primitive)))
+
+            self._is_streaming = stream is not None
+
+        if stream is not None and not stream.is_complete:
+            return
 
-            # Fix for memory leak, Issue #41
-            #   Reset the DIMSE message, ready for the next one
-            self.message.encoded_command_set = BytesIO()
-            self.message.data_set = BytesIO()
-            self.message._data_set_file = None
-            self.message._data_set_path = None
-            self.message = None
+        # Fix for memory leak, Issue #41
+        #   Reset the DIMSE message, ready for the next one
+        self._is_streaming = False
+        self.message.encoded_command_set = BytesIO()
+        self.message.data_set = BytesIO()
+        self.message._data_set_file = None
+        self.message._data_set_path = None
+        self.message._data_set_stream = None
+        self.message = None
+        self._message_size = 0
 
     def send_msg(self, primitive: DimsePrimitiveType, context_id: int) -> None:
         """Encode and send a DIMSE-C or DIMSE-N message to the peer AE.
@@ -328,7 +487,15 @@ class DIMSEServiceProvider:
         # Trigger event
         evt.trigger(self.assoc, evt.EVT_DIMSE_SENT, {"message": dimse_msg})
 
+        # A dataset stored in a file is only read when sending it if the
+        #   transport can't send it directly from the file
+        sock = self.dul.socket
+        sendfile = sock is not None and sock._can_sendfile
+
         # Split the full messages into P-DATA chunks,
         #   each below the max_pdu size
-        for pdata in dimse_msg.encode_msg(context_id, self.maximum_pdu_size):
-            self.dul.send_pdu(pdata)
+        with self._send_lock:
+            for pdata in dimse_msg.encode_msg(
+                context_id, self.maximum_pdu_size, sendfile
+            ):
+                self.dul.send_pdu(pdata)
@@ -1,11 +1,15 @@
 """Define the DIMSE Message classes."""
 
-from io import BytesIO
+from io import BytesIO, RawIOBase
 import logging
 from math import ceil
+import os
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, cast
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, BinaryIO, cast
 from collections.abc import Iterator
 
 from pydicom.dataset import Dataset
@@ -33,6 +37,8 @@ from pynetdicom.dsutils import encode, decode, create_file_meta
 from pynetdicom.pdu_primitives import P_DATA
 
 if TYPE_CHECKING:  # pragma: no cover
+    from _typeshed import WriteableBuffer
+
     from pynetdicom.association import Association
     from pynetdicom.dimse_primitives import NTF
 
@@ -291,6 +297,219 @@ _MSG_TO_PRIMITIVE = {
 _MULTIVALUE_TAGS = [Tag("OffendingElement"), Tag("AttributeIdentifierList")]
 
 
+class _FileFragment:
+    """A *Presentation Data Value* containing a fragment of an encoded
+    dataset that's stored in a file.
+
+    .. versionadded:: 3.1
+
+    The fragment isn't read from the file until it's needed, which allows
+    the transport to send it directly from the file using
+    :func:`os.sendfile`. All the fragments of a DIMSE message share the
+    same open file, which is closed once the message's last fragment has
+    been sent or discarded.
+    """
+
+    __slots__ = ("header", "file", "offset", "length", "__weakref__")
+
+    def __init__(self, header: bytes, file: BinaryIO, offset: int, length: int) -> None:
+        """Create a new fragment.
+
+        Parameters
+        ----------
+        header : bytes
+            The message control header byte.
+        file : file-like
+            The open file containing the fragment.
+        offset : int
+            The offset of the start of the fragment in the file.
+        length : int
+            The length of the fragment (in bytes).
+        """
+        self.header = header
+        self.file = file
+        self.offset = offset
+        self.length = length
+
+    def __bytes__(self) -> bytes:
+        """Return the message control header and fragment as :class:`bytes`."""
+        self.file.seek(self.offset)
+        return self.header + self.file.read(self.length)
+
+    def __len__(self) -> int:
+        """Return the length of the message control header and fragment."""
+        return 1 + self.length
+
+
+class DatasetStream(RawIOBase):
+    """A read-only file-like for a C-STORE request's *Data Set* that's
+    available while the dataset is still being received.
+
+    .. versionadded:: 3.1
+
+    Used when :attr:`~pynetdicom._config.STORE_RECV_STREAMING` is ``True``,
+    the stream contains the encoded dataset as sent by the peer (without any
+    File Meta Information). Reading blocks until more of the dataset has been
+    received, and returns ``b""`` once all of it has been read. Any of the
+    dataset that hasn't been read when the stream is closed is discarded.
+
+    Attributes
+    ----------
+    max_memory : int
+        The maximum number of bytes of the dataset that have been received
+        but not yet read to keep in memory, any more are spooled to a
+        temporary file until read (default 4 MiB).
+    timeout : int | float | None
+        The maximum time (in seconds) to wait for more of the dataset to be
+        received before raising :class:`TimeoutError`, or ``None`` to wait
+        indefinitely.
+    """
+
+    max_memory: int = 4 * 1024 * 1024
+
+    def __init__(
+        self, timeout: float | None = None, assoc: "Association | None" = None
+    ) -> None:
+        """Create a new stream.
+
+        Parameters
+        ----------
+        timeout : int | float | None, optional
+            The value to use for :attr:`timeout`.
+        assoc : association.Association, optional
+            The association the dataset is being received over. If used then
+            reading raises :class:`ConnectionError` should the association
+            end before the entire dataset has been received.
+        """
+        super().__init__()
+        self.timeout = timeout
+        self._assoc = assoc
+        self._buffer = SpooledTemporaryFile(max_size=self.max_memory)
+        self._cond = threading.Condition()
+        # The buffer offsets for the next write and read
+        self._write_offset = 0
+        self._read_offset = 0
+        self._is_complete = False
+        # Set if the association ends before the dataset has been received
+        self._is_ended = False
+        if assoc is not None:
+            assoc._bind_teardown(self._on_teardown)
+
+    def close(self) -> None:
+        """Close the stream, discarding any unread data."""
+        with self._cond:
+            if not self.closed:
+                self._buffer.close()
+
+            super().close()
+            self._cond.notify_all()
+
+        if self._assoc is not None:
+            self._assoc._unbind_teardown(self._on_teardown)
+
+    def _finish(self) -> None:
+        """Signal that the entire dataset has been received."""
+        with self._cond:
+            self._is_complete = True
+            self._cond.notify_all()
+
+        if self._assoc is not None:
+            self._assoc._unbind_teardown(self._on_teardown)
+
+    @property
+    def is_complete(self) -> bool:
+        """Return ``True`` if the entire dataset has been received."""
+        return self._is_complete
+
+    def _on_teardown(self) -> None:
+        """Wake any reads waiting for data after the association ends."""
+        with self._cond:
+            self._is_ended = True
+            self._cond.notify_all()
+
+    def readable(self) -> bool:
+        """Return ``True``."""
+        return True
+
+    def readinto(self, b: "WriteableBuffer") -> int:
+        """Read received data into the pre-allocated writeable buffer `b`,
+        waiting for more data to be received if none is available.
+
+        Parameters
+        ----------
+        b : bytes-like
+            The buffer to read into.
+
+        Returns
+        -------
+        int
+            The number of bytes read, or ``0`` if the entire dataset has been
+            read.
+
+        Raises
+        ------
+        TimeoutError
+            If no data was received within :attr:`timeout`.
+        ConnectionError
+            If the association ended before the entire dataset was received.
+        """
+        with self._cond:
+            self._checkClosed()
+            if self.timeout is not None:
+                deadline = time.monotonic() + self.timeout
+
+            while self._read_offset == self._write_offset:
+                if self._is_complete:
+                    return 0
+
+                if self._is_ended:
+                    raise ConnectionError(
+                        "The association ended before the C-STORE request's "
+                        "dataset was completely received"
+                    )
+
+                wait = None
+                if self.timeout is not None:
+                    wait = deadline - time.monotonic()
+                    if wait <= 0:
+                        raise TimeoutError(
+                            "Timed out waiting to receive more of the C-STORE "
+                            "request's dataset"
+                        )
+
+                self._cond.wait(wait)
+                self._checkClosed()
+
+            view = memoryview(b).cast("B")
+            self._buffer.seek(self._read_offset)
+            data = self._buffer.read(
+                min(len(view), self._write_offset - self._read_offset)
+            )
+            nr_bytes = len(data)
+            view[:nr_bytes] = data
+            self._read_offset += nr_bytes
+
+            # Reuse the buffer once everything received has been read
+            if self._read_offset == self._write_offset:
+                self._buffer.seek(0)
+                self._buffer.truncate()
+                self._read_offset = self._write_offset = 0
+
+            return nr_bytes
+
+    def _write(self, data: bytes) -> None:
+        """Add received `data` to the stream."""
+        with self._cond:
+            # Discard anything received after the stream has been closed
+            if self.closed:
+                return
+
+            self._buffer.seek(self._write_offset)
+            self._buffer.write(data)
+            self._write_offset += len(data)
+            self._cond.notify_all()
+
+
 class DIMSEMessage:
     """Represents a DIMSE Message.
 
@@ -356,6 +575,11 @@ class DIMSEMessage:
         # If writing the dataset in chunks this will be a NamedTemporaryFile:
         #   the file object backing its file path
         self._data_set_file: "NTF | None" = None
+        # If not None then the size (in bytes) the dataset can reach before
+        #   it's spooled to file
+        self._spool_threshold: int | None = None
+        # If streaming the dataset this will be the stream it's written to
+        self._data_set_stream: DatasetStream | None = None
 
         cls_name = self.__class__.__name__
         if cls_name == "DIMSEMessage":
@@ -365,6 +589,46 @@ class DIMSEMessage:
         for keyword in _COMMAND_SET_KEYWORDS[cls_name.replace("_", "-")]:
             setattr(self.command_set, keyword, None)
 
+    def _create_data_set_file(
+        self, assoc: "Association", directory: Path | None = None
+    ) -> None:
+        """Create the temporary file used to store a C-STORE request's *Data
+        Set* and write the DICOM preamble, prefix and File Meta Information.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association the message is being received over.
+        directory : pathlib.Path | None, optional
+            The directory to create the file in, default is the system's
+            temporary directory.
+        """
+        # delete=False is a workaround for Windows
+        # Setting delete=True prevents us from re-opening
+        # the file after it is opened by NamedTemporaryFile
+        # below.
+        self._data_set_file = cast(
+            "NTF",
+            NamedTemporaryFile(delete=False, mode="wb", suffix=".dcm", dir=directory),
+        )
+        self._data_set_path = Path(self._data_set_file.name)
+        # Write the File Meta
+        self._data_set_file.write(b"\x00" * 128)
+        self._data_set_file.write(b"DICM")
+
+        cs = self.command_set
+        cx = assoc._accepted_cx[cast(int, self.context_id)]
+        sop_class = cast(UID, cs.AffectedSOPClassUID)
+        sop_instance = cast(UID, cs.AffectedSOPInstanceUID)
+        write_file_meta_info(
+            self._data_set_file,  # type: ignore
+            create_file_meta(
+                sop_class_uid=sop_class,
+                sop_instance_uid=sop_instance,
+                transfer_syntax=cx.transfer_syntax[0],
+            ),
+        )
+
     def decode_msg(self, primitive: P_DATA, assoc: "Association | None" = None) -> bool:
         """Converts P-DATA primitives into a ``DIMSEMessage`` sub-class.
 
@@ -383,7 +647,9 @@ class DIMSEMessage:
             The association processing the message. This is required when:
 
             * :attr:`~pynetdicom._config.STORE_RECV_CHUNKED_DATASET` is
-              ``True``
+              ``True`` or the AE's
+              :attr:`~pynetdicom.ae.ApplicationEntity.store_recv_spool_threshold`
+              is set
             * The P-DATA primitive contains part of a C-STORE-RQ message
 
             In this case the association is consulted for its accepted
@@ -394,7 +660,8 @@ class DIMSEMessage:
         -------
         bool
             ``True`` when the DIMSE message is completely decoded, ``False``
-            otherwise.
+            otherwise. If the dataset of a C-STORE request is being streamed
+            then ``True`` once the command set has been decoded.
 
         References
         ----------
@@ -405,7 +672,10 @@ class DIMSEMessage:
         if primitive.__class__ != P_DATA or primitive is None:
             return False
 
-        for context_id, data in primitive.presentation_data_value_list:
+        for context_id, value in primitive.presentation_data_value_list:
+            # Values received from the peer are never stored in a file
+            data = cast(bytes, value)
+
             # The first byte of the P-DATA is the Message Control Header
             #   See Part 8, Annex E.2
             # The standard says that only the significant bits (ie the last
@@ -453,34 +723,18 @@ class DIMSEMessage:
                         return True
 
                     # Data Set is present
-                    if _config.STORE_RECV_CHUNKED_DATASET and isinstance(
-                        self, C_STORE_RQ
-                    ):
-                        # delete=False is a workaround for Windows
-                        # Setting delete=True prevents us from re-opening
-                        # the file after it is opened by NamedTemporaryFile
-                        # below.
-                        self._data_set_file = cast(
-                            "NTF",
-                            NamedTemporaryFile(delete=False, mode="wb", suffix=".dcm"),
-                        )
-                        self._data_set_path = Path(self._data_set_file.name)
-                        # Write the File Meta
-                        self._data_set_file.write(b"\x00" * 128)
-                        self._data_set_file.write(b"DICM")
-
-                        cs = self.command_set
-                        cx = cast("Association", assoc)._accepted_cx[context_id]
-                        sop_class = cast(UID, cs.AffectedSOPClassUID)
-                        sop_instance = cast(UID, cs.AffectedSOPInstanceUID)
-                        write_file_meta_info(
-                            self._data_set_file,  # type: ignore
-                            create_file_meta(
-                                sop_class_uid=sop_class,
-                                sop_instance_uid=sop_instance,
-                                transfer_syntax=cx.transfer_syntax[0],
-                            ),
+                    if _config.STORE_RECV_STREAMING and isinstance(self, C_STORE_RQ):
+                        self._data_set_stream = DatasetStream(
+                            assoc.dimse_timeout if assoc else None, assoc
                         )
+                    elif assoc and isinstance(self, C_STORE_RQ):
+                        # Use the AE's spool threshold in preference to
+                        #   STORE_RECV_CHUNKED_DATASET
+                        threshold = assoc.ae.store_recv_spool_threshold
+                        if threshold is not None:
+                            self._spool_threshold = threshold
+                        elif _config.STORE_RECV_CHUNKED_DATASET:
+                            self._create_data_set_file(assoc)
 
             # DATA SET
             # P-DATA fragment contains Data Set information
@@ -489,22 +743,43 @@ class DIMSEMessage:
                 # As with the command set, the data set may be spread over
                 #   a number of fragments in each P-DATA primitive and a
                 #   number of P-DATA primitives.
-                if self._data_set_file:
+                if self._data_set_stream is not None:
+                    self._data_set_stream._write(data[1:])
+                elif self._data_set_file:
                     self._data_set_file.write(data[1:])
-                    self._data_set_file.file.flush()
                 else:
-                    cast(BytesIO, self.data_set).write(data[1:])
+                    data_set = cast(BytesIO, self.data_set)
+                    data_set.write(data[1:])
+
+                    # Spool the dataset to file once it exceeds the threshold
+                    threshold = self._spool_threshold
+                    if threshold is not None and data_set.tell() > threshold:
+                        self._create_data_set_file(
+                            cast("Association", assoc),
+                            assoc.ae.store_recv_spool_dir,  # type: ignore[union-attr]
+                        )
+                        cast("NTF", self._data_set_file).write(data_set.getvalue())
+                        self.data_set = BytesIO()
 
                 # The final data set fragment (xxxxxx10) has been added
                 if control_header_byte & 2 != 0:
+                    if self._data_set_stream is not None:
+                        self._data_set_stream._finish()
+                    elif self._data_set_file:
+                        self._data_set_file.file.flush()
+
                     # By returning True we're indicating that the message
                     #   has been completely decoded
                     return True
 
-        # We return False to indicate that the message isn't yet fully decoded
-        return False
+        # A streamed message is ready once the command set has been decoded,
+        #   otherwise return False to indicate that the message isn't yet
+        #   fully decoded
+        return self._data_set_stream is not None
 
-    def encode_msg(self, context_id: int, max_pdu_length: int) -> Iterator[P_DATA]:
+    def encode_msg(
+        self, context_id: int, max_pdu_length: int, sendfile: bool = False
+    ) -> Iterator[P_DATA]:
         """Yield P-DATA primitives for the current DIMSE Message.
 
         **Encoding**
@@ -529,6 +804,13 @@ class DIMSEMessage:
             The *ID* of the agreed presentation context.
         max_pdu_length : int
             The maximum PDV length (in bytes).
+        sendfile : bool, optional
+            If ``True`` and the *Data Set* is stored in a file then yield
+            its fragments as :class:`_FileFragment` values that haven't been
+            read from the file, for a transport able to send them using
+            :func:`os.sendfile`. Default ``False``.
+
+            .. versionadded:: 3.1
 
         Yields
         ------
@@ -556,8 +838,10 @@ class DIMSEMessage:
         else:
             nr_fragments = ceil(len(encoded_command_set) / (max_pdu_length - 6))
 
+        # Fragment a memoryview so the only copy made is when the
+        #   message control header is prepended
         cmd_fragments = self._generate_pdv_fragments(
-            encoded_command_set, max_pdu_length
+            memoryview(encoded_command_set), max_pdu_length
         )
 
         # First to (n - 1)th command data fragment - bits xxxxxx01
@@ -588,7 +872,7 @@ class DIMSEMessage:
                     nr_fragments = ceil(len(encoded_data_set) / (max_pdu_length - 6))
 
                 ds_fragments = self._generate_pdv_fragments(
-                    encoded_data_set, max_pdu_length
+                    memoryview(encoded_data_set), max_pdu_length
                 )
 
                 # First to (n - 1)th dataset fragment - bits xxxxxx00
@@ -606,38 +890,51 @@ class DIMSEMessage:
                 )
                 yield pdata
         elif self._data_set_path is not None:
-            # Read and send encoded dataset from file
-            # Buffer size determined by io.DEFAULT_BUFFER_SIZE
-            self._data_set_path = cast(tuple[Path, int], self._data_set_path)
-            with open(self._data_set_path[0], "rb") as f:
-                end = f.seek(0, 2)
-                length = end - f.seek(self._data_set_path[1])
-
+            # Read and send encoded dataset from file, the file is only
+            #   opened once for all the fragments
+            path, offset = cast(tuple[Path, int], self._data_set_path)
+            f = open(path, "rb")
+            is_final = False
+            try:
+                length = f.seek(0, 2) - f.seek(offset)
                 if max_pdu_length == 0:
                     nr_fragments = 1
-                    max_pdu_length = length + 6
+                    fragment_length = length
                 else:
-                    nr_fragments = ceil(length / (max_pdu_length - 6))
+                    fragment_length = max_pdu_length - 6
+                    nr_fragments = max(ceil(length / fragment_length), 1)
+
+                for ii in range(nr_fragments):
+                    # First to (n - 1)th dataset fragment - bits xxxxxx00
+                    # Last dataset fragment - bits xxxxxx10
+                    is_final = ii == nr_fragments - 1
+                    header = b"\x02" if is_final else b"\x00"
+                    nr_bytes = min(fragment_length, length - ii * fragment_length)
+
+                    value: bytes | _FileFragment
+                    if sendfile:
+                        # Not read until sent so the transport can send
+                        #   it directly from the file
+                        value = _FileFragment(
+                            header, f, offset + ii * fragment_length, nr_bytes
+                        )
+                        if is_final:
+                            # Close the file once the last fragment is gone
+                            weakref.finalize(value, f.close)
+                    else:
+                        value = header + f.read(nr_bytes)
 
-                # First to (n - 1)th dataset fragment - bits xxxxxx00
-                for ii in range(int(nr_fragments - 1)):
                     pdata = P_DATA()
-                    pdata.presentation_data_value_list.append(
-                        (context_id, b"\x00" + f.read(max_pdu_length - 6))
-                    )
+                    pdata.presentation_data_value_list.append((context_id, value))
                     yield pdata
-
-                # Last dataset fragment - bits xxxxxx10
-                pdata = P_DATA()
-                pdata.presentation_data_value_list.append(
-                    (context_id, b"\x02" + f.read(max_pdu_length - 6))
-                )
-                yield pdata
+            finally:
+                if not sendfile or not is_final:
+                    f.close()
 
     @staticmethod
     def _generate_pdv_fragments(
-        bytestream: bytes, fragment_length: int
-    ) -> Iterator[bytes]:
+        bytestream: bytes | memoryview, fragment_length: int
+    ) -> Iterator[bytes | memoryview]:
         """Fragment `bytestream` into chunks, each `fragment_length` long.
 
         Fragments bytestream data for use in PDVs.
@@ -653,8 +950,9 @@ class DIMSEMessage:
 
         Parameters
         ----------
-        bytestream : bytes
-            The data to be fragmented.
+        bytestream : bytes | memoryview
+            The data to be fragmented. If a :class:`memoryview` then the
+            fragments will be views of it rather than copies.
         fragment_length : int
             The maximum size of each fragment, a value of 0 is taken to mean
             the fragment is infinite. Cannot be between 1 and 7 as
@@ -665,7 +963,7 @@ class DIMSEMessage:
 
         Yields
         ------
-        fragment : bytes
+        fragment : bytes | memoryview
             A `bytestream` fragment, with maximum length `fragment_length`, but
             may be smaller depending on the size of `bytestream`.
 
@@ -732,6 +1030,7 @@ class DIMSEMessage:
 
         primitive._dataset_path = self._data_set_path
         primitive._dataset_file = self._data_set_file
+        primitive._dataset_stream = self._data_set_stream
 
         return primitive
 
@@ -23,6 +23,8 @@ if TYPE_CHECKING:  # pragma: no cover
     from io import BufferedWriter
     from typing import Protocol  # Python 3.8+
 
+    from pynetdicom.dimse_messages import DatasetStream
+
     class NTF(Protocol):
         # Protocol for a NamedTemporaryFile
         name: str
@@ -86,8 +88,12 @@ class DIMSEPrimitive:
     #   If not None then _dataset_file backs the dataset stored
     #   at _dataset_path
     # self._dataset_file = None
+    #   If not None then the dataset is being streamed and _dataset_stream
+    #   is the DatasetStream it's being received into
+    # self._dataset_stream = None
     _dataset_path: Path | tuple[Path, int] | None = None
     _dataset_file: "NTF | None" = None
+    _dataset_stream: "DatasetStream | None" = None
 
     @property
     def AffectedSOPClassUID(self) -> UID | None:
@@ -1226,6 +1232,7 @@ class C_CANCEL:
         self._context_id: int | None = None
         self._dataset_path: Path | tuple[Path, int] | None = None
         self._dataset_file: "NTF" | None = None
+        self._dataset_stream: "DatasetStream | None" = None
 
     @property
     def MessageIDBeingRespondedTo(self) -> int | None:
@@ -2,14 +2,20 @@
 Implements the DICOM Upper Layer service provider.
 """
 
+from contextlib import contextmanager
 import logging
 import queue
+import selectors
+import socket
 import struct
+import threading
 from threading import Thread
 import time
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, TypeVar, cast
+from collections.abc import Callable, Iterator
 
 from pynetdicom import evt
+from pynetdicom._handlers import standard_pdu_recv_handler
 from pynetdicom.fsm import StateMachine
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ,
@@ -33,8 +39,17 @@ from pynetdicom.timer import Timer
 from pynetdicom.transport import T_CONNECT
 from pynetdicom.utils import make_target
 
+try:
+    import ssl
+
+    _HAS_SSL = True
+except ImportError:
+    # NOTE: Must check `_HAS_SSL` before all use of `ssl` module
+    _HAS_SSL = False
+
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.association import Association
+    from pynetdicom.events import _NotificationHandlerAttr
     from pynetdicom.transport import AssociationSocket
 
     _QueueType = queue.Queue[_PDUPrimitiveType | T_CONNECT]
@@ -43,6 +58,27 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# The initial size of the buffer used to receive PDUs, in bytes
+_RECV_BUFFER_SIZE = 65536
+_UNPACK_PDU_HEADER = struct.Struct(">BBL").unpack_from
+
+
+class _WakeupQueue(queue.Queue[_T]):
+    """A :class:`queue.Queue` that wakes the DUL reactor whenever an item is
+    added to it.
+    """
+
+    def __init__(self, wakeup: Callable[[], None]) -> None:
+        super().__init__()
+        self._wakeup = wakeup
+
+    def put(self, item: _T, block: bool = True, timeout: float | None = None) -> None:
+        """Put `item` on the queue and wake the reactor."""
+        super().put(item, block, timeout)
+        self._wakeup()
+
 
 class DULServiceProvider(Thread):
     """The DICOM Upper Layer Service Provider.
@@ -78,33 +114,78 @@ class DULServiceProvider(Thread):
         self._assoc = assoc
         self.socket: "AssociationSocket | None" = None
 
+        # Used to wake the reactor when it's blocked waiting for the socket
+        #   and there are events or primitives that need to be processed,
+        #   created when the reactor starts
+        self._wakeup_recv: socket.socket | None = None
+        self._wakeup_send: socket.socket | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._registered: "socket.socket | None" = None
+
+        # If set then the DUL is driven by a shared reactor rather than its
+        #   own thread, see SharedReactor
+        self._reactor: "SharedReactor | None" = None
+        # Set by the shared reactor when the socket has data to be read
+        self._readable = False
+        # The number of bytes of the current PDU that have been read and its
+        #   length, used by the shared reactor to read PDUs incrementally
+        self._recv_offset = 0
+        self._recv_length = 0
+
         # Tracks the events the state machine needs to process
-        self.event_queue: "queue.Queue[str]" = queue.Queue()
+        self.event_queue: "queue.Queue[str]" = _WakeupQueue(self._wakeup)
         # These queues provide communication between the DUL service
         #   user and the DUL service provider.
         # An event occurs when the DUL service user adds to
         #   the to_provider_queue
         # The queue contains A-ASSOCIATE, A-RELEASE, A-ABORT, A-P-ABORT, P-DATA and
         #   T-CONNECT primitives from the local user that are to be sent to the peer
-        self.to_provider_queue: "_QueueType" = queue.Queue()
+        self.to_provider_queue: "_QueueType" = _WakeupQueue(self._wakeup)
         # A primitive is sent to the service user when the DUL service provider
         # adds to the to_user_queue.
-        self.to_user_queue: "queue.Queue[_UserQueuePrimitives]" = queue.Queue()
+        #   The association reactor is woken whenever a primitive is added
+        self.to_user_queue: "queue.Queue[_UserQueuePrimitives]" = _WakeupQueue(
+            self._wakeup_user
+        )
 
         # A queue storing PDUs received from the peer
-        self._recv_pdu: "queue.Queue[_PDUType]" = queue.Queue()
+        #   P-DATA-TF PDUs may be decoded directly to P-DATA primitives
+        self._recv_pdu: "queue.Queue[_PDUType | P_DATA]" = queue.Queue()
+        # Reusable buffer each incoming PDU is read into, grows as needed
+        self._recv_buffer = bytearray(_RECV_BUFFER_SIZE)
 
         # Set the (network) idle and ARTIM timers
         # Timeouts gets set after DUL init so these are temporary
-        self._idle_timer = Timer(60)
-        self.artim_timer = Timer(30)
+        # The timers register their deadlines with the shared timer wheel,
+        #   the idle timer wakes the association reactor on expiry and the
+        #   ARTIM timer wakes the DUL reactor so it can issue Evt18
+        self._idle_timer = Timer(60, self._wakeup_user)
+        self.artim_timer = Timer(30, self._artim_expired)
+        # Set when the ARTIM timer's deadline is reached
+        self._is_artim_expired = False
+        # Set while too many received DIMSE messages are waiting to be
+        #   handled, see DIMSEServiceProvider._buffer()
+        self._is_throttled = False
+        # Set while the primitives from the local user are being held back,
+        #   see _hold_primitives()
+        self._is_holding = False
+        # In Sta13, how long to wait for the peer to close the connection
+        #   before closing it ourselves
+        self._close_timer = Timer(0.1, self._wakeup)
 
         # State machine - PS3.8 Section 9.2
         self.state_machine = StateMachine(self)
 
-        # Controls the minimum delay between loops in run() in seconds
-        # TODO: try and make this event based rather than running loops
-        self._run_loop_delay = 0.001
+        # The maximum time the reactor will block waiting for an event, in
+        #   seconds. The reactor is woken early by incoming data, primitives
+        #   from the local user and the ARTIM timer
+        self._max_wait = 0.5
+
+        # Set when the state machine returns to Sta1 (idle) or the reactor
+        #   stops, used to wait for the association to end without polling
+        self._idle_event = threading.Event()
+        # Set when the reactor has stopped
+        self._stopped = threading.Event()
 
         Thread.__init__(self, target=make_target(self.run_reactor))
         self.daemon = False
@@ -115,32 +196,75 @@ class DULServiceProvider(Thread):
         """Return the parent :class:`~pynetdicom.association.Association`."""
         return self._assoc
 
-    def _decode_pdu(self, bytestream: bytearray) -> tuple[_PDUType, str]:
+    def is_alive(self) -> bool:
+        """Return ``True`` if the reactor is running, ``False`` otherwise.
+
+        .. versionchanged:: 3.1
+
+            If the DUL is driven by a :class:`SharedReactor` then returns
+            ``True`` while the DUL is registered with the reactor.
+        """
+        if self._reactor is not None:
+            return self._reactor.is_registered(self)
+
+        return super().is_alive()
+
+    def _decode_pdu(
+        self, bytestream: bytes | memoryview
+    ) -> tuple["_PDUType | P_DATA", str]:
         """Decode a received PDU.
 
+        .. versionchanged:: 3.1
+
+            Added support for decoding from a :class:`memoryview` and for
+            decoding P-DATA-TF PDUs directly to a P-DATA primitive.
+
         Parameters
         ----------
-        bytestream : bytearray
+        bytestream : bytes | memoryview
             The received PDU.
 
         Returns
         -------
-        pdu.PDU subclass, str
+        pdu.PDU subclass | pdu_primitives.P_DATA, str
             The PDU subclass corresponding to the PDU and the event string
-            corresponding to receiving that PDU type.
+            corresponding to receiving that PDU type. If the PDU is a
+            P-DATA-TF and no handlers other than the default are bound to
+            ``evt.EVT_PDU_RECV`` then the corresponding P-DATA primitive is
+            returned instead of the PDU.
         """
-        # Trigger before data is decoded in case of exception in decoding
-        b = bytes(bytestream)
-        evt.trigger(self.assoc, evt.EVT_DATA_RECV, {"data": b})
-
-        pdu_cls, event = _PDU_TYPES[b[0:1]]
+        # The decoded PDU must hold no references to `bytestream` so it can
+        #   be reused. P-DATA primitives copy each PDV from `bytestream`,
+        #   otherwise the PDU is copied once and decoded from the copy
+        data: bytes | memoryview = bytestream
+        if self.assoc.get_handlers(evt.EVT_DATA_RECV):
+            data = bytes(bytestream)
+            # Trigger before data is decoded in case of exception in decoding
+            evt.trigger(self.assoc, evt.EVT_DATA_RECV, {"data": data})
+
+        if data[0] == 0x04 and not self._is_pdu_recv_bound():
+            return P_DATA_TF._decode_primitive(data), "Evt10"
+
+        data = bytes(data)
+        pdu_cls, event = _PDU_TYPES[data[0]]
         pdu = pdu_cls()
-        pdu.decode(b)
+        pdu.decode(data)
 
         evt.trigger(self.assoc, evt.EVT_PDU_RECV, {"pdu": pdu})
 
         return pdu, event
 
+    def _is_pdu_recv_bound(self) -> bool:
+        """Return ``True`` if a handler other than the default is bound to
+        ``evt.EVT_PDU_RECV``.
+
+        .. versionadded:: 3.1
+        """
+        handlers = cast(
+            "_NotificationHandlerAttr", self.assoc.get_handlers(evt.EVT_PDU_RECV)
+        )
+        return any(handler is not standard_pdu_recv_handler for handler, _ in handlers)
+
     def idle_timer_expired(self) -> bool:
         """Return ``True`` if the network idle timer has expired."""
         return self._idle_timer.expired
@@ -158,6 +282,23 @@ class DULServiceProvider(Thread):
         # Sta13: waiting for the transport connection to close
         # however it may still receive data that needs to be acted on
         self.socket = cast("AssociationSocket", self.socket)
+        if self._is_reading_paused():
+            return False
+
+        if self._reactor is not None:
+            # Driven by a shared reactor so we must never block
+            if self._read_available_pdu_data():
+                return True
+
+            if self.state_machine.current_state == "Sta13":
+                if self._is_waiting_for_close():
+                    return False
+
+                self.socket.close()
+                return True
+
+            return False
+
         if self.state_machine.current_state == "Sta13":
             # Check to see if there's more data to be read
             #   Might be any incoming PDU or valid/invalid data
@@ -166,6 +307,10 @@ class DULServiceProvider(Thread):
                 self._read_pdu_data()
                 return True
 
+            # Give the peer a short time to close the connection
+            if self._is_waiting_for_close():
+                return False
+
             # Once we have no more incoming data close the socket and
             #   add the corresponding event to the queue
             self.socket.close()
@@ -183,9 +328,61 @@ class DULServiceProvider(Thread):
 
         return False
 
+    def _is_reading_paused(self) -> bool:
+        """Return ``True`` if reading from the peer has been paused.
+
+        .. versionadded:: 3.1
+
+        Reading is only paused during data transfer, so that A-RELEASE and
+        A-ABORT exchanges started locally can still complete.
+        """
+        return self._is_throttled and self.state_machine.current_state == "Sta6"
+
+    def _is_waiting_for_close(self) -> bool:
+        """Return ``True`` while waiting in Sta13 for the peer to close the
+        connection.
+
+        .. versionadded:: 3.1
+
+        The peer closes the connection once it has handled our A-ABORT or
+        A-RELEASE-RP, so waiting briefly for it means the peer has finished
+        with the association by the time we have. The reactor is woken by the
+        peer closing the connection or when the wait is over.
+        """
+        if not self._close_timer.is_running:
+            self._close_timer.start()
+
+        return not self._close_timer.expired
+
+    def _set_throttled(self, value: bool) -> None:
+        """Pause or resume reading from the peer.
+
+        .. versionadded:: 3.1
+
+        Called by the DIMSE service provider when the received messages
+        waiting to be handled reach or drop below the AE's limits. While paused
+        incoming data is left in the socket's receive buffer, so that TCP flow
+        control pushes back on the peer.
+
+        Parameters
+        ----------
+        value : bool
+            ``True`` to pause reading, ``False`` to resume.
+        """
+        # The peer isn't idle while we aren't reading from it
+        if value:
+            self._idle_timer.stop()
+        else:
+            self._idle_timer.restart()
+
+        self._is_throttled = value
+        if not value:
+            self._wakeup()
+
     def kill_dul(self) -> None:
         """Kill the DUL reactor and stop the thread"""
         self._kill_thread = True
+        self._wakeup()
 
     @property
     def network_timeout(self) -> float | None:
@@ -199,8 +396,28 @@ class DULServiceProvider(Thread):
         except (queue.Empty, IndexError):
             return None
 
+    @contextmanager
+    def _hold_primitives(self) -> Iterator[None]:
+        """Return a context manager that holds back the primitives sent by
+        the local user until it exits.
+
+        .. versionadded:: 3.1
+
+        Used by the local user to finish acting on an association response
+        before the reactor sends it to the peer.
+        """
+        self._is_holding = True
+        try:
+            yield
+        finally:
+            self._is_holding = False
+            self._wakeup()
+
     def _process_recv_primitive(self) -> bool:
         """Check to see if the local user has sent any primitives to the DUL"""
+        if self._is_holding:
+            return False
+
         # Check the queue and see if there are any primitives
         # If so then put the corresponding event on the event queue
         try:
@@ -263,12 +480,12 @@ class DULServiceProvider(Thread):
         - Evt17: Transport connection closed
         - Evt19: Invalid or unrecognised PDU
         """
-        bytestream = bytearray()
         self.socket = cast("AssociationSocket", self.socket)
 
         # Try and read the PDU type and length from the socket
         try:
-            bytestream.extend(self.socket.recv(6))
+            with memoryview(self._recv_buffer) as view:
+                nr_read = self.socket.recv_into(view, 6)
         except (OSError, TimeoutError) as exc:
             # READ_PDU_EXC_A
             LOGGER.error("Connection closed before the entire PDU was received")
@@ -277,20 +494,20 @@ class DULServiceProvider(Thread):
             self.event_queue.put("Evt17")
             return
 
-        try:
-            # Byte 1 is always the PDU type
-            # Byte 2 is always reserved
-            # Bytes 3-6 are always the PDU length
-            pdu_type, _, pdu_length = struct.unpack(">BBL", bytestream)
-        except struct.error:
+        if nr_read != 6:
             # READ_PDU_EXC_B
             # LOGGER.error("Insufficient data received to decode the PDU")
             # Evt17: Transport connection closed
             self.event_queue.put("Evt17")
             return
 
+        # Byte 1 is always the PDU type
+        # Byte 2 is always reserved
+        # Bytes 3-6 are always the PDU length
+        pdu_type, _, pdu_length = _UNPACK_PDU_HEADER(self._recv_buffer)
+
         # If the `pdu_type` is unrecognised
-        if pdu_type not in (0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07):
+        if pdu_type not in _PDU_TYPES:
             # READ_PDU_EXC_C
             LOGGER.error(f"Unknown PDU type received '0x{pdu_type:02X}'")
             # Evt19: Unrecognised or invalid PDU received
@@ -299,7 +516,7 @@ class DULServiceProvider(Thread):
 
         # Try and read the rest of the PDU
         try:
-            bytestream += self.socket.recv(pdu_length)
+            nr_read += self._recv_into_buffer(6, 6 + pdu_length)
         except (OSError, TimeoutError) as exc:
             # READ_PDU_EXC_D
             LOGGER.error("Connection closed before the entire PDU was received")
@@ -309,19 +526,38 @@ class DULServiceProvider(Thread):
             return
 
         # Check that the PDU data was completely read
-        if len(bytestream) != 6 + pdu_length:
+        if nr_read != 6 + pdu_length:
             # READ_PDU_EXC_E
             # Evt17: Transport connection closed
             LOGGER.error(
-                f"The received PDU is shorter than expected ({len(bytestream)} of "
+                f"The received PDU is shorter than expected ({nr_read} of "
                 f"{6 + pdu_length} bytes received)"
             )
             self.event_queue.put("Evt17")
             return
 
+        self._process_pdu_data(nr_read)
+
+    def _process_pdu_data(self, length: int) -> None:
+        """Decode a complete PDU of `length` bytes from the receive buffer and
+        place the corresponding event in the event queue.
+
+        .. versionadded:: 3.1
+        """
+        # The decoded PDU holds no references to the buffer so it can be
+        #   reused for the next PDU
+        with memoryview(self._recv_buffer)[:length] as view:
+            self._process_pdu(view)
+
+    def _process_pdu(self, data: bytes | memoryview) -> None:
+        """Decode the complete PDU in `data` and place the corresponding event
+        in the event queue.
+
+        .. versionadded:: 3.1
+        """
         try:
             # Decode the PDU data, get corresponding FSM event
-            pdu, event = self._decode_pdu(bytestream)
+            pdu, event = self._decode_pdu(data)
             self.event_queue.put(event)
         except Exception as exc:
             # READ_PDU_EXC_F
@@ -333,6 +569,146 @@ class DULServiceProvider(Thread):
 
         self._recv_pdu.put(pdu)
 
+    def _read_available_pdu_data(self) -> bool:
+        """Read any PDU data sent by the peer without blocking.
+
+        .. versionadded:: 3.1
+
+        Used instead of :meth:`_read_pdu_data` when the DUL is driven by a
+        :class:`SharedReactor`. A partially received PDU is kept in the
+        receive buffer until the rest of its data becomes available, then
+        decoded and its event placed in the event queue as usual. If the
+        connection has been closed then the socket is closed, so that it's no
+        longer monitored by the reactor.
+
+        Returns
+        -------
+        bool
+            ``True`` if any data was read or an event added to the event queue,
+            ``False`` if no data was available.
+        """
+        sock = self.socket.socket if self.socket else None
+        if sock is None or not cast("AssociationSocket", self.socket)._is_connected:
+            return False
+
+        if sock.fileno() == -1:
+            # Socket closed by the local user
+            cast("AssociationSocket", self.socket).close()
+            return True
+
+        # An SSLSocket may have buffered data available that the selector
+        #   is unaware of - see #528
+        if not self._readable and not (
+            _HAS_SSL and isinstance(sock, ssl.SSLSocket) and sock.pending()
+        ):
+            return False
+
+        timeout = sock.gettimeout()
+        sock.settimeout(0.0)
+        try:
+            return self._recv_available(sock)
+        finally:
+            try:
+                sock.settimeout(timeout)
+            except OSError:
+                pass
+
+    def _recv_available(self, sock: socket.socket) -> bool:
+        """Read from non-blocking `sock` until either a complete PDU has been
+        received or no more data is available.
+
+        .. versionadded:: 3.1
+        """
+        offset = self._recv_offset
+        nr_read = 0
+        try:
+            while offset < 6 or offset != 6 + self._recv_length:
+                end = 6 if offset < 6 else 6 + self._recv_length
+                if offset == len(self._recv_buffer):
+                    size = min(end, 2 * len(self._recv_buffer))
+                    buffer = bytearray(size)
+                    buffer[:offset] = self._recv_buffer
+                    self._recv_buffer = buffer
+
+                end = min(end, len(self._recv_buffer))
+                with memoryview(self._recv_buffer) as view:
+                    bytes_read = sock.recv_into(view[offset:end], end - offset)
+
+                if not bytes_read:
+                    if offset:
+                        LOGGER.error(
+                            "Connection closed before the entire PDU was received"
+                        )
+
+                    # Evt17: Transport connection closed
+                    self._recv_offset = 0
+                    cast("AssociationSocket", self.socket).close()
+                    return True
+
+                nr_read += bytes_read
+                offset += bytes_read
+                if offset == 6:
+                    pdu_type, _, self._recv_length = _UNPACK_PDU_HEADER(
+                        self._recv_buffer
+                    )
+                    if pdu_type not in _PDU_TYPES:
+                        LOGGER.error(f"Unknown PDU type received '0x{pdu_type:02X}'")
+                        # Evt19: Unrecognised or invalid PDU received
+                        self._recv_offset = 0
+                        self.event_queue.put("Evt19")
+                        return True
+        except BlockingIOError:
+            self._readable = False
+            self._recv_offset = offset
+            return bool(nr_read)
+        except OSError as exc:
+            if _HAS_SSL and isinstance(exc, ssl.SSLWantReadError):
+                self._readable = False
+                self._recv_offset = offset
+                return bool(nr_read)
+
+            LOGGER.error("Connection closed before the entire PDU was received")
+            LOGGER.exception(exc)
+            # Evt17: Transport connection closed
+            self._recv_offset = 0
+            cast("AssociationSocket", self.socket).close()
+            return True
+
+        self._recv_offset = 0
+        self._process_pdu_data(offset)
+
+        return True
+
+    def _recv_into_buffer(self, offset: int, end: int) -> int:
+        """Read from the socket into the receive buffer from `offset` up to
+        `end`, returning the number of bytes read.
+
+        .. versionadded:: 3.1
+
+        The buffer is grown as the data arrives rather than up-front so that a
+        bogus PDU length can't force a large allocation.
+        """
+        self.socket = cast("AssociationSocket", self.socket)
+        nr_read = 0
+        while offset < end:
+            if offset == len(self._recv_buffer):
+                size = min(end, 2 * len(self._recv_buffer))
+                buffer = bytearray(size)
+                buffer[:offset] = self._recv_buffer
+                self._recv_buffer = buffer
+
+            nr_bytes = min(end, len(self._recv_buffer)) - offset
+            with memoryview(self._recv_buffer) as view:
+                bytes_read = self.socket.recv_into(view[offset:], nr_bytes)
+
+            nr_read += bytes_read
+            offset += bytes_read
+            if bytes_read != nr_bytes:
+                # Connection closed
+                break
+
+        return nr_read
+
     def receive_pdu(
         self, wait: bool = False, timeout: float | None = None
     ) -> "_UserQueuePrimitives | None":
@@ -377,75 +753,204 @@ class DULServiceProvider(Thread):
     def run_reactor(self) -> None:
         """Run the DUL reactor.
 
-        The main :class:`threading.Thread` run loop. Runs constantly, checking
-        the connection for incoming data. When incoming data is received it
-        categorises it and add its to the
+        The main :class:`threading.Thread` run loop. Checks the connection for
+        incoming data and the local user for outgoing primitives, blocking
+        on a :mod:`selectors` selector when there's nothing to do. When
+        incoming data is received it categorises it and add its to the
         :attr:`~DULServiceProvider.to_user_queue`.
         """
         # Main DUL loop
         self._idle_timer.start()
         self.socket = cast("AssociationSocket", self.socket)
-        sleep = False
 
+        # Anything queued before the wakeup socket exists is picked up by
+        #   the first loop of the reactor
+        wakeup_recv, wakeup_send = socket.socketpair()
+        wakeup_recv.setblocking(False)
+        wakeup_send.setblocking(False)
+        self._wakeup_recv, self._wakeup_send = wakeup_recv, wakeup_send
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(wakeup_recv, selectors.EVENT_READ)
+
+        try:
+            self._run_reactor()
+        finally:
+            self._selector.close()
+            self._selector = None
+            self._registered = None
+            self._wakeup_recv = self._wakeup_send = None
+            wakeup_recv.close()
+            wakeup_send.close()
+            self._set_stopped()
+
+    def _run_reactor(self) -> None:
+        """The DUL reactor loop."""
         while True:
             # Let the assoc reactor off the leash
             if not self.assoc._dul_ready.is_set():
                 self.assoc._dul_ready.set()
-                # When single-stepping the reactor, sleep between events so that
-                # test code has time to run.
-                sleep = True
-
-            if sleep:
-                # If there were no events to process on the previous loop,
-                #   sleep before checking again, otherwise check immediately
-                # Setting `_run_loop_delay` higher will use less CPU when idle, but
-                #   will also increase the latency to respond to new requests
-                time.sleep(self._run_loop_delay)
 
             if self._kill_thread:
                 break
 
-            # Check the ARTIM timer first so its event is placed on the queue
-            #   ahead of any other events this loop
+            # If there's nothing to do, wait for something to happen then
+            #   return to the start of the loop
+            if not self._step():
+                self._wait()
+
+    def _step(self) -> bool:
+        """Run a single iteration of the reactor.
+
+        .. versionadded:: 3.1
+
+        Returns
+        -------
+        bool
+            ``False`` if the event queue was empty and there was nothing to
+            do, ``True`` otherwise.
+        """
+        self.socket = cast("AssociationSocket", self.socket)
+
+        # Check the ARTIM timer first so its event is placed on the queue
+        #   ahead of any other events this loop
+        #   The timer may have been restarted since its deadline was reached
+        if self._is_artim_expired:
+            self._is_artim_expired = False
             if self.artim_timer.expired:
                 self.event_queue.put("Evt18")
 
-            # Check the connection for incoming data
-            try:
-                # We can either encode and send a primitive **OR**
-                #   receive and decode a PDU per loop of the reactor
-                if self._process_recv_primitive():  # encode (sent by state machine)
+        # Check the connection for incoming data
+        try:
+            # We can either encode and send a primitive **OR**
+            #   receive and decode a PDU per loop of the reactor
+            if self._process_recv_primitive():  # encode (sent by state machine)
+                pass
+            elif self._is_transport_event():  # receive and decode PDU
+                self._idle_timer.restart()
+        except Exception as exc:
+            LOGGER.error("Exception in DUL.run(), aborting association")
+            LOGGER.exception(exc)
+            # Bypass the state machine and send an A-ABORT
+            #   we do it this way because an exception here will mess up
+            #   the state machine and we can't guarantee it'll get sent
+            #   otherwise
+            abort_pdu = A_ABORT_RQ()
+            abort_pdu.source = 0x02
+            abort_pdu.reason_diagnostic = 0x00
+            self.socket.send(abort_pdu.encode())
+            self.assoc.is_aborted = True
+            self.assoc.is_established = False
+            # Hard shutdown of the Association and DUL reactors
+            self.assoc._kill = True
+            self._kill_thread = True
+            return True
+
+        # Check the event queue to see if there is anything to do
+        try:
+            event = self.event_queue.get(block=False)
+        except queue.Empty:
+            return False
+
+        self.state_machine.do_action(event)
+
+        return True
+
+    def _wait(self) -> None:
+        """Block until there's incoming data on the socket, the reactor is
+        woken by a new event or primitive, or the ARTIM timer expires.
+        """
+        selector = cast(selectors.BaseSelector, self._selector)
+
+        sock = None
+        if self.socket and self.socket.socket and self.socket._is_connected:
+            sock = self.socket.socket
+
+        # Don't wake for incoming data we won't read
+        if self._is_reading_paused():
+            sock = None
+
+        # An SSLSocket may have buffered data available that the selector
+        #   is unaware of - see #528
+        if _HAS_SSL and isinstance(sock, ssl.SSLSocket) and sock.pending():
+            return
+
+        if sock is not self._registered:
+            if self._registered is not None:
+                try:
+                    selector.unregister(self._registered)
+                except (KeyError, ValueError, OSError):
                     pass
-                elif self._is_transport_event():  # receive and decode PDU
-                    self._idle_timer.restart()
-            except Exception as exc:
-                LOGGER.error("Exception in DUL.run(), aborting association")
-                LOGGER.exception(exc)
-                # Bypass the state machine and send an A-ABORT
-                #   we do it this way because an exception here will mess up
-                #   the state machine and we can't guarantee it'll get sent
-                #   otherwise
-                abort_pdu = A_ABORT_RQ()
-                abort_pdu.source = 0x02
-                abort_pdu.reason_diagnostic = 0x00
-                self.socket.send(abort_pdu.encode())
-                self.assoc.is_aborted = True
-                self.assoc.is_established = False
-                # Hard shutdown of the Association and DUL reactors
-                self.assoc._kill = True
-                self._kill_thread = True
-                return
 
-            # Check the event queue to see if there is anything to do
-            try:
-                event = self.event_queue.get(block=False)
-            # If the queue is empty, return to the start of the loop
-            except queue.Empty:
-                sleep = True
-                continue
+                self._registered = None
+
+            if sock is not None:
+                try:
+                    selector.register(sock, selectors.EVENT_READ)
+                    self._registered = sock
+                except (KeyError, ValueError, OSError):
+                    # Socket has been closed, let the transport check handle it
+                    return
+
+        try:
+            events = selector.select(self._max_wait)
+        except (OSError, ValueError):
+            return
+
+        for key, _ in events:
+            if key.fileobj is self._wakeup_recv:
+                self._drain_wakeup()
 
-            self.state_machine.do_action(event)
-            sleep = False
+    def _drain_wakeup(self) -> None:
+        """Empty the reactor's wakeup socket."""
+        try:
+            while cast(socket.socket, self._wakeup_recv).recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _wakeup(self) -> None:
+        """Wake the reactor if it's blocked waiting for an event."""
+        if self._reactor is not None:
+            self._reactor.notify(self)
+            return
+
+        sock = self._wakeup_send
+        if sock is None:
+            return
+
+        try:
+            sock.send(b"\x00")
+        except OSError:
+            # Either the reactor has already been woken and the buffer is
+            #   full or the reactor has exited
+            pass
+
+    def _artim_expired(self) -> None:
+        """Called by the timer wheel when the ARTIM timer expires.
+
+        .. versionadded:: 3.1
+        """
+        self._is_artim_expired = True
+        self._wakeup()
+
+    def _wakeup_user(self) -> None:
+        """Wake the association reactor.
+
+        .. versionadded:: 3.1
+        """
+        self.assoc._reactor_wakeup.set()
+        if self._reactor is not None:
+            self._reactor.notify(self, user=True)
+
+    def _set_stopped(self) -> None:
+        """Signal that the reactor has stopped.
+
+        .. versionadded:: 3.1
+        """
+        self._stopped.set()
+        self._idle_event.set()
+        # Nothing more will be received from the peer
+        self.assoc._teardown()
 
     def _send(self, pdu: _PDUType) -> None:
         """Encode and send a PDU to the peer.
@@ -456,11 +961,26 @@ class DULServiceProvider(Thread):
             The PDU to be encoded and sent to the peer.
         """
         if self.socket is not None:
-            self.socket.send(pdu.encode())
+            self.socket.sendmsg(pdu._encode_buffers())
             evt.trigger(self.assoc, evt.EVT_PDU_SENT, {"pdu": pdu})
         else:
             LOGGER.warning("Attempted to send data over closed connection")
 
+    def start(self) -> None:
+        """Start the reactor.
+
+        .. versionchanged:: 3.1
+
+            If the DUL is driven by a :class:`SharedReactor` then it's
+            registered with the reactor rather than a new thread being started.
+        """
+        if self._reactor is None:
+            super().start()
+            return
+
+        self._idle_timer.start()
+        self._reactor.register(self)
+
     def send_pdu(self, primitive: _PDUPrimitiveType) -> None:
         """Place a primitive in the provider queue to be sent to the peer.
 
@@ -489,6 +1009,11 @@ class DULServiceProvider(Thread):
     def stop_dul(self) -> bool:
         """Stop the reactor if current state is ``'Sta1'``
 
+        .. versionchanged:: 3.1
+
+            Waits for the reactor to signal that it has stopped rather than
+            polling.
+
         Returns
         -------
         bool
@@ -497,22 +1022,351 @@ class DULServiceProvider(Thread):
         """
         if self.state_machine.current_state == "Sta1":
             self._kill_thread = True
+            self._wakeup()
             # Fix for Issue 39
-            # Give the DUL thread time to exit
-            while self.is_alive():
-                time.sleep(self._run_loop_delay)
+            # Wait for the DUL thread to exit
+            if self._reactor is None:
+                if super().is_alive() and threading.current_thread() is not self:
+                    self.join()
+            else:
+                while self.is_alive():
+                    self._stopped.wait(self._max_wait)
 
             return True
 
         return False
 
+    def _wait_for_idle(self, timeout: float | None = None) -> bool:
+        """Block until the state machine returns to ``'Sta1'`` (idle) or the
+        reactor stops.
+
+        .. versionadded:: 3.1
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The maximum time to wait (in seconds), default ``None`` to wait
+            indefinitely.
+
+        Returns
+        -------
+        bool
+            ``True`` if the state machine is idle or the reactor has stopped,
+            ``False`` if timed out.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._stopped.is_set():
+            if self.state_machine.current_state == "Sta1":
+                return True
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+
+            self._idle_event.wait(remaining)
+            # Cleared before the state is checked again so a signal can't be
+            #   missed
+            self._idle_event.clear()
+
+        return True
+
+
+class SharedReactor(Thread):
+    """A reactor that drives the DUL state machines of many associations from
+    a single thread.
+
+    .. versionadded:: 3.1
+
+    Rather than each :class:`DULServiceProvider` running in its own thread, the
+    sockets of all the registered DULs are monitored using a single
+    :mod:`selectors` selector and a DUL is only run when its socket has
+    incoming data, when the local user queues a primitive or event for it, or
+    when one of its timers expires. Incoming PDUs are read
+    without blocking so a slow peer doesn't hold up the other associations,
+    however outgoing PDUs are still written using blocking sends.
+
+    A DUL is registered with the reactor by setting its ``_reactor`` attribute
+    before calling :meth:`DULServiceProvider.start`, and is unregistered once
+    it's been killed or its connection has been closed.
+    """
+
+    def __init__(self, callback: Callable[[DULServiceProvider], None]) -> None:
+        """Create a new :class:`SharedReactor`.
+
+        Parameters
+        ----------
+        callback : Callable[[DULServiceProvider], None]
+            Called from the reactor thread with a DUL after it has processed
+            one or more events, after it has been unregistered or when its
+            service user has been woken, so that the service user can act on
+            any changes.
+        """
+        self._callback = callback
+
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_recv.setblocking(False)
+        self._wakeup_send.setblocking(False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+
+        # Protects the registered DULs and the DULs waiting to be run
+        self._lock = threading.Lock()
+        self._duls: set[DULServiceProvider] = set()
+        # {DUL: bool} for the DULs waiting to be run, the value is True if the
+        #   callback should be called even if the DUL has nothing to process
+        self._pending: dict[DULServiceProvider, bool] = {}
+        # The socket each DUL has registered with the selector
+        self._sockets: dict[DULServiceProvider, socket.socket] = {}
+        # Whether or not a wakeup has been sent since the reactor last woke
+        self._woken = False
+
+        self._stopping = False
+        self._deadline = 0.0
+
+        # The maximum number of events a DUL processes before the other DULs
+        #   get a turn
+        self._max_events = 32
+
+        Thread.__init__(self, target=make_target(self.run_reactor))
+        self.daemon = True
+
+    def _check_socket(self, dul: DULServiceProvider) -> None:
+        """Ensure the selector is monitoring the current socket for `dul`."""
+        sock = None
+        if dul.socket is not None and dul.socket._is_connected:
+            sock = dul.socket.socket
+
+        if sock is not None and (sock.fileno() == -1 or dul._is_reading_paused()):
+            sock = None
+
+        if sock is self._sockets.get(dul):
+            return
+
+        self._unregister_socket(dul)
+        if sock is None:
+            return
+
+        try:
+            self._selector.register(sock, selectors.EVENT_READ, dul)
+        except KeyError:
+            # The file descriptor belonged to a socket that was closed before
+            #   it could be unregistered and has since been reused
+            stale = self._selector.unregister(sock.fileno())
+            self._sockets.pop(stale.data, None)
+            self._selector.register(sock, selectors.EVENT_READ, dul)
+
+        self._sockets[dul] = sock
+
+    def _drain_wakeup(self) -> None:
+        """Empty the reactor's wakeup socket."""
+        try:
+            while self._wakeup_recv.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def is_registered(self, dul: DULServiceProvider) -> bool:
+        """Return ``True`` if `dul` is registered with the reactor."""
+        return dul in self._duls
+
+    def notify(self, dul: DULServiceProvider, user: bool = False) -> None:
+        """Wake the reactor so that `dul` gets run.
+
+        Parameters
+        ----------
+        dul : dul.DULServiceProvider
+            The DUL that has a primitive or event to be processed.
+        user : bool, optional
+            If ``True`` then also call the callback for `dul` even if it has
+            nothing to process, such as when one of the service user's timers
+            has expired (default ``False``).
+        """
+        with self._lock:
+            self._pending[dul] = user or self._pending.get(dul, False)
+            # The reactor checks for pending DULs before it blocks
+            if self._woken or threading.get_ident() == self.ident:
+                return
+
+            self._woken = True
+
+        try:
+            self._wakeup_send.send(b"\x00")
+        except OSError:
+            # The reactor has already exited
+            pass
+
+    def register(self, dul: DULServiceProvider) -> None:
+        """Register `dul` with the reactor.
+
+        Parameters
+        ----------
+        dul : dul.DULServiceProvider
+            The DUL to be driven by the reactor.
+        """
+        with self._lock:
+            self._duls.add(dul)
+
+        self.notify(dul)
+
+    def _run(self, dul: DULServiceProvider, user: bool) -> None:
+        """Run `dul` until it runs out of events to process.
+
+        Parameters
+        ----------
+        dul : dul.DULServiceProvider
+            The DUL to run.
+        user : bool
+            ``True`` if the callback should be called even if the DUL has
+            nothing to process, ``False`` otherwise.
+        """
+        if dul not in self._duls:
+            return
+
+        # Let the assoc reactor off the leash
+        if not dul.assoc._dul_ready.is_set():
+            dul.assoc._dul_ready.set()
+
+        processed = False
+        try:
+            for _ in range(self._max_events):
+                if dul._kill_thread or not dul._step():
+                    break
+
+                processed = True
+            else:
+                # Let the other DULs have a turn first
+                with self._lock:
+                    self._pending.setdefault(dul, False)
+        except Exception as exc:
+            LOGGER.error("Exception in the shared DUL reactor, stopping the DUL")
+            LOGGER.exception(exc)
+            dul._kill_thread = True
+
+        # No socket and idle so there's nothing more for the DUL to do
+        finished = dul.state_machine.current_state == "Sta1" and (
+            dul.socket is None or dul.socket.socket is None
+        )
+        if dul._kill_thread or finished:
+            self._unregister(dul)
+        else:
+            self._check_socket(dul)
+            if not processed and not user:
+                return
 
-_PDU_TYPES: dict[bytes, tuple[type[_PDUType], str]] = {
-    b"\x01": (A_ASSOCIATE_RQ, "Evt6"),
-    b"\x02": (A_ASSOCIATE_AC, "Evt3"),
-    b"\x03": (A_ASSOCIATE_RJ, "Evt4"),
-    b"\x04": (P_DATA_TF, "Evt10"),
-    b"\x05": (A_RELEASE_RQ, "Evt12"),
-    b"\x06": (A_RELEASE_RP, "Evt13"),
-    b"\x07": (A_ABORT_RQ, "Evt16"),
+        try:
+            self._callback(dul)
+        except Exception as exc:
+            LOGGER.exception(exc)
+
+    def run_reactor(self) -> None:
+        """Run the reactor.
+
+        The main :class:`threading.Thread` run loop. Blocks on the selector
+        until either a socket has incoming data or a DUL is woken by the local
+        user, then runs each of the DULs with something to do.
+        """
+        try:
+            self._run_reactor()
+        finally:
+            # Any DULs still registered are abandoned
+            for dul in list(self._duls):
+                self._unregister(dul)
+                dul._kill_thread = True
+                if dul.socket is not None:
+                    dul.socket.close()
+
+            self._selector.close()
+            self._wakeup_recv.close()
+            self._wakeup_send.close()
+
+    def _run_reactor(self) -> None:
+        """The shared reactor loop."""
+        while True:
+            with self._lock:
+                if self._stopping and (
+                    not self._duls or time.monotonic() >= self._deadline
+                ):
+                    break
+
+                # The DUL timers wake the reactor when they expire, so only
+                #   a shutdown needs a timeout
+                timeout: float | None = None
+                if self._pending:
+                    timeout = 0.0
+                elif self._stopping:
+                    timeout = max(self._deadline - time.monotonic(), 0)
+
+            ready: dict[DULServiceProvider, bool] = {}
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    self._drain_wakeup()
+                    continue
+
+                key.data._readable = True
+                ready[key.data] = False
+
+            with self._lock:
+                for dul, user in self._pending.items():
+                    ready[dul] = user or ready.get(dul, False)
+
+                self._pending = {}
+                self._woken = False
+
+            for dul, user in ready.items():
+                self._run(dul, user)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the reactor.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time (in seconds) to wait for the registered DULs to
+            finish before they're abandoned and their connections closed
+            (default ``1.0``).
+        """
+        with self._lock:
+            self._stopping = True
+            self._deadline = time.monotonic() + timeout
+
+        try:
+            self._wakeup_send.send(b"\x00")
+        except OSError:
+            pass
+
+        if self.is_alive() and threading.get_ident() != self.ident:
+            self.join()
+
+    def _unregister(self, dul: DULServiceProvider) -> None:
+        """Unregister `dul` from the reactor."""
+        with self._lock:
+            self._duls.discard(dul)
+            self._pending.pop(dul, None)
+
+        self._unregister_socket(dul)
+        dul._set_stopped()
+
+    def _unregister_socket(self, dul: DULServiceProvider) -> None:
+        """Stop monitoring the socket for `dul`."""
+        sock = self._sockets.pop(dul, None)
+        if sock is None:
+            return
+
+        try:
+            self._selector.unregister(sock)
+        except (KeyError, ValueError):
+            # Already unregistered after its file descriptor was reused
+            pass
+
+
+_PDU_TYPES: dict[int, tuple[type[_PDUType], str]] = {
+    0x01: (A_ASSOCIATE_RQ, "Evt6"),
+    0x02: (A_ASSOCIATE_AC, "Evt3"),
+    0x03: (A_ASSOCIATE_RJ, "Evt4"),
+    0x04: (P_DATA_TF, "Evt10"),
+    0x05: (A_RELEASE_RQ, "Evt12"),
+    0x06: (A_RELEASE_RP, "Evt13"),
+    0x07: (A_ABORT_RQ, "Evt16"),
 }
@@ -21,7 +21,7 @@ from pynetdicom.dsutils import decode, create_file_meta, encode_file_meta
 
 if TYPE_CHECKING:  # pragma: no cover
     from pynetdicom.association import Association
-    from pynetdicom.dimse_messages import DIMSEMessage
+    from pynetdicom.dimse_messages import DatasetStream, DIMSEMessage
     from pynetdicom.dimse_primitives import (
         C_ECHO,
         C_FIND,
@@ -595,8 +595,53 @@ class Event:
         except (TypeError, AttributeError):
             pass
 
+        self._read_dataset_stream()
+
         return self._get_dataset("DataSet", msg)
 
+    @property
+    def dataset_stream(self) -> "DatasetStream":
+        """Return a file-like for reading a C-STORE request's *Data Set* while
+        it's still being received when
+        :attr:`~pynetdicom._config.STORE_RECV_STREAMING` is ``True``.
+
+        .. versionadded:: 3.1
+
+        Reading from the stream returns the encoded dataset as sent by the
+        peer, without any File Meta Information, and blocks until more of the
+        dataset has been received. Once the stream has been read from
+        :attr:`dataset` and :meth:`encoded_dataset` can no longer be used.
+
+        Examples
+        --------
+        Write the encoded dataset to file as it's received::
+
+          def handle_store(event: pynetdicom.events.Event, dst: pathlib.Path) -> int:
+              with dst.open("wb") as f:
+                  shutil.copyfileobj(event.dataset_stream, f)
+
+              return 0x0000
+
+        Returns
+        -------
+        dimse_messages.DatasetStream
+            The stream the dataset is being received into.
+
+        Raises
+        ------
+        AttributeError
+            If the corresponding event is not a C-STORE request or
+            :attr:`~pynetdicom._config.STORE_RECV_STREAMING` is not ``True``.
+        """
+        stream = getattr(getattr(self, "request", None), "_dataset_stream", None)
+        if stream is None:
+            raise AttributeError(
+                "The corresponding event is either not a C-STORE request or "
+                "'STORE_RECV_STREAMING' is not True."
+            )
+
+        return cast("DatasetStream", stream)
+
     @property
     def dataset_path(self) -> Path:
         """Return the path to the dataset when
@@ -604,10 +649,17 @@ class Event:
 
         .. versionadded:: 2.0
 
+        .. versionchanged:: 3.1
+
+            Also returns the path to datasets spooled to file because they
+            exceeded the AE's
+            :attr:`~pynetdicom.ae.ApplicationEntity.store_recv_spool_threshold`
+
         Returns
         -------
-        pathlib.Path
-            The path to the dataset.
+        pathlib.Path | None
+            The path to the dataset, or ``None`` if the dataset is held in
+            memory.
         """
         try:
             req = cast("C_STORE", self.request)
@@ -662,6 +714,19 @@ class Event:
         AttributeError
             If the corresponding event is not a C-STORE request.
         """
+        self._read_dataset_stream()
+
+        path = getattr(getattr(self, "request", None), "_dataset_path", None)
+        if isinstance(path, Path):
+            # The dataset has been written to file in the DICOM File Format
+            data = path.read_bytes()
+            if include_meta:
+                return data
+
+            # Skip the preamble, prefix and File Meta Information, whose
+            #   length is the value of the (0002,0000) group length element
+            return data[144 + int.from_bytes(data[140:144], "little") :]
+
         try:
             request = cast(C_STORE, self.request)
             stream = cast(BytesIO, request.DataSet).getvalue()
@@ -815,6 +880,15 @@ class Event:
             transfer_syntax=self.context.transfer_syntax,
         )
 
+    def _read_dataset_stream(self) -> None:
+        """Read a streamed C-STORE request's *Data Set* into the request
+        primitive.
+        """
+        stream = getattr(getattr(self, "request", None), "_dataset_stream", None)
+        if stream is not None and not stream.closed:
+            cast(C_STORE, self.request).DataSet = BytesIO(stream.read())
+            stream.close()
+
     def _get_dataset(self, attr: str, exc_msg: str) -> Dataset:
         """Return DIMSE dataset-like parameter as a *pydicom* Dataset.
 
@@ -4,6 +4,7 @@ The DUL's finite state machine representation.
 
 import logging
 import queue
+import threading
 from typing import TYPE_CHECKING, cast
 
 from pynetdicom import evt
@@ -58,27 +59,47 @@ class StateMachine:
         dul : dul.DULServiceProvider
             The DICOM Upper Layer Service instance for the association.
         """
-        self.current_state = "Sta1"
+        # The index of the current state in _STATE_NAMES
+        self._state = _STATE_INDEX["Sta1"]
         self.dul = dul
 
+    @property
+    def current_state(self) -> str:
+        """Get or set the current state as ``'Sta1'`` to ``'Sta13'``."""
+        return _STATE_NAMES[self._state]
+
+    @current_state.setter
+    def current_state(self, state: str) -> None:
+        """Set the current state."""
+        self._state = _STATE_INDEX[state]
+
     def do_action(self, event: str) -> None:
         """Execute the action triggered by `event`.
 
+        .. versionchanged:: 3.1
+
+            The action is looked up using the integer indices of the event
+            and current state, and the ``EVT_FSM_TRANSITION`` event is only
+            triggered if a handler is bound to it.
+
         Parameters
         ----------
         event : str
             The event to be processed, ``'Evt1'`` to ``'Evt19'``
         """
         # Check (event + state) is valid
-        if (event, self.current_state) not in TRANSITION_TABLE:
+        event_idx = _EVENT_INDEX.get(event)
+        action_name = None
+        if event_idx is not None:
+            action_name = _DISPATCH[event_idx][self._state]
+
+        if action_name is None:
             msg = (
                 f"Invalid event '{event}' for the current state '{self.current_state}'"
             )
             LOGGER.error(msg)
             raise InvalidEventError(msg)
 
-        action_name = TRANSITION_TABLE[(event, self.current_state)]
-
         # action is the (description, function, state) tuple
         #   associated with the action_name
         action = ACTIONS[action_name]
@@ -90,25 +111,19 @@ class StateMachine:
             next_state = action[1](self.dul)
 
             # Event handler - FSM transition
-            evt.trigger(
-                self.dul.assoc,
-                evt.EVT_FSM_TRANSITION,
-                {
-                    "action": action_name,
-                    "current_state": self.current_state,
-                    "fsm_event": event,
-                    "next_state": next_state,
-                },
-            )
-            # print(
-            #     "{}: {} + {} -> {} -> {}".format(
-            #         self.dul.assoc.mode[0].upper(),
-            #         self.current_state,
-            #         event,
-            #         action_name,
-            #         next_state,
-            #     )
-            # )
+            #   Only build the event attributes if a handler is bound
+            assoc = self.dul.assoc
+            if assoc.get_handlers(evt.EVT_FSM_TRANSITION):
+                evt.trigger(
+                    assoc,
+                    evt.EVT_FSM_TRANSITION,
+                    {
+                        "action": action_name,
+                        "current_state": self.current_state,
+                        "fsm_event": event,
+                        "next_state": next_state,
+                    },
+                )
 
             # Move the state machine to the next state
             self.transition(next_state)
@@ -138,8 +153,12 @@ class StateMachine:
             If `state` is not a valid state.
         """
         # Validate that state is acceptable
-        if state in STATES:
-            self.current_state = state
+        state_idx = _STATE_INDEX.get(state)
+        if state_idx is not None:
+            self._state = state_idx
+            # Let anything waiting for the association to end know we're idle
+            if state_idx == _STA1:
+                self.dul._idle_event.set()
         else:
             msg = f"Invalid state '{state}' for State Machine"
             LOGGER.error(msg)
@@ -202,8 +221,9 @@ def AE_2(dul: "DULServiceProvider") -> str:
     # TRANSPORT CONNECTION primitive received from transport service
     primitive = cast("T_CONNECT", dul.to_provider_queue.get(False))
 
-    # Send A-ASSOCIATE-RQ PDU to the peer
-    dul._send(A_ASSOCIATE_RQ(primitive.request))
+    # Send A-ASSOCIATE-RQ PDU to the peer, using the one prebuilt by the AE
+    #   if available
+    dul._send(dul.assoc._request_pdu or A_ASSOCIATE_RQ(primitive.request))
 
     return "Sta5"
 
@@ -226,10 +246,10 @@ def AE_3(dul: "DULServiceProvider") -> str:
         ``'Sta6'``, the next state of the state machine
     """
     # Received A-ASSOCIATE-AC PDU from the peer
-    pdu = dul._recv_pdu.get(False)
+    pdu = cast("A_ASSOCIATE_AC", dul._recv_pdu.get(False))
 
     # Issue A-ASSOCIATE confirmation (accept) primitive
-    dul.to_user_queue.put(cast("A_ASSOCIATE", pdu.to_primitive()))
+    dul.to_user_queue.put(pdu.to_primitive())
 
     return "Sta6"
 
@@ -253,11 +273,11 @@ def AE_4(dul: "DULServiceProvider") -> str:
         ``'Sta1'``, the next state of the state machine
     """
     # Received A-ASSOCIATE-RJ PDU from the peer
-    pdu = dul._recv_pdu.get(False)
+    pdu = cast("A_ASSOCIATE_RJ", dul._recv_pdu.get(False))
 
     # Issue A-ASSOCIATE confirmation (reject) primitive and close transport
     # connection
-    dul.to_user_queue.put(cast("A_ASSOCIATE", pdu.to_primitive()))
+    dul.to_user_queue.put(pdu.to_primitive())
     sock = cast("AssociationSocket", dul.socket)
     sock.close()
 
@@ -448,11 +468,13 @@ def DT_2(dul: "DULServiceProvider") -> str:
     str
         ``'Sta6'``, the next state of the state machine
     """
-    # P-DATA-TF PDU received from peer
+    # P-DATA-TF PDU received from peer, may already be a P-DATA primitive
     pdu = dul._recv_pdu.get(False)
+    if isinstance(pdu, P_DATA_TF):
+        pdu = pdu.to_primitive()
 
     # Send P-DATA indication primitive directly to DIMSE for processing
-    dul.assoc.dimse.receive_primitive(cast("P_DATA", pdu.to_primitive()))
+    dul.assoc.dimse.receive_primitive(cast("P_DATA", pdu))
 
     return "Sta6"
 
@@ -626,11 +648,13 @@ def AR_6(dul: "DULServiceProvider") -> str:
     str
         ``'Sta7'``, the next state of the state machine
     """
-    # P-DATA-TF PDU received from peer
-    pdu = cast("P_DATA_TF", dul._recv_pdu.get(False))
+    # P-DATA-TF PDU received from peer, may already be a P-DATA primitive
+    pdu = dul._recv_pdu.get(False)
+    if isinstance(pdu, P_DATA_TF):
+        pdu = pdu.to_primitive()
 
     # Issue P-DATA indication
-    dul.assoc.dimse.receive_primitive(pdu.to_primitive())
+    dul.assoc.dimse.receive_primitive(cast("P_DATA", pdu))
 
     return "Sta7"
 
@@ -849,11 +873,17 @@ def AA_3(dul: "DULServiceProvider") -> str:
     # Otherwise (service-dul initiated abort):
     #   - Issue A-P-ABORT indication and close transport connection.
     # This action is triggered by the reception of an A-ABORT PDU
-    dul.to_user_queue.put(pdu.to_primitive())
+    assoc = dul.assoc
     sock = cast("AssociationSocket", dul.socket)
-    sock.close()
+    # Leave the connection open until the association has handled the abort
+    #   so that it's been aborted by the time the peer sees the connection
+    #   close, the peer will close the connection itself if we take too long
+    if assoc.is_alive() and threading.current_thread() is not assoc:
+        assoc._close_after_abort(sock)
+    else:
+        sock.close()
 
-    assoc = dul.assoc
+    dul.to_user_queue.put(pdu.to_primitive())
     assoc.dimse.msg_queue.put((None, None))
 
     remote = assoc.acceptor if assoc.is_requestor else assoc.requestor
@@ -1287,3 +1317,19 @@ TRANSITION_TABLE = {
     ("Evt19", "Sta12"): "AA-8",
     ("Evt19", "Sta13"): "AA-7",
 }
+
+
+# Integer indices for the states and events and the 2-D dispatch table of
+#   action names as _DISPATCH[event index][state index], with None for an
+#   invalid (event, state) combination. The action functions are looked up in
+#   ACTIONS by name when the action is performed
+_STATE_NAMES: list[str] = list(STATES)
+_STATE_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(_STATE_NAMES)}
+_STA1 = _STATE_INDEX["Sta1"]
+_EVENT_NAMES: list[str] = list(EVENTS)
+_EVENT_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(_EVENT_NAMES)}
+_DISPATCH: list[list[str | None]] = [[None] * len(_STATE_NAMES) for _ in _EVENT_NAMES]
+for (_event, _state), _action in TRANSITION_TABLE.items():
+    _DISPATCH[_EVENT_INDEX[_event]][_STATE_INDEX[_state]] = _action
+
+del _event, _state, _action
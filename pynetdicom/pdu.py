@@ -19,6 +19,7 @@ There are seven different PDUs:
                     to_primitive               decode
 """
 
+from copy import copy
 import logging
 from struct import Struct
 from typing import Any, TYPE_CHECKING, cast, TypeAlias
@@ -35,16 +36,19 @@ from pynetdicom.pdu_items import (
     PDU_ITEM_TYPES,
     _PDUItemType,
     PDUItem,
+    _write_bytes,
 )
 from pynetdicom.utils import decode_bytes, set_ae
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pynetdicom.dimse_messages import _FileFragment
     from pynetdicom.pdu_primitives import (
         A_ASSOCIATE,
         P_DATA,
         A_RELEASE,
         A_ABORT,
         A_P_ABORT,
+        _PDVValueType,
     )
 
 
@@ -56,6 +60,9 @@ _PDUType: TypeAlias = (
     "A_ASSOCIATE_RQ | A_ASSOCIATE_AC | A_ASSOCIATE_RJ | "
     "P_DATA_TF | A_RELEASE_RQ | A_RELEASE_RP | A_ABORT_RQ"
 )
+# A buffer of an encoded PDU, P-DATA-TF PDUs may also contain dataset
+#   fragments that are still stored in a file
+_BufferType: TypeAlias = "bytes | memoryview | _FileFragment"
 
 # Predefine some structs to make decoding and encoding faster
 UCHAR = Struct("B")
@@ -69,6 +76,24 @@ UNPACK_UINT4 = UINT4.unpack
 PACK_UCHAR = UCHAR.pack
 PACK_UINT2 = UINT2.pack
 PACK_UINT4 = UINT4.pack
+# PDU type, reserved, PDU length
+PACK_PDU_HEADER = Struct(">BBI").pack
+# PDV item length, context ID
+PACK_PDV_HEADER = Struct(">IB").pack
+UNPACK_FROM_PDV_HEADER = Struct(">IB").unpack_from
+
+# Precompiled structs for encoding PDUs directly into a buffer
+# PDU type, reserved, PDU length
+PACK_INTO_PDU_HEADER = Struct(">BxI").pack_into
+# PDU type, reserved, PDU length, protocol version, reserved, called AE title,
+#   calling AE title, reserved
+PACK_INTO_ASSOCIATE_HEADER = Struct(">BxIH2x16s16s32x").pack_into
+# PDU type, reserved, PDU length, reserved, result, source, reason/diagnostic
+PACK_INTO_ASSOCIATE_RJ = Struct(">BxIxBBB").pack_into
+# PDU type, reserved, PDU length, reserved
+PACK_INTO_RELEASE = Struct(">BxI4x").pack_into
+# PDU type, reserved, PDU length, reserved, source, reason/diagnostic
+PACK_INTO_ABORT = Struct(">BxI2xBB").pack_into
 
 
 class PDU:
@@ -110,20 +135,63 @@ class PDU:
     def encode(self) -> bytes:
         """Return the encoded PDU as :class:`bytes`.
 
+        .. versionchanged:: 3.1
+
+            The PDU is encoded directly into a single preallocated buffer.
+
         Returns
         -------
         bytes
             The encoded PDU.
         """
-        bytestream = bytes()
+        buffer = bytearray(len(self))
+        self._encode_into(buffer, 0)
+
+        return bytes(buffer)
+
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+
+        Subclasses override this with a routine specific to the PDU, by
+        default the fields given by :attr:`_encoders` are encoded in turn.
+
+        Parameters
+        ----------
+        buffer : bytearray
+            The buffer to encode into, which must have at least ``len(self)``
+            bytes available starting at `offset`.
+        offset : int
+            The offset in `buffer` to start encoding at.
+
+        Returns
+        -------
+        int
+            The offset in `buffer` following the encoded PDU.
+        """
         for attr_name, func, args in self._encoders:
             # If attr_name is None then the field is usually reserved
             if attr_name:
-                bytestream += func(getattr(self, attr_name), *args)
+                value = func(getattr(self, attr_name), *args)
             else:
-                bytestream += func(*args)
+                value = func(*args)
+
+            offset = _write_bytes(buffer, offset, value)
+
+        return offset
 
-        return bytestream
+    def _encode_buffers(self) -> list[_BufferType]:
+        """Return the encoded PDU as a list of buffers to be sent in order.
+
+        .. versionadded:: 3.1
+
+        Returns
+        -------
+        list[bytes | memoryview]
+            The encoded PDU, split across one or more buffers.
+        """
+        return [self.encode()]
 
     @property
     def _encoders(self) -> Any:
@@ -233,8 +301,8 @@ class PDU:
 
     @staticmethod
     def _wrap_bytes(bytestream: bytes) -> bytes:
-        """Return `bytestream` without changing it."""
-        return bytestream
+        """Return `bytestream` as :class:`bytes`."""
+        return bytes(bytestream)
 
     @staticmethod
     def _wrap_encode_items(items: list[PDUItem]) -> bytes:
@@ -250,11 +318,7 @@ class PDU:
         bytes
             The encoded items.
         """
-        bytestream = bytes()
-        for item in items:
-            bytestream += item.encode()
-
-        return bytestream
+        return b"".join(item.encode() for item in items)
 
     @staticmethod
     def _wrap_encode_str(value: str, pad: int = 0) -> bytes:
@@ -451,6 +515,9 @@ class A_ASSOCIATE_RQ(PDU):
         # The order of the items in the list may not be as given above
         self.variable_items: _PDUItemType = []
 
+        # The encoded PDU when created from a template
+        self._encoded: bytes | None = None
+
         if primitive is not None:
             self.from_primitive(primitive)
 
@@ -613,6 +680,27 @@ class A_ASSOCIATE_RQ(PDU):
             ((74, None), "variable_items", self._wrap_generate_items, []),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        end = offset + 74
+        for item in self.variable_items:
+            end = item._encode_into(buffer, end)
+
+        PACK_INTO_ASSOCIATE_HEADER(
+            buffer,
+            offset,
+            self.pdu_type,
+            end - offset - 6,
+            self.protocol_version,
+            self._wrap_encode_str(self.called_ae_title, 16),
+            self._wrap_encode_str(self.calling_ae_title, 16),
+        )
+
+        return end
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -646,6 +734,52 @@ class A_ASSOCIATE_RQ(PDU):
             ("variable_items", self._wrap_encode_items, []),
         ]
 
+    def _encode_buffers(self) -> list[_BufferType]:
+        """Return the encoded PDU as a list of buffers to be sent in order.
+
+        .. versionadded:: 3.1
+
+        If the PDU was created using :meth:`_from_template` then the encoding
+        patched from the template is used.
+
+        Returns
+        -------
+        list[bytes | memoryview]
+            The encoded PDU.
+        """
+        return [self._encoded or self.encode()]
+
+    def _from_template(self, called_ae_title: str) -> "A_ASSOCIATE_RQ":
+        """Return a copy of the current PDU with a new *Called AE Title*.
+
+        .. versionadded:: 3.1
+
+        The copy shares the current PDU's variable items and its encoding is
+        the current PDU's encoding with only the *Called AE Title* field
+        patched, so neither PDU should be modified afterwards.
+
+        Parameters
+        ----------
+        called_ae_title : str
+            The *Called AE Title* field value to use for the copy.
+
+        Returns
+        -------
+        pdu.A_ASSOCIATE_RQ
+            The new PDU.
+        """
+        if self._encoded is None:
+            self._encoded = self.encode()
+
+        pdu = copy(self)
+        pdu.called_ae_title = called_ae_title
+
+        encoded = bytearray(self._encoded)
+        encoded[10:26] = self._wrap_encode_str(pdu.called_ae_title, 16)
+        pdu._encoded = bytes(encoded)
+
+        return pdu
+
     @property
     def pdu_length(self) -> int:
         """Return the *PDU Length* field value as :class:`int`."""
@@ -972,6 +1106,27 @@ class A_ASSOCIATE_AC(PDU):
             ((74, None), "variable_items", self._wrap_generate_items, []),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        end = offset + 74
+        for item in self.variable_items:
+            end = item._encode_into(buffer, end)
+
+        PACK_INTO_ASSOCIATE_HEADER(
+            buffer,
+            offset,
+            self.pdu_type,
+            end - offset - 6,
+            self.protocol_version,
+            self._wrap_encode_str(self.reserved_aet, 16),
+            self._wrap_encode_str(self.reserved_aec, 16),
+        )
+
+        return end
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1262,6 +1417,23 @@ class A_ASSOCIATE_RJ(PDU):
             ((9, 1), "reason_diagnostic", self._wrap_unpack, [UNPACK_UCHAR]),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_ASSOCIATE_RJ(
+            buffer,
+            offset,
+            self.pdu_type,
+            self.pdu_length,
+            self.result,
+            self.source,
+            self.reason_diagnostic,
+        )
+
+        return offset + 10
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1464,7 +1636,7 @@ class P_DATA_TF(PDU):
             primitive.presentation_data_value_list.append(
                 (
                     cast(int, item.presentation_context_id),
-                    cast(bytes, item.presentation_data_value),
+                    cast("_PDVValueType", item.presentation_data_value),
                 )
             )
         return primitive
@@ -1489,6 +1661,19 @@ class P_DATA_TF(PDU):
             ((6, None), "presentation_data_value_items", self._wrap_generate_items, [])
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        end = offset + 6
+        for item in self.presentation_data_value_items:
+            end = item._encode_into(buffer, end)
+
+        PACK_INTO_PDU_HEADER(buffer, offset, self.pdu_type, end - offset - 6)
+
+        return end
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1509,6 +1694,84 @@ class P_DATA_TF(PDU):
             ("presentation_data_value_items", self._wrap_encode_items, []),
         ]
 
+    def _encode_buffers(self) -> list[_BufferType]:
+        """Return the encoded PDU as a list of buffers to be sent in order.
+
+        .. versionadded:: 3.1
+
+        The presentation data values aren't copied, instead each is placed
+        in its own buffer following the header of the PDV item containing it.
+
+        Returns
+        -------
+        list[bytes | memoryview | _FileFragment]
+            The encoded PDU header, then the header and presentation data
+            value for each PDV item.
+        """
+        buffers: list[_BufferType] = [
+            PACK_PDU_HEADER(self.pdu_type, 0x00, self.pdu_length)
+        ]
+        for item in self.presentation_data_value_items:
+            buffers.append(
+                PACK_PDV_HEADER(item.item_length, item.presentation_context_id)
+            )
+            if item.presentation_data_value:
+                buffers.append(item.presentation_data_value)
+
+        return buffers
+
+    @staticmethod
+    def _decode_primitive(bytestream: bytes | memoryview) -> "P_DATA":
+        """Return a P-DATA primitive decoded directly from an encoded
+        P-DATA-TF PDU.
+
+        .. versionadded:: 3.1
+
+        Faster than :meth:`decode` followed by :meth:`to_primitive` as no
+        PDV items are created and each presentation data value is copied
+        from `bytestream` only once. The primitive holds no references to
+        `bytestream`.
+
+        Parameters
+        ----------
+        bytestream : bytes | memoryview
+            The encoded P-DATA-TF PDU, including the PDU header.
+
+        Returns
+        -------
+        pdu_primitives.P_DATA
+            The primitive representation of the PDU.
+
+        Raises
+        ------
+        ValueError
+            If a PDV item's length is inconsistent with the PDU length.
+        """
+        from pynetdicom.pdu_primitives import P_DATA
+
+        primitive = P_DATA()
+        primitive.presentation_data_value_list = []
+        pdvs = primitive.presentation_data_value_list
+
+        end = len(bytestream)
+        offset = 6
+        while offset < end:
+            if offset + 5 > end:
+                raise ValueError("The P-DATA-TF contains a truncated PDV item")
+
+            item_length, context_id = UNPACK_FROM_PDV_HEADER(bytestream, offset)
+            start = offset + 5
+            offset += 4 + item_length
+            if item_length < 2 or offset > end:
+                raise ValueError(
+                    f"The P-DATA-TF contains a PDV item with an invalid length "
+                    f"({item_length})"
+                )
+
+            pdvs.append((context_id, bytes(bytestream[start:offset])))
+
+        return primitive
+
     @staticmethod
     def _generate_items(bytestream: bytes) -> Iterator[tuple[int, bytes]]:
         """Yield the variable PDV item data from `bytestream`.
@@ -1554,7 +1817,7 @@ class P_DATA_TF(PDU):
         while bytestream[offset : offset + 1]:
             item_length = UNPACK_UINT4(bytestream[offset : offset + 4])[0]
             context_id = UNPACK_UCHAR(bytestream[offset + 4 : offset + 5])[0]
-            data = bytestream[offset + 5 : offset + 4 + item_length]
+            data = bytes(bytestream[offset + 5 : offset + 4 + item_length])
             assert len(data) == item_length - 1
             yield context_id, data
             # Change `offset` to the start of the next PDV item
@@ -1708,6 +1971,15 @@ class A_RELEASE_RQ(PDU):
         """
         return []
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_RELEASE(buffer, offset, self.pdu_type, self.pdu_length)
+
+        return offset + 10
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1843,6 +2115,15 @@ class A_RELEASE_RP(PDU):
         """
         return []
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_RELEASE(buffer, offset, self.pdu_type, self.pdu_length)
+
+        return offset + 10
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2012,6 +2293,22 @@ class A_ABORT_RQ(PDU):
             ((9, 1), "reason_diagnostic", self._wrap_unpack, [UNPACK_UCHAR]),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the PDU into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_ABORT(
+            buffer,
+            offset,
+            self.pdu_type,
+            self.pdu_length,
+            self.source,
+            self.reason_diagnostic,
+        )
+
+        return offset + 10
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
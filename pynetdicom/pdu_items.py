@@ -61,6 +61,7 @@ if TYPE_CHECKING:  # pragma: no cover
         SCP_SCU_RoleSelectionNegotiation,
         UserIdentityNegotiation,
         AsynchronousOperationsWindowNegotiation,
+        _PDVValueType,
         _UserInformationPrimitiveType,
     )
 
@@ -80,6 +81,30 @@ PACK_UCHAR = UCHAR.pack
 PACK_UINT2 = UINT2.pack
 PACK_UINT4 = UINT4.pack
 
+# Precompiled structs for encoding items directly into a buffer
+PACK_INTO_UINT2 = UINT2.pack_into
+# Item type, reserved, item length
+PACK_INTO_ITEM_HEADER = Struct(">BxH").pack_into
+# Item type, reserved, item length, a 2-byte field length
+PACK_INTO_ITEM_HEADER_LENGTH = Struct(">BxHH").pack_into
+# Item type, reserved, item length, context ID, reserved, reserved, reserved
+PACK_INTO_CONTEXT_RQ_HEADER = Struct(">BxHB3x").pack_into
+# Item type, reserved, item length, context ID, reserved, result, reserved
+PACK_INTO_CONTEXT_AC_HEADER = Struct(">BxHBxBx").pack_into
+# Item type, reserved, item length, maximum length received
+PACK_INTO_MAXIMUM_LENGTH = Struct(">BxHI").pack_into
+# Item type, reserved, item length, operations invoked, operations performed
+PACK_INTO_ASYNC_OPS_WINDOW = Struct(">BxHHH").pack_into
+# SCU role, SCP role
+PACK_INTO_ROLES = Struct("BB").pack_into
+# Item type, sub-item version, item length, SOP class UID length
+PACK_INTO_COMMON_EXT_HEADER = Struct(">BBHH").pack_into
+# Item type, reserved, item length, user identity type, positive response
+#   requested, primary field length
+PACK_INTO_USER_IDENTITY_HEADER = Struct(">BxHBBH").pack_into
+# PDV item length, context ID
+PACK_INTO_PDV_HEADER = Struct(">IB").pack_into
+
 
 _DecoderType = list[tuple[int, int | None, str, Callable[[Any], bytes], list[Any]]]
 _EncoderType = list[tuple[str, Callable[[Any], bytes], list[Any]]]
@@ -104,6 +129,16 @@ _UIType: TypeAlias = (
 )
 
 
+def _write_bytes(buffer: bytearray, offset: int, value: bytes) -> int:
+    """Write `value` to `buffer` at `offset` and return the offset following
+    it.
+    """
+    end = offset + len(value)
+    buffer[offset:end] = value
+
+    return end
+
+
 class PDUItem:
     """Base class for PDU Items and Sub-items.
 
@@ -138,20 +173,51 @@ class PDUItem:
     def encode(self) -> bytes:
         """Return the encoded PDU as bytes.
 
+        .. versionchanged:: 3.1
+
+            The item is encoded directly into a single preallocated buffer.
+
         Returns
         -------
         bytes
             The encoded PDU.
         """
-        bytestream = bytes()
+        buffer = bytearray(len(self))
+        self._encode_into(buffer, 0)
+
+        return bytes(buffer)
+
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+
+        Subclasses override this with a routine specific to the item, by
+        default the fields given by :attr:`_encoders` are encoded in turn.
+
+        Parameters
+        ----------
+        buffer : bytearray
+            The buffer to encode into, which must have at least ``len(self)``
+            bytes available starting at `offset`.
+        offset : int
+            The offset in `buffer` to start encoding at.
+
+        Returns
+        -------
+        int
+            The offset in `buffer` following the encoded item.
+        """
         for attr_name, func, args in self._encoders:
             # If attr_name is None then the field is usually reserved
             if attr_name:
-                bytestream += func(getattr(self, attr_name), *args)
+                value = func(getattr(self, attr_name), *args)
             else:
-                bytestream += func(*args)
+                value = func(*args)
 
-        return bytestream
+            offset = _write_bytes(buffer, offset, value)
+
+        return offset
 
     @property
     def _encoders(self) -> Any:
@@ -262,16 +328,16 @@ class PDUItem:
 
     @staticmethod
     def _wrap_bytes(bytestream: bytes) -> bytes:
-        """Return `bytestream` without changing it."""
-        return bytestream
+        """Return `bytestream` as :class:`bytes`."""
+        return bytes(bytestream)
 
     @staticmethod
     def _wrap_uid_bytes(bytestream: bytes) -> bytes:
         """Return `bytestream` without any trailing null padding."""
         if bytestream[-1:] == b"\x00":
-            return bytestream[:-1]
+            return bytes(bytestream[:-1])
 
-        return bytestream
+        return bytes(bytestream)
 
     @staticmethod
     def _wrap_encode_items(items: list[_AllItemType]) -> bytes:
@@ -287,11 +353,7 @@ class PDUItem:
         bytes
             The encoded items.
         """
-        bytestream = bytes()
-        for item in items:
-            bytestream += item.encode()
-
-        return bytestream
+        return b"".join(item.encode() for item in items)
 
     @staticmethod
     def _wrap_encode_str(value: str) -> bytes:
@@ -480,6 +542,16 @@ class ApplicationContextItem(PDUItem):
         """
         return [((4, None), "application_context_name", self._wrap_uid_bytes, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = self.application_context_name.encode("ascii")
+        PACK_INTO_ITEM_HEADER(buffer, offset, self.item_type, len(value))
+
+        return _write_bytes(buffer, offset + 4, value)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -674,6 +746,26 @@ class PresentationContextItemRQ(PDUItem):
             ),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        start = offset
+        offset += 8
+        for item in self.abstract_transfer_syntax_sub_items:
+            offset = item._encode_into(buffer, offset)
+
+        PACK_INTO_CONTEXT_RQ_HEADER(
+            buffer,
+            start,
+            self.item_type,
+            offset - start - 4,
+            self.presentation_context_id,
+        )
+
+        return offset
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -860,6 +952,25 @@ class PresentationContextItemAC(PDUItem):
             ((8, None), "transfer_syntax_sub_item", self._wrap_generate_items, []),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_CONTEXT_AC_HEADER(
+            buffer,
+            offset,
+            self.item_type,
+            self.item_length,
+            self.presentation_context_id,
+            self.result_reason,
+        )
+        offset += 8
+        for item in self.transfer_syntax_sub_item:
+            offset = item._encode_into(buffer, offset)
+
+        return offset
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1096,6 +1207,20 @@ class UserInformationItem(PDUItem):
         """
         return [((4, None), "user_data", self._wrap_generate_items, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        start = offset
+        offset += 4
+        for item in self.user_data:
+            offset = item._encode_into(buffer, offset)
+
+        PACK_INTO_ITEM_HEADER(buffer, start, self.item_type, offset - start - 4)
+
+        return offset
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1312,6 +1437,16 @@ class AbstractSyntaxSubItem(PDUItem):
         """
         return [((4, None), "abstract_syntax_name", self._wrap_uid_bytes, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = self.abstract_syntax_name.encode("ascii")  # type: ignore[union-attr]
+        PACK_INTO_ITEM_HEADER(buffer, offset, self.item_type, len(value))
+
+        return _write_bytes(buffer, offset + 4, value)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1438,6 +1573,16 @@ class TransferSyntaxSubItem(PDUItem):
         """
         return [((4, None), "transfer_syntax_name", self._wrap_uid_bytes, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = self.transfer_syntax_name.encode("ascii")  # type: ignore[union-attr]
+        PACK_INTO_ITEM_HEADER(buffer, offset, self.item_type, len(value))
+
+        return _write_bytes(buffer, offset + 4, value)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1596,6 +1741,17 @@ class MaximumLengthSubItem(PDUItem):
             ((4, None), "maximum_length_received", self._wrap_unpack, [UNPACK_UINT4])
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_MAXIMUM_LENGTH(
+            buffer, offset, self.item_type, 4, self.maximum_length_received
+        )
+
+        return offset + 8
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1721,6 +1877,16 @@ class ImplementationClassUIDSubItem(PDUItem):
         """
         return [((4, None), "implementation_class_uid", self._wrap_uid_bytes, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = self.implementation_class_uid.encode("ascii")  # type: ignore[union-attr]
+        PACK_INTO_ITEM_HEADER(buffer, offset, self.item_type, len(value))
+
+        return _write_bytes(buffer, offset + 4, value)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -1873,6 +2039,16 @@ class ImplementationVersionNameSubItem(PDUItem):
         """
         return [((4, None), "implementation_version_name", self._wrap_bytes, [])]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = self.implementation_version_name.encode("ascii")  # type: ignore[union-attr]
+        PACK_INTO_ITEM_HEADER(buffer, offset, self.item_type, len(value))
+
+        return _write_bytes(buffer, offset + 4, value)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2046,6 +2222,22 @@ class AsynchronousOperationsWindowSubItem(PDUItem):
             ),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        PACK_INTO_ASYNC_OPS_WINDOW(
+            buffer,
+            offset,
+            self.item_type,
+            4,
+            self.maximum_number_operations_invoked,
+            self.maximum_number_operations_performed,
+        )
+
+        return offset + 8
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2231,6 +2423,20 @@ class SCP_SCU_RoleSelectionSubItem(PDUItem):
             [UNPACK_UCHAR],
         )
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        uid = self.sop_class_uid.encode("ascii")  # type: ignore[union-attr]
+        PACK_INTO_ITEM_HEADER_LENGTH(
+            buffer, offset, self.item_type, 4 + len(uid), len(uid)
+        )
+        offset = _write_bytes(buffer, offset + 6, uid)
+        PACK_INTO_ROLES(buffer, offset, self.scu_role, self.scp_role)
+
+        return offset + 2
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2466,6 +2672,20 @@ class SOPClassExtendedNegotiationSubItem(PDUItem):
             [],
         )
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        uid = self.sop_class_uid.encode("ascii")  # type: ignore[union-attr]
+        info = bytes(self.service_class_application_information)  # type: ignore
+        PACK_INTO_ITEM_HEADER_LENGTH(
+            buffer, offset, self.item_type, 2 + len(uid) + len(info), len(uid)
+        )
+        offset = _write_bytes(buffer, offset + 6, uid)
+
+        return _write_bytes(buffer, offset, info)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2705,6 +2925,40 @@ class SOPClassCommonExtendedNegotiationSubItem(PDUItem):
             [],
         )
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        start = offset
+        sop_class_uid = self.sop_class_uid.encode("ascii")  # type: ignore
+        offset = _write_bytes(buffer, offset + 6, sop_class_uid)
+
+        service_class_uid = self.service_class_uid.encode("ascii")  # type: ignore
+        PACK_INTO_UINT2(buffer, offset, len(service_class_uid))
+        offset = _write_bytes(buffer, offset + 2, service_class_uid)
+
+        # The length of the related general SOP class identification is
+        #   written once its UIDs have been
+        related_start = offset
+        offset += 2
+        for uid in self.related_general_sop_class_identification:
+            value = uid.encode("ascii")
+            PACK_INTO_UINT2(buffer, offset, len(value))
+            offset = _write_bytes(buffer, offset + 2, value)
+
+        PACK_INTO_UINT2(buffer, related_start, offset - related_start - 2)
+        PACK_INTO_COMMON_EXT_HEADER(
+            buffer,
+            start,
+            self.item_type,
+            self.sub_item_version,
+            offset - start - 4,
+            len(sop_class_uid),
+        )
+
+        return offset
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -2777,7 +3031,7 @@ class SOPClassCommonExtendedNegotiationSubItem(PDUItem):
                 raw_uid = raw_uid[:-1]
                 stripped_uid_length = uid_length - 1
 
-            uid = UID(decode_bytes(raw_uid))
+            uid = UID(decode_bytes(bytes(raw_uid)))
             assert len(uid) == stripped_uid_length
             yield uid
             offset += 2 + uid_length
@@ -3067,6 +3321,27 @@ class UserIdentitySubItemRQ(PDUItem):
             [],
         )
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        primary_field = bytes(self.primary_field)  # type: ignore[arg-type]
+        secondary_field = bytes(self.secondary_field)  # type: ignore[arg-type]
+        PACK_INTO_USER_IDENTITY_HEADER(
+            buffer,
+            offset,
+            self.item_type,
+            6 + len(primary_field) + len(secondary_field),
+            self.user_identity_type,
+            self.positive_response_requested,
+            len(primary_field),
+        )
+        offset = _write_bytes(buffer, offset + 8, primary_field)
+        PACK_INTO_UINT2(buffer, offset, len(secondary_field))
+
+        return _write_bytes(buffer, offset + 2, secondary_field)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -3268,6 +3543,22 @@ class UserIdentitySubItemAC(PDUItem):
             ((6, None), "server_response", self._wrap_bytes, []),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        server_response = bytes(self.server_response)  # type: ignore[arg-type]
+        PACK_INTO_ITEM_HEADER_LENGTH(
+            buffer,
+            offset,
+            self.item_type,
+            2 + len(server_response),
+            len(server_response),
+        )
+
+        return _write_bytes(buffer, offset + 6, server_response)
+
     @property
     def _encoders(self) -> Any:
         """Return an iterable of tuples that contain field decoders.
@@ -3366,7 +3657,7 @@ class PresentationDataValueItem(PDUItem):
     def __init__(self) -> None:
         """Initialise a new Presentation Data Value Item."""
         self.presentation_context_id: int | None = None
-        self.presentation_data_value: bytes | None = None
+        self.presentation_data_value: _PDVValueType | None = None
 
     @property
     def context_id(self) -> int | None:
@@ -3374,7 +3665,7 @@ class PresentationDataValueItem(PDUItem):
         return self.presentation_context_id
 
     @property
-    def data(self) -> bytes | None:
+    def data(self) -> "_PDVValueType | None":
         """Return the item's *Presentation Data Value* field value."""
         return self.presentation_data_value
 
@@ -3399,6 +3690,22 @@ class PresentationDataValueItem(PDUItem):
             ((5, None), "presentation_data_value", self._wrap_bytes, []),
         ]
 
+    def _encode_into(self, buffer: bytearray, offset: int) -> int:
+        """Encode the item into `buffer` starting at `offset`.
+
+        .. versionadded:: 3.1
+        """
+        value = cast("_PDVValueType", self.presentation_data_value)
+        if not isinstance(value, (bytes, bytearray, memoryview)):
+            # Values stored in a file
+            value = bytes(value)
+
+        PACK_INTO_PDV_HEADER(
+            buffer, offset, 1 + len(value), self.presentation_context_id
+        )
+
+        return _write_bytes(buffer, offset + 5, value)
+
     @property
     def _encoders(self) -> list[tuple[str, Callable, list[Any]]]:
         """Return an iterable of tuples that contain field decoders.
@@ -3437,14 +3744,14 @@ class PresentationDataValueItem(PDUItem):
     def message_control_header_byte(self) -> str:
         """Return the message control header byte as a formatted string."""
         if self.presentation_data_value:
-            return f"{ord(self.presentation_data_value[0:1]):08b}"
+            return f"{bytes(self.presentation_data_value)[0]:08b}"
 
         raise ValueError("No *Presentation Data Value* field value")
 
     def __str__(self) -> str:
         """Return a string representation of the Item."""
         pdv_samples = " ".join(
-            f"0x{b:02X}" for b in self.presentation_data_value[:10]  # type: ignore
+            f"0x{b:02X}" for b in bytes(self.presentation_data_value)[:10]  # type: ignore
         )
         s = [
             "Presentation Value Data Item",
@@ -24,12 +24,15 @@ from pynetdicom.utils import validate_uid, decode_bytes, set_ae, set_uid
 from pynetdicom._globals import DEFAULT_MAX_LENGTH
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pynetdicom.dimse_messages import _FileFragment
     from pynetdicom.transport import AddressInformation
 
 
 LOGGER = logging.getLogger(__name__)
 
 _PDUPrimitiveType: TypeAlias = "A_ASSOCIATE | A_RELEASE | A_ABORT | A_P_ABORT | P_DATA"
+# A P-DATA presentation data value, either encoded or stored in a file
+_PDVValueType: TypeAlias = "bytes | _FileFragment"
 _UserInformationPrimitiveType = list[
     "MaximumLengthNotification | ImplementationClassUIDNotification | "
     "ImplementationVersionNameNotification | AsynchronousOperationsWindowNegotiation | "
@@ -889,10 +892,10 @@ class P_DATA:
     """
 
     def __init__(self) -> None:
-        self._presentation_data_value_list: list[tuple[int, bytes]] = []
+        self._presentation_data_value_list: list[tuple[int, _PDVValueType]] = []
 
     @property
-    def presentation_data_value_list(self) -> list[tuple[int, bytes]]:
+    def presentation_data_value_list(self) -> list[tuple[int, _PDVValueType]]:
         """Get or set the *Presentation Data Value List*.
 
         Parameters
@@ -907,12 +910,18 @@ class P_DATA:
         return self._presentation_data_value_list
 
     @presentation_data_value_list.setter
-    def presentation_data_value_list(self, value_list: list[tuple[int, bytes]]) -> None:
+    def presentation_data_value_list(
+        self, value_list: list[tuple[int, _PDVValueType]]
+    ) -> None:
         """Set the Presentation Data Value List."""
+        from pynetdicom.dimse_messages import _FileFragment
+
         if isinstance(value_list, list):
             for pdv in value_list:
                 if isinstance(pdv, list):
-                    if isinstance(pdv[0], int) and isinstance(pdv[1], bytes):
+                    if isinstance(pdv[0], int) and isinstance(
+                        pdv[1], (bytes, _FileFragment)
+                    ):
                         pass
                     else:
                         raise TypeError(
@@ -936,7 +945,7 @@ class P_DATA:
         """String representation of the class."""
         s = "P-DATA\n"
         for pdv in self.presentation_data_value_list:
-            header_byte = pdv[1][0]
+            header_byte = bytes(pdv[1])[0]
             s += f"  Context ID: {pdv[0]}\n"
             s += f"  Value Length: {len(pdv[1])} bytes\n"
             s += f"  Message Control Header Byte: {header_byte:08b}\n"
@@ -0,0 +1,466 @@
+"""A pool of established requestor associations that may be reused.
+
+.. versionadded:: 3.1
+
+Requesting an association requires a TCP connection to be made and the
+association to be negotiated before any messages can be sent, which can take
+longer than the exchange of small messages that follows. An
+:class:`AssociationPool` keeps associations open after they've been used so
+that later requests to the same peer with the same presentation contexts can
+skip straight to sending messages.
+
+Examples
+--------
+
+Send a C-STORE request to a peer using a pooled association::
+
+    from pydicom import dcmread
+
+    from pynetdicom import AE
+    from pynetdicom.pool import AssociationPool
+    from pynetdicom.sop_class import CTImageStorage
+
+    ae = AE()
+    ae.add_requested_context(CTImageStorage)
+    pool = AssociationPool(ae, max_per_peer=2, idle_timeout=30)
+
+    ds = dcmread("path/to/file.dcm")
+    with pool.association("127.0.0.1", 11112) as assoc:
+        if assoc.is_established:
+            status = assoc.send_c_store(ds)
+
+    pool.shutdown()
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, cast
+
+from pynetdicom.association import Association
+from pynetdicom.presentation import PresentationContext
+from pynetdicom.sop_class import Verification  # type: ignore
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pynetdicom.ae import ApplicationEntity
+
+
+LOGGER = logging.getLogger(__name__)
+
+_PeerType = tuple[str | tuple[str, int, int], int, str]
+_PoolKeyType = tuple[_PeerType, tuple[tuple[Any, ...], ...]]
+
+
+class AssociationPool:
+    """A pool of established requestor associations.
+
+    .. versionadded:: 3.1
+
+    Associations are keyed on the peer's (address, port, AE title) and the
+    requested presentation contexts, and an association is only handed out
+    again for requests with the same key. Pooled associations are checked
+    before being handed out and are released once they've been idle for
+    longer than `idle_timeout`.
+
+    Attributes
+    ----------
+    ae : ae.ApplicationEntity
+        The AE used to request new associations.
+    echo : bool
+        If ``True`` then an idle association is checked by sending a C-ECHO
+        request before being handed out, provided the *Verification SOP
+        Class* was accepted for it, otherwise only check that it's still
+        established.
+    idle_timeout : float | None
+        The maximum amount of time (in seconds) an association may be idle
+        before being released, or ``None`` to keep idle associations open
+        indefinitely.
+    max_per_peer : int
+        The maximum number of associations, both idle and in use, with each
+        peer.
+    timeout : float | None
+        The maximum amount of time (in seconds) :meth:`acquire` will wait for
+        an association with the peer to become available, or ``None`` to wait
+        indefinitely.
+    """
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        max_per_peer: int = 4,
+        idle_timeout: float | None = 60,
+        echo: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Create a new pool.
+
+        Parameters
+        ----------
+        ae : ae.ApplicationEntity
+            The AE to use when requesting new associations.
+        max_per_peer : int, optional
+            The maximum number of associations with each peer (default ``4``).
+        idle_timeout : float | None, optional
+            The maximum amount of time (in seconds) an association may be idle
+            before being released (default ``60``), or ``None`` for no limit.
+        echo : bool, optional
+            If ``True`` then check idle associations by sending a C-ECHO
+            request before handing them out (default ``False``).
+        timeout : float | None, optional
+            The maximum amount of time (in seconds) to wait for an association
+            with a peer to become available when there are already
+            `max_per_peer` associations with it, or ``None`` to wait
+            indefinitely (default).
+        """
+        if max_per_peer < 1:
+            raise ValueError("'max_per_peer' must be at least 1")
+
+        self.ae = ae
+        self.max_per_peer = max_per_peer
+        self.idle_timeout = idle_timeout
+        self.echo = echo
+        self.timeout = timeout
+
+        self._condition = threading.Condition()
+        # {key: [(association, time returned to the pool)]}, most recent last
+        self._idle: dict[_PoolKeyType, list[tuple[Association, float]]] = {}
+        # {association: key} for the associations that have been handed out
+        self._in_use: dict[Association, _PoolKeyType] = {}
+        # {peer: number of idle and in use associations}
+        self._counts: dict[_PeerType, int] = {}
+
+        self._is_shutdown = False
+        self._stop = threading.Event()
+        self._eviction_thread: threading.Thread | None = None
+
+    def acquire(
+        self,
+        addr: str | tuple[str, int, int],
+        port: int,
+        contexts: list[PresentationContext] | None = None,
+        ae_title: str = "ANY-SCP",
+        **kwargs: Any,
+    ) -> Association:
+        """Return an established association with a peer, reusing an idle
+        association from the pool if there's a suitable one.
+
+        The association should be returned to the pool using :meth:`release`
+        once it's no longer needed.
+
+        Parameters
+        ----------
+        addr : str | tuple[str, int, int]
+            The peer AE's TCP/IP address.
+        port : int
+            The peer AE's listen port number.
+        contexts : list of presentation.PresentationContext, optional
+            The presentation contexts to request, if not used then the AE's
+            :attr:`~pynetdicom.ae.ApplicationEntity.requested_contexts` will
+            be requested instead.
+        ae_title : str, optional
+            The peer's AE title (default ``'ANY-SCP'``).
+        **kwargs
+            Other keyword parameters to pass to
+            :meth:`AE.associate()<pynetdicom.ae.ApplicationEntity.associate>`.
+            These are only used when a new association is requested and don't
+            form part of the key used to find a pooled association.
+
+        Returns
+        -------
+        association.Association
+            The association, which won't be established if a new association
+            was required and the peer didn't accept it.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been shutdown or if :attr:`timeout` was reached
+            before an association with the peer became available.
+        """
+        if contexts is None:
+            contexts = self.ae.requested_contexts
+
+        peer: _PeerType = (addr, port, ae_title)
+        key: _PoolKeyType = (
+            peer,
+            tuple(
+                (
+                    cx.abstract_syntax,
+                    tuple(cx.transfer_syntax),
+                    cx.scu_role,
+                    cx.scp_role,
+                )
+                for cx in contexts
+            ),
+        )
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            assoc, expired = self._reserve(key, deadline)
+            for idle in expired:
+                self._close(idle)
+
+            if assoc is None:
+                break
+
+            if self._is_usable(assoc):
+                LOGGER.debug("Reusing a pooled association")
+                return assoc
+
+            # No longer usable, so free up its place and try again
+            self.release(assoc, reuse=False)
+
+        try:
+            assoc = self.ae.associate(addr, port, contexts, ae_title, **kwargs)
+        except BaseException:
+            self._unreserve(peer)
+            raise
+
+        if not assoc.is_established:
+            self._unreserve(peer)
+            return assoc
+
+        with self._condition:
+            self._in_use[assoc] = key
+
+        return assoc
+
+    @contextmanager
+    def association(
+        self,
+        addr: str | tuple[str, int, int],
+        port: int,
+        contexts: list[PresentationContext] | None = None,
+        ae_title: str = "ANY-SCP",
+        **kwargs: Any,
+    ) -> Iterator[Association]:
+        """Return a context manager that acquires an association from the pool
+        and returns it afterwards.
+
+        The association won't be reused if an exception is raised within the
+        context. See :meth:`acquire` for the parameters.
+
+        Yields
+        ------
+        association.Association
+            The association, which won't be established if a new association
+            was required and the peer didn't accept it.
+        """
+        assoc = self.acquire(addr, port, contexts, ae_title, **kwargs)
+        try:
+            yield assoc
+        except BaseException:
+            self.release(assoc, reuse=False)
+            raise
+
+        self.release(assoc)
+
+    def clear(self) -> None:
+        """Release all the idle associations in the pool."""
+        idle: list[Association] = []
+        with self._condition:
+            for key, items in self._idle.items():
+                idle.extend(assoc for assoc, _ in items)
+                for _ in items:
+                    self._remove(key[0])
+
+            self._idle = {}
+            self._condition.notify_all()
+
+        for assoc in idle:
+            self._close(assoc)
+
+    def _close(self, assoc: Association) -> None:
+        """Release `assoc`, which is no longer in the pool."""
+        if assoc.is_established:
+            LOGGER.debug("Releasing a pooled association")
+            assoc.release()
+
+    def _evict(self, now: float) -> list[Association]:
+        """Remove the idle associations that have expired or are no longer
+        established and return them.
+
+        Must be called with the lock held.
+        """
+        evicted = []
+        for key in list(self._idle):
+            items = self._idle[key]
+            keep = []
+            for assoc, returned in items:
+                if not assoc.is_established or (
+                    self.idle_timeout is not None
+                    and now - returned >= self.idle_timeout
+                ):
+                    evicted.append(assoc)
+                    self._remove(key[0])
+                else:
+                    keep.append((assoc, returned))
+
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+
+        if evicted:
+            self._condition.notify_all()
+
+        return evicted
+
+    def _is_usable(self, assoc: Association) -> bool:
+        """Return ``True`` if the idle association `assoc` may be reused."""
+        if not assoc.is_established or not assoc.is_alive():
+            return False
+
+        if not self.echo:
+            return True
+
+        if Verification not in {cx.abstract_syntax for cx in assoc.accepted_contexts}:
+            return True
+
+        status = assoc.send_c_echo()
+        return bool(status) and status.get("Status") == 0x0000
+
+    def release(self, assoc: Association, reuse: bool = True) -> None:
+        """Return an association acquired from the pool.
+
+        Parameters
+        ----------
+        assoc : association.Association
+            The association to return. If it wasn't acquired from the pool
+            then it'll be released instead.
+        reuse : bool, optional
+            If ``True`` (default) then keep the association open so it can be
+            reused, otherwise release it.
+        """
+        with self._condition:
+            key = self._in_use.pop(assoc, None)
+            if key is not None:
+                if reuse and assoc.is_established and not self._is_shutdown:
+                    items = self._idle.setdefault(key, [])
+                    items.append((assoc, time.monotonic()))
+                    self._condition.notify_all()
+                    self._start_eviction()
+                    return
+
+                self._remove(key[0])
+                self._condition.notify_all()
+
+        self._close(assoc)
+
+    def _remove(self, peer: _PeerType) -> None:
+        """Remove an association from the count of associations with `peer`.
+
+        Must be called with the lock held.
+        """
+        self._counts[peer] -= 1
+        if not self._counts[peer]:
+            del self._counts[peer]
+
+    def _reserve(
+        self, key: _PoolKeyType, deadline: float | None
+    ) -> tuple[Association | None, list[Association]]:
+        """Return an idle association for `key` or reserve a place for a new
+        association with the peer, waiting until `deadline` if the peer
+        already has the maximum number of associations.
+
+        Returns
+        -------
+        tuple[Association | None, list[Association]]
+            The idle association to use, or ``None`` if a new one should be
+            requested, and any evicted associations that need to be released.
+        """
+        peer = key[0]
+        evicted: list[Association] = []
+        with self._condition:
+            while True:
+                if self._is_shutdown:
+                    raise RuntimeError("The association pool has been shutdown")
+
+                evicted.extend(self._evict(time.monotonic()))
+                items = self._idle.get(key)
+                if items:
+                    assoc, _ = items.pop()
+                    if not items:
+                        del self._idle[key]
+
+                    self._in_use[assoc] = key
+                    return assoc, evicted
+
+                if self._counts.get(peer, 0) < self.max_per_peer:
+                    self._counts[peer] = self._counts.get(peer, 0) + 1
+                    return None, evicted
+
+                # Make room by evicting the least recently used idle
+                #   association with the peer that has different contexts
+                candidates = [
+                    (items[0][1], other)
+                    for other, items in self._idle.items()
+                    if other[0] == peer
+                ]
+                if candidates:
+                    _, other = min(candidates)
+                    items = self._idle[other]
+                    evicted.append(items.pop(0)[0])
+                    if not items:
+                        del self._idle[other]
+
+                    return None, evicted
+
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        raise RuntimeError(
+                            "Timed out waiting for an association with the peer "
+                            "to become available"
+                        )
+
+                self._condition.wait(timeout)
+
+    def _run_eviction(self) -> None:
+        """Periodically release the idle associations that have expired."""
+        interval = max(cast(float, self.idle_timeout) / 2, 0.05)
+        while not self._stop.wait(interval):
+            with self._condition:
+                evicted = self._evict(time.monotonic())
+
+            for assoc in evicted:
+                self._close(assoc)
+
+    def shutdown(self) -> None:
+        """Release the idle associations and stop the pool.
+
+        Associations that are in use will be released when they're returned
+        to the pool.
+        """
+        with self._condition:
+            self._is_shutdown = True
+            self._condition.notify_all()
+
+        self._stop.set()
+        self.clear()
+
+    def _start_eviction(self) -> None:
+        """Start the thread that releases expired idle associations, if it's
+        needed and not already running.
+
+        Must be called with the lock held.
+        """
+        if self.idle_timeout is None or self._eviction_thread is not None:
+            return
+
+        timestamp = datetime.strftime(datetime.now(), "%Y%m%d%H%M%S")
+        self._eviction_thread = threading.Thread(
+            target=self._run_eviction, name=f"AssociationPool@{timestamp}"
+        )
+        self._eviction_thread.daemon = True
+        self._eviction_thread.start()
+
+    def _unreserve(self, peer: _PeerType) -> None:
+        """Free the place reserved for a new association with `peer`."""
+        with self._condition:
+            self._remove(peer)
+            self._condition.notify_all()
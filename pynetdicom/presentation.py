@@ -1,5 +1,6 @@
 """Implementation of the Presentation service."""
 
+from copy import copy
 import logging
 from typing import TYPE_CHECKING, NamedTuple, cast
 
@@ -501,6 +502,33 @@ CXNegotiationReturn = tuple[
 ]
 
 
+def _copy_contexts(contexts: ListCXType) -> ListCXType:
+    """Return copies of the presentation contexts in `contexts`.
+
+    .. versionadded:: 3.1
+
+    Equivalent to :func:`copy.deepcopy` but much faster, as the list of
+    transfer syntaxes is the only mutable value of a context.
+
+    Parameters
+    ----------
+    contexts : list of presentation.PresentationContext
+        The presentation contexts to copy.
+
+    Returns
+    -------
+    list of presentation.PresentationContext
+        The copied presentation contexts.
+    """
+    copied = []
+    for context in contexts:
+        context = copy(context)
+        context._transfer_syntax = context._transfer_syntax[:]
+        copied.append(context)
+
+    return copied
+
+
 def negotiate_unrestricted(
     rq_contexts: ListCXType, ac_contexts: ListCXType, roles: RoleType = None
 ) -> CXNegotiationReturn:
@@ -1558,6 +1558,10 @@ class StorageServiceClass(ServiceClass):
                     # not be deleted while in use.
                     pass
 
+        # Discard any of a streamed dataset the handler didn't read
+        if req._dataset_stream is not None:
+            req._dataset_stream.close()
+
         # Exception in context or handler aborted/released
         if not ctx.success or not self.assoc.is_established:
             return
@@ -2156,13 +2160,28 @@ class QueryRetrieveServiceClass(ServiceClass):
             if len(destination) >= 3 and destination[2]:
                 kwargs.update(destination[2])
 
-            store_assoc = self.ae.associate(
-                destination[0], destination[1], **kwargs  # type: ignore
-            )
+            pool = self.ae.association_pool
+            if pool is not None:
+                store_assoc = pool.acquire(
+                    destination[0], destination[1], **kwargs  # type: ignore
+                )
+            else:
+                store_assoc = self.ae.associate(
+                    destination[0], destination[1], **kwargs  # type: ignore
+                )
 
         if not ctx.success:
             return
 
+        def release_store_assoc() -> None:
+            """Release the association with the Move Destination or return it
+            to the pool.
+            """
+            if pool is not None:
+                pool.release(store_assoc)
+            else:
+                store_assoc.release()
+
         if not store_assoc.is_established:
             # Failed to associate with Move Destination AE
             LOGGER.error("Move SCP: Unable to associate with destination AE")
@@ -2208,7 +2227,7 @@ class QueryRetrieveServiceClass(ServiceClass):
 
             # Event handler has aborted or released - during any status yields
             if not self.assoc.is_established:
-                store_assoc.release()
+                release_store_assoc()
                 return
 
             # All sub-operations are complete
@@ -2226,7 +2245,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                 status = self.statuses[rsp.Status]
             else:
                 # Unknown status
-                store_assoc.release()
+                release_store_assoc()
                 self.dimse.send_msg(rsp, cx_id)
                 return
 
@@ -2238,7 +2257,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                 #   'FailedSOPInstanceUIDList' element
                 LOGGER.info("Received C-CANCEL-MOVE RQ from peer")
                 LOGGER.info(f"Move SCP Response {ii + 1}: 0x{rsp.Status:04X} (Cancel)")
-                store_assoc.release()
+                release_store_assoc()
 
                 # In case user didn't include it
                 if (
@@ -2270,7 +2289,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                     f"Move SCP Response {ii + 1}: 0x{rsp.Status:04X} "
                     f"({status[0]} - {status[1]})"
                 )
-                store_assoc.release()
+                release_store_assoc()
 
                 # In case user didn't include it
                 if (
@@ -2296,7 +2315,7 @@ class QueryRetrieveServiceClass(ServiceClass):
                 return
             elif status[0] == STATUS_SUCCESS:
                 # If Success, then dataset is None
-                store_assoc.release()
+                release_store_assoc()
 
                 # If the user yields Success, check it
                 if store_results[1] or store_results[2]:
@@ -2397,7 +2416,7 @@ class QueryRetrieveServiceClass(ServiceClass):
 
                 self.dimse.send_msg(rsp, cx_id)
 
-        store_assoc.release()
+        release_store_assoc()
 
         # Event handler has aborted or released - after any yields
         if not self.assoc.is_established:
@@ -117,6 +117,7 @@ class DummyAssociation:
         self.is_acceptor = False
         self.is_requestor = True
         self._handlers = {}
+        self._reactor_wakeup = threading.Event()
 
     def abort(self):
         self.is_aborted = True
@@ -1955,7 +1956,7 @@ class TestAsyncOpsNegotiation:
         port = get_port()
 
         def handle(event):
-            return event.invoked, event.performed
+            return event.nr_invoked, event.nr_performed
 
         handlers = [(evt.EVT_ASYNC_OPS, handle)]
 
@@ -1975,8 +1976,36 @@ class TestAsyncOpsNegotiation:
         assoc = ae.associate("localhost", port, ext_neg=ext_neg)
 
         assert assoc.is_established
-        # Because pynetdicom doesn't support async ops this is always 1, 1
-        assert assoc.acceptor.asynchronous_operations == (1, 1)
+        assert assoc.acceptor.asynchronous_operations == (0, 2)
+
+        assoc.release()
+
+        scp.shutdown()
+
+    def test_req_response_narrowed(self):
+        """Test the acceptor doesn't offer more operations than requested"""
+        port = get_port()
+
+        def handle(event):
+            return 10, 0
+
+        handlers = [(evt.EVT_ASYNC_OPS, handle)]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(("localhost", port), block=False, evt_handlers=handlers)
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+
+        item = AsynchronousOperationsWindowNegotiation()
+        item.maximum_number_operations_invoked = 4
+        item.maximum_number_operations_performed = 2
+
+        assoc = ae.associate("localhost", port, ext_neg=[item])
+
+        assert assoc.is_established
+        assert assoc.acceptor.asynchronous_operations == (4, 2)
 
         assoc.release()
 
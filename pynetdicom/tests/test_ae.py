@@ -1,5 +1,6 @@
 """Tests for the ae module."""
 
+from copy import deepcopy
 import logging
 import os
 import signal
@@ -26,8 +27,14 @@ from pynetdicom import (
     StoragePresentationContexts,
     VerificationPresentationContexts,
 )
+from pynetdicom.pdu import A_ASSOCIATE_RQ
+from pynetdicom.pdu_primitives import (
+    AsynchronousOperationsWindowNegotiation,
+    UserIdentityNegotiation,
+)
+from pynetdicom.pool import AssociationPool
 from pynetdicom.presentation import build_context
-from pynetdicom.sop_class import RTImageStorage, Verification
+from pynetdicom.sop_class import CTImageStorage, RTImageStorage, Verification
 from pynetdicom.transport import AssociationServer, RequestHandler
 
 from .utils import get_port
@@ -485,6 +492,88 @@ class TestAEGoodAssociation:
 
         scp.shutdown()
 
+    def test_associate_request_template(self):
+        """Check repeated requests reuse a prebuilt A-ASSOCIATE-RQ"""
+        requests = []
+
+        def handle(event):
+            if isinstance(event.pdu, A_ASSOCIATE_RQ):
+                requests.append(event.pdu.encode())
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_supported_context(RTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_PDU_RECV, handle)],
+        )
+
+        ae.add_requested_context(Verification)
+        ae.add_requested_context(RTImageStorage)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assoc.release()
+
+        assert len(ae._request_templates) == 1
+        contexts, template = list(ae._request_templates.values())[0]
+        assert [cx.context_id for cx in contexts] == [1, 3]
+        assert assoc._request_pdu is not template
+        assert assoc._request_pdu.variable_items is template.variable_items
+
+        # Only the Called AE Title differs
+        assoc = ae.associate("localhost", get_port(), ae_title="OTHER-SCP")
+        assert assoc.is_established
+        assert assoc._request_pdu.variable_items is template.variable_items
+        assert assoc._request_pdu.called_ae_title == "OTHER-SCP"
+        cx = assoc.requestor.requested_contexts
+        assert [c.context_id for c in cx] == [1, 3]
+        assert [c.abstract_syntax for c in cx] == [Verification, RTImageStorage]
+        assert cx[0] is not contexts[0]
+        assert cx[0].transfer_syntax is not contexts[0].transfer_syntax
+        assert len(assoc.accepted_contexts) == 2
+        assoc.release()
+
+        assert len(ae._request_templates) == 1
+        assert requests[0][:10] == requests[1][:10]
+        assert requests[1][10:26] == b"OTHER-SCP       "
+        assert requests[0][26:] == requests[1][26:]
+
+        # Any other change requires a new template
+        assoc = ae.associate("localhost", get_port(), max_pdu=12345)
+        assert assoc.is_established
+        assert assoc.requestor.maximum_length == 12345
+        assoc.release()
+
+        assert len(ae._request_templates) == 2
+
+        scp.shutdown()
+
+    def test_associate_request_template_user_identity(self):
+        """Check requests with user identity negotiation aren't cached"""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(Verification)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        item = UserIdentityNegotiation()
+        item.user_identity_type = 1
+        item.primary_field = b"username"
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port(), ext_neg=[item])
+        assert assoc.is_established
+        assert assoc._request_pdu is None
+        assert ae._request_templates == {}
+        assoc.release()
+
+        scp.shutdown()
+
     def test_associate_max_pdu(self):
         """Check Association has correct max PDUs on either end"""
         self.ae = ae = AE()
@@ -835,6 +924,26 @@ class TestAEGoodMiscSetters:
         ae.maximum_associations = 5
         assert ae.maximum_associations == 5
 
+    def test_max_buffered(self, caplog):
+        """Check AE maximum buffered bytes and messages"""
+        ae = AE()
+        assert ae.maximum_buffered_bytes is None
+        assert ae.maximum_buffered_messages is None
+
+        ae.maximum_buffered_bytes = 1024
+        ae.maximum_buffered_messages = 10
+        assert ae.maximum_buffered_bytes == 1024
+        assert ae.maximum_buffered_messages == 10
+
+        with caplog.at_level(logging.WARNING, logger="pynetdicom"):
+            ae.maximum_buffered_bytes = 0
+            ae.maximum_buffered_messages = "10"
+
+        assert ae.maximum_buffered_bytes is None
+        assert ae.maximum_buffered_messages is None
+        assert "maximum_buffered_bytes set to None" in caplog.text
+        assert "maximum_buffered_messages set to None" in caplog.text
+
     def test_max_pdu_good(self):
         """Check AE maximum pdu size change produces good value"""
         ae = AE()
@@ -845,6 +954,39 @@ class TestAEGoodMiscSetters:
         ae.maximum_pdu_size = 5000
         assert ae.maximum_pdu_size == 5000
 
+    def test_store_recv_spool(self, tmp_path):
+        """Check AE store_recv_spool_* change produces good value"""
+        ae = AE()
+        assert ae.store_recv_spool_threshold is None
+        assert ae.store_recv_spool_dir is None
+        ae.store_recv_spool_threshold = -10
+        assert ae.store_recv_spool_threshold is None
+        ae.store_recv_spool_threshold = 0
+        assert ae.store_recv_spool_threshold == 0
+        ae.store_recv_spool_threshold = 1024
+        assert ae.store_recv_spool_threshold == 1024
+        ae.store_recv_spool_threshold = None
+        assert ae.store_recv_spool_threshold is None
+
+        ae.store_recv_spool_dir = str(tmp_path)
+        assert ae.store_recv_spool_dir == tmp_path
+        ae.store_recv_spool_dir = None
+        assert ae.store_recv_spool_dir is None
+
+    def test_association_pool(self):
+        """Check AE association_pool change produces good value"""
+        ae = AE()
+        assert ae.association_pool is None
+        pool = AssociationPool(ae)
+        ae.association_pool = pool
+        assert ae.association_pool is pool
+        ae.association_pool = None
+        assert ae.association_pool is None
+
+        msg = r"'association_pool' must be an AssociationPool or None"
+        with pytest.raises(TypeError, match=msg):
+            ae.association_pool = "pool"
+
     def test_require_calling_aet(self):
         """Test AE.require_calling_aet"""
         self.ae = ae = AE()
@@ -1545,6 +1687,68 @@ class TestAESupportedPresentationContexts:
 
         assert self.ae.supported_contexts == []
 
+    def test_negotiation_results(self):
+        """Test negotiation results are cached and returned as copies."""
+        self.ae.add_supported_context(Verification)
+        self.ae.add_supported_context(RTImageStorage, scu_role=True, scp_role=True)
+        rq_contexts = [build_context(Verification), build_context(RTImageStorage)]
+        rq_contexts[0].context_id = 1
+        rq_contexts[1].context_id = 3
+        ac_contexts = self.ae.supported_contexts
+        rq_roles = {RTImageStorage: (True, False)}
+
+        contexts, roles = self.ae._negotiate_as_acceptor(
+            rq_contexts, ac_contexts, rq_roles
+        )
+        assert len(self.ae._negotiation_results) == 1
+        assert [cx.result for cx in contexts] == [0x00, 0x00]
+        assert roles[0].sop_class_uid == RTImageStorage
+
+        cached_contexts, cached_roles = self.ae._negotiate_as_acceptor(
+            rq_contexts, ac_contexts, rq_roles
+        )
+        assert len(self.ae._negotiation_results) == 1
+        for cx, cached in zip(contexts, cached_contexts):
+            assert cached is not cx
+            assert vars(cached) == vars(cx)
+
+        assert cached_roles[0] is not roles[0]
+        assert cached_roles[0].scu_role == roles[0].scu_role
+        assert cached_roles[0].scp_role == roles[0].scp_role
+
+        # Different roles
+        self.ae._negotiate_as_acceptor(rq_contexts, ac_contexts, {})
+        assert len(self.ae._negotiation_results) == 2
+
+        # Different proposed contexts
+        rq_contexts[1].transfer_syntax = [ImplicitVRLittleEndian]
+        self.ae._negotiate_as_acceptor(rq_contexts, ac_contexts, {})
+        assert len(self.ae._negotiation_results) == 3
+
+    def test_negotiation_results_invalidated(self):
+        """Test cached negotiation results are cleared on changes."""
+        self.ae.add_supported_context(Verification)
+        rq_contexts = [build_context(Verification)]
+        rq_contexts[0].context_id = 1
+
+        def negotiate():
+            self.ae._negotiate_as_acceptor(rq_contexts, self.ae.supported_contexts)
+
+        negotiate()
+        assert len(self.ae._negotiation_results) == 1
+        self.ae.add_supported_context(RTImageStorage)
+        assert self.ae._negotiation_results == {}
+
+        negotiate()
+        assert len(self.ae._negotiation_results) == 1
+        self.ae.remove_supported_context(RTImageStorage)
+        assert self.ae._negotiation_results == {}
+
+        negotiate()
+        assert len(self.ae._negotiation_results) == 1
+        self.ae.supported_contexts = []
+        assert self.ae._negotiation_results == {}
+
 
 class TestAERequestedPresentationContexts:
     """Tests for AE's presentation contexts when acting as an SCU"""
@@ -1887,3 +2091,216 @@ class TestAERequestedPresentationContexts:
         context = self.ae.requested_contexts[0]
         assert context.transfer_syntax == DEFAULT_TRANSFER_SYNTAXES
         assert context.abstract_syntax == "1.2.840.10008.5.1.4.1.1.481.1"
+
+
+class TestSendMany:
+    """Tests for AE.send_many()"""
+
+    def setup_method(self):
+        self.ae = None
+        self.requests = []
+        self.stored = []
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def start_scp(self, handle_store=None):
+        def handle_requested(event):
+            self.requests.append(event.assoc)
+
+        def default_store(event):
+            self.stored.append(event.request.AffectedSOPInstanceUID)
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(RTImageStorage, ImplicitVRLittleEndian)
+        handlers = [
+            (evt.EVT_C_STORE, handle_store or default_store),
+            (evt.EVT_REQUESTED, handle_requested),
+        ]
+        return ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+    def datasets(self, nr):
+        for ii in range(nr):
+            ds = deepcopy(DATASET)
+            ds.SOPInstanceUID = f"1.2.3.{ii}"
+            yield ds
+
+    def test_send(self):
+        """Test sending datasets using several associations."""
+        scp = self.start_scp()
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        results = list(
+            ae.send_many(self.datasets(20), "localhost", get_port(), n_associations=3)
+        )
+        assert len(results) == 20
+        assert all(status.Status == 0x0000 for _, status in results)
+        uids = sorted(ds.SOPInstanceUID for ds, _ in results)
+        assert uids == sorted(f"1.2.3.{ii}" for ii in range(20))
+        assert sorted(self.stored) == uids
+        assert 1 <= len(self.requests) <= 3
+
+        time.sleep(0.1)
+        assert ae.active_associations == []
+        scp.shutdown()
+
+    def test_retry(self):
+        """Test datasets are sent again if the association fails."""
+
+        def handle_store(event):
+            if not self.stored:
+                self.stored.append(None)
+                event.assoc.abort()
+                return 0x0000
+
+            self.stored.append(event.request.AffectedSOPInstanceUID)
+            return 0x0000
+
+        scp = self.start_scp(handle_store)
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        results = list(
+            ae.send_many(self.datasets(5), "localhost", get_port(), n_associations=1)
+        )
+        assert len(results) == 5
+        assert all(status.Status == 0x0000 for _, status in results)
+        assert len(self.requests) == 2
+        assert sorted(self.stored[1:]) == [f"1.2.3.{ii}" for ii in range(5)]
+        scp.shutdown()
+
+    def test_retries_exhausted(self):
+        """Test the result when a dataset can't be sent."""
+        ae = AE()
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        results = list(
+            ae.send_many(
+                self.datasets(3), "localhost", get_port(), n_associations=2, retries=0
+            )
+        )
+        assert len(results) == 3
+        assert all(status == Dataset() for _, status in results)
+
+    def test_bad_dataset(self, caplog):
+        """Test a dataset that can't be sent doesn't stop the others."""
+        scp = self.start_scp()
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        datasets = list(self.datasets(3))
+        del datasets[1].SOPClassUID
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            results = dict(
+                (ds.SOPInstanceUID, status)
+                for ds, status in ae.send_many(
+                    datasets, "localhost", get_port(), n_associations=1
+                )
+            )
+
+        assert results["1.2.3.0"].Status == 0x0000
+        assert results["1.2.3.1"] == Dataset()
+        assert results["1.2.3.2"].Status == 0x0000
+        assert "Unable to send the dataset" in caplog.text
+        # The association is kept and the other datasets only sent once
+        assert len(self.requests) == 1
+        assert sorted(self.stored) == ["1.2.3.0", "1.2.3.2"]
+        scp.shutdown()
+
+    def test_bad_dataset_window(self, tmp_path):
+        """Test datasets that can't be sent with requests outstanding."""
+
+        def handle_async(event):
+            return 3, 1
+
+        scp = self.start_scp()
+        scp.bind(evt.EVT_ASYNC_OPS, handle_async)
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+        item = AsynchronousOperationsWindowNegotiation()
+        item.maximum_number_operations_invoked = 3
+        item.maximum_number_operations_performed = 1
+
+        datasets = list(self.datasets(4))
+        datasets[1].SOPClassUID = CTImageStorage
+        datasets.insert(3, tmp_path / "missing.dcm")
+        results = list(
+            ae.send_many(
+                datasets,
+                "localhost",
+                get_port(),
+                n_associations=1,
+                ext_neg=[item],
+            )
+        )
+        assert len(results) == 5
+        failed = [ds for ds, status in results if status == Dataset()]
+        assert failed == [datasets[1], datasets[3]]
+        assert len(self.requests) == 1
+        assert sorted(self.stored) == ["1.2.3.0", "1.2.3.2", "1.2.3.3"]
+        scp.shutdown()
+
+    def test_stop_early(self):
+        """Test the associations are released if iteration stops early."""
+        scp = self.start_scp()
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        results = ae.send_many(
+            self.datasets(100), "localhost", get_port(), n_associations=2
+        )
+        ds, status = next(results)
+        assert status.Status == 0x0000
+        results.close()
+
+        assert len(self.stored) < 100
+        time.sleep(0.1)
+        assert ae.active_associations == []
+        scp.shutdown()
+
+    def test_datasets_raises(self):
+        """Test an exception raised by the datasets is re-raised."""
+        scp = self.start_scp()
+        ae = AE()
+        ae.dimse_timeout = 5
+        ae.add_requested_context(RTImageStorage, ImplicitVRLittleEndian)
+
+        def datasets():
+            yield from self.datasets(2)
+            raise ValueError("Bad datasets")
+
+        results = []
+        with pytest.raises(ValueError, match="Bad datasets"):
+            for result in ae.send_many(datasets(), "localhost", get_port()):
+                results.append(result)
+
+        assert len(results) == 2
+        scp.shutdown()
+
+    def test_invalid_parameters(self):
+        """Test send_many() with invalid parameters."""
+        ae = AE()
+        msg = r"'n_associations' must be at least 1"
+        with pytest.raises(ValueError, match=msg):
+            ae.send_many([], "localhost", get_port(), n_associations=0)
+
+        msg = r"'retries' must not be negative"
+        with pytest.raises(ValueError, match=msg):
+            ae.send_many([], "localhost", get_port(), retries=-1)
+
+        msg = r"At least one requested presentation context is required"
+        with pytest.raises(RuntimeError, match=msg):
+            ae.send_many([], "localhost", get_port())
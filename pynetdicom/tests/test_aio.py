@@ -0,0 +1,564 @@
+"""Tests for the asyncio association interface."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+import pytest
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset
+
+from pynetdicom import AE, evt, build_role
+from pynetdicom.aio import AsyncAE, AsyncAssociation, AsyncAssociationServer
+from pynetdicom.sop_class import (
+    Verification,
+    CTImageStorage,
+    PatientRootQueryRetrieveInformationModelFind,
+    PatientRootQueryRetrieveInformationModelGet,
+)
+
+from .utils import get_port
+
+# debug_logger()
+
+
+TEST_DS_DIR = os.path.join(os.path.dirname(__file__), "dicom_files")
+DATASET_PATH = os.path.join(TEST_DS_DIR, "CTImageStorage.dcm")
+DATASET = dcmread(DATASET_PATH)
+
+
+def handle_find(event):
+    """C-FIND handler that yields two matches."""
+    for name in ("A", "B"):
+        ds = Dataset()
+        ds.PatientName = name
+        yield 0xFF00, ds
+
+
+def handle_get(event):
+    """C-GET handler that yields a single C-STORE sub-operation."""
+    yield 1
+    yield 0xFF00, DATASET
+
+
+def make_ae(cls=AsyncAE):
+    """Return an AE with short timeouts."""
+    ae = cls()
+    ae.acse_timeout = 5
+    ae.dimse_timeout = 5
+    ae.network_timeout = 5
+    return ae
+
+
+class TestAsyncRequestor:
+    """Tests for AsyncAE.associate_async() with a threaded SCP."""
+
+    def setup_method(self):
+        self.scp = None
+
+    def teardown_method(self):
+        if self.scp:
+            self.scp.shutdown()
+
+    def start_scp(self, handlers=None, contexts=None):
+        ae = make_ae(AE)
+        for cx in contexts or [Verification]:
+            ae.add_supported_context(cx, scu_role=True, scp_role=True)
+
+        self.scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+        return ae
+
+    def test_echo_release(self):
+        """Test establishing, sending C-ECHO and releasing."""
+        self.start_scp()
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port())
+            assert isinstance(assoc, AsyncAssociation)
+            assert assoc.is_established
+            assert assoc.is_requestor
+            status = await assoc.send_c_echo()
+            assert status.Status == 0x0000
+            await assoc.release()
+            assert assoc.is_released
+            assert not assoc.is_established
+
+        asyncio.run(main())
+
+    def test_context_manager(self):
+        """Test the association is released on exiting the context."""
+        self.start_scp()
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            async with await ae.associate_async("localhost", get_port()) as assoc:
+                assert assoc.is_established
+
+            assert assoc.is_released
+
+        asyncio.run(main())
+
+    def test_connection_refused(self):
+        """Test unable to connect to the peer."""
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port("remote"))
+            assert not assoc.is_established
+            assert assoc.is_aborted
+            await assoc.wait_closed()
+
+        asyncio.run(main())
+
+    def test_rejected(self):
+        """Test association rejected by the peer."""
+        ae = self.start_scp()
+        ae.require_called_aet = True
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port(), ae_title="BAD")
+            assert not assoc.is_established
+            assert assoc.is_rejected
+            await assoc.wait_closed()
+
+        asyncio.run(main())
+
+    def test_no_accepted_contexts(self):
+        """Test association aborted if no contexts accepted."""
+        self.start_scp()
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(CTImageStorage)
+            assoc = await ae.associate_async("localhost", get_port())
+            assert not assoc.is_established
+            assert assoc.is_aborted
+            await assoc.wait_closed()
+
+        asyncio.run(main())
+
+    def test_send_before_established_raises(self):
+        """Test sending without an association raises."""
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port("remote"))
+            msg = r"association with a peer SCP must be established before"
+            with pytest.raises(RuntimeError, match=msg):
+                await assoc.send_c_echo()
+
+            with pytest.raises(RuntimeError, match=msg):
+                assoc.send_c_find(Dataset(), "1.2.3")
+
+        asyncio.run(main())
+
+    def test_store(self):
+        """Test sending C-STORE requests."""
+        received = []
+
+        def handle(event):
+            received.append(event.dataset)
+            return 0x0000
+
+        self.start_scp([(evt.EVT_C_STORE, handle)], [CTImageStorage])
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(CTImageStorage)
+            assoc = await ae.associate_async("localhost", get_port())
+            assert assoc.is_established
+            status = await assoc.send_c_store(DATASET)
+            assert status.Status == 0x0000
+            status = await assoc.send_c_store(DATASET_PATH, msg_id=2)
+            assert status.Status == 0x0000
+            await assoc.release()
+
+        asyncio.run(main())
+        assert len(received) == 2
+        assert received[0].SOPInstanceUID == DATASET.SOPInstanceUID
+
+    def test_find(self):
+        """Test iterating over C-FIND responses."""
+        model = PatientRootQueryRetrieveInformationModelFind
+        self.start_scp([(evt.EVT_C_FIND, handle_find)], [model])
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(model)
+            assoc = await ae.associate_async("localhost", get_port())
+            query = Dataset()
+            query.QueryRetrieveLevel = "PATIENT"
+            query.PatientName = "*"
+            results = []
+            async for status, identifier in assoc.send_c_find(query, model):
+                results.append((status.Status, identifier))
+
+            await assoc.release()
+            return results
+
+        results = asyncio.run(main())
+        assert [r[0] for r in results] == [0xFF00, 0xFF00, 0x0000]
+        assert results[0][1].PatientName == "A"
+        assert results[1][1].PatientName == "B"
+        assert results[2][1] is None
+
+    def test_get(self):
+        """Test C-GET with C-STORE sub-operations."""
+        model = PatientRootQueryRetrieveInformationModelGet
+        self.start_scp([(evt.EVT_C_GET, handle_get)], [model, CTImageStorage])
+        received = []
+
+        def handle_store(event):
+            received.append(event.dataset)
+            return 0x0000
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(model)
+            ae.add_requested_context(CTImageStorage)
+            role = build_role(CTImageStorage, scp_role=True)
+            assoc = await ae.associate_async(
+                "localhost",
+                get_port(),
+                ext_neg=[role],
+                evt_handlers=[(evt.EVT_C_STORE, handle_store)],
+            )
+            assert assoc.is_established
+            query = Dataset()
+            query.QueryRetrieveLevel = "PATIENT"
+            query.PatientID = "*"
+            statuses = []
+            async for status, identifier in assoc.send_c_get(query, model):
+                statuses.append(status.Status)
+
+            await assoc.release()
+            return statuses
+
+        statuses = asyncio.run(main())
+        assert statuses == [0xFF00, 0x0000]
+        assert len(received) == 1
+
+    def test_peer_aborts(self):
+        """Test the peer aborting the association."""
+        self.start_scp()
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port())
+            assert assoc.is_established
+            while not self.scp.active_associations:
+                await asyncio.sleep(0.01)
+
+            self.scp.active_associations[0].abort(block=False)
+            await asyncio.wait_for(assoc.wait_closed(), 5)
+            assert assoc.is_aborted
+            assert not assoc.is_established
+
+        asyncio.run(main())
+
+    def test_dimse_timeout(self):
+        """Test the association is aborted on DIMSE timeout."""
+
+        def handle(event):
+            time.sleep(0.5)
+            return 0x0000
+
+        self.start_scp([(evt.EVT_C_ECHO, handle)])
+
+        async def main():
+            ae = make_ae()
+            ae.dimse_timeout = 0.1
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async("localhost", get_port())
+            status = await assoc.send_c_echo()
+            assert status == Dataset()
+            await asyncio.wait_for(assoc.wait_closed(), 5)
+            assert assoc.is_aborted
+
+        asyncio.run(main())
+
+    def test_events(self):
+        """Test the notification events are triggered."""
+        self.start_scp()
+        triggered = []
+
+        def handle(event):
+            triggered.append(event.event)
+
+        events = [
+            evt.EVT_CONN_OPEN,
+            evt.EVT_REQUESTED,
+            evt.EVT_ACCEPTED,
+            evt.EVT_ESTABLISHED,
+            evt.EVT_RELEASED,
+            evt.EVT_CONN_CLOSE,
+        ]
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async(
+                "localhost", get_port(), evt_handlers=[(e, handle) for e in events]
+            )
+            await assoc.release()
+
+        asyncio.run(main())
+        assert triggered[:4] == events[:4]
+        # The peer may close the connection before the release is confirmed
+        assert sorted(triggered[4:], key=events.index) == events[4:]
+
+    def test_fsm_transitions(self):
+        """Test the association is driven by the Upper Layer state machine."""
+        self.start_scp()
+        actions = []
+
+        def handle(event):
+            actions.append(event.action)
+
+        async def main():
+            ae = make_ae()
+            ae.add_requested_context(Verification)
+            assoc = await ae.associate_async(
+                "localhost",
+                get_port(),
+                evt_handlers=[(evt.EVT_FSM_TRANSITION, handle)],
+            )
+            assert assoc.is_established
+            await assoc.release()
+            assert assoc.is_released
+
+        asyncio.run(main())
+        assert actions == ["AE-1", "AE-2", "AE-3", "AR-1", "AR-3"]
+
+
+class TestAsyncServer:
+    """Tests for AsyncAE.start_server_async()."""
+
+    def test_echo_threaded_requestor(self):
+        """Test a threaded requestor with an asyncio server."""
+
+        async def main():
+            ae = make_ae()
+            ae.add_supported_context(Verification)
+            server = await ae.start_server_async(("localhost", get_port()))
+            assert isinstance(server, AsyncAssociationServer)
+
+            def request():
+                ae = make_ae(AE)
+                ae.add_requested_context(Verification)
+                assoc = ae.associate("localhost", get_port())
+                assert assoc.is_established
+                status = assoc.send_c_echo()
+                assoc.release()
+                return status, assoc.is_released
+
+            status, is_released = await asyncio.to_thread(request)
+            assert status.Status == 0x0000
+            assert is_released
+            await ae.shutdown_async()
+
+        asyncio.run(main())
+
+    def test_store_and_find(self):
+        """Test service requests are passed to the handlers."""
+        received = []
+
+        def handle_store(event):
+            received.append(event.dataset)
+            return 0x0000
+
+        model = PatientRootQueryRetrieveInformationModelFind
+        handlers = [
+            (evt.EVT_C_STORE, handle_store),
+            (evt.EVT_C_FIND, handle_find),
+        ]
+
+        async def main():
+            ae = make_ae()
+            ae.add_supported_context(CTImageStorage)
+            ae.add_supported_context(model)
+            ae.add_requested_context(CTImageStorage)
+            ae.add_requested_context(model)
+            server = await ae.start_server_async(
+                ("localhost", get_port()), evt_handlers=handlers
+            )
+            async with server:
+                assoc = await ae.associate_async("localhost", get_port())
+                assert assoc.is_established
+                assert len(server.active_associations) == 1
+                status = await assoc.send_c_store(DATASET)
+                assert status.Status == 0x0000
+
+                query = Dataset()
+                query.QueryRetrieveLevel = "PATIENT"
+                query.PatientName = "*"
+                statuses = []
+                async for status, _ in assoc.send_c_find(query, model):
+                    statuses.append(status.Status)
+
+                assert statuses == [0xFF00, 0xFF00, 0x0000]
+                await assoc.release()
+                assert assoc.is_released
+
+        asyncio.run(main())
+        assert len(received) == 1
+
+    def test_requestor_aborts(self):
+        """Test the requestor aborting the association."""
+        aborted = []
+
+        async def main():
+            ae = make_ae()
+            ae.add_supported_context(Verification)
+            ae.add_requested_context(Verification)
+            server = await ae.start_server_async(
+                ("localhost", get_port()),
+                evt_handlers=[(evt.EVT_ABORTED, lambda e: aborted.append(e))],
+            )
+            assoc = await ae.associate_async("localhost", get_port())
+            assert assoc.is_established
+            await assoc.abort()
+            assert assoc.is_aborted
+            for _ in range(100):
+                if not server._associations:
+                    break
+
+                await asyncio.sleep(0.01)
+
+            assert server.active_associations == []
+            await server.shutdown()
+
+        asyncio.run(main())
+        assert len(aborted) == 1
+
+    def test_pending_connections(self):
+        """Test connections waiting for an A-ASSOCIATE-RQ don't block
+        negotiation when they outnumber the executor's workers.
+        """
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=2))
+
+            ae = make_ae()
+            ae.acse_timeout = 30
+            ae.add_supported_context(Verification)
+            ae.add_requested_context(Verification)
+            server = await ae.start_server_async(("localhost", get_port()))
+            # Connections that never send an A-ASSOCIATE-RQ
+            writers = []
+            for _ in range(4):
+                _, writer = await asyncio.open_connection("localhost", get_port())
+                writers.append(writer)
+
+            start = time.monotonic()
+            assoc = await ae.associate_async("localhost", get_port())
+            assert assoc.is_established
+            status = await assoc.send_c_echo()
+            assert status.Status == 0x0000
+            await assoc.release()
+            assert assoc.is_released
+            assert time.monotonic() - start < 5
+
+            for writer in writers:
+                writer.close()
+
+            await server.shutdown()
+
+        asyncio.run(main())
+
+    def test_artim_timeout(self):
+        """Test the connection is closed if no A-ASSOCIATE-RQ is received
+        before the ARTIM timer expires.
+        """
+
+        async def main():
+            ae = make_ae()
+            ae.acse_timeout = 0.2
+            ae.add_supported_context(Verification)
+            server = await ae.start_server_async(("localhost", get_port()))
+            reader, writer = await asyncio.open_connection("localhost", get_port())
+            start = time.monotonic()
+            assert await asyncio.wait_for(reader.read(), 5) == b""
+            assert time.monotonic() - start < 5
+            writer.close()
+            for _ in range(100):
+                if not server._associations:
+                    break
+
+                await asyncio.sleep(0.01)
+
+            assert not server._associations
+            await server.shutdown()
+
+        asyncio.run(main())
+
+    def test_reject(self):
+        """Test the server rejecting an association."""
+
+        async def main():
+            ae = make_ae()
+            ae.require_called_aet = True
+            ae.add_supported_context(Verification)
+            ae.add_requested_context(Verification)
+            server = await ae.start_server_async(("localhost", get_port()))
+            assoc = await ae.associate_async("localhost", get_port(), ae_title="BAD")
+            assert assoc.is_rejected
+            await server.shutdown()
+
+        asyncio.run(main())
+
+    def test_shutdown_aborts(self):
+        """Test shutting down the server aborts active associations."""
+
+        async def main():
+            ae = make_ae()
+            ae.add_supported_context(Verification)
+            ae.add_requested_context(Verification)
+            await ae.start_server_async(("localhost", get_port()))
+            assoc = await ae.associate_async("localhost", get_port())
+            assert assoc.is_established
+            await ae.shutdown_async()
+            await asyncio.wait_for(assoc.wait_closed(), 5)
+            assert assoc.is_aborted
+            assert ae._async_servers == []
+
+        asyncio.run(main())
+
+    def test_bind_unbind(self):
+        """Test binding handlers to the server and its associations."""
+
+        def handle(event):
+            return 0x0000
+
+        async def main():
+            ae = make_ae()
+            ae.add_supported_context(Verification)
+            ae.add_requested_context(Verification)
+            server = await ae.start_server_async(("localhost", get_port()))
+            assoc = await ae.associate_async("localhost", get_port())
+            while not server.active_associations:
+                await asyncio.sleep(0.01)
+
+            server.bind(evt.EVT_C_ECHO, handle)
+            assert server.get_handlers(evt.EVT_C_ECHO) == (handle, None)
+            acceptor = server.active_associations[0]
+            assert acceptor.get_handlers(evt.EVT_C_ECHO) == (handle, None)
+            server.unbind(evt.EVT_C_ECHO, handle)
+            assert acceptor.get_handlers(evt.EVT_C_ECHO) != (handle, None)
+            await assoc.release()
+            await server.shutdown()
+
+        asyncio.run(main())
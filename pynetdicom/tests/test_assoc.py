@@ -15,6 +15,7 @@ from pathlib import Path
 import queue
 import socket
 import sys
+import threading
 import time
 
 import pytest
@@ -41,13 +42,14 @@ from pynetdicom import (
     debug_logger,
     build_role,
 )
-from pynetdicom.association import Association
-from pynetdicom.dimse_primitives import C_STORE, C_FIND, C_GET, C_MOVE
+from pynetdicom.association import Association, _AssociationRegistry
+from pynetdicom.dimse_primitives import C_ECHO, C_STORE, C_FIND, C_GET, C_MOVE
 from pynetdicom.dsutils import encode, decode
 from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR
-from pynetdicom.pdu import A_RELEASE_RQ
+from pynetdicom.pdu import A_RELEASE_RQ, A_RELEASE_RP, P_DATA_TF
 from pynetdicom.pdu_primitives import (
+    AsynchronousOperationsWindowNegotiation,
     UserIdentityNegotiation,
     SOPClassExtendedNegotiation,
     SOPClassCommonExtendedNegotiation,
@@ -114,7 +116,7 @@ class DummyDIMSE:
         self.status = rsp.Status
         self.rsp = rsp
 
-    def get_msg(self, block=False):
+    def get_msg(self, block=False, hold=False):
         return None, None
 
 
@@ -692,6 +694,188 @@ class TestAssociation:
 
         assert len(made_it) > 0
 
+    def test_reactor_wakeup(self):
+        """Test the reactor blocks until there's something to do."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        # Don't wake up for the network timeout
+        acceptor = scp.active_associations[0]
+        acceptor._reactor_max_wait = 10
+        original = acceptor._reactor_step
+        steps = []
+
+        def reactor_step():
+            steps.append(time.monotonic())
+            return original()
+
+        acceptor._reactor_step = reactor_step
+        # Wake the reactor so it picks up the new maximum wait
+        acceptor._reactor_wakeup.set()
+        time.sleep(0.5)
+        assert len(steps) == 1
+
+        # Woken by incoming DIMSE messages
+        start = time.monotonic()
+        for _ in range(5):
+            assert assoc.send_c_echo().Status == 0x0000
+
+        assert 6 <= len(steps) < 12
+        assert time.monotonic() - start < 2
+
+        # Woken by an A-RELEASE request
+        assoc.release()
+        assert assoc.is_released
+        acceptor.join(timeout=2)
+        assert not acceptor.is_alive()
+
+        scp.shutdown()
+
+    def test_buffer_limits(self):
+        """Test reading is paused while too many messages are buffered."""
+        buffered = []
+
+        def handle(event):
+            buffered.append(event.assoc.dimse.buffered_messages)
+            time.sleep(0.1)
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.maximum_buffered_messages = 1
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_C_ECHO, handle)],
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        # Pipeline the requests without waiting for the responses
+        assoc._reactor_checkpoint.clear()
+        while not assoc._is_paused:
+            time.sleep(0.0001)
+
+        context_id = assoc.accepted_contexts[0].context_id
+        for msg_id in range(1, 6):
+            req = C_ECHO()
+            req.MessageID = msg_id
+            req.AffectedSOPClassUID = Verification
+            assoc.dimse.send_msg(req, context_id)
+
+        responses = [assoc.dimse.get_msg(block=True)[1] for _ in range(5)]
+        assoc._reactor_checkpoint.set()
+        assert [rsp.MessageIDBeingRespondedTo for rsp in responses] == [1, 2, 3, 4, 5]
+        assert all(rsp.Status == 0x0000 for rsp in responses)
+
+        acceptor = scp.active_associations[0]
+        assert acceptor.dimse.throttle_count > 0
+        assert acceptor.dimse.buffered_messages == 0
+        assert max(buffered) <= 1
+
+        assoc.release()
+        assert assoc.is_released
+
+        scp.shutdown()
+
+
+class TestAssociationRegistry:
+    """Tests for the registry of live associations."""
+
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_add_discard(self):
+        """Test adding and removing associations."""
+        ae = AE()
+        registry = _AssociationRegistry()
+        requestor = Association(ae, MODE_REQUESTOR)
+        requestor.requestor.ae_title = "LOCAL"
+        acceptor = Association(ae, "acceptor")
+
+        registry.add(requestor)
+        registry.add(acceptor)
+        registry.add(acceptor)
+        assert len(registry) == 2
+        assert requestor in registry
+        assert registry.associations() == [requestor, acceptor]
+        assert registry.nr_acceptors == 1
+        assert registry.associations("LOCAL") == [requestor]
+        assert registry.associations("REMOTE") == []
+
+        # Acceptors are indexed once the calling AE title is known
+        acceptor.requestor.ae_title = "REMOTE"
+        registry.update(acceptor)
+        assert registry.associations("REMOTE") == [acceptor]
+
+        registry.discard(acceptor)
+        registry.discard(acceptor)
+        assert len(registry) == 1
+        assert registry.nr_acceptors == 0
+        assert registry.associations("REMOTE") == []
+        assert registry._calling == {"LOCAL": {requestor: None}}
+
+        registry.discard(requestor)
+        assert registry.associations() == []
+        assert registry._calling == {}
+        assert registry._titles == {}
+
+    def test_update_missing(self):
+        """Test updating an association not in the registry does nothing."""
+        registry = _AssociationRegistry()
+        assoc = Association(AE(), MODE_REQUESTOR)
+        assoc.requestor.ae_title = "LOCAL"
+        registry.update(assoc)
+        assert registry.associations("LOCAL") == []
+
+    def test_live_associations(self):
+        """Test associations are registered while running."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        assert ae.active_associations == []
+        assoc = ae.associate("localhost", get_port(), ae_title="REMOTE")
+        assert assoc.is_established
+
+        assert assoc in ae._registry
+        assert len(ae.active_associations) == 2
+        assert ae._registry.nr_acceptors == 1
+        acceptor = scp.active_associations[0]
+        assert acceptor.is_acceptor
+        assert scp._registry.associations() == [acceptor]
+        assert scp._registry.nr_acceptors == 1
+        # Both are indexed by the requestor's AE title
+        assert ae._registry.associations(ae.ae_title) == [acceptor, assoc]
+
+        assoc.release()
+        assoc.join()
+        acceptor.join()
+
+        assert ae.active_associations == []
+        assert scp.active_associations == []
+        assert ae._registry.nr_acceptors == 0
+
+        scp.shutdown()
+
 
 class TestCStoreSCP:
     """Tests for Association._c_store_scp()."""
@@ -2130,6 +2314,452 @@ class TestAssociationSendCStore:
         assert "^^^^" == recv_ds[0].PatientName
 
 
+class TestAssociationSendCStoreMany:
+    """Run tests on Association send_c_store_many."""
+
+    def setup_method(self):
+        """Run prior to each test"""
+        self.ae = None
+
+    def teardown_method(self):
+        """Clear any active threads"""
+        if self.ae:
+            self.ae.shutdown()
+
+    def create_assoc(self, handlers, nr_invoked=None):
+        """Return an association with a Storage SCP, requesting an
+        asynchronous operations window if `nr_invoked` is used.
+        """
+        self.ae = ae = AE()
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        ae.network_timeout = 5
+        ae.add_supported_context(CTImageStorage)
+        self.scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ext_neg = []
+        if nr_invoked is not None:
+            item = AsynchronousOperationsWindowNegotiation()
+            item.maximum_number_operations_invoked = nr_invoked
+            item.maximum_number_operations_performed = 1
+            ext_neg.append(item)
+
+        ae.add_requested_context(CTImageStorage)
+        return ae.associate("localhost", get_port(), ext_neg=ext_neg)
+
+    def test_must_be_associated(self):
+        """Test SCU can't send without association."""
+        assoc = self.create_assoc([])
+        assoc.release()
+
+        assert assoc.is_released
+        with pytest.raises(RuntimeError):
+            assoc.send_c_store_many([DATASET])
+
+        self.scp.shutdown()
+
+    def test_no_window(self):
+        """Test requests are sent one at a time without a window."""
+        queued = []
+
+        def handle_store(event):
+            queued.append(event.assoc.dimse.msg_queue.qsize())
+            return 0x0000
+
+        assoc = self.create_assoc([(evt.EVT_C_STORE, handle_store)])
+        assert assoc.is_established
+        assert assoc.acceptor.asynchronous_operations == (1, 1)
+
+        datasets = [DATASET, DATASET_PATH, Path(DATASET_PATH)]
+        results = list(assoc.send_c_store_many(datasets))
+        assert [ds for ds, _ in results] == datasets
+        assert [status.Status for _, status in results] == [0x0000] * 3
+        assert queued == [0, 0, 0]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_window(self):
+        """Test requests are pipelined up to the negotiated window."""
+        msg_ids = []
+        waited = []
+        received = threading.Event()
+
+        def handle_async(event):
+            return 3, 1
+
+        def handle_store(event):
+            msg_ids.append(event.request.MessageID)
+            if len(msg_ids) == 3:
+                received.set()
+
+            # Only respond once the whole window has been received
+            waited.append(received.wait(5))
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=5)
+        assert assoc.is_established
+        assert assoc.acceptor.asynchronous_operations == (3, 1)
+
+        results = list(assoc.send_c_store_many([DATASET] * 6))
+        assert [status.Status for _, status in results] == [0x0000] * 6
+        assert sorted(msg_ids) == [1, 2, 3, 4, 5, 6]
+        assert waited == [True] * 6
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_msg_id_wraps(self):
+        """Test the Message ID wraps around after 65535."""
+        msg_ids = []
+
+        def handle_async(event):
+            return 0, 1
+
+        def handle_store(event):
+            msg_ids.append(event.request.MessageID)
+            return 0xB000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=0)
+        assert assoc.is_established
+        assert assoc.acceptor.asynchronous_operations == (0, 1)
+
+        results = list(assoc.send_c_store_many([DATASET] * 3, msg_id=65535))
+        assert [status.Status for _, status in results] == [0xB000] * 3
+        assert msg_ids == [65535, 0, 1]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_dimse_timeout(self):
+        """Test outstanding requests get an empty status on DIMSE timeout."""
+        received = []
+
+        def handle_async(event):
+            return 2, 1
+
+        def handle_store(event):
+            received.append(event.request.MessageID)
+            time.sleep(0.5)
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=2)
+        assert assoc.is_established
+
+        assoc.dimse_timeout = 0.2
+        datasets = [DATASET, DATASET_PATH, Path(DATASET_PATH)]
+        results = list(assoc.send_c_store_many(datasets))
+        assert [ds for ds, _ in results] == datasets[:2]
+        assert [status for _, status in results] == [Dataset(), Dataset()]
+        assert assoc.is_aborted
+
+        self.scp.shutdown()
+
+    def test_invalid_context(self):
+        """Test the reactor is resumed if a request can't be sent."""
+
+        def handle_store(event):
+            return 0x0000
+
+        assoc = self.create_assoc([(evt.EVT_C_STORE, handle_store)])
+        assert assoc.is_established
+
+        ds = Dataset()
+        ds.SOPClassUID = "1.2.3.4"
+        ds.SOPInstanceUID = "1.2.3.4"
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+
+        results = assoc.send_c_store_many([DATASET, ds])
+        assert next(results)[1].Status == 0x0000
+        with pytest.raises(ValueError):
+            next(results)
+
+        assert assoc._reactor_checkpoint.is_set()
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_invalid_context_outstanding(self):
+        """Test outstanding responses are received before raising."""
+        msg_ids = []
+
+        def handle_async(event):
+            return 3, 1
+
+        def handle_store(event):
+            msg_ids.append(event.request.MessageID)
+            time.sleep(0.1)
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=3)
+        assert assoc.is_established
+
+        ds = Dataset()
+        ds.SOPClassUID = "1.2.3.4"
+        ds.SOPInstanceUID = "1.2.3.4"
+        ds.file_meta = FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+
+        results = assoc.send_c_store_many([DATASET, DATASET, ds, DATASET])
+        assert next(results)[1].Status == 0x0000
+        assert next(results)[1].Status == 0x0000
+        with pytest.raises(ValueError):
+            next(results)
+
+        assert msg_ids == [1, 2]
+        assert assoc._reactor_checkpoint.is_set()
+        assert assoc.dimse.msg_queue.empty()
+
+        # The next request gets its own response
+        status = assoc.send_c_store(DATASET, msg_id=3)
+        assert status.Status == 0x0000
+        assert msg_ids == [1, 2, 3]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_scp_concurrent(self):
+        """Test the SCP handles requests concurrently within the window."""
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def handle_async(event):
+            return 3, 1
+
+        def handle_store(event):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+
+            time.sleep(0.2)
+            with lock:
+                active[0] -= 1
+
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=3)
+        assert assoc.is_established
+
+        results = list(assoc.send_c_store_many([DATASET] * 6))
+        assert [status.Status for _, status in results] == [0x0000] * 6
+        assert active == [0, 3]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def send_requests(self, assoc, nr_requests):
+        """Send C-STORE requests without waiting for the responses."""
+        # Pause the reactor so it doesn't take the responses
+        assoc._reactor_checkpoint.clear()
+        while not assoc._is_paused:
+            time.sleep(0.001)
+
+        context = assoc._get_valid_context(CTImageStorage, "", "scu")
+        for msg_id in range(1, nr_requests + 1):
+            req = C_STORE()
+            req.MessageID = msg_id
+            req.AffectedSOPClassUID = DATASET.SOPClassUID
+            req.AffectedSOPInstanceUID = DATASET.SOPInstanceUID
+            req.Priority = 2
+            req.DataSet = BytesIO(encode(DATASET, True, True))
+            assoc.dimse.send_msg(req, context.context_id)
+
+    def test_scp_exceeds_window(self):
+        """Test the SCP leaves requests queued while it's performing as many
+        as it can.
+        """
+        lock = threading.Lock()
+        active = [0, 0]
+        queued = []
+
+        def handle_async(event):
+            return 2, 1
+
+        def handle_store(event):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+
+            # By now all the requests have been received
+            time.sleep(0.2)
+            queued.append(event.assoc.dimse.msg_queue.qsize())
+            time.sleep(0.1)
+            with lock:
+                active[0] -= 1
+
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=2)
+        assert assoc.is_established
+
+        # The peer ignores the window
+        self.send_requests(assoc, 6)
+        msg_ids = []
+        for _ in range(6):
+            _, rsp = assoc.dimse.get_msg(block=True)
+            assert rsp.Status == 0x0000
+            msg_ids.append(rsp.MessageIDBeingRespondedTo)
+
+        assert sorted(msg_ids) == [1, 2, 3, 4, 5, 6]
+        assert active == [0, 2]
+        # Requests were left queued rather than taken off by the reactor
+        assert max(queued) == 4
+
+        assoc._reactor_checkpoint.set()
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_scp_buffer_limits(self):
+        """Test requests being performed count towards the buffer limits."""
+        buffered = []
+
+        def handle_async(event):
+            return 2, 1
+
+        def handle_store(event):
+            time.sleep(0.3)
+            buffered.append(event.assoc.dimse.buffered_messages)
+            return 0x0000
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=2)
+        assert assoc.is_established
+        self.ae.maximum_buffered_messages = 3
+
+        # Two requests are performed while the third waits in the queue
+        self.send_requests(assoc, 3)
+        for _ in range(3):
+            _, rsp = assoc.dimse.get_msg(block=True)
+            assert rsp.Status == 0x0000
+
+        # The last request is released after its response is sent
+        acceptor = self.scp.active_associations[0]
+        timeout = 0
+        while acceptor.dimse.buffered_messages and timeout < 1:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        assert acceptor.dimse.buffered_messages == 0
+        assert acceptor.dimse.throttle_count > 0
+        assert max(buffered) == 3
+
+        assoc._reactor_checkpoint.set()
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+    def test_scp_release_waits(self):
+        """Test a release request waits for requests being performed."""
+        order = []
+        started = threading.Event()
+
+        def handle_async(event):
+            return 2, 1
+
+        def handle_store(event):
+            started.set()
+            time.sleep(0.5)
+            order.append("stored")
+            return 0x0000
+
+        def handle_sent(event):
+            if isinstance(event.pdu, (P_DATA_TF, A_RELEASE_RP)):
+                order.append(event.pdu.__class__.__name__)
+
+        handlers = [
+            (evt.EVT_ASYNC_OPS, handle_async),
+            (evt.EVT_C_STORE, handle_store),
+            (evt.EVT_PDU_SENT, handle_sent),
+        ]
+        assoc = self.create_assoc(handlers, nr_invoked=2)
+        assert assoc.is_established
+
+        self.send_requests(assoc, 1)
+        assert started.wait(5)
+        assoc.release()
+        assert assoc.is_released
+        # The response is sent before the release response
+        assert order == ["stored", "P_DATA_TF", "A_RELEASE_RP"]
+
+        self.scp.shutdown()
+
+    def test_scp_serial(self):
+        """Test the SCP handles requests one at a time without a window."""
+        lock = threading.Lock()
+        active = [0, 0]
+        threads = set()
+
+        def handle_store(event):
+            threads.add(threading.current_thread())
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+            return 0x0000
+
+        assoc = self.create_assoc([(evt.EVT_C_STORE, handle_store)])
+        assert assoc.is_established
+
+        results = list(assoc.send_c_store_many([DATASET] * 3))
+        assert [status.Status for _, status in results] == [0x0000] * 3
+        assert active == [0, 1]
+        # Run by the association's reactor
+        assert [isinstance(t, Association) for t in threads] == [True]
+
+        assoc.release()
+        assert assoc.is_released
+
+        self.scp.shutdown()
+
+
 class TestAssociationSendCFind:
     """Run tests on Association send_c_find."""
 
@@ -5599,6 +6229,59 @@ class TestGetValidContext:
         assoc.release()
         scp.shutdown()
 
+    def test_context_index(self):
+        """Test the index of accepted contexts is used and kept up to date."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+
+        def context(cx_id, tsyntax, as_scu=True, as_scp=False):
+            cx = build_context(CTImageStorage, tsyntax)
+            cx.context_id = cx_id
+            cx.result = 0x00
+            cx._as_scu = as_scu
+            cx._as_scp = as_scp
+            return cx
+
+        cx_jpg = context(1, JPEGBaseline8Bit)
+        cx_implicit = context(3, ImplicitVRLittleEndian)
+        cx_explicit = context(5, ExplicitVRLittleEndian, as_scu=False, as_scp=True)
+        assoc._accepted_cx = {1: cx_jpg, 3: cx_implicit, 5: cx_explicit}
+
+        get = assoc._get_valid_context
+        assert get(CTImageStorage, "", "scu") is cx_jpg
+        assert get(CTImageStorage, "", "scp") is cx_explicit
+        assert get(CTImageStorage, "", None) is cx_jpg
+        assert get(CTImageStorage, ExplicitVRLittleEndian, None) is cx_explicit
+        assert get(CTImageStorage, ExplicitVRLittleEndian, "scu") is cx_implicit
+        assert get(CTImageStorage, DeflatedExplicitVRLittleEndian, "scu") is (
+            cx_implicit
+        )
+        assert get(CTImageStorage, "", "scp", context_id=5) is cx_explicit
+        assert get(CTImageStorage, "", "scu", context_id=99) is cx_jpg
+
+        msg = r"No presentation context for 'CT Image Storage' has been accepted"
+        for tsyntax in (JPEG2000, ExplicitVRBigEndian):
+            with pytest.raises(ValueError, match=msg):
+                get(CTImageStorage, tsyntax, "scu")
+
+        with pytest.raises(ValueError, match=msg):
+            get(CTImageStorage, "", "scp", context_id=3)
+
+        with pytest.raises(ValueError, match=msg):
+            get(CTImageStorage, ExplicitVRLittleEndian, "scu", allow_conversion=False)
+
+        # Index is only rebuilt when the accepted contexts change
+        index = assoc._context_index()
+        assert assoc._context_index() is index
+
+        cx_big = context(7, ExplicitVRBigEndian)
+        assoc._accepted_cx[7] = cx_big
+        assert get(CTImageStorage, ExplicitVRBigEndian, "scu") is cx_big
+        assert assoc._context_index() is not index
+
+        assoc._accepted_cx = {3: cx_implicit}
+        with pytest.raises(ValueError, match=msg):
+            get(CTImageStorage, ExplicitVRBigEndian, "scu")
+
 
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
@@ -39,7 +39,7 @@ class DummyDIMSE:
         self.req = req
         self.context_id = context_id
 
-    def get_msg(self, block=False):
+    def get_msg(self, block=False, hold=False):
         return None, None
 
 
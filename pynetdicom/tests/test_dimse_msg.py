@@ -2,6 +2,8 @@
 
 from io import BytesIO
 import logging
+import threading
+import time
 
 import pytest
 
@@ -9,6 +11,9 @@ from pydicom.dataset import Dataset
 from pydicom.tag import Tag
 from pydicom.uid import UID
 
+from pynetdicom import AE, _config
+from pynetdicom._globals import MODE_REQUESTOR
+from pynetdicom.association import Association
 from pynetdicom.dimse_messages import (
     C_STORE_RQ,
     C_STORE_RSP,
@@ -34,7 +39,9 @@ from pynetdicom.dimse_messages import (
     N_DELETE_RQ,
     N_DELETE_RSP,
     C_CANCEL_RQ,
+    DatasetStream,
     _COMMAND_SET_KEYWORDS,
+    _FileFragment,
 )
 from pynetdicom.dimse_primitives import (
     C_STORE,
@@ -147,6 +154,101 @@ class TestDIMSEMessage:
         with pytest.raises(ValueError):
             next(frag(c_echo_rsp_cmd, 6))
 
+    def test_fragment_pdv_memoryview(self):
+        """Test the PDV fragmenter returns views when passed a memoryview."""
+        dimse_msg = C_STORE_RQ()
+        frag = dimse_msg._generate_pdv_fragments
+        result = list(frag(memoryview(c_echo_rsp_cmd), 10))
+        assert len(result) == 20
+        assert isinstance(result[0], memoryview)
+        assert result[0] == c_echo_rsp_cmd[:4]
+        assert b"".join(result) == c_echo_rsp_cmd
+
+    def test_encode_file(self, tmp_path):
+        """Test encoding a dataset stored in a file."""
+        path = tmp_path / "dataset"
+        path.write_bytes(b"\xff" * 4 + bytes(range(20)))
+
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+        primitive._dataset_path = (path, 4)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+
+        p_data = list(msg.encode_msg(1, 14))
+        values = [p.presentation_data_value_list[0][1] for p in p_data]
+        assert all(isinstance(v, bytes) for v in values)
+        assert values[-3:] == [
+            b"\x00" + bytes(range(8)),
+            b"\x00" + bytes(range(8, 16)),
+            b"\x02" + bytes(range(16, 20)),
+        ]
+
+        p_data = list(msg.encode_msg(1, 0))
+        assert p_data[-1].presentation_data_value_list[0][1] == (
+            b"\x02" + bytes(range(20))
+        )
+
+    def test_encode_file_sendfile(self, tmp_path):
+        """Test encoding a dataset stored in a file for sending from file."""
+        path = tmp_path / "dataset"
+        path.write_bytes(b"\xff" * 4 + bytes(range(20)))
+
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+        primitive._dataset_path = (path, 4)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+
+        p_data = list(msg.encode_msg(1, 14, sendfile=True))
+        fragments = [p.presentation_data_value_list[0][1] for p in p_data]
+        fragments = [f for f in fragments if isinstance(f, _FileFragment)]
+        assert [(f.header, f.offset, f.length) for f in fragments] == [
+            (b"\x00", 4, 8),
+            (b"\x00", 12, 8),
+            (b"\x02", 20, 4),
+        ]
+        assert [len(f) for f in fragments] == [9, 9, 5]
+        assert bytes(fragments[0]) == b"\x00" + bytes(range(8))
+        assert bytes(fragments[2]) == b"\x02" + bytes(range(16, 20))
+        assert bytes(fragments[1]) == b"\x00" + bytes(range(8, 16))
+
+        # The file is only opened once and is closed with the last fragment
+        f = fragments[0].file
+        assert all(fragment.file is f for fragment in fragments)
+        assert not f.closed
+        del p_data, fragments[2]
+        assert f.closed
+
+    def test_encode_file_sendfile_closed(self, tmp_path):
+        """Test the file is closed if the message isn't completely encoded."""
+        path = tmp_path / "dataset"
+        path.write_bytes(bytes(20))
+
+        primitive = C_STORE()
+        primitive.MessageID = 7
+        primitive.AffectedSOPClassUID = "1.1.1"
+        primitive.AffectedSOPInstanceUID = "1.2.1"
+        primitive.Priority = 0x02
+        primitive._dataset_path = (path, 0)
+        msg = C_STORE_RQ()
+        msg.primitive_to_message(primitive)
+
+        p_data = msg.encode_msg(1, 14, sendfile=True)
+        for pdata in p_data:
+            value = pdata.presentation_data_value_list[0][1]
+            if isinstance(value, _FileFragment):
+                break
+
+        p_data.close()
+        assert value.file.closed
+
     def test_fragment_pdv_zero(self):
         """Test that the PDV fragmenter works correctly for 0 max PDU."""
         dimse_msg = C_STORE_RQ()
@@ -822,3 +924,153 @@ class TestThreadSafety:
             assert C_STORE_RQ.command_set.MessageID
         with pytest.raises(AttributeError, match=r"no attribute 'data_set'"):
             assert C_STORE_RQ.data_set.get_value() == b""
+
+
+class TestDatasetStream:
+    """Tests for DatasetStream."""
+
+    def setup_method(self):
+        ds = Dataset()
+        ds.SOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        ds.SOPInstanceUID = "1.2.3.4"
+        ds.PatientName = "Test^Testing"
+        self.ds = ds
+
+    def test_read_write(self):
+        """Test reading data as it's written."""
+        stream = DatasetStream()
+        assert stream.readable()
+        assert not stream.writable()
+        assert not stream.is_complete
+
+        stream._write(b"\x00\x01\x02")
+        assert stream.read(2) == b"\x00\x01"
+        stream._write(b"\x03\x04")
+        stream._finish()
+        assert stream.is_complete
+        assert stream.read() == b"\x02\x03\x04"
+        assert stream.read() == b""
+
+    def test_read_blocks(self):
+        """Test reading blocks until data is written."""
+        stream = DatasetStream(timeout=5)
+
+        def write():
+            time.sleep(0.1)
+            stream._write(b"\x00" * 10)
+            time.sleep(0.1)
+            stream._write(b"\x01" * 10)
+            stream._finish()
+
+        t = threading.Thread(target=write)
+        t.start()
+        assert stream.read() == b"\x00" * 10 + b"\x01" * 10
+        t.join()
+
+    def test_spooled(self, monkeypatch):
+        """Test unread data beyond max_memory is written to file."""
+        monkeypatch.setattr(DatasetStream, "max_memory", 16)
+        stream = DatasetStream()
+        stream._write(b"\x00" * 20)
+        assert stream._buffer._rolled
+        stream._write(b"\x01" * 20)
+        stream._finish()
+        assert stream.read() == b"\x00" * 20 + b"\x01" * 20
+
+    def test_timeout(self):
+        """Test reading raises if no data is written within the timeout."""
+        stream = DatasetStream(timeout=0.1)
+        msg = "Timed out waiting to receive more of the C-STORE request's dataset"
+        with pytest.raises(TimeoutError, match=msg):
+            stream.read()
+
+    def test_association_ended(self):
+        """Test reading raises if the association ends."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        assoc.is_established = True
+        stream = DatasetStream(timeout=5, assoc=assoc)
+        stream._write(b"\x00")
+        assert stream.read(1) == b"\x00"
+
+        def end():
+            time.sleep(0.1)
+            assoc._teardown()
+
+        t = threading.Thread(target=end)
+        t.start()
+        msg = (
+            "The association ended before the C-STORE request's dataset was "
+            "completely received"
+        )
+        start = time.monotonic()
+        with pytest.raises(ConnectionError, match=msg):
+            stream.read()
+
+        # Woken by the association rather than by polling
+        assert time.monotonic() - start < 0.4
+        t.join()
+
+        # Streams created after the association has ended raise immediately
+        stream = DatasetStream(timeout=5, assoc=assoc)
+        with pytest.raises(ConnectionError, match=msg):
+            stream.read()
+
+    def test_teardown_unbound(self):
+        """Test the stream stops waiting for the association once done."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        stream = DatasetStream(assoc=assoc)
+        assert stream._on_teardown in assoc._teardown_hooks
+        stream._finish()
+        assert assoc._teardown_hooks == {}
+
+        stream = DatasetStream(assoc=assoc)
+        stream.close()
+        assert assoc._teardown_hooks == {}
+
+    def test_close(self):
+        """Test closing the stream discards any further data."""
+        stream = DatasetStream()
+        stream._write(b"\x00")
+        stream.close()
+        assert stream.closed
+        stream._write(b"\x01")
+        stream._finish()
+        with pytest.raises(ValueError, match="I/O operation on closed file"):
+            stream.read()
+
+    def test_decode_msg(self):
+        """Test decoding a C-STORE request when streaming."""
+        _config.STORE_RECV_STREAMING = True
+        try:
+            primitive = C_STORE()
+            primitive.MessageID = 7
+            primitive.AffectedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+            primitive.AffectedSOPInstanceUID = "1.2.3.4"
+            primitive.Priority = 0x02
+            primitive.DataSet = BytesIO(encode(self.ds, True, True))
+
+            msg = C_STORE_RQ()
+            msg.primitive_to_message(primitive)
+            fragments = list(msg.encode_msg(1, 16))
+
+            rq = DIMSEMessage()
+            nr_fragments = 0
+            for fragment in fragments:
+                nr_fragments += 1
+                if rq.decode_msg(fragment):
+                    break
+
+            # Ready as soon as the command set has been decoded
+            stream = rq._data_set_stream
+            assert isinstance(stream, DatasetStream)
+            assert nr_fragments < len(fragments)
+            assert not stream.is_complete
+            assert rq.message_to_primitive()._dataset_stream is stream
+
+            for fragment in fragments[nr_fragments:]:
+                assert rq.decode_msg(fragment)
+
+            assert stream.is_complete
+            assert stream.read() == encode(self.ds, True, True)
+        finally:
+            _config.STORE_RECV_STREAMING = False
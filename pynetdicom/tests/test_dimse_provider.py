@@ -60,7 +60,7 @@ from pynetdicom.dsutils import encode
 from pynetdicom.events import Event
 from pynetdicom.pdu_primitives import P_DATA
 from pynetdicom.pdu import P_DATA_TF
-from .encoded_dimse_msg import c_store_ds
+from .encoded_dimse_msg import c_store_ds, c_echo_rq_cmd
 from .encoded_dimse_n_msg import (
     n_er_rq_ds,
     n_er_rsp_ds,
@@ -108,6 +108,7 @@ class DummyAssociation:
         self.is_acceptor = False
         self.is_requestor = True
         self._handlers = {}
+        self._reactor_wakeup = threading.Event()
 
     def abort(self):
         self.is_aborted = True
@@ -136,6 +137,10 @@ class DummyDUL:
 
     def __init__(self):
         self.event_queue = queue.Queue()
+        self.throttled = []
+
+    def _set_throttled(self, value):
+        self.throttled.append(value)
 
     @staticmethod
     def is_alive():
@@ -228,6 +233,90 @@ class TestDIMSEProvider:
         dimse.receive_primitive(pdata)
         assert dimse.assoc.dul.event_queue.get() == "Evt19"
 
+    def test_buffer_limits(self):
+        """Test reading is paused when the buffer limits are reached."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        dul = dimse.assoc.dul
+        ae = dimse.assoc.ae
+        ae.maximum_buffered_messages = 3
+        ae.maximum_buffered_bytes = 150
+
+        def receive():
+            primitive = P_DATA()
+            primitive.presentation_data_value_list.append((1, c_echo_rq_cmd))
+            dimse.receive_primitive(primitive)
+
+        size = len(c_echo_rq_cmd)
+        receive()
+        assert dimse.buffered_messages == 1
+        assert dimse.buffered_bytes == size
+        assert dul.throttled == []
+
+        # Bytes limit reached
+        receive()
+        assert dimse.buffered_messages == 2
+        assert dimse.buffered_bytes == 2 * size
+        assert dul.throttled == []
+        receive()
+        assert dul.throttled == [True]
+        assert dimse.throttle_count == 1
+
+        # Still over the messages limit
+        receive()
+        assert dimse.buffered_messages == 4
+        assert dul.throttled == [True]
+        assert dimse.get_msg()[1].MessageID == 7
+        assert dimse.get_msg()[1].MessageID == 7
+        assert dul.throttled == [True, False]
+        assert dimse.buffered_messages == 2
+        assert dimse.buffered_bytes == 2 * size
+
+        # Abort notifications aren't counted
+        dimse.msg_queue.put((None, None))
+        assert dimse.get_msg()[1].MessageID == 7
+        assert dimse.get_msg()[1].MessageID == 7
+        assert dimse.get_msg() == (None, None)
+        assert dimse.buffered_messages == 0
+        assert dimse.buffered_bytes == 0
+        assert dimse.throttle_count == 1
+
+    def test_buffer_limits_hold(self):
+        """Test held messages count towards the buffer limits."""
+        dimse = DIMSEServiceProvider(DummyAssociation())
+        dul = dimse.assoc.dul
+        dimse.assoc.ae.maximum_buffered_messages = 2
+
+        def receive():
+            primitive = P_DATA()
+            primitive.presentation_data_value_list.append((1, c_echo_rq_cmd))
+            dimse.receive_primitive(primitive)
+
+        size = len(c_echo_rq_cmd)
+        receive()
+        receive()
+        assert dul.throttled == [True]
+
+        # Held messages remain buffered once taken off the queue
+        first = dimse.get_msg(hold=True)[1]
+        assert dimse.msg_queue.qsize() == 1
+        assert dimse.buffered_messages == 2
+        assert dimse.buffered_bytes == 2 * size
+        assert dul.throttled == [True]
+
+        second = dimse.get_msg()[1]
+        assert dimse.buffered_messages == 1
+        assert dul.throttled == [True, False]
+
+        # Releasing a message that isn't held does nothing
+        dimse.release_msg(second)
+        assert dimse.buffered_messages == 1
+        dimse.release_msg(first)
+        assert dimse.buffered_messages == 0
+        assert dimse.buffered_bytes == 0
+        dimse.release_msg(first)
+        assert dimse.buffered_bytes == 0
+        assert dimse.throttle_count == 1
+
 
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
@@ -9,7 +9,9 @@ import time
 import pytest
 
 from pynetdicom import AE, debug_logger, evt
-from pynetdicom.dul import DULServiceProvider
+from pynetdicom._globals import MODE_REQUESTOR
+from pynetdicom.association import Association
+from pynetdicom.dul import DULServiceProvider, SharedReactor
 from pynetdicom.pdu import (
     A_ASSOCIATE_RQ,
     A_ASSOCIATE_AC,
@@ -21,7 +23,8 @@ from pynetdicom.pdu import (
 )
 from pynetdicom.pdu_primitives import A_ASSOCIATE, A_RELEASE, A_ABORT, P_DATA
 from pynetdicom.sop_class import Verification
-from .encoded_pdu_items import a_associate_ac, a_release_rq
+from pynetdicom.transport import AddressInformation, AssociationSocket
+from .encoded_pdu_items import a_associate_ac, a_associate_rq, a_release_rq
 from .parrot import start_server, ThreadedParrot, ParrotRequest
 from .utils import sleep, get_port
 
@@ -65,6 +68,9 @@ class DummyAssociation:
 
     acse = DummyACSE()
 
+    def _teardown(self):
+        pass
+
 
 class TestDUL:
     """Run tests on DUL service provider.
@@ -144,6 +150,264 @@ class TestDUL:
             dul.to_provider_queue.put("TEST")
             dul._process_recv_primitive()
 
+    def test_queue_put_wakes_reactor(self):
+        """Test adding to the DUL queues writes to the wakeup socket."""
+        dul = DULServiceProvider(DummyAssociation())
+        # No wakeup socket until the reactor is started
+        assert dul._wakeup_send is None
+        dul.event_queue.put("Evt1")
+
+        dul._wakeup_recv, dul._wakeup_send = socket.socketpair()
+        dul._wakeup_recv.settimeout(1)
+
+        dul.event_queue.put("Evt1")
+        assert dul._wakeup_recv.recv(1) == b"\x00"
+
+        dul.to_provider_queue.put(A_RELEASE())
+        assert dul._wakeup_recv.recv(1) == b"\x00"
+
+        dul._wakeup_recv.close()
+        dul._wakeup_send.close()
+
+    def test_reactor_blocks_until_woken(self):
+        """Test the reactor waits on the selector rather than polling."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        dul = assoc.dul
+        dul._max_wait = 10
+        waits = []
+        orig_wait = dul._wait
+
+        def patch_wait():
+            waits.append(time.monotonic())
+            orig_wait()
+
+        dul._wait = patch_wait
+        time.sleep(0.1)
+        nr_waits = len(waits)
+        time.sleep(0.2)
+        # Idle reactor shouldn't be looping
+        assert len(waits) == nr_waits
+
+        start = time.monotonic()
+        assoc.release()
+        assert assoc.is_released
+        assert time.monotonic() - start < 5
+
+        scp.shutdown()
+
+    def test_reactor_closes_wakeup(self):
+        """Test the wakeup socket and selector are closed on exit."""
+        self.ae = ae = AE()
+        ae.network_timeout = 5
+        ae.dimse_timeout = 5
+        ae.acse_timeout = 5
+        ae.add_supported_context(Verification)
+        scp = ae.start_server(("localhost", get_port()), block=False)
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assoc.release()
+        assoc.dul.join(timeout=5)
+
+        assert not assoc.dul.is_alive()
+        assert assoc.dul._selector is None
+        assert assoc.dul._wakeup_recv is None
+        assert assoc.dul._wakeup_send is None
+        # Waking a stopped reactor is a no-op
+        assoc.dul._wakeup()
+
+        scp.shutdown()
+
+    def test_read_pdu_data_buffer(self):
+        """Test PDUs are read into the reusable receive buffer."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul.socket.event_queue.get(block=False)
+
+        size = len(dul._recv_buffer)
+        # A P-DATA-TF larger than the initial buffer
+        data = bytes(range(256)) * (3 * size // 256)
+        primitive = P_DATA()
+        primitive.presentation_data_value_list = [[1, b"\x00" + data]]
+        pdu = P_DATA_TF()
+        pdu.from_primitive(primitive)
+        sender = threading.Thread(target=remote.sendall, args=(pdu.encode(),))
+        sender.start()
+        dul._read_pdu_data()
+        sender.join()
+
+        assert dul.event_queue.get(block=False) == "Evt10"
+        first = dul._recv_pdu.get(block=False)
+        assert isinstance(first, P_DATA)
+        assert first.presentation_data_value_list[0][1] == b"\x00" + data
+        assert len(dul._recv_buffer) >= len(pdu)
+
+        # Reusing the buffer doesn't change previously decoded PDUs
+        remote.sendall(A_RELEASE_RQ().encode())
+        dul._read_pdu_data()
+        assert dul.event_queue.get(block=False) == "Evt12"
+        assert isinstance(dul._recv_pdu.get(block=False), A_RELEASE_RQ)
+        assert first.presentation_data_value_list[0][1] == b"\x00" + data
+
+        local.close()
+        remote.close()
+
+    def test_decode_pdu_p_data_tf(self):
+        """Test P-DATA-TF PDUs are only decoded to PDUs when observed."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        primitive = P_DATA()
+        primitive.presentation_data_value_list = [[1, b"\x03\x01\x02\x03"]]
+        data = P_DATA_TF(primitive).encode()
+
+        # Only the default handler bound: decoded directly to P-DATA
+        pdu, event = assoc.dul._decode_pdu(memoryview(data))
+        assert event == "Evt10"
+        assert isinstance(pdu, P_DATA)
+        assert pdu.presentation_data_value_list == [(1, b"\x03\x01\x02\x03")]
+
+        # EVT_DATA_RECV handlers don't require the PDU
+        received = []
+        assoc.bind(evt.EVT_DATA_RECV, lambda event: received.append(event.data))
+        pdu, event = assoc.dul._decode_pdu(memoryview(data))
+        assert isinstance(pdu, P_DATA)
+        assert received == [data]
+
+        # EVT_PDU_RECV handlers do
+        pdus = []
+        assoc.bind(evt.EVT_PDU_RECV, lambda event: pdus.append(event.pdu))
+        pdu, event = assoc.dul._decode_pdu(memoryview(data))
+        assert event == "Evt10"
+        assert isinstance(pdu, P_DATA_TF)
+        assert pdus == [pdu]
+        assert received == [data, data]
+
+    def test_decode_pdu_data_recv_unbound(self, monkeypatch):
+        """Test EVT_DATA_RECV is only triggered when handlers are bound."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        data = A_RELEASE_RQ().encode()
+
+        triggered = []
+        trigger = evt.trigger
+
+        def record(assoc, event, attrs=None):
+            triggered.append(event)
+            return trigger(assoc, event, attrs)
+
+        monkeypatch.setattr(evt, "trigger", record)
+        pdu, event = assoc.dul._decode_pdu(memoryview(data))
+        assert isinstance(pdu, A_RELEASE_RQ)
+        assert evt.EVT_DATA_RECV not in triggered
+
+        received = []
+        assoc.bind(evt.EVT_DATA_RECV, lambda event: received.append(event.data))
+        pdu, event = assoc.dul._decode_pdu(memoryview(data))
+        assert isinstance(pdu, A_RELEASE_RQ)
+        assert evt.EVT_DATA_RECV in triggered
+        assert received == [data]
+        assert isinstance(received[0], bytes)
+
+    def test_read_pdu_data_buffer_bad_length(self, caplog):
+        """Test a bogus PDU length doesn't allocate the full length up front."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul.socket.event_queue.get(block=False)
+
+        size = len(dul._recv_buffer)
+        remote.sendall(b"\x04\x00\xff\xff\xff\xff" + b"\x00" * 10)
+        remote.close()
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            dul._read_pdu_data()
+
+        assert dul.event_queue.get(block=False) == "Evt17"
+        assert len(dul._recv_buffer) == size
+        assert "The received PDU is shorter than expected" in caplog.text
+
+        local.close()
+
+    def test_read_available_pdu_data(self):
+        """Test PDUs are read incrementally without blocking."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul.socket.event_queue.get(block=False)
+
+        # Not flagged as readable by the reactor
+        remote.sendall(a_release_rq)
+        assert not dul._read_available_pdu_data()
+        assert dul.event_queue.empty()
+
+        dul._readable = True
+        assert dul._read_available_pdu_data()
+        assert dul.event_queue.get(block=False) == "Evt12"
+        assert isinstance(dul._recv_pdu.get(block=False), A_RELEASE_RQ)
+        assert dul._readable
+
+        # Partial header, then partial PDU
+        data = a_associate_ac
+        remote.sendall(data[:3])
+        assert dul._read_available_pdu_data()
+        assert dul.event_queue.empty()
+        assert not dul._readable
+        assert dul._recv_offset == 3
+
+        dul._readable = True
+        remote.sendall(data[3:20])
+        assert dul._read_available_pdu_data()
+        assert dul.event_queue.empty()
+        assert dul._recv_offset == 20
+
+        dul._readable = True
+        remote.sendall(data[20:])
+        assert dul._read_available_pdu_data()
+        assert dul.event_queue.get(block=False) == "Evt3"
+        assert isinstance(dul._recv_pdu.get(block=False), A_ASSOCIATE_AC)
+        assert dul._recv_offset == 0
+
+        # The socket's timeout is restored
+        assert local.gettimeout() is None
+
+        # Connection closed by the peer
+        remote.close()
+        assert dul._read_available_pdu_data()
+        assert dul.event_queue.get(block=False) == "Evt17"
+
+        local.close()
+
+    def test_read_available_pdu_data_unknown(self, caplog):
+        """Test reading an unknown PDU type without blocking."""
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul.socket.event_queue.get(block=False)
+
+        remote.sendall(b"\x10\x00\x00\x00\x00\x04\x00\x00\x00\x00")
+        dul._readable = True
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            assert dul._read_available_pdu_data()
+
+        assert dul.event_queue.get(block=False) == "Evt19"
+        assert "Unknown PDU type received '0x10'" in caplog.text
+
+        local.close()
+        remote.close()
+
     def test_recv_failure_aborts(self, caplog):
         """Test connection close during PDU recv causes abort."""
         with caplog.at_level(logging.ERROR, logger="pynetdicom"):
@@ -402,6 +666,83 @@ class TestDUL:
 
         scp.shutdown()
 
+    def test_timer_callbacks(self):
+        """Test the timers wake the reactors when they expire."""
+        assoc = DummyAssociation()
+        assoc._reactor_wakeup = threading.Event()
+        dul = DULServiceProvider(assoc)
+
+        dul.artim_timer.timeout = 0.01
+        dul.artim_timer.start()
+        timeout = 0
+        while not dul._is_artim_expired and timeout < 2:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        assert dul._is_artim_expired
+
+        dul._idle_timer.timeout = 0.01
+        dul._idle_timer.start()
+        assert assoc._reactor_wakeup.wait(2)
+        assert dul.idle_timer_expired()
+
+    def test_wait_for_idle(self):
+        """Test waiting for the state machine to return to Sta1."""
+        dul = DULServiceProvider(DummyAssociation())
+        assert dul._wait_for_idle(0)
+
+        dul.state_machine.current_state = "Sta6"
+        assert not dul._wait_for_idle(0.05)
+
+        def transition():
+            time.sleep(0.1)
+            dul.state_machine.transition("Sta1")
+
+        thread = threading.Thread(target=transition)
+        thread.start()
+        start = time.monotonic()
+        assert dul._wait_for_idle(5)
+        assert time.monotonic() - start < 2
+        thread.join()
+
+        # Returns once the reactor has stopped
+        dul.state_machine.current_state = "Sta6"
+        dul._set_stopped()
+        assert dul._wait_for_idle()
+
+    def test_set_throttled(self):
+        """Test pausing and resuming reading from the peer."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._idle_timer.start()
+        dul.state_machine.current_state = "Sta6"
+        assert not dul._is_reading_paused()
+
+        dul._set_throttled(True)
+        assert dul._is_reading_paused()
+        assert not dul._idle_timer.is_running
+        assert not dul._is_transport_event()
+
+        # Only paused during data transfer
+        dul.state_machine.current_state = "Sta7"
+        assert not dul._is_reading_paused()
+        dul.state_machine.current_state = "Sta6"
+
+        dul._set_throttled(False)
+        assert not dul._is_reading_paused()
+        assert dul._idle_timer.is_running
+
+    def test_wait_for_close(self):
+        """Test waiting in Sta13 for the peer to close the connection."""
+        dul = DULServiceProvider(DummyAssociation())
+        dul._close_timer.timeout = 0.1
+        assert not dul._close_timer.is_running
+        assert dul._is_waiting_for_close()
+        assert dul._close_timer.is_running
+        assert dul._is_waiting_for_close()
+
+        time.sleep(0.15)
+        assert not dul._is_waiting_for_close()
+
     def test_send_over_closed(self, caplog):
         """Test attempting to send data over closed socket logs warning."""
         with caplog.at_level(logging.WARNING, logger="pynetdicom"):
@@ -424,3 +765,138 @@ class TestDUL:
 
             scp.shutdown()
             assert "Attempted to send data over closed connection" in caplog.text
+
+
+class TestSharedReactor:
+    """Tests for SharedReactor."""
+
+    def setup_method(self):
+        self.reactor = None
+
+    def teardown_method(self):
+        if self.reactor:
+            self.reactor.stop(timeout=0)
+
+    def test_run_dul(self):
+        """Test the reactor runs a registered DUL."""
+        calls = []
+        self.reactor = reactor = SharedReactor(calls.append)
+        reactor.start()
+
+        assoc = Association(AE(), MODE_REQUESTOR)
+        assoc.acceptor.address_info = AddressInformation("127.0.0.1", 11112)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul._reactor = reactor
+        assert not dul.is_alive()
+        dul.start()
+        assert dul.is_alive()
+        assert not isinstance(threading.current_thread(), DULServiceProvider)
+        assert dul not in threading.enumerate()
+
+        # Evt5: Transport connection indication
+        timeout = 0
+        while dul.state_machine.current_state != "Sta2" and timeout < 5:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        assert dul.state_machine.current_state == "Sta2"
+        assert assoc._dul_ready.is_set()
+        assert calls and calls[0] is dul
+
+        # The peer's A-ASSOCIATE-RQ is received without blocking the reactor
+        remote.sendall(a_associate_rq[:10])
+        time.sleep(0.1)
+        assert dul.state_machine.current_state == "Sta2"
+        remote.sendall(a_associate_rq[10:])
+        assert isinstance(dul.receive_pdu(wait=True, timeout=5), A_ASSOCIATE)
+        assert dul.state_machine.current_state == "Sta3"
+
+        # Closing the connection unregisters the DUL
+        remote.close()
+        timeout = 0
+        while dul.is_alive() and timeout < 5:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        assert not dul.is_alive()
+        assert dul.state_machine.current_state == "Sta1"
+        assert calls[-1] is dul
+        assert dul.socket.socket is None
+
+    def test_idle_dul(self):
+        """Test an idle DUL is only run when woken."""
+        calls = []
+        self.reactor = reactor = SharedReactor(calls.append)
+        reactor.start()
+
+        assoc = Association(AE(), MODE_REQUESTOR)
+        assoc.acceptor.address_info = AddressInformation("127.0.0.1", 11112)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul._reactor = reactor
+        dul.start()
+
+        timeout = 0
+        while dul.state_machine.current_state != "Sta2" and timeout < 5:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        time.sleep(0.1)
+        calls.clear()
+        time.sleep(1.2)
+        assert calls == []
+
+        # The service user is run when one of its timers wakes it
+        dul._wakeup_user()
+        timeout = 0
+        while not calls and timeout < 5:
+            time.sleep(0.01)
+            timeout += 0.01
+
+        assert calls == [dul]
+
+        local.close()
+        remote.close()
+
+    def test_stop_dul(self):
+        """Test stopping a DUL driven by the reactor."""
+        self.reactor = reactor = SharedReactor(lambda dul: None)
+        reactor.start()
+
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul.socket.event_queue.get(block=False)
+        dul._reactor = reactor
+        dul.start()
+        assert dul.is_alive()
+        assert dul.stop_dul()
+        assert not dul.is_alive()
+
+        local.close()
+        remote.close()
+
+    def test_stop_abandons(self):
+        """Test stopping the reactor closes any remaining connections."""
+        self.reactor = reactor = SharedReactor(lambda dul: None)
+        reactor.start()
+
+        assoc = Association(AE(), MODE_REQUESTOR)
+        dul = assoc.dul
+        local, remote = socket.socketpair()
+        dul.socket = AssociationSocket(assoc, client_socket=local)
+        dul._reactor = reactor
+        dul.start()
+
+        reactor.stop(timeout=0)
+        assert not reactor.is_alive()
+        assert not dul.is_alive()
+        assert dul._kill_thread
+        assert dul.socket.socket is None
+        assert remote.recv(1) == b""
+
+        remote.close()
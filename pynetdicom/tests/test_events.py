@@ -233,6 +233,13 @@ class TestEvent:
         with pytest.raises(AttributeError, match=msg):
             event.dataset_path
 
+        msg = (
+            r"The corresponding event is either not a C-STORE request or "
+            r"'STORE_RECV_STREAMING' is not True."
+        )
+        with pytest.raises(AttributeError, match=msg):
+            event.dataset_stream
+
     def test_is_cancelled_non(self):
         """Test Event.is_cancelled with wrong event type."""
         event = evt.Event(None, evt.EVT_DATA_RECV)
@@ -189,6 +189,65 @@ class TestStateMachine:
             assert fsm.dul.is_killed is True
             assert fsm.current_state == state
 
+    def test_dispatch_table(self):
+        """Test the dispatch table matches the transition table."""
+        for event in EVENTS:
+            for state in STATES:
+                action = FINITE_STATE._DISPATCH[FINITE_STATE._EVENT_INDEX[event]][
+                    FINITE_STATE._STATE_INDEX[state]
+                ]
+                assert action == TRANSITION_TABLE.get((event, state))
+
+    def test_unknown_event_raises(self):
+        """Test StateMachine.do_action raises if the event is unknown."""
+        ae = AE()
+        ae.add_requested_context(Verification)
+
+        assoc = Association(ae, mode="requestor")
+        fsm = assoc.dul.state_machine
+
+        msg = r"Invalid event 'Evt0' for the current state 'Sta1'"
+        with pytest.raises(InvalidEventError, match=msg):
+            fsm.do_action("Evt0")
+
+    def test_transition_event_not_bound(self, monkeypatch):
+        """Test EVT_FSM_TRANSITION is only triggered if a handler is bound."""
+        ae = AE()
+        ae.add_requested_context(Verification)
+
+        assoc = Association(ae, mode="requestor")
+        fsm = assoc.dul.state_machine
+
+        triggered = []
+
+        def trigger(assoc, event, attrs=None):
+            triggered.append((event, attrs))
+
+        monkeypatch.setattr(FINITE_STATE.evt, "trigger", trigger)
+        monkeypatch.setitem(
+            FINITE_STATE.ACTIONS, "AA-8", ("Bluh", lambda dul: "Sta13", "Sta13")
+        )
+
+        fsm.current_state = "Sta6"
+        fsm.do_action("Evt19")
+        assert fsm.current_state == "Sta13"
+        assert triggered == []
+
+        assoc.bind(evt.EVT_FSM_TRANSITION, lambda event: None)
+        fsm.current_state = "Sta6"
+        fsm.do_action("Evt19")
+        assert triggered == [
+            (
+                evt.EVT_FSM_TRANSITION,
+                {
+                    "action": "AA-8",
+                    "current_state": "Sta6",
+                    "fsm_event": "Evt19",
+                    "next_state": "Sta13",
+                },
+            )
+        ]
+
 
 class TestStateBase:
     """Base class for State tests."""
@@ -39,6 +39,7 @@ from pynetdicom.pdu_primitives import (
     ImplementationVersionNameNotification,
     A_P_ABORT,
     A_ABORT,
+    P_DATA,
 )
 from .encoded_pdu_items import (
     a_associate_rq,
@@ -109,6 +110,32 @@ class TestPDU:
         with pytest.raises(NotImplementedError):
             pdu._encoders
 
+    @pytest.mark.parametrize(
+        "pdu_class, data",
+        [
+            (A_ASSOCIATE_RQ, a_associate_rq),
+            (A_ASSOCIATE_RQ, a_associate_rq_user_id_ext_neg),
+            (A_ASSOCIATE_AC, a_associate_ac),
+            (A_ASSOCIATE_RJ, a_associate_rj),
+            (P_DATA_TF, p_data_tf),
+            (A_RELEASE_RQ, a_release_rq),
+            (A_RELEASE_RP, a_release_rp),
+            (A_ABORT_RQ, a_abort),
+        ],
+    )
+    def test_encode_into(self, pdu_class, data):
+        """Test encoding a PDU into a buffer at an offset."""
+        pdu = pdu_class()
+        pdu.decode(data)
+        buffer = bytearray(b"\xff" * (len(data) + 4))
+        assert pdu._encode_into(buffer, 2) == len(data) + 2
+        assert buffer == b"\xff\xff" + data + b"\xff\xff"
+
+        # Matches the output from the field encoders
+        buffer = bytearray(len(data))
+        assert PDU._encode_into(pdu, buffer, 0) == len(data)
+        assert buffer == data
+
     def test_generate_items(self):
         """Test the PDU._generate_items method."""
         pdu = PDU()
@@ -382,6 +409,26 @@ class TestASSOC_RQ:
 
         assert out == a_associate_rq
 
+    def test_from_template(self):
+        """Check creating a PDU from a template PDU."""
+        template = A_ASSOCIATE_RQ()
+        template.decode(a_associate_rq)
+        assert template._encoded is None
+        assert template._encode_buffers() == [a_associate_rq]
+
+        pdu = template._from_template("STORESCP")
+        assert template._encoded == a_associate_rq
+        assert template.called_ae_title == "ANY-SCP"
+        assert pdu.called_ae_title == "STORESCP"
+        assert pdu.calling_ae_title == "ECHOSCU"
+        assert pdu.variable_items is template.variable_items
+
+        # Only the Called AE Title is patched
+        assert pdu._encode_buffers() == [pdu.encode()]
+        assert pdu._encoded[:10] == a_associate_rq[:10]
+        assert pdu._encoded[10:26] == b"STORESCP        "
+        assert pdu._encoded[26:] == a_associate_rq[26:]
+
     def test_to_primitive(self):
         """Check converting PDU to primitive"""
         pdu = A_ASSOCIATE_RQ()
@@ -1183,6 +1230,26 @@ class TestP_DATA_TF:
 
         assert pdu.encode() == p_data_tf
 
+    def test_encode_buffers(self):
+        """Check encoding a p_data as buffers produces the correct output"""
+        pdu = P_DATA_TF()
+        pdu.decode(p_data_tf)
+        pdv = pdu.presentation_data_value_items[0]
+        item = PresentationDataValueItem()
+        item.presentation_context_id = 3
+        item.presentation_data_value = b""
+        pdu.presentation_data_value_items.append(item)
+
+        buffers = pdu._encode_buffers()
+        assert len(buffers) == 4
+        assert b"".join(buffers) == pdu.encode()
+        # PDU length includes the extra 5 byte PDV item
+        assert buffers[0] == p_data_tf[:5] + b"\x59"
+        assert buffers[1] == p_data_tf[6:11]
+        # The presentation data value isn't copied
+        assert buffers[2] is pdv.presentation_data_value
+        assert buffers[3] == b"\x00\x00\x00\x01\x03"
+
     def test_to_primitive(self):
         """Check converting PDU to primitive"""
         pdu = P_DATA_TF()
@@ -1193,6 +1260,64 @@ class TestP_DATA_TF:
         assert primitive.presentation_data_value_list == [(1, p_data_tf[11:])]
         assert isinstance(primitive.presentation_data_value_list, list)
 
+    def test_decode_primitive(self):
+        """Test decoding directly to a P-DATA primitive"""
+        primitive = P_DATA_TF._decode_primitive(p_data_tf)
+        assert isinstance(primitive, P_DATA)
+        pdvs = primitive.presentation_data_value_list
+        assert pdvs == [(1, p_data_tf[11:])]
+        assert isinstance(pdvs[0][1], bytes)
+
+        # Decoding from a memoryview leaves no references to its buffer
+        buffer = bytearray(p_data_tf)
+        with memoryview(buffer) as view:
+            primitive = P_DATA_TF._decode_primitive(view)
+
+        pdvs = primitive.presentation_data_value_list
+        assert isinstance(pdvs[0][1], bytes)
+        assert pdvs[0][1] + b"" == p_data_tf[11:]
+        buffer.clear()
+        assert pdvs == [(1, p_data_tf[11:])]
+
+        # Multiple PDV items
+        data = (
+            b"\x04\x00\x00\x00\x00\x11"
+            b"\x00\x00\x00\x04\x01\x01\x02\x03"
+            b"\x00\x00\x00\x05\x02\x03\x01\x02\x03"
+        )
+        primitive = P_DATA_TF._decode_primitive(data)
+        assert primitive.presentation_data_value_list == [
+            (1, b"\x01\x02\x03"),
+            (2, b"\x03\x01\x02\x03"),
+        ]
+
+        # Matches the standard decode
+        pdu = P_DATA_TF()
+        pdu.decode(data)
+        assert (
+            pdu.to_primitive().presentation_data_value_list
+            == primitive.presentation_data_value_list
+        )
+
+    def test_decode_primitive_raises(self):
+        """Test failure modes of decoding directly to a P-DATA primitive"""
+        msg = "The P-DATA-TF contains a PDV item with an invalid length"
+        # Short data
+        data = b"\x04\x00\x00\x00\x00\x07\x00\x00\x00\x04\x01\x01\x02"
+        with pytest.raises(ValueError, match=msg):
+            P_DATA_TF._decode_primitive(data)
+
+        # No presentation data value
+        data = b"\x04\x00\x00\x00\x00\x05\x00\x00\x00\x01\x01"
+        with pytest.raises(ValueError, match=msg):
+            P_DATA_TF._decode_primitive(data)
+
+        # Truncated PDV item header
+        msg = "The P-DATA-TF contains a truncated PDV item"
+        data = b"\x04\x00\x00\x00\x00\x03\x00\x00\x00"
+        with pytest.raises(ValueError, match=msg):
+            P_DATA_TF._decode_primitive(data)
+
     def test_from_primitive(self):
         """Check converting PDU to primitive"""
         orig_pdu = P_DATA_TF()
@@ -1606,6 +1731,14 @@ class TestEventHandlingAcceptor:
         assoc = ae.associate("localhost", get_port())
         assert assoc.is_established
 
+        # The acceptor triggers EVT_PDU_SENT for the A-ASSOCIATE-AC after
+        #   sending it, which may be after the requestor has received it
+        child = scp.active_associations[0]
+        timeout = time.monotonic() + 5
+        while child.dul.state_machine.current_state != "Sta6":
+            assert time.monotonic() < timeout
+            time.sleep(0.01)
+
         assert len(triggered) == 0
         scp.bind(evt.EVT_PDU_SENT, handle)
 
@@ -1655,6 +1788,13 @@ class TestEventHandlingAcceptor:
         child = scp.active_associations[0]
         assert child.get_handlers(evt.EVT_PDU_SENT) == [(handle, None)]
 
+        # The acceptor triggers EVT_PDU_SENT for the A-ASSOCIATE-AC after
+        #   sending it, which may be after the requestor has received it
+        timeout = time.monotonic() + 5
+        while child.dul.state_machine.current_state != "Sta6":
+            assert time.monotonic() < timeout
+            time.sleep(0.01)
+
         scp.unbind(evt.EVT_PDU_SENT, handle)
 
         assoc.release()
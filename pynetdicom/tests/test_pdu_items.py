@@ -183,6 +183,46 @@ class TestPDU:
         with pytest.raises(NotImplementedError):
             item._encoders
 
+    @pytest.mark.parametrize(
+        "pdu_class, data",
+        [
+            (A_ASSOCIATE_RQ, a_associate_rq),
+            (A_ASSOCIATE_RQ, a_associate_rq_user_async),
+            (A_ASSOCIATE_RQ, a_associate_rq_role),
+            (A_ASSOCIATE_RQ, a_associate_rq_user_id_user_pass),
+            (A_ASSOCIATE_RQ, a_associate_rq_user_id_ext_neg),
+            (A_ASSOCIATE_RQ, a_associate_rq_com_ext_neg),
+            (A_ASSOCIATE_AC, a_associate_ac),
+            (A_ASSOCIATE_AC, a_associate_ac_user),
+        ],
+    )
+    def test_encode_into(self, pdu_class, data):
+        """Test encoding items into a buffer at an offset."""
+        pdu = pdu_class()
+        pdu.decode(data)
+        items = []
+        for item in pdu.variable_items:
+            items.append(item)
+            if isinstance(item, PresentationContextItemRQ):
+                items.extend(item.abstract_transfer_syntax_sub_items)
+            elif isinstance(item, PresentationContextItemAC):
+                items.extend(item.transfer_syntax_sub_item)
+            elif isinstance(item, UserInformationItem):
+                items.extend(item.user_data)
+
+        for item in items:
+            encoded = item.encode()
+            assert len(encoded) == len(item)
+
+            buffer = bytearray(b"\xff" * (len(item) + 4))
+            assert item._encode_into(buffer, 2) == len(item) + 2
+            assert buffer == b"\xff\xff" + encoded + b"\xff\xff"
+
+            # Matches the output from the field encoders
+            buffer = bytearray(len(item))
+            assert PDUItem._encode_into(item, buffer, 0) == len(item)
+            assert buffer == encoded
+
     def test_generate_items(self):
         """Test the PDU._generate_items method."""
         item = PDUItem()
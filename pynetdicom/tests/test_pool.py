@@ -0,0 +1,253 @@
+"""Tests for the requestor association pool."""
+
+import threading
+import time
+
+import pytest
+
+from pynetdicom import AE, evt, build_context
+from pynetdicom.pool import AssociationPool
+from pynetdicom.sop_class import Verification, CTImageStorage
+
+from .utils import get_port
+
+# debug_logger()
+
+
+def make_ae():
+    """Return an AE with short timeouts."""
+    ae = AE()
+    ae.acse_timeout = 5
+    ae.dimse_timeout = 5
+    ae.network_timeout = 5
+    return ae
+
+
+class TestAssociationPool:
+    """Tests for AssociationPool."""
+
+    def setup_method(self):
+        self.scp = None
+        self.pool = None
+        self.requests = []
+
+    def teardown_method(self):
+        if self.pool:
+            self.pool.shutdown()
+
+        if self.scp:
+            self.scp.shutdown()
+
+    def start_scp(self, handlers=None):
+        def handle_requested(event):
+            self.requests.append(event.assoc)
+
+        ae = make_ae()
+        ae.add_supported_context(Verification)
+        ae.add_supported_context(CTImageStorage)
+        handlers = (handlers or []) + [(evt.EVT_REQUESTED, handle_requested)]
+        self.scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+    def make_pool(self, **kwargs):
+        ae = make_ae()
+        ae.add_requested_context(Verification)
+        self.pool = AssociationPool(ae, **kwargs)
+        return self.pool
+
+    def test_init(self):
+        """Test creating a pool."""
+        ae = AE()
+        pool = AssociationPool(ae)
+        assert pool.ae is ae
+        assert pool.max_per_peer == 4
+        assert pool.idle_timeout == 60
+        assert pool.echo is False
+        assert pool.timeout is None
+
+        msg = r"'max_per_peer' must be at least 1"
+        with pytest.raises(ValueError, match=msg):
+            AssociationPool(ae, max_per_peer=0)
+
+    def test_reuse(self):
+        """Test idle associations are reused for the same key."""
+        self.start_scp()
+        pool = self.make_pool()
+
+        assoc = pool.acquire("localhost", get_port())
+        assert assoc.is_established
+        assert assoc.send_c_echo().Status == 0x0000
+        pool.release(assoc)
+        assert assoc.is_established
+
+        assert pool.acquire("localhost", get_port()) is assoc
+        pool.release(assoc)
+        assert len(self.requests) == 1
+
+        # Different contexts and AE title use different associations
+        contexts = [build_context(CTImageStorage)]
+        other = pool.acquire("localhost", get_port(), contexts)
+        assert other is not assoc
+        assert other.accepted_contexts[0].abstract_syntax == CTImageStorage
+        pool.release(other)
+
+        third = pool.acquire("localhost", get_port(), ae_title="OTHER")
+        assert third not in (assoc, other)
+        pool.release(third)
+        assert len(self.requests) == 3
+
+        pool.shutdown()
+        for item in (assoc, other, third):
+            assert item.is_released
+
+    def test_max_per_peer(self):
+        """Test the number of associations with a peer is limited."""
+        self.start_scp()
+        pool = self.make_pool(max_per_peer=1, timeout=0.1)
+
+        assoc = pool.acquire("localhost", get_port())
+        msg = (
+            r"Timed out waiting for an association with the peer to become "
+            r"available"
+        )
+        with pytest.raises(RuntimeError, match=msg):
+            pool.acquire("localhost", get_port())
+
+        # An idle association with different contexts is evicted to make room
+        pool.release(assoc)
+        contexts = [build_context(CTImageStorage)]
+        other = pool.acquire("localhost", get_port(), contexts)
+        assert other is not assoc
+        assert assoc.is_released
+        pool.release(other)
+
+    def test_wait_for_release(self):
+        """Test acquire() waits for an association to be returned."""
+        self.start_scp()
+        pool = self.make_pool(max_per_peer=1, timeout=5)
+
+        assoc = pool.acquire("localhost", get_port())
+
+        def handle_release():
+            time.sleep(0.2)
+            pool.release(assoc)
+
+        thread = threading.Thread(target=handle_release)
+        thread.start()
+        assert pool.acquire("localhost", get_port()) is assoc
+        thread.join()
+        pool.release(assoc)
+
+    def test_idle_timeout(self):
+        """Test idle associations are released after the idle timeout."""
+        self.start_scp()
+        pool = self.make_pool(idle_timeout=0.2)
+
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        time.sleep(0.6)
+        assert assoc.is_released
+        assert pool._idle == {}
+        assert pool._counts == {}
+
+        other = pool.acquire("localhost", get_port())
+        assert other is not assoc
+        pool.release(other)
+
+    def test_not_usable(self):
+        """Test idle associations that are no longer established aren't used."""
+        self.start_scp()
+        pool = self.make_pool(max_per_peer=1, timeout=1)
+
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+        assoc.abort()
+
+        other = pool.acquire("localhost", get_port())
+        assert other is not assoc
+        assert other.is_established
+        pool.release(other)
+
+    def test_echo(self):
+        """Test checking idle associations with C-ECHO."""
+
+        def handle_echo(event):
+            return 0x0000 if len(self.requests) > 1 else 0x0110
+
+        self.start_scp([(evt.EVT_C_ECHO, handle_echo)])
+        pool = self.make_pool(echo=True)
+
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc)
+
+        # Failed C-ECHO check
+        other = pool.acquire("localhost", get_port())
+        assert other is not assoc
+        assert assoc.is_released
+        pool.release(other)
+
+        # Successful C-ECHO check
+        assert pool.acquire("localhost", get_port()) is other
+        pool.release(other)
+
+    def test_release_no_reuse(self):
+        """Test releasing associations that shouldn't be reused."""
+        self.start_scp()
+        pool = self.make_pool(max_per_peer=1, timeout=1)
+
+        assoc = pool.acquire("localhost", get_port())
+        pool.release(assoc, reuse=False)
+        assert assoc.is_released
+        assert pool._counts == {}
+
+        # Associations not from the pool are released
+        other = pool.ae.associate("localhost", get_port())
+        pool.release(other)
+        assert other.is_released
+
+    def test_association(self):
+        """Test the association() context manager."""
+        self.start_scp()
+        pool = self.make_pool()
+
+        with pool.association("localhost", get_port()) as assoc:
+            assert assoc.is_established
+
+        with pool.association("localhost", get_port()) as other:
+            assert other is assoc
+
+        with pytest.raises(ValueError):
+            with pool.association("localhost", get_port()) as other:
+                raise ValueError()
+
+        assert assoc.is_released
+
+    def test_not_established(self):
+        """Test failing to associate doesn't use up the peer's places."""
+        pool = self.make_pool(max_per_peer=1, timeout=0.1)
+
+        for _ in range(2):
+            assoc = pool.acquire("localhost", get_port())
+            assert not assoc.is_established
+
+        assert pool._counts == {}
+
+    def test_shutdown(self):
+        """Test shutting down the pool."""
+        self.start_scp()
+        pool = self.make_pool()
+
+        idle = pool.acquire("localhost", get_port())
+        in_use = pool.acquire("localhost", get_port())
+        pool.release(idle)
+        pool.shutdown()
+        assert idle.is_released
+        assert in_use.is_established
+
+        pool.release(in_use)
+        assert in_use.is_released
+
+        msg = r"The association pool has been shutdown"
+        with pytest.raises(RuntimeError, match=msg):
+            pool.acquire("localhost", get_port())
@@ -16,6 +16,7 @@ from pynetdicom.presentation import (
     build_context,
     build_role,
     PresentationContext,
+    _copy_contexts,
     negotiate_as_acceptor,
     negotiate_as_requestor,
     negotiate_unrestricted,
@@ -94,6 +95,24 @@ class TestPresentationContext:
         assert pc._as_scp is None
         assert pc.result is None
 
+    def test_copy_contexts(self):
+        """Test _copy_contexts()"""
+        contexts = [build_context("1.2.3", ["1.2", "1.3"]), build_context("1.2.4")]
+        contexts[0].context_id = 1
+        contexts[0].scu_role = True
+        contexts[0].scp_role = False
+        contexts[1].result = 0x00
+        contexts[1]._as_scu = True
+
+        copied = _copy_contexts(contexts)
+        for original, copy in zip(contexts, copied):
+            assert copy is not original
+            assert copy.transfer_syntax is not original.transfer_syntax
+            assert vars(copy) == vars(original)
+
+        copied[0].transfer_syntax.append(UID("1.4"))
+        assert contexts[0].transfer_syntax == ["1.2", "1.3"]
+
     def test_add_transfer_syntax(self):
         """Test adding transfer syntaxes"""
         pc = PresentationContext()
@@ -803,6 +822,20 @@ REFERENCE_ROLES = [
 ]
 
 
+class TestNegotiateAsAcceptorCached(TestNegotiateAsAcceptor):
+    """Tests ApplicationEntity._negotiate_as_acceptor."""
+
+    def setup_method(self):
+        ae = AE()
+
+        def test_func(*args):
+            # Return the result from the cache
+            ae._negotiate_as_acceptor(*args)
+            return ae._negotiate_as_acceptor(*args)
+
+        self.test_func = test_func
+
+
 class TestNegotiateAsAcceptorWithRoleSelection:
     """Tests negotiate_as_acceptor with role selection."""
 
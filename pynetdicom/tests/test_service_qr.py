@@ -32,6 +32,7 @@ from pynetdicom import (
 )
 from pynetdicom.dimse_primitives import C_FIND, C_GET, C_MOVE, C_STORE
 from pynetdicom.presentation import PresentationContext
+from pynetdicom.pool import AssociationPool
 from pynetdicom.service_class import (
     QueryRetrieveServiceClass,
     BasicWorklistManagementServiceClass,
@@ -5360,6 +5361,60 @@ class TestQRMoveServiceClass:
         assoc.release()
         scp.shutdown()
 
+    def test_move_association_pool(self):
+        """Test the C-STORE sub-operations use the AE's association pool"""
+        requests = []
+
+        def handle(event):
+            yield self.destination
+            yield 1
+            yield 0xFF00, self.ds
+
+        def handle_store(event):
+            return 0x0000
+
+        def handle_requested(event):
+            requests.append(event.assoc)
+
+        handlers = [
+            (evt.EVT_C_MOVE, handle),
+            (evt.EVT_C_STORE, handle_store),
+            (evt.EVT_REQUESTED, handle_requested),
+        ]
+
+        self.ae = ae = AE()
+        ae.add_supported_context(PatientRootQueryRetrieveInformationModelMove)
+        ae.add_supported_context(CTImageStorage, scu_role=False, scp_role=True)
+        ae.add_requested_context(PatientRootQueryRetrieveInformationModelMove)
+        ae.add_requested_context(CTImageStorage)
+        ae.association_pool = pool = AssociationPool(ae)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        ae.acse_timeout = 5
+        ae.dimse_timeout = 5
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        for _ in range(3):
+            result = assoc.send_c_move(
+                self.query, "TESTMOVE", PatientRootQueryRetrieveInformationModelMove
+            )
+            status, identifier = next(result)
+            assert status.Status == 0xFF00
+            status, identifier = next(result)
+            assert status.Status == 0x0000
+            assert status.NumberOfCompletedSuboperations == 1
+            pytest.raises(StopIteration, next, result)
+
+        # The move association and a single pooled store association
+        assert len(requests) == 2
+        assert len(pool._idle) == 1
+
+        assoc.release()
+        pool.shutdown()
+        scp.shutdown()
+
     def test_move_cancel(self):
         """Test handler returns cancel status"""
 
@@ -14,6 +14,7 @@ from pydicom.uid import ExplicitVRLittleEndian, ImplicitVRLittleEndian
 
 from pynetdicom import AE, _config, evt, debug_logger, register_uid, sop_class
 from pynetdicom.dimse_primitives import C_STORE
+from pynetdicom.dsutils import decode
 from pynetdicom.pdu_primitives import SOPClassExtendedNegotiation
 from pynetdicom.sop_class import (
     Verification,
@@ -77,6 +78,7 @@ class TestStorageServiceClass:
             self.ae.shutdown()
 
         _config.STORE_RECV_CHUNKED_DATASET = False
+        _config.STORE_RECV_STREAMING = False
 
     @pytest.mark.skipif(not HAS_STATUS, reason="No Status class available")
     def test_status_enum(self):
@@ -574,6 +576,135 @@ class TestStorageServiceClass:
 
         scp.shutdown()
 
+    def test_scp_handler_spool_threshold(self, tmp_path):
+        """Test datasets larger than the AE's spool threshold are spooled"""
+        attrs = {"paths": [], "encoded": [], "datasets": []}
+
+        def handle(event):
+            path = event.dataset_path
+            if path is not None:
+                assert path.parent == tmp_path
+                assert path.exists()
+
+            attrs["paths"].append(path)
+            attrs["encoded"].append(event.encoded_dataset(include_meta=False))
+            attrs["datasets"].append(event.dataset)
+            return 0x0000
+
+        # The AE's threshold takes precedence
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.maximum_pdu_size = 256
+        ae.store_recv_spool_threshold = 1024
+        ae.store_recv_spool_dir = tmp_path
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(self.ds)
+        assert status.Status == 0x0000
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        assert attrs["paths"][0] is None
+        assert isinstance(attrs["paths"][1], Path)
+        assert list(tmp_path.iterdir()) == []
+
+        assert len(attrs["encoded"][0]) < 1024
+        assert len(attrs["encoded"][1]) > 1024
+        assert attrs["datasets"][0].PatientName == "Test"
+        ds = decode(BytesIO(attrs["encoded"][1]), True, True, False)
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert attrs["datasets"][1].PatientName == ds.PatientName
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_stream(self):
+        """Test handler event's dataset_stream property"""
+        attrs = {}
+
+        def handle(event):
+            attrs["stream"] = stream = event.dataset_stream
+            attrs["data"] = stream.read()
+            attrs["is_complete"] = stream.is_complete
+            return 0x0000
+
+        _config.STORE_RECV_STREAMING = True
+        _config.STORE_RECV_CHUNKED_DATASET = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.maximum_pdu_size = 256
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        status = assoc.send_c_store(DATASET)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        assert attrs["is_complete"]
+        assert attrs["stream"].closed
+        ds = decode(BytesIO(attrs["data"]), True, True, False)
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert len(ds.DataSetTrailingPadding) == 126
+
+        scp.shutdown()
+
+    def test_scp_handler_dataset_stream_unread(self):
+        """Test handler not reading the dataset_stream"""
+        attrs = {"datasets": []}
+
+        def handle(event):
+            if event.request.MessageID == 2:
+                attrs["datasets"].append(event.dataset)
+
+            return 0x0000
+
+        _config.STORE_RECV_STREAMING = True
+
+        handlers = [(evt.EVT_C_STORE, handle)]
+
+        self.ae = ae = AE()
+        ae.maximum_pdu_size = 256
+        ae.add_supported_context(CTImageStorage)
+        ae.add_requested_context(CTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()), block=False, evt_handlers=handlers
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        status = assoc.send_c_store(DATASET, msg_id=1)
+        assert status.Status == 0x0000
+        status = assoc.send_c_store(DATASET, msg_id=2)
+        assert status.Status == 0x0000
+        assoc.release()
+        assert assoc.is_released
+
+        ds = attrs["datasets"][0]
+        assert "CompressedSamples^CT1" == ds.PatientName
+        assert len(ds.DataSetTrailingPadding) == 126
+
+        scp.shutdown()
+
     def test_scp_handler_move_origin(self):
         """Test handler event's request property with MoveOriginator"""
         attrs = {}
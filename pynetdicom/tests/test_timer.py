@@ -1,11 +1,14 @@
 """Unit tests for the Timer class."""
 
 import logging
+import random
+import threading
 import time
+from weakref import WeakMethod
 
 import pytest
 
-from pynetdicom.timer import Timer
+from pynetdicom.timer import Timer, TimerWheel, timer_wheel
 from .utils import sleep
 
 LOGGER = logging.getLogger(__name__)
@@ -61,6 +64,17 @@ class TestTimer:
         time.sleep(0.5)
         assert not timer.expired
 
+    def test_is_running(self):
+        """Test Timer.is_running."""
+        timer = Timer(0.2)
+        assert not timer.is_running
+        timer.start()
+        assert timer.is_running
+        timer.stop()
+        assert not timer.is_running
+        timer.restart()
+        assert timer.is_running
+
     def test_restart(self):
         """Test Timer restarts correctly."""
         timer = Timer(0.2)
@@ -124,3 +138,178 @@ class TestTimer:
         assert timer.timeout == 0.1
         assert timer.expired is True
         assert timer.remaining < 0
+
+    def test_clock_change(self, monkeypatch):
+        """Test the timer isn't affected by changes to the system clock."""
+        timer = Timer(10)
+        timer.start()
+        monkeypatch.setattr(time, "time", lambda: 0)
+        assert timer.expired is False
+        assert 9 < timer.remaining <= 10
+
+    def test_callback(self):
+        """Test the callback is called when the running timer expires."""
+        called = []
+        event = threading.Event()
+
+        def callback():
+            called.append(time.monotonic())
+            event.set()
+
+        timer = Timer(0.1, callback)
+        start = time.monotonic()
+        timer.start()
+        time.sleep(0.05)
+        # Restarting moves the deadline
+        timer.restart()
+        assert event.wait(2)
+        assert timer.expired
+        assert len(called) == 1
+        assert called[0] - start >= 0.15
+
+    def test_callback_stopped(self):
+        """Test the callback isn't called if the timer is stopped."""
+        called = []
+        timer = Timer(0.05, lambda: called.append(True))
+        timer.start()
+        timer.stop()
+        time.sleep(0.2)
+        assert called == []
+
+        # Not called if not running
+        timer = Timer(0.05, lambda: called.append(True))
+        timer.timeout = 0.01
+        time.sleep(0.1)
+        assert called == []
+
+    def test_callback_timeout(self):
+        """Test changing the timeout of a running timer."""
+        event = threading.Event()
+        timer = Timer(10, event.set)
+        timer.start()
+        timer.timeout = 0.05
+        assert event.wait(2)
+
+        event.clear()
+        timer.start()
+        timer.timeout = None
+        time.sleep(0.1)
+        assert not event.is_set()
+
+
+class Callback:
+    """Record when a deadline is reached."""
+
+    def __init__(self, due, results):
+        self.due = due
+        self.results = results
+
+    def __call__(self):
+        self.results.append(time.monotonic() - self.due)
+
+
+class TestTimerWheel:
+    """Tests for TimerWheel."""
+
+    def setup_method(self):
+        self.wheels = []
+
+    def teardown_method(self):
+        for wheel in self.wheels:
+            wheel.stop()
+
+    def create_wheel(self, **kwargs):
+        """Return a new wheel to be stopped after the test."""
+        wheel = TimerWheel(**kwargs)
+        self.wheels.append(wheel)
+        return wheel
+
+    def test_shared(self):
+        """Test the shared timer wheel."""
+        assert isinstance(timer_wheel(), TimerWheel)
+        assert timer_wheel() is timer_wheel()
+
+    def test_deadlines(self):
+        """Test deadlines at each level of the wheel are reached on time."""
+        # Small wheels so the deadlines span every level and beyond
+        wheel = self.create_wheel(resolution=0.001, slots=4, levels=3)
+        results = []
+        callbacks = []
+        for _ in range(200):
+            delay = random.uniform(0, 0.3)
+            callback = Callback(time.monotonic() + delay, results)
+            callbacks.append(callback)
+            wheel.schedule(delay, WeakMethod(callback.__call__))
+
+        time.sleep(0.5)
+        assert len(results) == 200
+        # Never early
+        assert min(results) >= 0
+        assert wheel._count == 0
+
+    def test_cancel(self):
+        """Test cancelled deadlines aren't called."""
+        wheel = self.create_wheel(resolution=0.001)
+        results = []
+        callback = Callback(time.monotonic(), results)
+        deadline = wheel.schedule(0.05, WeakMethod(callback.__call__))
+        deadline.cancel()
+        time.sleep(0.1)
+        assert results == []
+
+    def test_garbage_collected(self):
+        """Test the wheel doesn't keep the callback's object alive."""
+        wheel = self.create_wheel(resolution=0.001)
+        results = []
+        callback = Callback(time.monotonic(), results)
+        wheel.schedule(0.05, WeakMethod(callback.__call__))
+        del callback
+        time.sleep(0.1)
+        assert results == []
+
+    def test_callback_raises(self, caplog):
+        """Test an exception in a callback is logged."""
+
+        class Raiser:
+            def __call__(self):
+                raise ValueError("Bad callback")
+
+        wheel = self.create_wheel(resolution=0.001)
+        raiser = Raiser()
+        results = []
+        callback = Callback(time.monotonic(), results)
+        with caplog.at_level(logging.ERROR, logger="pynetdicom"):
+            wheel.schedule(0.01, WeakMethod(raiser.__call__))
+            wheel.schedule(0.02, WeakMethod(callback.__call__))
+            time.sleep(0.1)
+
+        assert "Exception raised by a timer wheel callback" in caplog.text
+        assert "Bad callback" in caplog.text
+        assert len(results) == 1
+
+    def test_stop(self):
+        """Test stopping the wheel's thread."""
+        wheel = self.create_wheel(resolution=0.001)
+        wheel.stop()
+
+        results = []
+        callback = Callback(time.monotonic(), results)
+        wheel.schedule(0.05, WeakMethod(callback.__call__))
+        thread = wheel._thread
+        assert thread.is_alive()
+
+        # Registered deadlines are discarded
+        wheel.stop()
+        assert not thread.is_alive()
+        assert wheel._thread is None
+        assert wheel._count == 0
+        time.sleep(0.1)
+        assert results == []
+
+        # Registering another deadline starts a new thread
+        wheel.schedule(0.01, WeakMethod(callback.__call__))
+        assert wheel._thread is not thread
+        time.sleep(0.1)
+        assert len(results) == 1
+        wheel.stop()
+        assert wheel._thread is None
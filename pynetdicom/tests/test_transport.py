@@ -20,6 +20,7 @@ from pydicom import dcmread
 import pynetdicom
 from pynetdicom import AE, evt, _config, debug_logger
 from pynetdicom.association import Association
+from pynetdicom.dimse_messages import _FileFragment
 from pynetdicom.events import Event
 from pynetdicom._globals import MODE_REQUESTOR
 from pynetdicom.pdu_primitives import A_ASSOCIATE
@@ -331,6 +332,186 @@ class TestAssociationSocket:
         assert sock.ready is False
         assert sock.event_queue.get() == "Evt17"
 
+    def test_recv_into(self):
+        """Test AssociationSocket.recv_into()."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        remote.sendall(b"\x01\x02\x03\x04")
+        buffer = bytearray(6)
+        with memoryview(buffer) as view:
+            assert sock.recv_into(view, 3) == 3
+            assert buffer == b"\x01\x02\x03\x00\x00\x00"
+            # Connection closed before all the data is read
+            remote.close()
+            assert sock.recv_into(view[3:], 3) == 1
+
+        assert buffer == b"\x01\x02\x03\x04\x00\x00"
+        local.close()
+
+    def test_recv(self):
+        """Test AssociationSocket.recv()."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        remote.sendall(b"\x01\x02\x03\x04")
+        assert sock.recv(3) == bytearray(b"\x01\x02\x03")
+        remote.close()
+        assert sock.recv(3) == bytearray(b"\x04")
+        assert sock.recv(3) == bytearray()
+        local.close()
+
+    def test_sendmsg(self):
+        """Test AssociationSocket.sendmsg()."""
+        events = []
+        self.assoc.bind(evt.EVT_DATA_SENT, lambda event: events.append(event.data))
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        sock.sendmsg([b"\x01\x02", memoryview(b"\x03\x04\x05"), b"", b"\x06"])
+
+        assert remote.recv(6) == b"\x01\x02\x03\x04\x05\x06"
+        assert events == [b"\x01\x02\x03\x04\x05\x06"]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        local.close()
+        remote.close()
+
+    def test_sendmsg_partial(self):
+        """Test AssociationSocket.sendmsg() with partial sends."""
+        sent = []
+
+        def sendmsg(buffers):
+            # Only send up to 2 bytes at a time
+            data = b"".join(buffers)[:2]
+            sent.append(data)
+            return len(data)
+
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        sock.socket = mock.MagicMock()
+        sock.socket.sendmsg = sendmsg
+        sock.sendmsg([b"\x01\x02\x03", b"\x04", b"\x05\x06\x07"])
+
+        assert sent == [b"\x01\x02", b"\x03\x04", b"\x05\x06", b"\x07"]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        local.close()
+        remote.close()
+
+    def test_sendmsg_fallback(self, monkeypatch):
+        """Test AssociationSocket.sendmsg() falls back to send()."""
+        monkeypatch.setattr(transport, "_HAS_SENDMSG", False)
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        sock.sendmsg([b"\x01\x02", memoryview(b"\x03")])
+
+        assert remote.recv(3) == b"\x01\x02\x03"
+
+        local.close()
+        remote.close()
+
+    @pytest.mark.skipif(not transport._HAS_SENDFILE, reason="Requires os.sendfile")
+    def test_sendmsg_file_fragment(self, tmp_path):
+        """Test AssociationSocket.sendmsg() with a fragment stored in a file."""
+        events = []
+        self.assoc.bind(evt.EVT_DATA_SENT, lambda event: events.append(event.data))
+        path = tmp_path / "fragment"
+        path.write_bytes(b"\x00\x01\x03\x04\x05\x06")
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        with open(path, "rb") as f:
+            fragment = _FileFragment(b"\x02", f, 2, 3)
+            sock.sendmsg([b"\x01", fragment, b"\x06"])
+
+        assert remote.recv(6) == b"\x01\x02\x03\x04\x05\x06"
+        assert events == [b"\x01\x02\x03\x04\x05\x06"]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        local.close()
+        remote.close()
+
+    @pytest.mark.skipif(not transport._HAS_SENDFILE, reason="Requires os.sendfile")
+    def test_sendmsg_file_fragment_fd(self, monkeypatch, tmp_path):
+        """Test AssociationSocket.sendmsg() sends fragments from the file's fd."""
+        calls = []
+        sendfile = os.sendfile
+
+        def _sendfile(out_fd, in_fd, offset, count):
+            calls.append((in_fd, offset, count))
+            # Send at most 2 bytes at a time
+            return sendfile(out_fd, in_fd, offset, min(count, 2))
+
+        monkeypatch.setattr(os, "sendfile", _sendfile)
+        path = tmp_path / "fragment"
+        path.write_bytes(b"\x00\x01\x02\x03\x04\x05\x06\x07")
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        with open(path, "rb") as f:
+            sock.sendmsg([_FileFragment(b"\x00", f, 1, 3)])
+            sock.sendmsg([_FileFragment(b"\x02", f, 4, 4)])
+
+        assert remote.recv(9) == b"\x00\x01\x02\x03\x02\x04\x05\x06\x07"
+        fd = calls[0][0]
+        assert calls == [(fd, 1, 3), (fd, 3, 1), (fd, 4, 4), (fd, 6, 2)]
+        with pytest.raises(queue.Empty):
+            sock.event_queue.get(block=False)
+
+        local.close()
+        remote.close()
+
+    def test_can_sendfile(self, monkeypatch):
+        """Test AssociationSocket._can_sendfile."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        monkeypatch.setattr(transport, "_HAS_SENDMSG", True)
+        monkeypatch.setattr(transport, "_HAS_SENDFILE", True)
+        assert sock._can_sendfile
+
+        monkeypatch.setattr(transport, "_HAS_SENDFILE", False)
+        assert not sock._can_sendfile
+        monkeypatch.setattr(transport, "_HAS_SENDFILE", True)
+        monkeypatch.setattr(transport, "_HAS_SENDMSG", False)
+        assert not sock._can_sendfile
+
+        local.close()
+        remote.close()
+
+    @pytest.mark.skipif(not transport._HAS_SENDFILE, reason="Requires os.sendfile")
+    def test_sendmsg_file_fragment_short(self, tmp_path):
+        """Test AssociationSocket.sendmsg() with a file that's too short."""
+        path = tmp_path / "fragment"
+        path.write_bytes(b"\x03\x04")
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        with open(path, "rb") as f:
+            sock.sendmsg([b"\x01", _FileFragment(b"\x02", f, 0, 3)])
+
+        assert sock.event_queue.get(block=False) == "Evt17"
+
+        local.close()
+        remote.close()
+
+    def test_sendmsg_raises(self):
+        """Test AssociationSocket.sendmsg() with an exception."""
+        local, remote = socket.socketpair()
+        sock = AssociationSocket(self.assoc, client_socket=local)
+        sock.event_queue.get(block=False)
+        sock.socket = mock.MagicMock()
+        sock.socket.sendmsg.side_effect = OSError
+        sock.sendmsg([b"\x01\x02"])
+
+        assert sock.event_queue.get(block=False) == "Evt17"
+
+        local.close()
+        remote.close()
+
     def test_print(self):
         """Test str(AssociationSocket)."""
         sock = AssociationSocket(self.assoc, address=AddressInformation("", 0))
@@ -1048,6 +1229,609 @@ class TestAssociationServer:
         server.shutdown()
 
 
+class TestMultiplexedAssociationServer:
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_multi_assoc(self):
+        """Test multiple associations without a thread per association."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 10
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.MultiplexedAssociationServer,
+            max_workers=2,
+        )
+        assert isinstance(scp, transport.MultiplexedAssociationServer)
+
+        assocs = []
+        for ii in range(10):
+            assoc = ae.associate("localhost", get_port())
+            assert assoc.is_established
+            assert assoc.send_c_echo().Status == 0x0000
+            assocs.append(assoc)
+
+        assert len(scp.active_associations) == 10
+        assert len([a for a in ae.active_associations if a.is_acceptor]) == 10
+        threads = threading.enumerate()
+        assert not [t for t in threads if "AcceptorThread" in t.name]
+        assert len([t for t in threads if "AcceptorWorker" in t.name]) <= 2
+
+        for assoc in assocs:
+            assoc.release()
+            assert assoc.is_released
+
+        timeout = 0
+        while scp.active_associations and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert scp.active_associations == []
+
+        scp.shutdown()
+
+    def test_store(self):
+        """Test receiving a large dataset in multiple PDUs."""
+        datasets = []
+
+        def handle_store(event):
+            datasets.append(event.dataset)
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.add_supported_context(RTImageStorage)
+        ae.add_requested_context(RTImageStorage)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_C_STORE, handle_store)],
+            server_class=transport.MultiplexedAssociationServer,
+            reactors=2,
+        )
+        assert len(scp._reactors) == 2
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        assert assoc.send_c_store(DATASET).Status == 0x0000
+        assoc.release()
+
+        assert len(datasets) == 2
+        assert datasets[0].SOPInstanceUID == DATASET.SOPInstanceUID
+
+        scp.shutdown()
+
+    def test_split_pdu(self):
+        """Test a PDU split across TCP segments doesn't block the reactor."""
+        events = []
+
+        def handle_echo(event):
+            events.append(event)
+            return 0x0000
+
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        server = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            evt_handlers=[(evt.EVT_C_ECHO, handle_echo)],
+            server_class=transport.MultiplexedAssociationServer,
+        )
+
+        req_sock = socket.create_connection(("localhost", get_port()))
+        req_sock.send(a_associate_rq)
+
+        while not server.active_associations:
+            time.sleep(0.001)
+
+        assoc = server.active_associations[0]
+        while not assoc.is_established:
+            time.sleep(0.001)
+
+        # Forcibly split the P-DATA PDU into two TCP segments
+        req_sock.send(p_data_tf_rq[:12])
+        time.sleep(0.2)
+
+        # Other associations are still serviced in the meantime
+        other = ae.associate("localhost", get_port())
+        assert other.is_established
+        assert other.send_c_echo().Status == 0x0000
+        other.release()
+        assert len(events) == 1
+
+        req_sock.send(p_data_tf_rq[12:])
+        while assoc.is_established and len(events) < 2:
+            time.sleep(0.001)
+
+        assert len(events) == 2
+
+        server.shutdown()
+        req_sock.close()
+
+    def test_acse_timeout(self):
+        """Test the connection is closed if no A-ASSOCIATE-RQ is received."""
+        self.ae = ae = AE()
+        ae.acse_timeout = 0.5
+        ae.add_supported_context(Verification)
+        server = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.MultiplexedAssociationServer,
+        )
+
+        req_sock = socket.create_connection(("localhost", get_port()))
+        req_sock.settimeout(5)
+        assert req_sock.recv(1) == b""
+
+        timeout = 0
+        while server.active_associations and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert server.active_associations == []
+
+        server.shutdown()
+        req_sock.close()
+
+    def test_maximum_associations(self):
+        """Test the maximum number of associations is enforced."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 1
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        server = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.MultiplexedAssociationServer,
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        assoc_b = ae.associate("localhost", get_port())
+        assert assoc_b.is_rejected
+
+        assoc.release()
+        server.shutdown()
+
+    def test_shutdown_aborts(self):
+        """Test shutting down the server aborts any associations."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        server = ae.make_server(
+            ("localhost", get_port()),
+            server_class=transport.MultiplexedAssociationServer,
+        )
+        ae._servers.append(server)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        ae.add_requested_context(Verification)
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        server.shutdown()
+
+        timeout = 0
+        while not assoc.is_aborted and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert assoc.is_aborted
+        assert not [r for r in server._reactors if r.is_alive()]
+
+
+HAS_PREFORK = hasattr(socket, "SO_REUSEPORT") and platform.system() == "Linux"
+
+
+def handle_echo_prefork(event):
+    """C-ECHO handler that can be sent to the worker processes."""
+    return 0x0122
+
+
+@pytest.mark.skipif(not HAS_PREFORK, reason="Requires fork and SO_REUSEPORT")
+class TestPreforkAssociationServer:
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_multi_process(self):
+        """Test associations are handled by the worker processes."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", 0),
+            block=False,
+            server_class=transport.PreforkAssociationServer,
+            processes=2,
+        )
+        assert isinstance(scp, transport.PreforkAssociationServer)
+        port = scp.server_address[1]
+        assert port != 0
+
+        pids = [process.pid for process, _ in scp._workers]
+        assert len(pids) == 2
+        assert os.getpid() not in pids
+
+        for ii in range(4):
+            assoc = ae.associate("localhost", port)
+            assert assoc.is_established
+            assert assoc.send_c_echo().Status == 0x0000
+            assoc.release()
+
+        # No associations are run by the parent
+        assert scp.active_associations == []
+
+        scp.shutdown()
+
+        assert not [p for p, _ in scp._workers if p.is_alive()]
+        assert not [p for p in pids if os.path.exists(f"/proc/{p}/status")]
+        assert scp not in ae._servers
+
+    def test_maximum_associations(self):
+        """Test the maximum associations are shared between the workers."""
+        self.ae = ae = AE()
+        ae.maximum_associations = 2
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", 0),
+            block=False,
+            server_class=transport.PreforkAssociationServer,
+            processes=2,
+        )
+        port = scp.server_address[1]
+
+        assocs = [ae.associate("localhost", port) for _ in range(2)]
+        assert all(assoc.is_established for assoc in assocs)
+
+        assoc = ae.associate("localhost", port)
+        assert assoc.is_rejected
+
+        for assoc in assocs:
+            assoc.release()
+
+        # Released associations stop counting at the next poll
+        time.sleep(1)
+
+        assoc = ae.associate("localhost", port)
+        assert assoc.is_established
+        assoc.release()
+
+        scp.shutdown()
+
+    def test_bind_unbind(self):
+        """Test binding handlers after the workers have started."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", 0),
+            block=False,
+            server_class=transport.PreforkAssociationServer,
+            processes=2,
+        )
+        port = scp.server_address[1]
+
+        scp.bind(evt.EVT_C_ECHO, handle_echo_prefork)
+        assert scp.get_handlers(evt.EVT_C_ECHO) == (handle_echo_prefork, None)
+        for ii in range(2):
+            assoc = ae.associate("localhost", port)
+            assert assoc.send_c_echo().Status == 0x0122
+            assoc.release()
+
+        scp.unbind(evt.EVT_C_ECHO, handle_echo_prefork)
+        for ii in range(2):
+            assoc = ae.associate("localhost", port)
+            assert assoc.send_c_echo().Status == 0x0000
+            assoc.release()
+
+        msg = "Event handlers bound or unbound after the PreforkAssociationServer"
+        with pytest.raises(ValueError, match=msg):
+            scp.bind(evt.EVT_C_ECHO, lambda event: 0x0000)
+
+        scp.shutdown()
+
+    def test_restart_worker(self):
+        """Test workers that exit are restarted."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", 0),
+            block=False,
+            server_class=transport.PreforkAssociationServer,
+            processes=1,
+        )
+        port = scp.server_address[1]
+
+        process = scp._workers[0][0]
+        process.kill()
+        process.join()
+
+        timeout = 0
+        while scp._workers[0][0] is process and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert scp._workers[0][0] is not process
+        assoc = ae.associate("localhost", port)
+        assert assoc.is_established
+        assoc.release()
+
+        scp.shutdown()
+
+    def test_worker_start_fails(self):
+        """Test an exception is raised if a worker fails to start."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        with mock.patch.object(
+            transport._PreforkWorkerServer,
+            "server_bind",
+            side_effect=OSError("Unable to bind"),
+        ):
+            with pytest.raises(OSError, match="Unable to bind"):
+                ae.start_server(
+                    ("localhost", 0),
+                    block=False,
+                    server_class=transport.PreforkAssociationServer,
+                    processes=2,
+                )
+
+        assert ae._servers == []
+
+    def test_shutdown_waits(self):
+        """Test shutdown waits for the current associations to end."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", 0),
+            block=False,
+            server_class=transport.PreforkAssociationServer,
+            processes=1,
+            shutdown_timeout=0.5,
+        )
+        port = scp.server_address[1]
+
+        assoc = ae.associate("localhost", port)
+        assert assoc.is_established
+
+        # The association is aborted once the timeout expires
+        scp.shutdown()
+        assoc.join(5)
+        assert assoc.is_aborted
+
+        assoc = ae.associate("localhost", port)
+        assert not assoc.is_established
+
+
+class TestPooledAssociationServer:
+    def setup_method(self):
+        self.ae = None
+
+    def teardown_method(self):
+        if self.ae:
+            self.ae.shutdown()
+
+    def test_pool(self):
+        """Test associations are run by the worker pool."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.PooledAssociationServer,
+            max_workers=2,
+            request_queue_size=10,
+        )
+        assert isinstance(scp, transport.PooledAssociationServer)
+        assert scp.request_queue_size == 10
+
+        assocs = []
+        for ii in range(2):
+            assoc = ae.associate("localhost", get_port())
+            assert assoc.is_established
+            assert assoc.send_c_echo().Status == 0x0000
+            assocs.append(assoc)
+
+        assert len(scp.active_associations) == 2
+        assert len([a for a in ae.active_associations if a.is_acceptor]) == 2
+        threads = [t.name for t in threading.enumerate()]
+        assert not [t for t in threads if "AcceptorThread" in t]
+        assert len([t for t in threads if "AcceptorWorker" in t]) == 2
+
+        for assoc in assocs:
+            assoc.release()
+
+        timeout = 0
+        while scp.active_associations and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assert scp.active_associations == []
+        assert scp._nr_requests == 0
+
+        scp.shutdown()
+
+    def test_saturated(self):
+        """Test connections are rejected early when the pool is saturated."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.PooledAssociationServer,
+            max_workers=1,
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        rejected = ae.associate("localhost", get_port())
+        assert rejected.is_rejected
+        primitive = rejected.acceptor.primitive
+        assert primitive.result == 0x02
+        assert primitive.result_source == 0x03
+        assert primitive.diagnostic == 0x02
+
+        assoc.release()
+
+        timeout = 0
+        while scp._nr_requests and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+        assoc.release()
+
+        scp.shutdown()
+
+    def test_rejected_limit(self):
+        """Test the connections with rejected peers are closed promptly."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.PooledAssociationServer,
+            max_workers=1,
+        )
+        scp._max_rejected = 2
+        scp._reject_linger = 10
+
+        def connect():
+            peer = socket.socket()
+            peer.settimeout(5)
+            peer.connect(("localhost", get_port()))
+            return peer
+
+        def wait_for(condition):
+            timeout = 0
+            while not condition() and timeout < 5:
+                time.sleep(0.05)
+                timeout += 0.05
+
+            return timeout
+
+        # Peers that never send an A-ASSOCIATE-RQ or close the connection
+        peers = [connect()]
+        wait_for(lambda: scp._nr_requests)
+        peers.append(connect())
+        wait_for(lambda: len(scp._rejected) == 1)
+        oldest, _ = scp._rejected[0]
+
+        # The oldest rejected connection is closed when there are too many
+        peers.extend([connect(), connect()])
+        wait_for(lambda: oldest not in [sock for sock, _ in scp._rejected])
+        wait_for(lambda: len(scp._rejected) == 2)
+        assert len(scp._rejected) == 2
+        assert oldest.fileno() == -1
+
+        # Rejected connections are only kept open for a short time
+        scp._reject_linger = 0.5
+        peers.append(connect())
+        wait_for(lambda: peers[4].recv(1))
+        assert wait_for(lambda: len(scp._rejected) == 1) < 2
+        assert len(scp._rejected) == 1
+
+        for peer in peers:
+            peer.close()
+
+        scp.shutdown()
+
+    def test_queued(self):
+        """Test connections wait for a worker when queueing is allowed."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.PooledAssociationServer,
+            max_workers=1,
+            max_queued=1,
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        queued = []
+        t = threading.Thread(
+            target=lambda: queued.append(ae.associate("localhost", get_port()))
+        )
+        t.start()
+
+        timeout = 0
+        while scp._nr_requests < 2 and timeout < 5:
+            time.sleep(0.05)
+            timeout += 0.05
+
+        # Queue is full
+        rejected = ae.associate("localhost", get_port())
+        assert rejected.is_rejected
+
+        assoc.release()
+        t.join(10)
+        assert queued[0].is_established
+        queued[0].release()
+
+        scp.shutdown()
+
+    def test_shutdown_aborts(self):
+        """Test shutting down the server aborts its associations."""
+        self.ae = ae = AE()
+        ae.add_supported_context(Verification)
+        ae.add_requested_context(Verification)
+        scp = ae.start_server(
+            ("localhost", get_port()),
+            block=False,
+            server_class=transport.PooledAssociationServer,
+        )
+
+        assoc = ae.associate("localhost", get_port())
+        assert assoc.is_established
+
+        scp.shutdown()
+        assoc.join(5)
+        assert assoc.is_aborted
+
+    def test_invalid_limits(self):
+        """Test exception raised with invalid pool limits."""
+        ae = AE()
+        ae.add_supported_context(Verification)
+        msg = "'max_workers' must be greater than 0 and 'max_queued' must not"
+        with pytest.raises(ValueError, match=msg):
+            ae.make_server(
+                ("localhost", get_port()),
+                server_class=transport.PooledAssociationServer,
+                max_workers=0,
+            )
+
+        with pytest.raises(ValueError, match=msg):
+            ae.make_server(
+                ("localhost", get_port()),
+                server_class=transport.PooledAssociationServer,
+                max_queued=-1,
+            )
+
+
 class TestEventHandlingAcceptor:
     """Test the transport events and handling as acceptor."""
 
@@ -3,7 +3,13 @@ A generic timer class suitable for use as the DICOM UL's ARTIM timer.
 """
 
 import logging
+import math
+import os
+import threading
 import time
+from typing import cast
+from collections.abc import Callable
+from weakref import WeakMethod
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +38,12 @@ class Timer:
       :attr:`~Timer.remaining` always returns the number of seconds until
       :attr:`~Timer.expired` returns ``True``.
 
+    .. versionchanged:: 3.1
+
+        Uses :func:`time.monotonic` rather than :func:`time.time` so the timer
+        isn't affected by changes to the system clock, and added the
+        `callback` parameter.
+
     References
     ----------
 
@@ -39,7 +51,9 @@ class Timer:
       :dcm:`Section 9.1.5<part08/chapter_9.html#sect_9.1.5>`.
     """
 
-    def __init__(self, timeout: float | None) -> None:
+    def __init__(
+        self, timeout: float | None, callback: Callable[[], None] | None = None
+    ) -> None:
         """Create a new :class:`Timer`.
 
         Parameters
@@ -47,11 +61,22 @@ class Timer:
         timeout : numeric or None
             The number of seconds before the timer expires. A value of ``None``
             means the timer never expires.
+        callback : callable, optional
+            If used then a callable that takes no parameters which will be
+            called from the timer wheel's thread when the running timer
+            expires, see :class:`TimerWheel`.
+
+            .. versionadded:: 3.1
         """
         self._start_time: float | None = None
         self._end_time: float | None = None
         self._timeout = timeout
 
+        self._callback = callback
+        # The deadline registered with the timer wheel, if any
+        self._deadline: _Deadline | None = None
+        self._lock = threading.Lock()
+
     @property
     def expired(self) -> bool:
         """Check if the timer has expired.
@@ -72,6 +97,14 @@ class Timer:
         # Timer has started
         return self.remaining < 0
 
+    @property
+    def is_running(self) -> bool:
+        """Return ``True`` if the timer has been started and not yet stopped.
+
+        .. versionadded:: 3.1
+        """
+        return self._start_time is not None and self._end_time is None
+
     @property
     def remaining(self) -> float:
         """Return the number of seconds remaining until timeout.
@@ -88,7 +121,7 @@ class Timer:
 
         # Timer has started and hasn't been stopped
         if self._end_time is None:
-            return self.timeout - (time.time() - self._start_time)
+            return self.timeout - (time.monotonic() - self._start_time)
 
         # Time has been start and been stopped
         return self.timeout - (self._end_time - self._start_time)
@@ -99,12 +132,61 @@ class Timer:
 
     def start(self) -> None:
         """Resets and starts the timer running."""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._end_time = None
+        if self._callback is not None:
+            self._schedule()
 
     def stop(self) -> None:
         """Stops the timer and resets it."""
-        self._end_time = time.time()
+        self._end_time = time.monotonic()
+
+    def _schedule(self, reschedule: bool = False) -> None:
+        """Register the timer's deadline with the timer wheel.
+
+        .. versionadded:: 3.1
+
+        A timer that's restarted before its registered deadline is reached
+        keeps the existing registration, which is moved to the new deadline
+        once the existing one is reached, so restarting the timer is cheap.
+
+        Parameters
+        ----------
+        reschedule : bool, optional
+            If ``True`` then replace any existing registration, default
+            ``False``.
+        """
+        with self._lock:
+            if self._deadline is not None:
+                if not reschedule:
+                    return
+
+                self._deadline.cancel()
+                self._deadline = None
+
+            if self._timeout is None or not self.is_running:
+                return
+
+            self._deadline = timer_wheel().schedule(
+                max(self.remaining, 0), WeakMethod(self._on_deadline)
+            )
+
+    def _on_deadline(self) -> None:
+        """Called by the timer wheel when the timer's deadline is reached."""
+        with self._lock:
+            self._deadline = None
+            if self._timeout is None or not self.is_running:
+                return
+
+            # Restarted since the deadline was registered
+            remaining = self.remaining
+            if remaining > 0:
+                self._deadline = timer_wheel().schedule(
+                    remaining, WeakMethod(self._on_deadline)
+                )
+                return
+
+        cast(Callable[[], None], self._callback)()
 
     @property
     def timeout(self) -> float | None:
@@ -122,3 +204,254 @@ class Timer:
             means the timer never expires.
         """
         self._timeout = value
+        if self._callback is not None:
+            self._schedule(reschedule=True)
+
+
+class _Deadline:
+    """A deadline registered with a :class:`TimerWheel`."""
+
+    __slots__ = ("tick", "callback")
+
+    def __init__(self, tick: int, callback: "WeakMethod[Callable[[], None]]") -> None:
+        self.tick = tick
+        self.callback: "WeakMethod[Callable[[], None]] | None" = callback
+
+    def cancel(self) -> None:
+        """Cancel the deadline."""
+        self.callback = None
+
+
+class TimerWheel:
+    """A hierarchical timing wheel for calling functions at a deadline.
+
+    .. versionadded:: 3.1
+
+    Deadlines are rounded up to the next tick of the wheel and are kept in a
+    hierarchy of wheels with `slots` slots each, with the first wheel holding
+    the deadlines due within `slots` ticks, the second those due within
+    `slots` ** 2 ticks and so on. Each time the first wheel completes a
+    rotation the deadlines in the next slot of the second wheel are moved down
+    to the first, so registering and cancelling a deadline are O(1)
+    regardless of how many are registered. Time is measured using
+    :func:`time.monotonic`.
+
+    A single daemon thread, started when the first deadline is registered,
+    sleeps until the next slot with deadlines is due and then calls their
+    functions, so the functions should return quickly. The thread runs until
+    :meth:`stop` is called. The timers of all associations share the wheel
+    returned by :func:`timer_wheel`.
+    """
+
+    def __init__(self, resolution: float = 0.01, slots: int = 256, levels: int = 4):
+        """Create a new :class:`TimerWheel`.
+
+        Parameters
+        ----------
+        resolution : float, optional
+            The duration of each tick of the wheel (in seconds), default
+            ``0.01``.
+        slots : int, optional
+            The number of slots in each wheel of the hierarchy, default
+            ``256``.
+        levels : int, optional
+            The number of wheels in the hierarchy, default ``4``. Deadlines
+            further away than `slots` ** `levels` ticks are re-registered when
+            they come within range.
+        """
+        self.resolution = resolution
+        self._slots = slots
+        self._wheels: list[list[list[_Deadline]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        # The number of ticks per slot for each wheel
+        self._spans = [slots**level for level in range(levels)]
+        self._start = time.monotonic()
+        # The last tick that has been processed
+        self._tick = 0
+        # The number of deadlines in the wheels, including cancelled ones
+        self._count = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def _current_tick(self) -> int:
+        """Return the number of ticks since the wheel was created."""
+        return int((time.monotonic() - self._start) / self.resolution)
+
+    def _insert(self, deadline: _Deadline) -> None:
+        """Add `deadline` to the slot of the wheel it's due in."""
+        delta = deadline.tick - self._tick
+        for level, span in enumerate(self._spans):
+            if delta < span * self._slots or level == len(self._spans) - 1:
+                idx = (deadline.tick // span) % self._slots
+                self._wheels[level][idx].append(deadline)
+                return
+
+    def _next_tick(self) -> int:
+        """Return the next tick that has deadlines to be processed."""
+        tick = self._tick
+        # The next rotation of the first wheel
+        end = (tick // self._slots + 1) * self._slots
+        first = self._wheels[0]
+        for next_tick in range(tick + 1, end):
+            if first[next_tick % self._slots]:
+                return next_tick
+
+        return end
+
+    def _advance(self, tick: int) -> list[_Deadline]:
+        """Process the wheel up to `tick` and return the deadlines due."""
+        due: list[_Deadline] = []
+        while self._tick < tick:
+            self._tick += 1
+            current = self._tick
+            # Move the deadlines from the higher wheels down a level as the
+            #   lower wheels complete a rotation
+            for level in range(1, len(self._spans)):
+                span = self._spans[level]
+                if current % span:
+                    break
+
+                idx = (current // span) % self._slots
+                deadlines = self._wheels[level][idx]
+                self._wheels[level][idx] = []
+                for deadline in deadlines:
+                    if deadline.callback is None:
+                        self._count -= 1
+                    else:
+                        self._insert(deadline)
+
+            idx = current % self._slots
+            due.extend(self._wheels[0][idx])
+            self._wheels[0][idx] = []
+
+        self._count -= len(due)
+        return due
+
+    def _run(self) -> None:
+        """The timer wheel's thread."""
+        thread = threading.current_thread()
+        while True:
+            with self._cond:
+                while not self._count and self._thread is thread:
+                    self._cond.wait()
+
+                # Stopped
+                if self._thread is not thread:
+                    return
+
+                tick = self._current_tick()
+                next_tick = self._next_tick()
+                if tick < next_tick:
+                    timeout = (
+                        self._start + next_tick * self.resolution - time.monotonic()
+                    )
+                    self._cond.wait(max(timeout, 0))
+                    continue
+
+                due = self._advance(tick)
+
+            for deadline in due:
+                ref = deadline.callback
+                func = ref() if ref is not None else None
+                if func is None:
+                    continue
+
+                try:
+                    func()
+                except Exception as exc:
+                    LOGGER.error("Exception raised by a timer wheel callback")
+                    LOGGER.exception(exc)
+
+    def schedule(
+        self, delay: float, callback: "WeakMethod[Callable[[], None]]"
+    ) -> _Deadline:
+        """Register a function to be called after `delay` seconds.
+
+        Parameters
+        ----------
+        delay : float
+            The number of seconds until the deadline.
+        callback : weakref.WeakMethod
+            A weak reference to the method to be called at the deadline, so
+            the registration doesn't keep its object alive. If the object has
+            been garbage collected by the deadline then nothing is called.
+
+        Returns
+        -------
+        _Deadline
+            The registered deadline, which can be cancelled using its
+            ``cancel()`` method.
+        """
+        with self._cond:
+            if not self._count:
+                # Nothing to process so skip straight to the current tick
+                self._tick = self._current_tick()
+
+            tick = math.ceil((time.monotonic() + delay - self._start) / self.resolution)
+            deadline = _Deadline(max(tick, self._tick + 1), callback)
+            self._insert(deadline)
+            self._count += 1
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="TimerWheel", daemon=True
+                )
+                self._thread.start()
+
+            self._cond.notify()
+
+        return deadline
+
+    def stop(self) -> None:
+        """Stop the wheel's thread and discard any registered deadlines.
+
+        A new thread is started if another deadline is registered afterwards.
+        """
+        with self._cond:
+            thread = self._thread
+            if thread is None:
+                return
+
+            self._thread = None
+            for wheel in self._wheels:
+                for slot in wheel:
+                    slot.clear()
+
+            self._count = 0
+            self._cond.notify()
+
+        if thread is not threading.current_thread():
+            thread.join()
+
+
+_TIMER_WHEEL: TimerWheel | None = None
+_TIMER_WHEEL_LOCK = threading.Lock()
+
+
+def timer_wheel() -> TimerWheel:
+    """Return the :class:`TimerWheel` shared by all the :class:`Timer`
+    instances, creating it if required.
+
+    .. versionadded:: 3.1
+    """
+    global _TIMER_WHEEL
+
+    if _TIMER_WHEEL is None:
+        with _TIMER_WHEEL_LOCK:
+            if _TIMER_WHEEL is None:
+                _TIMER_WHEEL = TimerWheel()
+
+    return _TIMER_WHEEL
+
+
+def _reset_timer_wheel() -> None:
+    """Discard the shared timer wheel, whose thread doesn't survive a fork."""
+    global _TIMER_WHEEL, _TIMER_WHEEL_LOCK
+
+    _TIMER_WHEEL = None
+    _TIMER_WHEEL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_timer_wheel)
@@ -1,11 +1,16 @@
 """Implementation of the Transport Service."""
 
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import gc
+import itertools
 import logging
+import multiprocessing
+import os
+import pickle
 import queue
 import select
+import signal
 import socket
 from socketserver import TCPServer, ThreadingMixIn, BaseRequestHandler
 
@@ -18,8 +23,10 @@ except ImportError:
     #   and must use "ssl.SSLContext" in type hints
     _HAS_SSL = False
 import threading
+import time
 from typing import TYPE_CHECKING, Any, cast
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Sequence
 import warnings
 
 from pynetdicom import evt, _config
@@ -30,19 +37,37 @@ from pynetdicom._handlers import (
     standard_pdu_recv_handler,
     standard_pdu_sent_handler,
 )
+from pynetdicom.dimse_messages import _FileFragment
+from pynetdicom.pdu import A_ASSOCIATE_RJ, _BufferType
 from pynetdicom.pdu_primitives import A_ASSOCIATE
-from pynetdicom.presentation import PresentationContext
+from pynetdicom.presentation import PresentationContext, _copy_contexts
+from pynetdicom.utils import make_target
 
 if TYPE_CHECKING:  # pragma: no cover
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+    from multiprocessing.sharedctypes import SynchronizedArray
     from socketserver import BaseServer
 
     from pynetdicom.ae import ApplicationEntity
+    from pynetdicom.aio import AsyncAssociationServer
     from pynetdicom.association import Association
-    from pynetdicom.dul import _QueueType
+    from pynetdicom.dul import _QueueType, DULServiceProvider
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Scatter/gather sends aren't available on all platforms (i.e. Windows)
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# Zero-copy sends from file aren't available on all platforms (i.e. Windows)
+_HAS_SENDFILE = hasattr(os, "sendfile")
+# The maximum number of buffers that can be passed to a single sendmsg() call
+#   may be -1 if indeterminate, so fall back to the POSIX minimum of 16
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+
 
 class AddressInformation:
     """IPv4 or IPv6 address information.
@@ -579,32 +604,57 @@ class AssociationSocket:
         bytearray
             The data read from the socket.
         """
+        bytestream = bytearray(nr_bytes)
+        with memoryview(bytestream) as view:
+            nr_read = self.recv_into(view, nr_bytes)
+
+        # Connection broken, so return what we have so far
+        del bytestream[nr_read:]
+
+        return bytestream
+
+    def recv_into(self, buffer: memoryview, nr_bytes: int) -> int:
+        """Read `nr_bytes` from the socket directly into `buffer`.
+
+        .. versionadded:: 3.1
+
+        *Events Emitted*
+
+        - None
+
+        Parameters
+        ----------
+        buffer : memoryview
+            A writeable buffer at least `nr_bytes` long to read the data into.
+        nr_bytes : int
+            The number of bytes to attempt to read from the socket.
+
+        Returns
+        -------
+        int
+            The number of bytes read, which will only be less than `nr_bytes`
+            if the connection was closed by the peer.
+        """
         self.socket = cast(socket.socket, self.socket)
-        bytestream = bytearray()
         nr_read = 0
-        # socket.recv() returns when the network buffer has been emptied
+        # socket.recv_into() returns when the network buffer has been emptied
         #   not necessarily when the number of bytes requested have been
-        #   read. Its up to us to keep calling recv() until we have all the
-        #   data we want
+        #   read. Its up to us to keep calling recv_into() until we have all
+        #   the data we want
         # **BLOCKING** until either all the data is read or an error occurs
         while nr_read < nr_bytes:
-            # Python docs recommend reading a relatively small power of 2
-            #   such as 4096
-            bufsize = 4096
-            if (nr_bytes - nr_read) < bufsize:
-                bufsize = nr_bytes - nr_read
-
-            bytes_read = self.socket.recv(bufsize)
+            bytes_read = self.socket.recv_into(
+                buffer[nr_read:nr_bytes], nr_bytes - nr_read
+            )
 
-            # If socket.recv() reads 0 bytes then the connection has been
-            #   broken, so return what we have so far
+            # If socket.recv_into() reads 0 bytes then the connection has
+            #   been broken, so return what we have so far
             if not bytes_read:
-                return bytestream
+                break
 
-            bytestream.extend(bytes_read)
-            nr_read += len(bytes_read)
+            nr_read += bytes_read
 
-        return bytestream
+        return nr_read
 
     def send(self, bytestream: bytes) -> None:
         """Try and send the data in `bytestream` to the remote.
@@ -623,16 +673,138 @@ class AssociationSocket:
         total_sent = 0
         length_data = len(bytestream)
         try:
-            while total_sent < length_data:
-                # Returns the number of bytes sent
-                nr_sent = self.socket.send(bytestream[total_sent:])
-                total_sent += nr_sent
+            # Use a memoryview so partial sends don't copy the remaining data
+            with memoryview(bytestream) as view:
+                while total_sent < length_data:
+                    # Returns the number of bytes sent
+                    nr_sent = self.socket.send(view[total_sent:])
+                    total_sent += nr_sent
 
             evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": bytestream})
         except Exception:
             # Evt17: Transport connection closed
             self.event_queue.put("Evt17")
 
+    @property
+    def _can_sendfile(self) -> bool:
+        """Return ``True`` if dataset fragments stored in a file can be
+        passed to :meth:`sendmsg` to be sent directly from the file.
+
+        .. versionadded:: 3.1
+        """
+        if not _HAS_SENDMSG or not _HAS_SENDFILE:
+            return False
+
+        return not (_HAS_SSL and isinstance(self.socket, ssl.SSLSocket))
+
+    def sendmsg(self, buffers: Sequence[_BufferType]) -> None:
+        """Try and send the data in `buffers` to the remote.
+
+        .. versionadded:: 3.1
+
+        The buffers are sent in order using a single scatter/gather
+        :meth:`socket.socket.sendmsg` call where possible, so the data
+        doesn't have to be joined together first. If the socket doesn't
+        support :meth:`~socket.socket.sendmsg`, such as when using TLS, then
+        the buffers are joined and sent with :meth:`send` instead.
+
+        Dataset fragments stored in a file are sent directly from the file
+        using :func:`os.sendfile`, and should only be used if
+        :attr:`_can_sendfile` is ``True``.
+
+        *Events Emitted*
+
+        - None
+        - Evt17: Transport connected closed.
+
+        Parameters
+        ----------
+        buffers : Sequence[bytes | memoryview | dimse_messages._FileFragment]
+            The data to send to the remote.
+        """
+        self.socket = cast(socket.socket, self.socket)
+        if not _HAS_SENDMSG or (_HAS_SSL and isinstance(self.socket, ssl.SSLSocket)):
+            # No dataset fragments stored in a file as `_can_sendfile` is False
+            self.send(b"".join(cast(Sequence[bytes | memoryview], buffers)))
+            return
+
+        views: list[memoryview] = []
+        try:
+            for buffer in buffers:
+                if not isinstance(buffer, _FileFragment):
+                    views.append(memoryview(buffer))
+                    continue
+
+                # Send everything up to and including the message control
+                #   header, then the rest of the fragment from its file
+                views.append(memoryview(buffer.header))
+                self._send_views(views)
+                self._sendfile(buffer)
+
+            self._send_views(views)
+
+            # Only join the buffers if there's a handler to pass the data to
+            if self.assoc.get_handlers(evt.EVT_DATA_SENT):
+                data = b"".join(
+                    bytes(b) if isinstance(b, _FileFragment) else b for b in buffers
+                )
+                evt.trigger(self.assoc, evt.EVT_DATA_SENT, {"data": data})
+        except Exception:
+            # Evt17: Transport connection closed
+            self.event_queue.put("Evt17")
+
+    def _sendfile(self, fragment: _FileFragment) -> None:
+        """Send the dataset `fragment` to the remote directly from its file
+        using :func:`os.sendfile`.
+
+        .. versionadded:: 3.1
+        """
+        sock = cast(socket.socket, self.socket)
+        sock_fd, file_fd = sock.fileno(), fragment.file.fileno()
+        offset, remaining = fragment.offset, fragment.length
+        while remaining:
+            try:
+                nr_sent = os.sendfile(sock_fd, file_fd, offset, remaining)
+            except BlockingIOError:
+                # Sockets with a timeout are non-blocking so wait until
+                #   the socket is writable again
+                _, ready, _ = select.select([], [sock], [], sock.gettimeout())
+                if not ready:
+                    raise TimeoutError("Timed out sending the dataset fragment")
+
+                continue
+
+            if not nr_sent:
+                raise EOFError(
+                    f"Only {fragment.length - remaining} of {fragment.length} "
+                    "bytes of the dataset fragment were available to be sent"
+                )
+
+            offset += nr_sent
+            remaining -= nr_sent
+
+    def _send_views(self, views: list[memoryview]) -> None:
+        """Send `views` to the remote using :meth:`socket.socket.sendmsg`,
+        removing them from the list as they're sent.
+
+        .. versionadded:: 3.1
+        """
+        sock = cast(socket.socket, self.socket)
+        while views:
+            # Returns the number of bytes sent
+            nr_sent = sock.sendmsg(views[:_IOV_MAX])
+
+            # Discard any buffers that have been completely sent and
+            #   trim the start of a partially sent one
+            idx = 0
+            while idx < len(views) and nr_sent >= len(views[idx]):
+                nr_sent -= len(views[idx])
+                idx += 1
+
+            del views[:idx]
+            if nr_sent:
+                views[0] = views[0][nr_sent:]
+
     def _shutdown_socket(self) -> None:
         """Try to shutdown and close the socket."""
         sock = cast(socket.socket, self.socket)
@@ -751,31 +923,55 @@ class RequestHandler(BaseRequestHandler):
         sock = AssociationSocket(assoc, client_socket=self.request)
         assoc.set_socket(sock)
 
-        # Association Acceptor object -> local AE
-        assoc.acceptor.maximum_length = self.ae.maximum_pdu_size
-        assoc.acceptor.ae_title = self.server.ae_title
-        assoc.acceptor.address_info = self.local
-        assoc.acceptor.implementation_class_uid = self.ae.implementation_class_uid
-        assoc.acceptor.implementation_version_name = self.ae.implementation_version_name
-        assoc.acceptor.supported_contexts = deepcopy(self.server.contexts)
-
-        # Association Requestor object -> remote AE
-        assoc.requestor.address_info = self.remote
-
-        # Bind events to handlers
-        for event in self.server._handlers:
-            # Intervention events
-            if event.is_intervention and self.server._handlers[event]:
-                assoc.bind(event, *self.server._handlers[event])
-            elif isinstance(event, evt.NotificationEvent):
-                # list[tuple[Callable, list[Any] | None]]
-                for handler in self.server._handlers[event]:
-                    handler = cast(evt._HandlerBase, handler)
-                    assoc.bind(event, handler[0], handler[1])
+        _configure_acceptor(assoc, self.server, self.local, self.remote)
 
         return assoc
 
 
+def _configure_acceptor(
+    assoc: "Association",
+    server: "AssociationServer | AsyncAssociationServer",
+    local: AddressInformation,
+    remote: AddressInformation,
+) -> None:
+    """Configure an acceptor `assoc` for a connection accepted by `server`.
+
+    .. versionadded:: 3.1
+
+    Parameters
+    ----------
+    assoc : association.Association
+        The association to configure.
+    server : AssociationServer or aio.AsyncAssociationServer
+        The server that accepted the connection.
+    local : AddressInformation
+        The address of the local end of the connection.
+    remote : AddressInformation
+        The address of the peer.
+    """
+    # Association Acceptor object -> local AE
+    assoc.acceptor.maximum_length = server.ae.maximum_pdu_size
+    assoc.acceptor.ae_title = server.ae_title
+    assoc.acceptor.address_info = local
+    assoc.acceptor.implementation_class_uid = server.ae.implementation_class_uid
+    assoc.acceptor.implementation_version_name = server.ae.implementation_version_name
+    assoc.acceptor.supported_contexts = _copy_contexts(server.contexts)
+
+    # Association Requestor object -> remote AE
+    assoc.requestor.address_info = remote
+
+    # Bind events to handlers
+    for event in server._handlers:
+        # Intervention events
+        if event.is_intervention and server._handlers[event]:
+            assoc.bind(event, *server._handlers[event])
+        elif isinstance(event, evt.NotificationEvent):
+            # list[tuple[Callable, list[Any] | None]]
+            for handler in server._handlers[event]:
+                handler = cast(evt._HandlerBase, handler)
+                assoc.bind(event, handler[0], handler[1])
+
+
 class AssociationServer(TCPServer):
     """An Association server implementation.
 
@@ -801,8 +997,15 @@ class AssociationServer(TCPServer):
     server_address : tuple[str, int] | tuple[str, int, int, int]
         The ``(host: str, port: int)`` or ``(host: str, port: int, flowinfo: int,
         scope_id: int)`` that the server is running on.
+    allow_reuse_port : bool
+        If ``True`` then ``socket.SO_REUSEPORT`` will be set on the server's
+        socket, default ``False``.
+
+        .. versionadded:: 3.1
     """
 
+    allow_reuse_port = False
+
     def __init__(
         self,
         ae: "ApplicationEntity",
@@ -840,6 +1043,8 @@ class AssociationServer(TCPServer):
             is created for each request. Should be a subclass of
             :class:`~socketserver.BaseRequestHandler`.
         """
+        from pynetdicom.association import _AssociationRegistry
+
         self.ae = ae
         self.ae_title = ae_title
         self.contexts = contexts
@@ -849,6 +1054,8 @@ class AssociationServer(TCPServer):
         self.allow_reuse_address = True
         self.server_address: tuple[str, int] | tuple[str, int, int, int] = address
         self.socket: socket.socket | None = None  # type: ignore[assignment]
+        # The live associations, maintained by the associations themselves
+        self._registry = _AssociationRegistry()
 
         request_handler = request_handler or RequestHandler
 
@@ -910,12 +1117,14 @@ class AssociationServer(TCPServer):
         """Return the server's running
         :class:`~pynetdicom.association.Association` acceptor instances
         """
-        # Find all AcceptorThreads with `_server` as self
-        threads = cast(
-            list["Association"],
-            [tt for tt in threading.enumerate() if "AcceptorThread" in tt.name],
-        )
-        return [tt for tt in threads if tt._server is self]
+        return self._registry.associations()
+
+    def _count_acceptors(self) -> int:
+        """Return the number of acceptors to check against
+        :attr:`AE.maximum_associations
+        <pynetdicom.ae.ApplicationEntity.maximum_associations>`.
+        """
+        return self.ae._registry.nr_acceptors
 
     def get_events(self) -> list[evt.EventType]:
         """Return a list of currently bound events."""
@@ -980,6 +1189,8 @@ class AssociationServer(TCPServer):
         """Bind the socket and set the socket options.
 
         - ``socket.SO_REUSEADDR`` is set to ``1``
+        - ``socket.SO_REUSEPORT`` is set to ``1`` if
+          :attr:`~AssociationServer.allow_reuse_port` is ``True``
         - socket.settimeout is used to set to
           :attr:`AE.network_timeout
           <pynetdicom.ae.ApplicationEntity.network_timeout>` unless the
@@ -990,6 +1201,11 @@ class AssociationServer(TCPServer):
         #   waiting for its natural timeout to expire
         #   Allows local address reuse
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # SO_REUSEPORT: allow other sockets to bind to the same address and
+        #   have the kernel distribute incoming connections between them
+        if self.allow_reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
         # If no timeout is set then recv() will block forever if
         #   the connection is kept alive with no data sent
         if self.ae.network_timeout is not None:
@@ -1081,3 +1297,833 @@ class ThreadedAssociationServer(ThreadingMixIn, AssociationServer):
         except Exception:
             self.handle_error(request, client_address)
             self.shutdown_request(request)
+
+
+class MultiplexedRequestHandler(RequestHandler):
+    """Connection request handler for the :class:`MultiplexedAssociationServer`.
+
+    .. versionadded:: 3.1
+    """
+
+    server: "MultiplexedAssociationServer"
+
+    def handle(self) -> None:
+        """Handle an association request.
+
+        * Creates a new Association acceptor instance and configures it.
+        * Sets the Association's socket to the request's socket.
+        * Registers the Association with one of the server's shared reactors.
+        """
+        assoc = self._create_association()
+
+        # Trigger must be after binding the events
+        evt.trigger(assoc, evt.EVT_CONN_OPEN, {"address": self.client_address})
+
+        self.server._add_association(assoc)
+
+
+class MultiplexedAssociationServer(AssociationServer):
+    """An :class:`AssociationServer` that runs its associations without
+    starting any new threads for them.
+
+    .. versionadded:: 3.1
+
+    The DUL state machines of all the server's associations are driven by one
+    or more :class:`~pynetdicom.dul.SharedReactor` threads, while association
+    negotiation and the handling of service requests, including the bound
+    intervention event handlers, are run by a pool of worker threads. Unlike
+    :class:`ThreadedAssociationServer` the number of threads doesn't grow with
+    the number of associations.
+
+    Notification event handlers bound to events raised by the DUL, such as
+    ``evt.EVT_DATA_RECV`` or ``evt.EVT_PDU_SENT``, are called from a reactor
+    thread and should return quickly.
+
+    The server can be started using :meth:`AE.start_server()
+    <pynetdicom.ae.ApplicationEntity.start_server>`:
+
+    .. code-block:: python
+
+        from pynetdicom import AE
+        from pynetdicom.sop_class import Verification
+        from pynetdicom.transport import MultiplexedAssociationServer
+
+        ae = AE()
+        ae.add_supported_context(Verification)
+        ae.start_server(
+            ("127.0.0.1", 11112),
+            server_class=MultiplexedAssociationServer,
+            max_workers=16,
+        )
+    """
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str,
+        contexts: list[PresentationContext],
+        ssl_context: "ssl.SSLContext | None" = None,
+        evt_handlers: list[evt.EventHandlerType] | None = None,
+        request_handler: Callable[..., BaseRequestHandler] | None = None,
+        max_workers: int | None = None,
+        reactors: int = 1,
+    ) -> None:
+        """Create a new :class:`MultiplexedAssociationServer`, bind a socket
+        and start listening.
+
+        Accepts the same parameters as :class:`AssociationServer`, plus:
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of worker threads used to run the associations,
+            defaults to the :class:`~concurrent.futures.ThreadPoolExecutor`
+            default. Each association uses at most one worker at a time, and
+            only while it has something to do.
+        reactors : int, optional
+            The number of :class:`~pynetdicom.dul.SharedReactor` threads, new
+            associations are assigned to them in turn (default ``1``).
+        """
+        from pynetdicom.dul import SharedReactor
+
+        # Protects the live associations and the state of their workers
+        self._lock = threading.Lock()
+        # {association: callable} for each live association, the callable
+        #   runs the association in a worker
+        self._associations: dict["Association", Callable[[], bool]] = {}
+        # {association: bool} for each association with a worker, the value
+        #   is True if it should be run again once the current run ends
+        self._running: dict["Association", bool] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="AcceptorWorker"
+        )
+        self._reactors = [
+            SharedReactor(self._on_dul_activity) for _ in range(max(reactors, 1))
+        ]
+        self._next_reactor = itertools.cycle(self._reactors)
+
+        super().__init__(
+            ae,
+            address,
+            ae_title,
+            contexts,
+            ssl_context,
+            evt_handlers,
+            request_handler or MultiplexedRequestHandler,
+        )
+
+        for reactor in self._reactors:
+            reactor.start()
+
+    def _add_association(self, assoc: "Association") -> None:
+        """Start running `assoc` using one of the server's reactors."""
+        assoc.dul._reactor = next(self._next_reactor)
+        # The association has no reactor thread of its own, so it's only ever
+        #   unpaused while it's being run by a worker
+        assoc._is_paused = True
+        assoc._started_dul = True
+        with self._lock:
+            self._associations[assoc] = make_target(assoc._run_shared)
+
+        assoc._register()
+        assoc.dul.start()
+
+    def _on_dul_activity(self, dul: "DULServiceProvider") -> None:
+        """Called by a reactor whenever the state of `dul` may have changed."""
+        assoc = dul.assoc
+        with self._lock:
+            if assoc not in self._associations:
+                return
+
+            # Already running, so ensure the worker takes another pass
+            if assoc in self._running:
+                self._running[assoc] = True
+                return
+
+            self._running[assoc] = False
+
+        try:
+            self._executor.submit(self._run_association, assoc)
+        except RuntimeError:
+            # The server has been shutdown
+            with self._lock:
+                del self._running[assoc]
+
+    def _run_association(self, assoc: "Association") -> None:
+        """Run `assoc` in a worker thread until it has nothing left to do."""
+        run = self._associations[assoc]
+        while True:
+            try:
+                finished = run()
+            except Exception as exc:
+                LOGGER.error("Exception raised while running the association")
+                LOGGER.exception(exc)
+                assoc.dul.kill_dul()
+                finished = True
+
+            with self._lock:
+                if finished:
+                    del self._associations[assoc]
+                    del self._running[assoc]
+                    assoc._unregister()
+                    return
+
+                if not self._running[assoc]:
+                    del self._running[assoc]
+                    return
+
+                self._running[assoc] = False
+
+    def shutdown(self) -> None:
+        """Completely shutdown the server and close its socket.
+
+        Any associations that are still running will be aborted.
+        """
+        super().shutdown()
+
+        for assoc in self.active_associations:
+            assoc.abort(block=False)
+
+        for reactor in self._reactors:
+            reactor.stop()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _PreforkWorkerServer(ThreadedAssociationServer):
+    """The server run by each of the worker processes of a
+    :class:`PreforkAssociationServer`.
+
+    .. versionadded:: 3.1
+    """
+
+    allow_reuse_port = True
+
+    def __init__(
+        self,
+        *args: Any,
+        budget: "SynchronizedArray[int]",
+        index: int,
+        **kwargs: Any,
+    ) -> None:
+        """Create a new worker server.
+
+        Accepts the same parameters as :class:`AssociationServer`, plus:
+
+        Parameters
+        ----------
+        budget : multiprocessing.Array
+            The number of acceptors in each of the worker processes.
+        index : int
+            The index of the worker process in `budget`.
+        """
+        self._budget = budget
+        self._index = index
+
+        super().__init__(*args, **kwargs)
+
+    def _count_acceptors(self) -> int:
+        """Return the number of acceptors across all the worker processes."""
+        with self._budget.get_lock():
+            self._budget[self._index] = super()._count_acceptors()
+            return sum(self._budget[:])
+
+    def service_actions(self) -> None:
+        """Called by the serve_forever() loop"""
+        super().service_actions()
+
+        # Let the other workers know about any associations that have ended
+        with self._budget.get_lock():
+            self._budget[self._index] = super()._count_acceptors()
+
+
+class PreforkAssociationServer(AssociationServer):
+    """An :class:`AssociationServer` that accepts associations in several
+    worker processes.
+
+    .. versionadded:: 3.1
+
+    Each worker is a forked copy of the current process that runs its own
+    :class:`ThreadedAssociationServer` bound to the same address using
+    ``socket.SO_REUSEPORT``. The kernel distributes incoming connections
+    between the workers, so the handling of associations is no longer limited
+    to a single CPU core by the GIL. The server itself only reserves the
+    address, and :meth:`serve_forever` restarts any worker processes that exit
+    unexpectedly.
+
+    The limit set by :attr:`AE.maximum_associations
+    <pynetdicom.ae.ApplicationEntity.maximum_associations>` applies to the
+    total number of associations across all the workers. Each worker updates
+    its count when it negotiates an association and every *poll_interval*,
+    so an association that has ended may still be counted for that long.
+
+    Event handlers are inherited by the workers when they're started. Handlers
+    bound or unbound later using :meth:`bind` or :meth:`unbind` are sent to
+    the workers, so they must be picklable, such as module level functions.
+    Because the handlers run in the worker processes any changes they make to
+    the state of the process aren't visible in the process that started the
+    server.
+
+    Only available on platforms that support both :func:`os.fork` and
+    ``socket.SO_REUSEPORT``, such as Linux. As with any use of
+    :func:`os.fork`, the server should be created before any other threads are
+    started.
+
+    The server can be started using :meth:`AE.start_server()
+    <pynetdicom.ae.ApplicationEntity.start_server>`:
+
+    .. code-block:: python
+
+        from pynetdicom import AE
+        from pynetdicom.sop_class import Verification
+        from pynetdicom.transport import PreforkAssociationServer
+
+        ae = AE()
+        ae.add_supported_context(Verification)
+        ae.start_server(
+            ("127.0.0.1", 11112),
+            server_class=PreforkAssociationServer,
+            processes=8,
+        )
+    """
+
+    allow_reuse_port = True
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str,
+        contexts: list[PresentationContext],
+        ssl_context: "ssl.SSLContext | None" = None,
+        evt_handlers: list[evt.EventHandlerType] | None = None,
+        request_handler: Callable[..., BaseRequestHandler] | None = None,
+        processes: int | None = None,
+        shutdown_timeout: float | None = 30,
+    ) -> None:
+        """Create a new :class:`PreforkAssociationServer`, bind a socket and
+        start the worker processes.
+
+        Accepts the same parameters as :class:`AssociationServer`, plus:
+
+        Parameters
+        ----------
+        processes : int, optional
+            The number of worker processes to use, defaults to the number of
+            CPUs in the system.
+        shutdown_timeout : float | None, optional
+            The time (in seconds) the workers will wait for their associations
+            to end after :meth:`shutdown` is called before aborting them,
+            default ``30``. If ``None`` then wait indefinitely.
+        """
+        if (
+            not hasattr(socket, "SO_REUSEPORT")
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            raise RuntimeError(
+                "The PreforkAssociationServer requires a platform that supports "
+                "both 'fork' and 'SO_REUSEPORT'"
+            )
+
+        self._context = multiprocessing.get_context("fork")
+        self._shutdown_timeout = shutdown_timeout
+        self._request_handler = request_handler
+        self._is_stopped = threading.Event()
+        # Protects the worker processes from being restarted while the
+        #   bound handlers are being changed
+        self._lock = threading.RLock()
+        # The worker processes and the parent end of their command pipes
+        self._workers: list[tuple["BaseProcess", "Connection"]] = []
+        # The number of acceptors in each of the worker processes
+        self._budget = self._context.Array("i", processes or os.cpu_count() or 1)
+
+        super().__init__(
+            ae,
+            address,
+            ae_title,
+            contexts,
+            ssl_context,
+            evt_handlers,
+            request_handler,
+        )
+
+        try:
+            for index in range(len(self._budget)):
+                self._workers.append(self._start_worker(index))
+        except Exception:
+            self._is_stopped.set()
+            self._stop_workers()
+            self.server_close()
+            raise
+
+    def bind(
+        self, event: evt.EventType, handler: Callable, args: list[Any] | None = None
+    ) -> None:
+        """Bind a callable `handler` to an `event`.
+
+        Parameters
+        ----------
+        event : namedtuple
+            The event to bind the function to.
+        handler : callable
+            The function that will be called if the event occurs. Must be
+            picklable if the worker processes have been started.
+        args : list, optional
+            Optional extra arguments to be passed to the handler (default:
+            no extra arguments passed to the handler).
+        """
+        with self._lock:
+            self._send_command("bind", event, handler, args)
+            super().bind(event, handler, args)
+
+    def _run_worker(self, index: int, conn: "Connection", other: "Connection") -> None:
+        """Run an association server in a worker process."""
+        # Interrupts are handled by the parent process, which will then
+        #   shutdown the workers
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        # Close our copies of the parent's socket and ends of the pipes
+        self.socket = cast(socket.socket, self.socket)
+        self.socket.close()
+        other.close()
+        for _, worker_conn in self._workers:
+            worker_conn.close()
+
+        try:
+            server = _PreforkWorkerServer(
+                self.ae,
+                self.server_address,
+                self.ae_title,
+                self.contexts,
+                self.ssl_context,
+                request_handler=self._request_handler,
+                budget=self._budget,
+                index=index,
+            )
+        except Exception as exc:
+            conn.send(exc)
+            raise
+
+        server._handlers = self._handlers
+        self.ae._servers = [server]
+
+        thread = threading.Thread(
+            target=self._recv_commands,
+            args=(server, conn),
+            name=f"PreforkCommands-{index}",
+            daemon=True,
+        )
+        thread.start()
+
+        # Let the parent know we're accepting connections
+        conn.send(None)
+
+        server.serve_forever()
+
+        # Wait for the remaining associations to end
+        timeout = self._shutdown_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for assoc in server.active_associations:
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+
+            assoc.join(timeout)
+
+        for assoc in server.active_associations:
+            assoc.abort()
+
+    @staticmethod
+    def _recv_commands(server: AssociationServer, reader: "Connection") -> None:
+        """Apply the commands sent by the parent process to a worker's
+        `server`.
+        """
+        while True:
+            try:
+                command, args = reader.recv()
+            except (EOFError, OSError):
+                # The parent process has gone away
+                command, args = "shutdown", ()
+            except Exception as exc:
+                LOGGER.error("Unable to receive a command from the parent process")
+                LOGGER.exception(exc)
+                continue
+
+            if command == "shutdown":
+                server.shutdown()
+                return
+
+            # "bind" or "unbind"
+            getattr(server, command)(*args)
+
+    def _send_command(self, command: str, *args: Any) -> None:
+        """Send a `command` to the running worker processes."""
+        if not self._workers:
+            return
+
+        try:
+            data = pickle.dumps((command, args))
+        except Exception as exc:
+            raise ValueError(
+                "Event handlers bound or unbound after the PreforkAssociationServer "
+                "has started must be picklable"
+            ) from exc
+
+        for process, conn in self._workers:
+            try:
+                conn.send_bytes(data)
+            except OSError:
+                # The worker has exited and will be restarted
+                pass
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Restart any worker processes that exit until :meth:`shutdown` is
+        called.
+
+        Parameters
+        ----------
+        poll_interval : float, optional
+            The interval (in seconds) between checks of the workers, default
+            ``0.5``.
+        """
+        while not self._is_stopped.wait(poll_interval):
+            with self._lock:
+                for index, (process, conn) in enumerate(self._workers):
+                    if process.is_alive() or self._is_stopped.is_set():
+                        continue
+
+                    LOGGER.warning(
+                        f"Worker process {process.pid} exited unexpectedly with "
+                        f"code {process.exitcode}, restarting"
+                    )
+                    conn.close()
+                    try:
+                        self._workers[index] = self._start_worker(index)
+                    except Exception as exc:
+                        LOGGER.error("Unable to restart the worker process")
+                        LOGGER.exception(exc)
+
+    def server_activate(self) -> None:
+        """Reserve the server's address without listening on it, the
+        connections are accepted by the worker processes instead.
+        """
+        pass
+
+    def shutdown(self) -> None:
+        """Shutdown the worker processes and close the server's socket.
+
+        The workers stop accepting new associations and wait up to
+        *shutdown_timeout* seconds for their current associations to end
+        before aborting them.
+        """
+        self._is_stopped.set()
+        self._stop_workers()
+        self.server_close()
+        self.ae._servers.remove(self)
+
+    def _start_worker(self, index: int) -> tuple["BaseProcess", "Connection"]:
+        """Start the worker process at `index` and wait until it's accepting
+        connections.
+        """
+        with self._budget.get_lock():
+            self._budget[index] = 0
+
+        conn, worker_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=self._run_worker,
+            args=(index, worker_conn, conn),
+            name=f"PreforkWorker-{index}",
+            daemon=True,
+        )
+        process.start()
+        worker_conn.close()
+
+        try:
+            exc = conn.recv()
+        except EOFError:
+            exc = RuntimeError(
+                f"Worker process {process.pid} exited with code {process.exitcode}"
+            )
+
+        if exc is not None:
+            process.join()
+            conn.close()
+            raise exc
+
+        return process, conn
+
+    def _stop_workers(self) -> None:
+        """Shutdown the worker processes."""
+        with self._lock:
+            self._send_command("shutdown")
+            workers, self._workers = self._workers, []
+
+        # Allow the workers a little longer to abort their associations
+        timeout = self._shutdown_timeout
+        deadline = None if timeout is None else time.monotonic() + timeout + 5
+        for process, conn in workers:
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+            conn.close()
+
+    def unbind(self, event: evt.EventType, handler: Callable) -> None:
+        """Unbind a callable `handler` from an `event`.
+
+        Parameters
+        ----------
+        event : 3-tuple
+            The event to unbind the function from.
+        handler : callable
+            The function that will no longer be called if the event occurs.
+            Must be picklable if the worker processes have been started.
+        """
+        with self._lock:
+            self._send_command("unbind", event, handler)
+            super().unbind(event, handler)
+
+
+class PooledRequestHandler(RequestHandler):
+    """Connection request handler for the :class:`PooledAssociationServer`.
+
+    .. versionadded:: 3.1
+    """
+
+    server: "PooledAssociationServer"
+
+    def handle(self) -> None:
+        """Handle an association request.
+
+        * Creates a new Association acceptor instance and configures it.
+        * Sets the Association's socket to the request's socket.
+        * Runs the Association reactor in the current worker thread until the
+          association ends.
+        """
+        assoc = self._create_association()
+
+        # Trigger must be after binding the events
+        evt.trigger(assoc, evt.EVT_CONN_OPEN, {"address": self.client_address})
+
+        # Runs the Association reactor, without starting a new thread
+        assoc.run()
+
+
+class PooledAssociationServer(AssociationServer):
+    """An :class:`AssociationServer` that runs its associations using a
+    bounded pool of worker threads.
+
+    .. versionadded:: 3.1
+
+    Where :class:`ThreadedAssociationServer` starts new threads for every
+    connection it accepts, each association is run by one of at most
+    *max_workers* worker threads (plus the thread used by its DUL). Once all
+    the workers are busy up to *max_queued* connections will wait for a worker
+    to become available, and any further connections are immediately sent an
+    A-ASSOCIATE-RJ with a result of *rejected (transient)* and a diagnostic of
+    *local-limit-exceeded*, without an association being created for them.
+
+    The server can be started using :meth:`AE.start_server()
+    <pynetdicom.ae.ApplicationEntity.start_server>`:
+
+    .. code-block:: python
+
+        from pynetdicom import AE
+        from pynetdicom.sop_class import Verification
+        from pynetdicom.transport import PooledAssociationServer
+
+        ae = AE()
+        ae.add_supported_context(Verification)
+        ae.start_server(
+            ("127.0.0.1", 11112),
+            server_class=PooledAssociationServer,
+            max_workers=64,
+            max_queued=16,
+        )
+    """
+
+    def __init__(
+        self,
+        ae: "ApplicationEntity",
+        address: tuple[str, int] | tuple[str, int, int, int],
+        ae_title: str,
+        contexts: list[PresentationContext],
+        ssl_context: "ssl.SSLContext | None" = None,
+        evt_handlers: list[evt.EventHandlerType] | None = None,
+        request_handler: Callable[..., BaseRequestHandler] | None = None,
+        max_workers: int = 32,
+        max_queued: int = 0,
+        request_queue_size: int = 5,
+    ) -> None:
+        """Create a new :class:`PooledAssociationServer`, bind a socket and
+        start listening.
+
+        Accepts the same parameters as :class:`AssociationServer`, plus:
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            The maximum number of associations that will be run at the same
+            time, default ``32``.
+        max_queued : int, optional
+            The maximum number of connections that will wait for a worker
+            to become available before new connections are rejected, default
+            ``0``.
+        request_queue_size : int, optional
+            The size of the backlog of connections waiting to be accepted by
+            the server, passed to :meth:`socket.socket.listen`, default ``5``.
+        """
+        if max_workers < 1 or max_queued < 0:
+            raise ValueError(
+                "'max_workers' must be greater than 0 and 'max_queued' must not "
+                "be negative"
+            )
+
+        self.request_queue_size = request_queue_size
+        # Protects the number of requests
+        self._lock = threading.Lock()
+        # The number of connections being run or waiting for a worker
+        self._nr_requests = 0
+        self._max_requests = max_workers + max_queued
+        self._is_shutdown = False
+        # Connections with rejected peers as (socket, close by), oldest first
+        self._rejected: deque[tuple[socket.socket, float]] = deque()
+        # The maximum time (in seconds) to wait for a rejected peer to close
+        #   the connection and the maximum number of connections waiting
+        self._reject_linger = 1.0
+        self._max_rejected = 64
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="AcceptorWorker"
+        )
+
+        super().__init__(
+            ae,
+            address,
+            ae_title,
+            contexts,
+            ssl_context,
+            evt_handlers,
+            request_handler or PooledRequestHandler,
+        )
+
+    def process_request(
+        self,
+        request: socket.socket | tuple[bytes, socket.socket],
+        client_address: tuple[str, int] | str,
+    ) -> None:
+        """Pass a connection request to a worker, or reject it if the server
+        is saturated.
+        """
+        request = cast(socket.socket, request)
+        with self._lock:
+            is_saturated = self._nr_requests >= self._max_requests
+            if not is_saturated:
+                self._nr_requests += 1
+
+        if is_saturated:
+            self._reject_request(request, client_address)
+            return
+
+        try:
+            self._executor.submit(self.process_request_thread, request, client_address)
+        except RuntimeError:
+            # The server has been shutdown
+            with self._lock:
+                self._nr_requests -= 1
+
+            self.shutdown_request(request)
+
+    def process_request_thread(
+        self,
+        request: socket.socket,
+        client_address: tuple[str, int] | str,
+    ) -> None:
+        """Process a connection request in a worker thread."""
+        try:
+            # Connections still waiting for a worker at shutdown are closed
+            if not self._is_shutdown:
+                self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._lock:
+                self._nr_requests -= 1
+
+    def _reject_request(
+        self, request: socket.socket, client_address: tuple[str, int] | str
+    ) -> None:
+        """Send an A-ASSOCIATE-RJ to the peer without creating an association."""
+        LOGGER.warning(
+            f"Rejecting the association request from {client_address[0]}, the "
+            "maximum number of associations has been reached"
+        )
+
+        pdu = A_ASSOCIATE_RJ()
+        # Rejected (transient), service-provider (presentation related),
+        #   local-limit-exceeded
+        pdu.result = 0x02
+        pdu.source = 0x03
+        pdu.reason_diagnostic = 0x02
+
+        try:
+            request.setblocking(False)
+            request.sendall(pdu.encode())
+            request.shutdown(socket.SHUT_WR)
+        except OSError:
+            self.shutdown_request(request)
+            return
+
+        # Closing the connection before the A-ASSOCIATE-RQ has been read
+        #   resets it, which may cause the peer to lose the A-ASSOCIATE-RJ,
+        #   so wait a short time for the peer to close it instead
+        if len(self._rejected) >= self._max_rejected:
+            oldest, _ = self._rejected.popleft()
+            oldest.close()
+
+        self._rejected.append((request, time.monotonic() + self._reject_linger))
+
+    def _close_rejected(self, force: bool = False) -> None:
+        """Close the connections with rejected peers once the peer has closed
+        the connection, it has timed out or if `force` is ``True``.
+        """
+        now = time.monotonic()
+        lingering = []
+        for request, deadline in self._rejected:
+            try:
+                while request.recv(4096):
+                    pass
+            except BlockingIOError:
+                if not force and now < deadline:
+                    lingering.append((request, deadline))
+                    continue
+            except OSError:
+                pass
+
+            request.close()
+
+        self._rejected = deque(lingering)
+
+    def service_actions(self) -> None:
+        """Called by the serve_forever() loop"""
+        super().service_actions()
+        self._close_rejected()
+
+    def shutdown(self) -> None:
+        """Completely shutdown the server and close its socket.
+
+        Any associations that are still running will be aborted and any
+        connections waiting for a worker will be closed.
+        """
+        super().shutdown()
+        self._is_shutdown = True
+
+        for assoc in self.active_associations:
+            assoc.abort(block=False)
+
+        self._executor.shutdown(wait=False)
+        self._close_rejected(force=True)